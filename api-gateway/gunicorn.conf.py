@@ -0,0 +1,26 @@
+"""
+Gunicorn configuration for the Api-Gateway.
+
+`GATEWAY_WORKER_MODE` selects how requests are executed:
+    - "sync":  classic pre-fork workers, one in-flight request per worker (default).
+    - "async": gevent workers. Sockets are cooperative, so every worker can keep
+               `GATEWAY_WORKER_CONNECTIONS` requests waiting on downstream services at once.
+"""
+from dotenv import load_dotenv
+import os
+
+load_dotenv()
+
+WORKER_CLASSES: dict[str, str] = {
+    "sync": "sync",
+    "async": "gevent",
+}
+
+worker_mode = os.getenv("GATEWAY_WORKER_MODE", "sync")
+if worker_mode not in WORKER_CLASSES:
+    raise ValueError(f"Unknown GATEWAY_WORKER_MODE '{worker_mode}', expected one of {list(WORKER_CLASSES)}")
+
+bind = os.getenv("GATEWAY_BIND", "0.0.0.0:5000")
+workers = int(os.getenv("GATEWAY_WORKERS", "4"))
+worker_class = WORKER_CLASSES[worker_mode]
+worker_connections = int(os.getenv("GATEWAY_WORKER_CONNECTIONS", "1000"))
@@ -201,12 +201,12 @@ def test_user_role(mock_get_user_by_id: MagicMock, app: Flask, client: FlaskClie
     assert data["Message"] == "Hello, User!"
 
 
-@patch("webapp.services.auth.services.AuthService.generate_token")
-def test_refresh_token(mock_generate_token: MagicMock, app: Flask, client: FlaskClient) -> None:
+@patch("webapp.services.auth.services.AuthService.refresh")
+def test_refresh_token(mock_refresh: MagicMock, app: Flask, client: FlaskClient) -> None:
     token_pair = TokenPairDTO(access_token="access_token", refresh_token="refresh_token")
     schema = to_schema_token_pair(token_pair)
 
-    mock_generate_token.return_value = schema
+    mock_refresh.return_value = schema
 
     with app.app_context():
         refresh_token = create_refresh_token(identity="id12345")
@@ -218,4 +218,50 @@ def test_refresh_token(mock_generate_token: MagicMock, app: Flask, client: Flask
     assert "access_token" in data
     assert resp.status_code == 200
 
-    mock_generate_token.assert_called_once()
+    mock_refresh.assert_called_once_with("id12345")
+
+
+@patch("webapp.services.users.services.UserService.get_user_by_id")
+def test_role_from_token_claims(mock_get_user_by_id: MagicMock, app: Flask, client: FlaskClient) -> None:
+    with app.app_context():
+        token = create_access_token(
+            identity="id12345",
+            additional_claims={"role": "admin", "role_ver": app.config["JWT_ROLE_CLAIMS_VERSION"]}
+        )
+
+    resp = client.get("/api/protected/admin-only", headers={"Authorization": f"Bearer {token}"})
+    assert resp.status_code == 200
+
+    resp = client.get("/api/protected/user-only", headers={"Authorization": f"Bearer {token}"})
+    assert resp.status_code == 403
+
+    mock_get_user_by_id.assert_not_called()
+
+
+@patch("webapp.services.users.services.UserService.get_user_by_id")
+def test_role_stale_version_falls_back_to_users_service(
+        mock_get_user_by_id: MagicMock,
+        app: Flask,
+        client: FlaskClient
+) -> None:
+    mock_get_user_by_id.return_value = MagicMock(id="id12345", role="user")
+    with app.app_context():
+        token = create_access_token(
+            identity="id12345",
+            additional_claims={"role": "admin", "role_ver": app.config["JWT_ROLE_CLAIMS_VERSION"] - 1}
+        )
+
+    resp = client.get("/api/protected/admin-only", headers={"Authorization": f"Bearer {token}"})
+    assert resp.status_code == 403
+    mock_get_user_by_id.assert_called_once()
+
+
+@patch("webapp.services.users.services.UserService.get_user_by_id")
+def test_role_stale_without_fallback(mock_get_user_by_id: MagicMock, app: Flask, client: FlaskClient) -> None:
+    app.config["JWT_ROLE_FALLBACK_ENABLED"] = False
+    with app.app_context():
+        token = create_access_token(identity="id12345")
+
+    resp = client.get("/api/protected/any-authenticated", headers={"Authorization": f"Bearer {token}"})
+    assert resp.status_code == 401
+    mock_get_user_by_id.assert_not_called()
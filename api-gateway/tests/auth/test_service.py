@@ -9,6 +9,7 @@ from flask_jwt_extended import decode_token
 from webapp import create_app
 from webapp.services.auth.dtos import LoginDTO, LoginMfaRequiredDTO, TokenPairDTO, VerifyMfaDTO
 from webapp.services.auth.services import AuthService
+from webapp.services.downstream import DownstreamClient
 from webapp.services.exceptions import ValidationException
 
 
@@ -16,16 +17,18 @@ from webapp.services.exceptions import ValidationException
 def app() -> Flask:
     app = create_app()
     app.config.update({
-        "TESTING": True,
-        "USERS_SERVICE_URL": "http://localhost:users-webapp",
-        "HTTP_TIMEOUT": 5,
+        "TESTING": True
     })
     return app
 
 @pytest.fixture
-def service(app: Flask) -> Generator[AuthService, None, None]:
+def http_client() -> MagicMock:
+    return MagicMock(spec=DownstreamClient)
+
+@pytest.fixture
+def service(app: Flask, http_client: MagicMock) -> Generator[AuthService, None, None]:
     with app.app_context():
-        yield AuthService()
+        yield AuthService(client=http_client)
 
 def make_response(json_data: dict, status_code: int = 200) -> MagicMock:
     resp = MagicMock(spec=httpx.Response)
@@ -34,14 +37,13 @@ def make_response(json_data: dict, status_code: int = 200) -> MagicMock:
     return resp
 
 
-@patch("webapp.services.auth.services.httpx.post")
 @patch("webapp.services.auth.services.raise_for_status")
-def test_login(mock_raise: MagicMock, mock_post: MagicMock, service: AuthService, app: Flask) -> None:
+def test_login(mock_raise: MagicMock, service: AuthService, app: Flask, http_client: MagicMock) -> None:
     dto = LoginDTO(identifier="test", password="123456")
-    mock_post.return_value = make_response({
+    http_client.post.return_value = make_response({
         "id": "1",
         "is_active": True,
-        "mfa_secret": "",
+        "mfa_enabled": False,
     }, 201)
 
 
@@ -52,32 +54,28 @@ def test_login(mock_raise: MagicMock, mock_post: MagicMock, service: AuthService
     payload = decode_token(result.access_token)
     assert payload["sub"] == "1"
     mock_raise.assert_called_once()
-    mock_post.assert_called_once_with("http://localhost:users-webapp/auth/check", json=dto.__dict__, timeout=5)
+    http_client.post.assert_called_once_with("/auth/check", json=dto.__dict__)
 
-@patch("webapp.services.auth.services.httpx.post")
 @patch("webapp.services.auth.services.raise_for_status")
-def test_login_if_user_not_active(mock_raise: MagicMock, mock_post: MagicMock, app: Flask, service: AuthService) -> None:
+def test_login_if_user_not_active(mock_raise: MagicMock, app: Flask, service: AuthService, http_client: MagicMock) -> None:
     dto = LoginDTO(identifier="test", password="123456")
-    mock_post.return_value = make_response({
+    http_client.post.return_value = make_response({
         "id": "1",
         "is_active": False,
-        "mfa_secret": ""
+        "mfa_enabled": False
     })
     with pytest.raises(ValidationException, match="User is not active"):
         service.login(dto)
     mock_raise.assert_called_once()
-    mock_post.assert_called_once_with(
-        "http://localhost:users-webapp/auth/check", json=dto.__dict__, timeout=5
-    )
+    http_client.post.assert_called_once_with("/auth/check", json=dto.__dict__)
 
-@patch("webapp.services.auth.services.httpx.post")
 @patch("webapp.services.auth.services.raise_for_status")
-def test_login_if_user_mfa_secret(mock_raise: MagicMock, mock_post: MagicMock, app: Flask, service: AuthService) -> None:
+def test_login_if_user_mfa_enabled(mock_raise: MagicMock, app: Flask, service: AuthService, http_client: MagicMock) -> None:
     dto = LoginDTO(identifier="test", password="123456")
-    mock_post.return_value = make_response({
+    http_client.post.return_value = make_response({
         "id": "1",
         "is_active": True,
-        "mfa_secret": "secret123"
+        "mfa_enabled": True
     })
     with app.app_context():
         result = service.login(dto)
@@ -85,81 +83,82 @@ def test_login_if_user_mfa_secret(mock_raise: MagicMock, mock_post: MagicMock, a
     assert isinstance(result, LoginMfaRequiredDTO)
     assert result.mfa_required is True
     mock_raise.assert_called_once()
-    mock_post.assert_called_once_with("http://localhost:users-webapp/auth/check", json=dto.__dict__, timeout=5)
+    http_client.post.assert_called_once_with("/auth/check", json=dto.__dict__)
 
 
-@patch("webapp.services.auth.services.httpx.get")
 @patch("webapp.services.auth.services.raise_for_status")
-@patch("webapp.services.auth.services.pyotp.TOTP.verify")
-def test_verify_mfa(mock_verify: MagicMock, mock_raise: MagicMock, mock_get: MagicMock, service: AuthService, app: Flask) -> None:
-    dto = VerifyMfaDTO(user_id="123", code="code123")
-    mock_get.return_value = make_response({
-        "id": "1",
-        "is_active": True,
-        "mfa_secret": "secret123"
+def test_verify_mfa(mock_raise: MagicMock, service: AuthService, app: Flask, http_client: MagicMock) -> None:
+    dto = VerifyMfaDTO(user_id="123", code="123456")
+    http_client.post.return_value = make_response({
+        "user_id": "123",
+        "role": "admin",
+        "verified": True
     })
 
-    mock_verify.return_value = True
     with app.app_context():
         result = service.verify_mfa(dto)
 
     assert isinstance(result, TokenPairDTO)
     payload = decode_token(result.access_token)
-    assert payload["sub"] == "1"
+    assert payload["sub"] == "123"
+    assert payload["role"] == "admin"
     mock_raise.assert_called_once()
-    mock_verify.assert_called_once_with('code123', valid_window=1)
+    http_client.post.assert_called_once_with("/mfa/verify", json={"user_id": "123", "code": "123456"})
+    http_client.get.assert_not_called()
+
+def test_verify_mfa_if_rejected(service: AuthService, http_client: MagicMock) -> None:
+    dto = VerifyMfaDTO(user_id="123", code="123456")
+    http_client.post.return_value = httpx.Response(
+        400,
+        json={"message": "MFA verification failed", "error": "validation_error"}
+    )
+
+    with pytest.raises(ValidationException, match="MFA verification failed"):
+        service.verify_mfa(dto)
 
-@patch("webapp.services.auth.services.httpx.get")
 @patch("webapp.services.auth.services.raise_for_status")
-@patch("webapp.services.auth.services.pyotp.TOTP.verify")
-def test_verify_mfa_if_not_secret(
-        mock_verify: MagicMock,
-        mock_raise: MagicMock,
-        mock_get: MagicMock,
-        service: AuthService,
-        app: Flask
-) -> None:
-    dto = VerifyMfaDTO(user_id="123", code="code123")
-    mock_get.return_value = make_response({
-        "id": "1",
-        "is_active": True,
-        "mfa_secret": ""
+def test_verify_mfa_if_not_verified(mock_raise: MagicMock, service: AuthService, http_client: MagicMock) -> None:
+    dto = VerifyMfaDTO(user_id="123", code="123456")
+    http_client.post.return_value = make_response({
+        "user_id": "123",
+        "role": "user",
+        "verified": False
     })
 
-    mock_verify.return_value = False
-    with pytest.raises(ValidationException, match="Mfa is not enabled for this user"):
+    with pytest.raises(ValidationException, match="Mfa verification failed"):
         service.verify_mfa(dto)
-    mock_raise.assert_called_once()
-    mock_verify.assert_not_called()
-    mock_get.assert_called_once_with("http://localhost:users-webapp/id", params=dto.__dict__, timeout=5)
 
-@patch("webapp.services.auth.services.httpx.get")
 @patch("webapp.services.auth.services.raise_for_status")
-@patch("webapp.services.auth.services.pyotp.TOTP.verify")
-def test_verify_mfa_if_not_totp_verify(
-        mock_verify: MagicMock,
-        mock_raise: MagicMock,
-        mock_get: MagicMock,
-        service: AuthService,
-        app: Flask
-) -> None:
-    dto = VerifyMfaDTO(user_id="123", code="code123")
-    mock_get.return_value = make_response({
+def test_login_embeds_role_claims(mock_raise: MagicMock, service: AuthService, app: Flask, http_client: MagicMock) -> None:
+    dto = LoginDTO(identifier="test", password="123456")
+    http_client.post.return_value = make_response({
         "id": "1",
         "is_active": True,
-        "mfa_secret": "secret123"
+        "mfa_enabled": False,
+        "role": "admin"
     })
-    mock_verify.return_value = False
-
-    with pytest.raises(ValidationException, match="Mfa verification failed"):
-        service.verify_mfa(dto)
-
-
-    mock_raise.assert_called_once()
-    mock_verify.assert_called_once()
-    mock_get.assert_called_once_with("http://localhost:users-webapp/id", params=dto.__dict__, timeout=5)
 
+    with app.app_context():
+        result = service.login(dto)
+        assert isinstance(result, TokenPairDTO)
+        payload = decode_token(result.access_token)
 
+    assert payload["role"] == "admin"
+    assert payload["role_ver"] == app.config["JWT_ROLE_CLAIMS_VERSION"]
 
+@patch("webapp.services.auth.services.raise_for_status")
+def test_refresh(mock_raise: MagicMock, service: AuthService, app: Flask, http_client: MagicMock) -> None:
+    http_client.get.return_value = make_response({
+        "id": "1",
+        "is_active": True,
+        "role": "user"
+    })
 
+    with app.app_context():
+        result = service.refresh("1")
+        payload = decode_token(result.access_token)
 
+    assert payload["sub"] == "1"
+    assert payload["role"] == "user"
+    mock_raise.assert_called_once()
+    http_client.get.assert_called_once_with("/id", params={"user_id": "1"})
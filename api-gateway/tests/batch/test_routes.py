@@ -0,0 +1,113 @@
+from threading import Barrier
+from unittest.mock import patch, MagicMock
+from flask import Flask, request
+from flask.testing import FlaskClient
+from pydantic import ValidationError
+from webapp.api.batch.schemas import BatchItemSchema
+from webapp.services.batch.dtos import BatchItemDTO
+from webapp.services.courses.dtos import CourseDTO, CourseIdDTO
+import pytest
+
+
+@pytest.fixture
+def course() -> CourseDTO:
+    return CourseDTO(
+        id=1,
+        name="Test Course",
+        description="Test Course",
+        price=100,
+        start_date="2026-01-10",
+        end_date="2026-01-20"
+    )
+
+
+@patch("webapp.services.courses.services.CourseService.get_by_id")
+@patch("webapp.api.auth.decorators.UserService.get_user_by_id")
+def test_batch(
+        mock_admin: MagicMock,
+        mock_get: MagicMock,
+        client: FlaskClient,
+        admin_headers: dict[str, str],
+        course: CourseDTO
+) -> None:
+    mock_admin.return_value = MagicMock(id="1", role="admin")
+    barrier = Barrier(2, timeout=5)
+
+    def get_by_id(dto: CourseIdDTO) -> CourseDTO:
+        barrier.wait()
+        return course
+
+    mock_get.side_effect = get_by_id
+
+    response = client.post("/api/batch", json={"requests": [
+        {"method": "GET", "path": "/api/course/1"},
+        {"method": "GET", "path": "/api/course/2"},
+        {"method": "GET", "path": "/api/protected/user-only"}
+    ]}, headers=admin_headers)
+    assert response.status_code == 200
+
+    data = response.get_json()["responses"]
+    assert [item["status"] for item in data] == [200, 200, 403]
+    assert data[0]["body"]["name"] == "Test Course"
+    assert mock_get.call_count == 2
+
+
+@patch("webapp.services.courses.services.CourseService.get_by_id")
+@patch("webapp.api.auth.decorators.UserService.get_user_by_id")
+def test_batch_item_dispatch_failure_is_isolated(
+        mock_admin: MagicMock,
+        mock_get: MagicMock,
+        app: Flask,
+        admin_headers: dict[str, str],
+        course: CourseDTO
+) -> None:
+    mock_admin.return_value = MagicMock(id="1", role="admin")
+    mock_get.return_value = course
+
+    with app.test_request_context("/api/batch", method="POST", headers=admin_headers):
+        results = app.container.batch_service().execute(app, request, [  # type: ignore
+            BatchItemDTO(method="GET", path="/api/course/1?x=1"),
+            BatchItemDTO(method="GET", path="/api/course/1")
+        ])
+
+    assert [result.status for result in results] == [500, 200]
+    assert results[0].body == {"message": "Unexpected error.", "error": "internal_error"}
+
+
+def test_batch_requires_auth(client: FlaskClient) -> None:
+    response = client.post("/api/batch", json={"requests": [{"method": "GET", "path": "/api/course/1"}]})
+    assert response.status_code == 401
+
+
+@patch("webapp.api.auth.decorators.UserService.get_user_by_id")
+def test_batch_too_many_items(
+        mock_user: MagicMock,
+        app: Flask,
+        client: FlaskClient,
+        user_headers: dict[str, str]
+) -> None:
+    mock_user.return_value = MagicMock(id="user123", role="user")
+    max_items = app.container.batch_service().max_items  # type: ignore
+
+    response = client.post("/api/batch", json={
+        "requests": [{"method": "GET", "path": "/api/protected/user-only"}] * (max_items + 1)
+    }, headers=user_headers)
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("path", [
+    "/api/batch",
+    "/api/batch/",
+    "/api/batch#x",
+    "/api/batch?x=1",
+    "/api/course/1?x=1",
+    "/api/course/1#x",
+    "/api//batch",
+    "/api/course/../batch",
+    "/api/%62atch",
+    "/health",
+    "api/course/1"
+])
+def test_batch_item_path_validation(path: str) -> None:
+    with pytest.raises(ValidationError):
+        BatchItemSchema(method="GET", path=path)
@@ -1,9 +1,23 @@
+import httpx
 import pytest
+from dependency_injector import providers
 from flask import Flask
 from flask.testing import FlaskClient
 from flask_jwt_extended import create_access_token
+from unittest.mock import MagicMock
 
 from webapp import create_app
+from webapp.services.cache import TTLCache
+from webapp.services.downstream import DownstreamClient
+from webapp.services.revocation.services import RevocationService
+
+
+def empty_revocation_service() -> RevocationService:
+    client = MagicMock(spec=DownstreamClient)
+    client.get.return_value = httpx.Response(200, json={"tokens": [], "synced_at": "2026-01-01T12:00:00+00:00"})
+    service = RevocationService(client, TTLCache(max_size=10, ttl=60), 1000, 0.01, 60, 3600)
+    service.sync()
+    return service
 
 
 @pytest.fixture
@@ -12,6 +26,7 @@ def app() -> Flask:
     app.config.update({
         "TESTING": True,
     })
+    app.container.revocation_service.override(providers.Object(empty_revocation_service()))  # type: ignore[attr-defined]
     return app
 @pytest.fixture
 def client(app: Flask) -> FlaskClient:
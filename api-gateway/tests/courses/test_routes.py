@@ -56,6 +56,48 @@ def test_get_by_id(
     mock_get.assert_called_once_with(CourseIdDTO(1))
     mock_admin.assert_called_once()
 
+@patch("webapp.services.courses.services.CourseService.get_by_id")
+@patch("webapp.api.auth.decorators.UserService.get_user_by_id")
+def test_get_by_id_conditional(
+        mock_admin: MagicMock,
+        mock_get: MagicMock,
+        client: FlaskClient,
+        admin_headers: dict[str, str],
+        course: CourseDTO
+) -> None:
+    mock_admin.return_value = MagicMock(id="1", role="admin")
+    mock_get.return_value = course
+
+    resp = client.get(f"/api/course/{course.id}", headers=admin_headers)
+    etag = resp.headers["ETag"]
+    not_modified = client.get(f"/api/course/{course.id}", headers={**admin_headers, "If-None-Match": etag})
+
+    assert resp.status_code == 200
+    assert not_modified.status_code == 304
+    assert not_modified.data == b""
+    assert not_modified.headers["ETag"] == etag
+
+@patch("webapp.services.courses.services.CourseService.stream_by_name")
+@patch("webapp.api.auth.decorators.UserService.get_user_by_id")
+def test_get_by_name_ndjson(
+        mock_admin: MagicMock,
+        mock_stream: MagicMock,
+        client: FlaskClient,
+        admin_headers: dict[str, str]
+) -> None:
+    mock_admin.return_value = MagicMock(id="1", role="admin")
+    mock_stream.return_value = iter([b'{"id":1,"name":"Test Course"}\n'])
+
+    resp = client.get(
+        f"/api/course/",
+        query_string={"name": "Test"},
+        headers={**admin_headers, "Accept": "application/x-ndjson"}
+    )
+    assert resp.status_code == 200
+    assert resp.mimetype == "application/x-ndjson"
+    assert resp.get_data() == b'{"id":1,"name":"Test Course"}\n'
+    mock_stream.assert_called_once_with(CourseNameDTO("Test"))
+
 @patch("webapp.services.courses.services.CourseService.get_by_name")
 @patch("webapp.api.auth.decorators.UserService.get_user_by_id")
 def test_get_by_name(
@@ -126,4 +168,14 @@ def test_delete_by_id(
     mock_admin.assert_called_once()
     mock_del.assert_called_once_with(CourseIdDTO(1))
 
+@patch("webapp.api.auth.decorators.UserService.get_user_by_id")
+def test_cache_stats(mock_admin: MagicMock, client: FlaskClient, admin_headers: dict[str, str]) -> None:
+    mock_admin.return_value = MagicMock(id="1", role="admin")
 
+    response = client.get("/api/course/cache/stats", headers=admin_headers)
+    assert response.status_code == 200
+
+    data = response.get_json()
+    assert data["by_id"]["size"] == 0
+    assert data["by_name"]["hits"] == 0
+    mock_admin.assert_called_once()
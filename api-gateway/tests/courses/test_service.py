@@ -7,32 +7,40 @@ import pytest
 
 from webapp.services.courses.dtos import CreateCourseDTO, CourseDTO, CourseIdDTO, CourseNameDTO, UpdateCourseDTO
 from webapp.services.courses.services import CourseService
+from webapp.services.downstream import DownstreamClient
+from webapp.services.cache import TTLCache
 
 
 @pytest.fixture
 def app() -> Flask:
     app = Flask(__name__)
     app.config.update({
-        "TESTING": True,
-        "COURSE_SERVICE_URL": "https://localhost:courses-webapp",
-        "HTTP_TIMEOUT": 5,
+        "TESTING": True
     }
     )
     return app
 @pytest.fixture
-def service(app: Flask) -> Generator[CourseService, None, None]:
+def http_client() -> MagicMock:
+    return MagicMock(spec=DownstreamClient)
+
+@pytest.fixture
+def service(app: Flask, http_client: MagicMock) -> Generator[CourseService, None, None]:
     with app.app_context():
-        yield CourseService()
+        yield CourseService(
+            client=http_client,
+            cache=TTLCache(max_size=10, ttl=60),
+            search_cache=TTLCache(max_size=10, ttl=60)
+        )
 
-def make_response(json_data: dict, status_code: int = 200) -> MagicMock:
+def make_response(json_data: dict, status_code: int = 200, headers: dict[str, str] | None = None) -> MagicMock:
     resp = MagicMock(spec=httpx.Response)
     resp.json.return_value = json_data
     resp.status_code = status_code
+    resp.headers = httpx.Headers(headers)
     return resp
 
-@patch("webapp.services.courses.services.httpx.post")
 @patch("webapp.services.courses.services.raise_for_status")
-def test_create_course(mock_raise: MagicMock, mock_post: MagicMock, service: CourseService, app: Flask) -> None:
+def test_create_course(mock_raise: MagicMock, service: CourseService, app: Flask, http_client: MagicMock) -> None:
     dto = CreateCourseDTO(
         name="Test",
         description="Test",
@@ -40,7 +48,7 @@ def test_create_course(mock_raise: MagicMock, mock_post: MagicMock, service: Cou
         start_date="2026-01-10",
         end_date="2026-01-11"
     )
-    mock_post.return_value = make_response({
+    http_client.post.return_value = make_response({
         "id": 1,
         "name": "Test",
         "description": "Test",
@@ -55,13 +63,12 @@ def test_create_course(mock_raise: MagicMock, mock_post: MagicMock, service: Cou
 
     assert isinstance(result, CourseDTO)
     mock_raise.assert_called_once()
-    mock_post.assert_called_once()
+    http_client.post.assert_called_once()
 
-@patch("webapp.services.courses.services.httpx.get")
 @patch("webapp.services.courses.services.raise_for_status")
-def test_get_by_id(mock_raise: MagicMock, mock_get: MagicMock, service: CourseService, app: Flask) -> None:
+def test_get_by_id(mock_raise: MagicMock, service: CourseService, app: Flask, http_client: MagicMock) -> None:
     dto = CourseIdDTO(1)
-    mock_get.return_value = make_response({
+    http_client.get.return_value = make_response({
         "id": 1,
         "name": "Test",
         "description": "Test",
@@ -77,12 +84,11 @@ def test_get_by_id(mock_raise: MagicMock, mock_get: MagicMock, service: CourseSe
 
     assert result.id == 1
     mock_raise.assert_called_once()
-    mock_get.assert_called_once_with("https://localhost:courses-webapp/1", timeout=5)
+    http_client.get.assert_called_once_with("/1")
 
-@patch("webapp.services.courses.services.httpx.get")
-def test_get_by_name(mock_get: MagicMock, service: CourseService, app: Flask) -> None:
+def test_get_by_name(service: CourseService, app: Flask, http_client: MagicMock) -> None:
     dto = CourseNameDTO("Test")
-    mock_get.return_value.json.return_value = {
+    http_client.get.return_value.json.return_value = {
         "courses": [
             {
             "id": 1,
@@ -100,13 +106,12 @@ def test_get_by_name(mock_get: MagicMock, service: CourseService, app: Flask) ->
 
     assert len(result) == 1
     assert result[0].name == "Test"
-    mock_get.assert_called_once_with("https://localhost:courses-webapp/", params={"name": "Test"}, timeout=5)
+    http_client.get.assert_called_once_with("/", params={"name": "Test"})
 
-@patch("webapp.services.courses.services.httpx.patch")
 @patch("webapp.services.courses.services.raise_for_status")
-def test_update_course(mock_raise: MagicMock, mock_patch: MagicMock, service: CourseService, app: Flask) -> None:
+def test_update_course(mock_raise: MagicMock, service: CourseService, app: Flask, http_client: MagicMock) -> None:
     dto = UpdateCourseDTO(1)
-    mock_patch.return_value = make_response({
+    http_client.patch.return_value = make_response({
         "id": 1,
         "name": "Test",
         "description": "Test",
@@ -120,15 +125,95 @@ def test_update_course(mock_raise: MagicMock, mock_patch: MagicMock, service: Co
 
     assert result.id == 1
     mock_raise.assert_called_once()
-    mock_patch.assert_called_once_with("https://localhost:courses-webapp/1", json=dto.__dict__, timeout=5)
+    http_client.patch.assert_called_once_with("/1", json=dto.__dict__)
 
-@patch("webapp.services.courses.services.httpx.delete")
 @patch("webapp.services.courses.services.raise_for_status")
-def test_delete_course(mock_raise: MagicMock, mock_delete: MagicMock, service: CourseService, app: Flask) -> None:
+def test_delete_course(mock_raise: MagicMock, service: CourseService, app: Flask, http_client: MagicMock) -> None:
     dto = CourseIdDTO(1)
-    mock_delete.return_value = make_response({}, 204)
+    http_client.delete.return_value = make_response({}, 204)
     with app.app_context():
         service.delete_by_id(dto)
 
     mock_raise.assert_called_once()
-    mock_delete.assert_called_once_with("https://localhost:courses-webapp/1", timeout=5)
\ No newline at end of file
+    http_client.delete.assert_called_once_with("/1")
+
+COURSE_JSON = {
+    "id": 1,
+    "name": "Test",
+    "description": "Test",
+    "price": 100,
+    "start_date": "2026-01-10",
+    "end_date": "2026-01-11",
+    "max_participants": 10
+}
+
+@patch("webapp.services.courses.services.raise_for_status")
+def test_get_by_id_served_from_cache(mock_raise: MagicMock, service: CourseService, http_client: MagicMock) -> None:
+    http_client.get.return_value = make_response(COURSE_JSON)
+
+    first = service.get_by_id(CourseIdDTO(1))
+    second = service.get_by_id(CourseIdDTO(1))
+
+    assert first is second
+    http_client.get.assert_called_once_with("/1")
+    stats = service.cache_stats()
+    assert stats.by_id.hits == 1
+    assert stats.by_id.misses == 1
+
+def test_get_by_id_revalidates_expired_course(service: CourseService, http_client: MagicMock) -> None:
+    clock = MagicMock(return_value=0.0)
+    service.cache = TTLCache(max_size=10, ttl=60, clock=clock)
+    http_client.get.return_value = make_response(COURSE_JSON, headers={"ETag": '"v1"'})
+    first = service.get_by_id(CourseIdDTO(1))
+
+    clock.return_value = 60.0
+    http_client.get.return_value = make_response({}, 304)
+    second = service.get_by_id(CourseIdDTO(1))
+    third = service.get_by_id(CourseIdDTO(1))
+
+    assert first is second is third
+    assert http_client.get.call_args_list[1].kwargs == {"headers": {"If-None-Match": '"v1"'}}
+    assert http_client.get.call_count == 2
+
+def test_get_by_name_served_from_cache(service: CourseService, http_client: MagicMock) -> None:
+    http_client.get.return_value = make_response({"courses": [COURSE_JSON]})
+
+    service.get_by_name(CourseNameDTO("Test"))
+    service.get_by_name(CourseNameDTO("Test"))
+
+    http_client.get.assert_called_once_with("/", params={"name": "Test"})
+    assert service.cache_stats().by_name.size == 1
+
+@patch("webapp.services.courses.services.raise_for_status")
+def test_writes_invalidate_cache(mock_raise: MagicMock, service: CourseService, http_client: MagicMock) -> None:
+    http_client.get.return_value = make_response(COURSE_JSON)
+    http_client.post.return_value = make_response(COURSE_JSON, 201)
+    http_client.patch.return_value = make_response(COURSE_JSON)
+    http_client.delete.return_value = make_response({}, 204)
+
+    service.get_by_id(CourseIdDTO(1))
+    service.search_cache.set("Test", [])
+    service.create_course(CreateCourseDTO("Test", "Test", 100, "2026-01-10", "2026-01-11"))
+    assert service.cache_stats().by_id.size == 1
+    assert service.cache_stats().by_name.size == 0
+
+    service.search_cache.set("Test", [])
+    service.update_course(UpdateCourseDTO(1))
+    assert service.cache_stats().by_id.size == 0
+    assert service.cache_stats().by_name.size == 0
+
+    service.get_by_id(CourseIdDTO(1))
+    service.delete_by_id(CourseIdDTO(1))
+    assert service.cache_stats().by_id.size == 0
+    assert http_client.get.call_count == 2
+
+def test_stream_by_name_bypasses_cache(service: CourseService, http_client: MagicMock) -> None:
+    http_client.stream.return_value = httpx.Response(200, stream=httpx.ByteStream(b'{"id":1}\n'))
+
+    chunks = service.stream_by_name(CourseNameDTO("Test"))
+
+    assert b"".join(chunks) == b'{"id":1}\n'
+    http_client.stream.assert_called_once_with(
+        "/", params={"name": "Test"}, headers={"Accept": "application/x-ndjson"}
+    )
+    assert service.cache_stats().by_name.size == 0
@@ -1,4 +1,5 @@
 from unittest.mock import MagicMock, patch
+from flask import Flask
 from flask.testing import FlaskClient
 from webapp.services.enrolments.dtos import (
     EnrolmentDTO,
@@ -6,9 +7,13 @@ from webapp.services.enrolments.dtos import (
     Status,
     EnrolmentIdDTO,
     EnrolmentByUserDTO,
-    DeleteEnrolmentDTO
+    DeleteEnrolmentDTO,
+    EnrolmentUserIdDTO
 )
+from webapp.services.courses.dtos import CourseDTO
+from webapp.services.user_enrolments.dtos import EnrolmentWithCourseDTO
 from webapp.services.users.dtos import UserIdDTO
+import httpx
 
 @patch("webapp.api.enrolments.routes.EnrolmentService.create_enrolment_for_user")
 @patch("webapp.api.auth.decorators.UserService.get_user_by_id")
@@ -141,6 +146,43 @@ def test_get_by_id_and_user(
     mock_get.assert_called_once_with(EnrolmentByUserDTO(enrolment_id=1, user_id="user123"))
     mock_user.assert_called_once()
 
+@patch("webapp.api.enrolments.routes.UserEnrolmentsService.get_for_user")
+@patch("webapp.api.auth.decorators.UserService.get_user_by_id")
+def test_get_my_enrolments(
+        mock_user: MagicMock,
+        mock_get: MagicMock,
+        client: FlaskClient,
+        user_headers: dict[str, str]
+) -> None:
+    mock_user.return_value = MagicMock(id="user123", role="user")
+    enrolment = EnrolmentDTO(
+        id=1,
+        user_id="user123",
+        course_id=1,
+        status=Status.ACTIVE,
+        payment_status=PaymentStatus.PAID,
+    )
+    course = CourseDTO(
+        id=1,
+        name="Test Course",
+        description="Test Course",
+        price=100,
+        start_date="2026-01-10",
+        end_date="2026-01-20"
+    )
+    mock_get.return_value = [
+        EnrolmentWithCourseDTO(enrolment=enrolment, course=course),
+        EnrolmentWithCourseDTO(enrolment=enrolment, course=None)
+    ]
+    resp = client.get(f"/api/enrolment/me", headers=user_headers)
+    assert resp.status_code == 200
+    data = resp.get_json()
+    assert data["enrolments"][0]["payment_status"] == "paid"
+    assert data["enrolments"][0]["course"]["name"] == "Test Course"
+    assert data["enrolments"][1]["course"] is None
+
+    mock_get.assert_called_once_with(EnrolmentUserIdDTO(user_id="user123"))
+
 @patch("webapp.api.enrolments.routes.EnrolmentService.get_active")
 @patch("webapp.api.auth.decorators.UserService.get_user_by_id")
 def test_get_active(
@@ -167,6 +209,87 @@ def test_get_active(
     mock_admin.assert_called_once()
     mock_get.assert_called_once()
 
+@patch("webapp.api.enrolments.routes.EnrolmentService.stream_active")
+@patch("webapp.api.auth.decorators.UserService.get_user_by_id")
+def test_get_active_ndjson(
+        mock_admin: MagicMock,
+        mock_stream: MagicMock,
+        client: FlaskClient,
+        admin_headers: dict[str, str]
+) -> None:
+    mock_admin.return_value = MagicMock(id="admin123", role="admin")
+    mock_stream.return_value = iter([b'{"id":1}\n{"i', b'd":2}\n'])
+
+    resp = client.get(f"/api/enrolment/active", headers={**admin_headers, "Accept": "application/x-ndjson"})
+    assert resp.status_code == 200
+    assert resp.mimetype == "application/x-ndjson"
+    assert resp.is_streamed
+    assert resp.get_data() == b'{"id":1}\n{"id":2}\n'
+
+@patch("webapp.api.enrolments.routes.EnrolmentService.get_active_raw")
+@patch("webapp.api.auth.decorators.UserService.get_user_by_id")
+def test_get_active_passthrough(
+        mock_admin: MagicMock,
+        mock_get: MagicMock,
+        app: Flask,
+        client: FlaskClient,
+        admin_headers: dict[str, str]
+) -> None:
+    app.config["PASSTHROUGH_ENABLED"] = True
+    mock_admin.return_value = MagicMock(id="admin123", role="admin")
+    body = b'{"enrolments":[{"course_id":1,"id":1,"invoice_url":null,"payment_status":"paid","status":"active","user_id":"admin123"}]}'
+    mock_get.return_value = httpx.Response(
+        200,
+        content=body,
+        headers={"Content-Type": "application/json", "ETag": '"abc"', "Server": "gunicorn"}
+    )
+
+    resp = client.get(f"/api/enrolment/active", headers=admin_headers)
+    assert resp.status_code == 200
+    assert resp.data == body
+    assert resp.headers["ETag"] == '"abc"'
+    assert "Server" not in resp.headers
+    mock_get.assert_called_once()
+
+@patch("webapp.api.enrolments.routes.EnrolmentService.get_by_id_raw")
+@patch("webapp.api.auth.decorators.UserService.get_user_by_id")
+def test_get_by_id_passthrough_not_modified(
+        mock_admin: MagicMock,
+        mock_get: MagicMock,
+        app: Flask,
+        client: FlaskClient,
+        admin_headers: dict[str, str]
+) -> None:
+    app.config["PASSTHROUGH_ENABLED"] = True
+    mock_admin.return_value = MagicMock(id="admin123", role="admin")
+    mock_get.return_value = httpx.Response(
+        200,
+        content=b'{"id":1}',
+        headers={"Content-Type": "application/json", "ETag": '"abc"'}
+    )
+
+    resp = client.get("/api/enrolment/1", headers={**admin_headers, "If-None-Match": '"abc"'})
+    assert resp.status_code == 304
+    assert resp.data == b""
+    assert resp.headers["ETag"] == '"abc"'
+
+@patch("webapp.api.enrolments.routes.EnrolmentService.get_by_id_raw")
+@patch("webapp.api.auth.decorators.UserService.get_user_by_id")
+def test_get_by_id_passthrough_unexpected_shape(
+        mock_admin: MagicMock,
+        mock_get: MagicMock,
+        app: Flask,
+        client: FlaskClient,
+        admin_headers: dict[str, str]
+) -> None:
+    app.config["PASSTHROUGH_ENABLED"] = True
+    mock_admin.return_value = MagicMock(id="admin123", role="admin")
+    mock_get.return_value = httpx.Response(200, content=b"<html></html>", headers={"Content-Type": "text/html"})
+
+    resp = client.get(f"/api/enrolment/1", headers=admin_headers)
+    assert resp.status_code == 500
+    assert resp.get_json()["error"] == "server_error"
+
 @patch("webapp.api.enrolments.routes.EnrolmentService.delete_by_id")
 @patch("webapp.api.auth.decorators.UserService.get_user_by_id")
 def test_delete_by_id(
@@ -1,8 +1,12 @@
 from typing import Generator
 from unittest.mock import patch, MagicMock
 from flask import Flask
-from webapp.services.enrolments.dtos import CreateEnrolmentDTO, EnrolmentIdDTO, EnrolmentByUserDTO, DeleteEnrolmentDTO
+import httpx
+from webapp.services.enrolments.dtos import CreateEnrolmentDTO, EnrolmentIdDTO, EnrolmentByUserDTO, DeleteEnrolmentDTO, \
+    EnrolmentUserIdDTO
 from webapp.services.enrolments.services import EnrolmentService
+from webapp.services.downstream import DownstreamClient
+from webapp.services.exceptions import NotFoundException
 import pytest
 
 
@@ -10,32 +14,33 @@ import pytest
 def app() -> Flask:
     app = Flask(__name__)
     app.config.update({
-        "TESTING": True,
-        "ENROLMENT_SERVICE_URL": "http://localhost:enrolment-service-webapp",
-        "HTTP_TIMEOUT": 5
+        "TESTING": True
     })
     return app
 
 @pytest.fixture
-def service(app: Flask) -> Generator[EnrolmentService, None, None]:
+def http_client() -> MagicMock:
+    return MagicMock(spec=DownstreamClient)
+
+@pytest.fixture
+def service(app: Flask, http_client: MagicMock) -> Generator[EnrolmentService, None, None]:
     with app.app_context():
-        yield EnrolmentService()
+        yield EnrolmentService(client=http_client)
 
 
-@patch("webapp.services.enrolments.services.httpx.post")
 @patch("webapp.services.enrolments.services.raise_for_status")
 def test_create_enrolment(
         mock_raise: MagicMock,
-        mock_post: MagicMock,
         service: EnrolmentService,
-        app: Flask
+        app: Flask,
+        http_client: MagicMock
 ) -> None:
     dto = CreateEnrolmentDTO(
         course_id=1,
         user_id="123"
     )
     mock_raise.return_value.status_code = 201
-    mock_post.return_value.json.return_value = {
+    http_client.post.return_value.json.return_value = {
         "id":1,
         "user_id": "123",
         "course_id":1,
@@ -46,16 +51,15 @@ def test_create_enrolment(
     with app.app_context():
         service.create_enrolment_for_user(dto)
 
-    mock_post.assert_called_once()
-    sent_payload = mock_post.call_args.kwargs["json"]
+    http_client.post.assert_called_once()
+    sent_payload = http_client.post.call_args.kwargs["json"]
     assert sent_payload["course_id"] == 1
     assert sent_payload["user_id"] == "123"
 
-@patch("webapp.services.enrolments.services.httpx.patch")
 @patch("webapp.services.enrolments.services.raise_for_status")
-def test_set_paid(mock_raise: MagicMock, mock_patch: MagicMock, service: EnrolmentService, app: Flask) -> None:
+def test_set_paid(mock_raise: MagicMock, service: EnrolmentService, app: Flask, http_client: MagicMock) -> None:
     dto = EnrolmentIdDTO(1)
-    mock_patch.return_value.json.return_value = {
+    http_client.patch.return_value.json.return_value = {
         "id": 1,
         "user_id": "123",
         "course_id": 1,
@@ -67,14 +71,13 @@ def test_set_paid(mock_raise: MagicMock, mock_patch: MagicMock, service: Enrolme
     with app.app_context():
         service.set_paid(dto)
 
-    mock_patch.assert_called_once()
-    sent_payload = mock_patch.call_args.kwargs["json"]
+    http_client.patch.assert_called_once()
+    sent_payload = http_client.patch.call_args.kwargs["json"]
     assert sent_payload["enrolment_id"] == 1
 
-@patch("webapp.services.enrolments.services.httpx.patch")
 @patch("webapp.services.enrolments.services.raise_for_status")
-def test_expired_courses(mock_raise: MagicMock, mock_patch: MagicMock, service: EnrolmentService, app: Flask) -> None:
-    mock_patch.return_value.json.return_value = {
+def test_expired_courses(mock_raise: MagicMock, service: EnrolmentService, app: Flask, http_client: MagicMock) -> None:
+    http_client.patch.return_value.json.return_value = {
         "enrolments":[{
             "id": 1,
             "user_id": "123",
@@ -88,16 +91,15 @@ def test_expired_courses(mock_raise: MagicMock, mock_patch: MagicMock, service:
     with app.app_context():
         result = service.expired_courses()
 
-    mock_patch.assert_called_once()
+    http_client.patch.assert_called_once()
     mock_raise.assert_called_once()
     assert len(result) == 1
     assert result[0].payment_status == "paid"
 
-@patch("webapp.services.enrolments.services.httpx.get")
 @patch("webapp.services.enrolments.services.raise_for_status")
-def test_get_by_id(mock_raise: MagicMock, mock_get: MagicMock, service: EnrolmentService, app: Flask) -> None:
+def test_get_by_id(mock_raise: MagicMock, service: EnrolmentService, app: Flask, http_client: MagicMock) -> None:
     dto = EnrolmentIdDTO(1)
-    mock_get.return_value.json.return_value = {
+    http_client.get.return_value.json.return_value = {
             "id": 1,
             "user_id": "123",
             "course_id": 1,
@@ -107,19 +109,18 @@ def test_get_by_id(mock_raise: MagicMock, mock_get: MagicMock, service: Enrolmen
     mock_raise.return_value.status_code = 200
     with app.app_context():
         result = service.get_by_id(dto)
-    mock_get.assert_called_once()
+    http_client.get.assert_called_once()
     mock_raise.assert_called_once()
 
     assert result.user_id == "123"
 
-@patch("webapp.services.enrolments.services.httpx.get")
 @patch("webapp.services.enrolments.services.raise_for_status")
-def test_get_by_id_and_user(mock_raise: MagicMock, mock_get: MagicMock, service: EnrolmentService, app: Flask) -> None:
+def test_get_by_id_and_user(mock_raise: MagicMock, service: EnrolmentService, app: Flask, http_client: MagicMock) -> None:
     dto = EnrolmentByUserDTO(
         enrolment_id=1,
         user_id="123"
     )
-    mock_get.return_value.json.return_value = {"id": 1,
+    http_client.get.return_value.json.return_value = {"id": 1,
             "user_id": "123",
             "course_id": 1,
             "status": "complete",
@@ -128,19 +129,16 @@ def test_get_by_id_and_user(mock_raise: MagicMock, mock_get: MagicMock, service:
     mock_raise.return_value.status_code = 200
     with app.app_context():
         result = service.get_by_id_and_user(dto)
-    mock_get.assert_called_once_with(
-        "http://localhost:enrolment-service-webapp/1/details",
-        params={"user_id": dto.user_id},
-        timeout=5
-    )
+    http_client.get.assert_called_once_with(
+        "/1/details",
+        params={"user_id": dto.user_id})
     mock_raise.assert_called_once()
 
     assert result.user_id == "123"
 
-@patch("webapp.services.enrolments.services.httpx.get")
 @patch("webapp.services.enrolments.services.raise_for_status")
-def test_get_active(mock_raise: MagicMock, mock_get: MagicMock, service: EnrolmentService, app: Flask) -> None:
-    mock_get.return_value.json.return_value = {
+def test_get_active(mock_raise: MagicMock, service: EnrolmentService, app: Flask, http_client: MagicMock) -> None:
+    http_client.get.return_value.json.return_value = {
         "enrolments": [{"id": 1,
         "user_id": "123",
         "course_id": 1,
@@ -152,22 +150,46 @@ def test_get_active(mock_raise: MagicMock, mock_get: MagicMock, service: Enrolme
     with app.app_context():
         result = service.get_active()
 
-    mock_get.assert_called_once_with("http://localhost:enrolment-service-webapp/active", timeout=5)
+    http_client.get.assert_called_once_with("/active")
     mock_raise.assert_called_once()
 
     assert len(result) == 1
     assert result[0].user_id == "123"
 
-@patch("webapp.services.enrolments.services.httpx.delete")
 @patch("webapp.services.enrolments.services.raise_for_status")
-def test_delete_by_id(mock_raise: MagicMock, mock_del: MagicMock, service: EnrolmentService, app: Flask) -> None:
+def test_get_by_user(mock_raise: MagicMock, service: EnrolmentService, app: Flask, http_client: MagicMock) -> None:
+    http_client.get.return_value.json.return_value = {
+        "enrolments": [{
+            "id": 1,
+            "user_id": "123",
+            "course_id": 1,
+            "status": "active",
+            "payment_status": "paid"
+        }]
+    }
+    with app.app_context():
+        result = service.get_by_user(EnrolmentUserIdDTO(user_id="123"))
+
+    http_client.get.assert_called_once_with("/user", params={"user_id": "123"})
+    mock_raise.assert_called_once()
+    assert result[0].course_id == 1
+
+def test_stream_active_not_found(service: EnrolmentService, http_client: MagicMock) -> None:
+    response = httpx.Response(404, json={"message": "Enrolments not found"})
+    http_client.stream.return_value = response
+
+    with pytest.raises(NotFoundException, match="Enrolments not found"):
+        service.stream_active()
+
+@patch("webapp.services.enrolments.services.raise_for_status")
+def test_delete_by_id(mock_raise: MagicMock, service: EnrolmentService, app: Flask, http_client: MagicMock) -> None:
     dto = DeleteEnrolmentDTO(enrolment_id=1)
-    mock_del.return_value.json.return_value = {"uid": 1}
+    http_client.delete.return_value.json.return_value = {"uid": 1}
     mock_raise.return_value.status_code = 204
 
     with app.app_context():
         service.delete_by_id(dto)
-    mock_del.assert_called_once_with("http://localhost:enrolment-service-webapp/1", timeout=5)
+    http_client.delete.assert_called_once_with("/1")
     mock_raise.assert_called_once()
 
 
@@ -0,0 +1,118 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from typing import Callable, Iterator
+from unittest.mock import patch, MagicMock
+from flask.testing import FlaskClient
+from webapp.services.cache import TTLCache
+from webapp.services.circuit_breaker import CircuitBreaker, RetryBudget
+from webapp.services.downstream import DownstreamClient
+from webapp.services.health.dtos import DependencyHealthDTO, HealthDTO, HealthStatus
+from webapp.services.health.services import HealthService
+from webapp.services.single_flight import SingleFlight
+import httpx
+import pytest
+
+
+def make_client(name: str, handler: Callable[[httpx.Request], httpx.Response]) -> DownstreamClient:
+    return DownstreamClient(
+        name,
+        client=httpx.Client(base_url=f"http://{name}/api/{name}", transport=httpx.MockTransport(handler)),
+        single_flight=SingleFlight(),
+        circuit_breaker=CircuitBreaker(
+            name,
+            failure_rate_threshold=0.5,
+            minimum_calls=10,
+            window_size=10,
+            open_seconds=30,
+            half_open_max_calls=1,
+            retry_budget=RetryBudget(ratio=0.1, max_tokens=10)
+        )
+    )
+
+
+@pytest.fixture
+def executor() -> Iterator[ThreadPoolExecutor]:
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        yield executor
+
+
+def test_probes_services_concurrently_and_reports_each(executor: ThreadPoolExecutor) -> None:
+    barrier = Barrier(3, timeout=5)
+    paths = []
+
+    def healthy(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        barrier.wait()
+        return httpx.Response(200, json={"status": "ok", "database": "ok"})
+
+    def failing(request: httpx.Request) -> httpx.Response:
+        barrier.wait()
+        return httpx.Response(503, json={"status": "error", "database": "down"})
+
+    service = HealthService(
+        clients=[make_client("users", healthy), make_client("courses", healthy), make_client("enrolments", failing)],
+        executor=executor,
+        cache=TTLCache(max_size=1, ttl=60),
+        timeout=1
+    )
+
+    health = service.check()
+
+    assert health.status == HealthStatus.DOWN
+    assert sorted(paths) == ["/api/courses/health", "/api/users/health"]
+    users, _, enrolments = health.dependencies
+    assert users.name == "users"
+    assert users.status == HealthStatus.OK
+    assert users.circuit == "closed"
+    assert users.latency_ms >= 0
+    assert enrolments.status == HealthStatus.DOWN
+    assert enrolments.details == {"status": "error", "database": "down"}
+
+
+def test_result_is_cached(executor: ThreadPoolExecutor) -> None:
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        return httpx.Response(200, json={"status": "ok"})
+
+    service = HealthService([make_client("users", handler)], executor, TTLCache(max_size=1, ttl=60), timeout=1)
+
+    assert service.check() is service.check()
+    assert service.check().status == HealthStatus.OK
+    assert len(calls) == 1
+
+
+def test_unreachable_service_is_down(executor: ThreadPoolExecutor) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    service = HealthService([make_client("users", handler)], executor, TTLCache(max_size=1, ttl=60), timeout=1)
+
+    dependency = service.check().dependencies[0]
+    assert dependency.status == HealthStatus.DOWN
+    assert dependency.details == {}
+
+
+@pytest.mark.parametrize("status, status_code", [(HealthStatus.OK, 200), (HealthStatus.DOWN, 503)])
+@patch("webapp.services.health.services.HealthService.check")
+def test_health_route(mock_check: MagicMock, client: FlaskClient, status: HealthStatus, status_code: int) -> None:
+    mock_check.return_value = HealthDTO(
+        status=status,
+        checked_at=0,
+        dependencies=[DependencyHealthDTO("users", status, 1.5, "closed", {"database": "ok"})]
+    )
+
+    response = client.get("/api/health")
+
+    assert response.status_code == status_code
+    data = response.get_json()
+    assert data["status"] == ("ok" if status == HealthStatus.OK else "error")
+    assert data["gateway"] == "ok"
+    assert data["checked_at"] == "1970-01-01T00:00:00Z"
+    assert data["dependencies"]["users"] == {
+        "status": status.value,
+        "latency_ms": 1.5,
+        "circuit": "closed",
+        "details": {"database": "ok"}
+    }
@@ -0,0 +1,214 @@
+from datetime import datetime, timezone, timedelta
+from typing import Callable
+from unittest.mock import patch, MagicMock
+from flask import Flask
+from flask.testing import FlaskClient
+from flask_jwt_extended import create_access_token, create_refresh_token
+from webapp.services.cache import TTLCache
+from webapp.services.circuit_breaker import CircuitBreaker, RetryBudget
+from webapp.services.downstream import DownstreamClient
+from webapp.services.revocation.dtos import RevokeTokenDTO
+from webapp.services.revocation.services import RevocationService, init_revocation_service
+from webapp.services.single_flight import SingleFlight
+import httpx
+import json
+
+SYNCED_AT = "2026-01-01T12:00:00+00:00"
+
+
+def make_service(handler: Callable[[httpx.Request], httpx.Response]) -> RevocationService:
+    client = DownstreamClient(
+        "users",
+        client=httpx.Client(base_url="http://users/api/users", transport=httpx.MockTransport(handler)),
+        single_flight=SingleFlight(),
+        circuit_breaker=CircuitBreaker(
+            "users",
+            failure_rate_threshold=1,
+            minimum_calls=10,
+            window_size=10,
+            open_seconds=30,
+            half_open_max_calls=1,
+            retry_budget=RetryBudget(ratio=0.1, max_tokens=0)
+        )
+    )
+    return RevocationService(
+        client,
+        cache=TTLCache(max_size=100, ttl=60),
+        capacity=1000,
+        false_positive_rate=0.01,
+        sync_interval=60,
+        rebuild_interval=3600
+    )
+
+
+def denylist(revoked: set[str], requests: list[httpx.Request]) -> Callable[[httpx.Request], httpx.Response]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path == "/api/users/revoked-tokens/jti":
+            jti = request.url.params["jti"]
+            if jti not in revoked:
+                return httpx.Response(404, json={"message": "Token is not revoked", "error": "not_found"})
+            return httpx.Response(200, json={"jti": jti})
+        if request.method == "POST":
+            revoked.add(json.loads(request.content)["jti"])
+            return httpx.Response(201, json={})
+        tokens = [{"jti": jti, "expires_at": SYNCED_AT, "revoked_at": SYNCED_AT} for jti in sorted(revoked)]
+        return httpx.Response(200, json={"tokens": tokens, "synced_at": SYNCED_AT})
+
+    return handler
+
+
+def test_tokens_missing_from_filter_are_not_looked_up() -> None:
+    requests: list[httpx.Request] = []
+    service = make_service(denylist({"revoked"}, requests))
+    service.sync()
+    requests.clear()
+
+    assert not any(service.is_revoked(f"jti-{i}") for i in range(50))
+    assert len(requests) == service.stats().lookups
+
+
+def test_synced_tokens_are_confirmed_once_and_cached() -> None:
+    requests: list[httpx.Request] = []
+    service = make_service(denylist({"revoked"}, requests))
+    service.sync()
+
+    assert service.is_revoked("revoked")
+    assert service.is_revoked("revoked")
+    assert [request.url.path for request in requests].count("/api/users/revoked-tokens/jti") == 1
+    assert service.stats().tokens == 1
+
+
+def test_incremental_sync_requests_tokens_since_last_sync() -> None:
+    revoked = {"first"}
+    requests: list[httpx.Request] = []
+    service = make_service(denylist(revoked, requests))
+    service.sync()
+    revoked.add("second")
+
+    service.sync()
+
+    assert "since" not in requests[0].url.params
+    assert requests[1].url.params["since"] == "2026-01-01T11:59:55+00:00"
+    assert service.is_revoked("second")
+    assert service.stats().synced_at == datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+
+
+def test_false_positive_is_counted_and_cached() -> None:
+    requests: list[httpx.Request] = []
+    service = make_service(denylist(set(), requests))
+    service.sync()
+    service._filter.add("not-revoked")
+    requests.clear()
+
+    assert not service.is_revoked("not-revoked")
+    assert not service.is_revoked("not-revoked")
+    assert service.stats().false_positives == 1
+    assert len(requests) == 1
+
+
+def test_tokens_are_looked_up_until_first_sync() -> None:
+    requests: list[httpx.Request] = []
+    service = make_service(denylist({"revoked"}, requests))
+
+    assert service.is_revoked("revoked")
+    assert not service.is_revoked("not-revoked")
+    assert len(requests) == 2
+    assert service.stats().false_positives == 0
+
+
+def test_sync_drops_cached_answer_for_tokens_revoked_elsewhere() -> None:
+    revoked: set[str] = set()
+    requests: list[httpx.Request] = []
+    service = make_service(denylist(revoked, requests))
+
+    assert not service.is_revoked("jti")
+    revoked.add("jti")
+    service.sync()
+
+    assert service.is_revoked("jti")
+
+
+def test_unreachable_denylist_rejects_tokens_until_first_sync() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    assert make_service(handler).is_revoked("unknown")
+
+
+def test_sync_is_not_started_for_testing_app() -> None:
+    app = Flask(__name__)
+    app.config.update({"TESTING": True})
+
+    with app.app_context():
+        resource = init_revocation_service(
+            MagicMock(spec=DownstreamClient), TTLCache(max_size=10, ttl=60), 1000, 0.01, 60, 3600
+        )
+        service = next(resource)
+        assert service._thread is None
+        resource.close()
+
+
+def test_failed_lookup_is_treated_as_revoked() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    service = make_service(handler)
+    service._filter.add("unknown")
+
+    assert service.is_revoked("unknown")
+
+
+def test_revoke_stores_token_and_updates_filter() -> None:
+    revoked: set[str] = set()
+    requests: list[httpx.Request] = []
+    service = make_service(denylist(revoked, requests))
+    expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+
+    service.revoke(RevokeTokenDTO(jti="logged-out", expires_at=expires_at))
+
+    assert revoked == {"logged-out"}
+    assert json.loads(requests[0].content) == {"jti": "logged-out", "expires_at": expires_at.isoformat()}
+    assert service.is_revoked("logged-out")
+    assert len(requests) == 1
+
+
+def test_tokens_revoked_during_rebuild_are_kept() -> None:
+    requests: list[httpx.Request] = []
+    handler = denylist(set(), requests)
+    service: RevocationService
+
+    def revoking_handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET" and request.url.path == "/api/users/revoked-tokens/":
+            service._filter.add("during-sync")
+            service._revoked_during_sync.append("during-sync")  # type: ignore[union-attr]
+        return handler(request)
+
+    service = make_service(revoking_handler)
+    service.sync()
+
+    assert service._filter.might_contain("during-sync")
+
+
+@patch("webapp.services.revocation.services.RevocationService.revoke")
+def test_logout_revokes_presented_tokens(mock_revoke: MagicMock, app: Flask, client: FlaskClient) -> None:
+    with app.app_context():
+        access_token = create_access_token(identity="user123")
+        refresh_token = create_refresh_token(identity="user123")
+    client.set_cookie(app.config["JWT_REFRESH_COOKIE_NAME"], refresh_token)
+
+    response = client.post("/api/auth/logout", headers={"Authorization": f"Bearer {access_token}"})
+
+    assert response.status_code == 200
+    revoked = [call.args[0] for call in mock_revoke.call_args_list]
+    assert len(revoked) == 2
+    assert len({dto.jti for dto in revoked}) == 2
+    assert all(dto.expires_at > datetime.now(timezone.utc) for dto in revoked)
+
+
+@patch("webapp.services.revocation.services.RevocationService.is_revoked", return_value=True)
+def test_revoked_token_is_rejected(mock_is_revoked: MagicMock, client: FlaskClient, user_headers: dict[str, str]) -> None:
+    response = client.get("/api/protected/user-only", headers=user_headers)
+
+    assert response.status_code == 401
+    mock_is_revoked.assert_called_once()
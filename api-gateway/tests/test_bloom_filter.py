@@ -0,0 +1,29 @@
+from webapp.services.bloom_filter import BloomFilter
+
+
+def test_added_items_are_always_found() -> None:
+    bloom_filter = BloomFilter(capacity=1000, false_positive_rate=0.01)
+    items = [f"jti-{i}" for i in range(1000)]
+    for item in items:
+        bloom_filter.add(item)
+
+    assert all(bloom_filter.might_contain(item) for item in items)
+    assert bloom_filter.count == 1000
+
+
+def test_false_positive_rate_stays_near_target_at_capacity() -> None:
+    bloom_filter = BloomFilter(capacity=1000, false_positive_rate=0.01)
+    for i in range(1000):
+        bloom_filter.add(f"jti-{i}")
+
+    false_positives = sum(bloom_filter.might_contain(f"other-{i}") for i in range(10000))
+
+    assert false_positives < 300
+
+
+def test_sizing() -> None:
+    bloom_filter = BloomFilter(capacity=100000, false_positive_rate=0.001)
+
+    assert bloom_filter.size == 1437759
+    assert bloom_filter.hash_count == 10
+    assert not bloom_filter.might_contain("jti")
@@ -0,0 +1,121 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from typing import Callable
+from webapp.metrics import registry
+from webapp.services.bulkhead import Bulkhead
+from webapp.services.circuit_breaker import CircuitBreaker, RetryBudget
+from webapp.services.downstream import DownstreamClient, iter_chunks
+from webapp.services.exceptions import ServiceUnavailableException
+from webapp.services.single_flight import SingleFlight
+import httpx
+import os
+import pytest
+import time
+
+
+def make_client(name: str, handler: Callable[[httpx.Request], httpx.Response], bulkhead: Bulkhead) -> DownstreamClient:
+    return DownstreamClient(
+        name,
+        client=httpx.Client(base_url=f"http://{name}", transport=httpx.MockTransport(handler)),
+        single_flight=SingleFlight(),
+        circuit_breaker=CircuitBreaker(
+            name,
+            failure_rate_threshold=1,
+            minimum_calls=10,
+            window_size=10,
+            open_seconds=30,
+            half_open_max_calls=1,
+            retry_budget=RetryBudget(ratio=0.1, max_tokens=0)
+        ),
+        single_flight_enabled=False,
+        bulkhead=bulkhead
+    )
+
+
+def test_calls_over_capacity_wait_in_queue() -> None:
+    bulkhead = Bulkhead("queue-test", max_concurrent=1, max_queue=1, queue_timeout=1)
+    assert bulkhead.acquire()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        waiting = executor.submit(bulkhead.acquire)
+        while bulkhead.stats().queued == 0:
+            time.sleep(0.001)
+        assert not bulkhead.acquire()
+        bulkhead.release()
+        assert waiting.result()
+
+    stats = bulkhead.stats()
+    assert (stats.active, stats.queued, stats.rejected) == (1, 0, 1)
+
+
+def test_queued_call_gives_up_after_timeout() -> None:
+    bulkhead = Bulkhead("timeout-test", max_concurrent=1, max_queue=5, queue_timeout=1)
+    assert bulkhead.acquire()
+
+    started = time.perf_counter()
+    assert not bulkhead.acquire(timeout=0.05)
+    assert 0.05 <= time.perf_counter() - started < 0.5
+    assert bulkhead.stats().rejected == 1
+
+
+def test_stalled_service_does_not_starve_other_services() -> None:
+    release = Event()
+
+    def stalled(request: httpx.Request) -> httpx.Response:
+        release.wait(5)
+        return httpx.Response(200, json={})
+
+    enrolments = make_client("bulkhead-enrolments", stalled, Bulkhead("bulkhead-enrolments", 2, 0, 0.01))
+    users = make_client("bulkhead-users", lambda _: httpx.Response(200, json={"id": 1}), Bulkhead("bulkhead-users", 2, 0, 0.01))
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        calls = [executor.submit(enrolments.get, "/expired") for _ in range(2)]
+        while enrolments.bulkhead_stats().active < 2:  # type: ignore[union-attr]
+            time.sleep(0.001)
+
+        with pytest.raises(ServiceUnavailableException, match="busy"):
+            enrolments.get("/expired")
+        assert users.get("/1").json() == {"id": 1}
+
+        assert f'upstream_bulkhead_active{{worker="{os.getpid()}",service="bulkhead-enrolments"}} 2' in registry.render()
+        release.set()
+        assert all(call.result().status_code == 200 for call in calls)
+
+    assert enrolments.bulkhead_stats().active == 0  # type: ignore[union-attr]
+    assert enrolments.bulkhead_stats().rejected == 1  # type: ignore[union-attr]
+    assert enrolments.circuit_breaker.stats().rejected == 0
+
+
+def test_slot_is_released_when_the_service_is_unreachable() -> None:
+    def refused(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    client = make_client("bulkhead-refused", refused, Bulkhead("bulkhead-refused", 1, 0, 0.01))
+
+    for _ in range(2):
+        with pytest.raises(ServiceUnavailableException, match="unavailable"):
+            client.post("/", json={})
+    assert client.bulkhead_stats().active == 0  # type: ignore[union-attr]
+
+
+def test_streamed_call_holds_its_slot_until_the_response_is_closed() -> None:
+    client = make_client(
+        "bulkhead-stream",
+        lambda _: httpx.Response(200, stream=httpx.ByteStream(b'{"id":1}\n')),
+        Bulkhead("bulkhead-stream", 1, 0, 0.01)
+    )
+
+    response = client.stream("/active")
+    assert client.bulkhead_stats().active == 1  # type: ignore[union-attr]
+    with pytest.raises(ServiceUnavailableException, match="busy"):
+        client.stream("/active")
+
+    assert b"".join(iter_chunks(response)) == b'{"id":1}\n'
+    assert client.bulkhead_stats().active == 0  # type: ignore[union-attr]
+
+
+def test_streamed_error_response_releases_its_slot() -> None:
+    client = make_client("bulkhead-stream-error", lambda _: httpx.Response(404, json={}), Bulkhead("bulkhead-stream-error", 1, 0, 0.01))
+
+    assert client.stream("/active").status_code == 404
+    assert client.bulkhead_stats().active == 0  # type: ignore[union-attr]
@@ -0,0 +1,81 @@
+from webapp.services.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_hit_and_miss_counters() -> None:
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=10)
+
+    assert cache.get("a") is None
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+def test_cache_ttl_expiry() -> None:
+    clock = FakeClock()
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=10, clock=clock)
+    cache.set("a", 1)
+
+    clock.now = 9.9
+    assert cache.get("a") == 1
+
+    clock.now = 10
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+def test_cache_lru_eviction() -> None:
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+def test_cache_invalidation() -> None:
+    cache: TTLCache[str, int] = TTLCache(max_size=5, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+
+    cache.invalidate("a")
+    cache.invalidate_where(lambda value: value > 2)
+
+    assert cache.get("a") is None
+    assert cache.get("c") is None
+    assert cache.get("b") == 2
+
+    cache.clear()
+    assert len(cache) == 0
+
+def test_cache_disabled_with_zero_size() -> None:
+    cache: TTLCache[str, int] = TTLCache(max_size=0, ttl=10)
+    cache.set("a", 1)
+
+    assert cache.get("a") is None
+
+def test_cache_keeps_expired_entries_with_etag_for_revalidation() -> None:
+    clock = FakeClock()
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=10, clock=clock)
+    cache.set("a", 1, etag='"v1"')
+    cache.set("b", 2)
+
+    clock.now = 10
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+    assert cache.get_stale("a") == (1, '"v1"')
+    assert cache.get_stale("b") is None
+    assert len(cache) == 1
+
+    cache.touch("a")
+    assert cache.get("a") == 1
@@ -0,0 +1,94 @@
+from webapp.services.circuit_breaker import CircuitBreaker, CircuitState, RetryBudget
+from webapp.services.exceptions import ServiceUnavailableException
+import pytest
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+@pytest.fixture
+def breaker(clock: FakeClock) -> CircuitBreaker:
+    return CircuitBreaker(
+        "enrolments",
+        failure_rate_threshold=0.5,
+        minimum_calls=4,
+        window_size=10,
+        open_seconds=30,
+        half_open_max_calls=1,
+        retry_budget=RetryBudget(ratio=0.5, max_tokens=2),
+        clock=clock
+    )
+
+def test_circuit_opens_at_failure_rate(breaker: CircuitBreaker) -> None:
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+
+    with pytest.raises(ServiceUnavailableException):
+        breaker.before_call()
+    assert breaker.stats().rejected == 1
+
+def test_circuit_half_open_success_closes(breaker: CircuitBreaker, clock: FakeClock) -> None:
+    for _ in range(4):
+        breaker.record_failure()
+
+    clock.now = 30
+    assert breaker.state == CircuitState.HALF_OPEN
+
+    breaker.before_call()
+    with pytest.raises(ServiceUnavailableException):
+        breaker.before_call()
+
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.stats().failure_rate == 0.0
+
+def test_circuit_half_open_failure_reopens(breaker: CircuitBreaker, clock: FakeClock) -> None:
+    for _ in range(4):
+        breaker.record_failure()
+
+    clock.now = 30
+    breaker.before_call()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.OPEN
+    clock.now = 59
+    assert breaker.state == CircuitState.OPEN
+
+def test_circuit_half_open_released_trial_frees_its_slot(breaker: CircuitBreaker, clock: FakeClock) -> None:
+    for _ in range(4):
+        breaker.record_failure()
+
+    clock.now = 30
+    breaker.before_call()
+    breaker.release()
+
+    assert breaker.state == CircuitState.HALF_OPEN
+    breaker.before_call()
+    with pytest.raises(ServiceUnavailableException):
+        breaker.before_call()
+
+def test_retry_budget() -> None:
+    budget = RetryBudget(ratio=0.5, max_tokens=1)
+
+    assert budget.withdraw() is True
+    assert budget.withdraw() is False
+
+    budget.deposit()
+    budget.deposit()
+    budget.deposit()
+    assert budget.tokens == 1
+    assert budget.withdraw() is True
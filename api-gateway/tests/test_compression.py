@@ -0,0 +1,93 @@
+from flask import Flask, Response, jsonify, request
+from flask.typing import ResponseReturnValue
+from webapp.compression import init_compression
+import gzip
+import pytest
+
+
+@pytest.fixture
+def app() -> Flask:
+    app = Flask(__name__)
+    app.config.update({
+        "COMPRESSION_ENABLED": True,
+        "COMPRESSION_ENCODINGS": ["zstd", "br", "gzip"],
+        "COMPRESSION_MIN_SIZE": 1024,
+        "COMPRESSION_GZIP_LEVEL": 5,
+        "COMPRESSION_BR_LEVEL": 4,
+        "COMPRESSION_ZSTD_LEVEL": 3,
+    })
+    init_compression(app)
+
+    items = [{"id": i, "title": f"Course {i}", "description": "Distributed systems in practice"} for i in range(50)]
+
+    @app.get("/items")
+    def list_items() -> ResponseReturnValue:
+        response = jsonify(items)
+        response.set_etag("abc")
+        return response.make_conditional(request)
+
+    @app.get("/small")
+    def small() -> Response:
+        return jsonify({"id": 1})
+
+    @app.get("/image")
+    def image() -> Response:
+        return Response(b"\x89PNG" + bytes(4096), mimetype="image/png")
+
+    @app.get("/stream")
+    def stream() -> Response:
+        return Response((b"x" * 2048 for _ in range(2)), mimetype="application/x-ndjson")
+
+    return app
+
+
+def test_compresses_large_response_with_gzip(app: Flask) -> None:
+    response = app.test_client().get("/items", headers={"Accept-Encoding": "gzip, deflate"})
+
+    body = response.get_data()
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Content-Length"] == str(len(body))
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert response.headers["ETag"] == 'W/"abc"'
+    assert len(gzip.decompress(body)) > len(body)
+
+
+def test_compressed_response_matches_weak_if_none_match(app: Flask) -> None:
+    client = app.test_client()
+    etag = client.get("/items", headers={"Accept-Encoding": "gzip"}).headers["ETag"]
+
+    response = client.get("/items", headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert "Content-Encoding" not in response.headers
+
+
+def test_identity_without_accept_encoding(app: Flask) -> None:
+    response = app.test_client().get("/items")
+
+    assert "Content-Encoding" not in response.headers
+    assert response.headers["ETag"] == '"abc"'
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert response.get_json()[0]["id"] == 0
+
+
+def test_refused_encoding_is_not_used(app: Flask) -> None:
+    response = app.test_client().get("/items", headers={"Accept-Encoding": "gzip;q=0, identity"})
+
+    assert "Content-Encoding" not in response.headers
+
+
+@pytest.mark.parametrize("path", ["/small", "/image", "/stream"])
+def test_skips_small_compressed_and_streamed_responses(app: Flask, path: str) -> None:
+    response = app.test_client().get(path, headers={"Accept-Encoding": "gzip"})
+
+    assert "Content-Encoding" not in response.headers
+
+
+def test_disabled_compression_registers_nothing() -> None:
+    app = Flask(__name__)
+    app.config["COMPRESSION_ENABLED"] = False
+    init_compression(app)
+
+    assert "compression" not in app.extensions
+    assert not app.after_request_funcs
@@ -0,0 +1,136 @@
+from concurrent.futures import ThreadPoolExecutor
+from flask import Flask, jsonify
+from flask.typing import ResponseReturnValue
+from webapp import deadline
+from webapp.api.error_handlers import register_error_handlers
+from webapp.services.circuit_breaker import CircuitBreaker, RetryBudget
+from webapp.services.downstream import DownstreamClient
+from webapp.services.exceptions import DeadlineExceededException, raise_for_status
+from webapp.services.single_flight import SingleFlight
+import httpx
+import math
+import pytest
+import time
+
+
+def make_client(handler: httpx.MockTransport) -> DownstreamClient:
+    return DownstreamClient(
+        "deadline-test",
+        client=httpx.Client(base_url="http://courses", transport=handler, timeout=httpx.Timeout(5, connect=2)),
+        single_flight=SingleFlight(),
+        circuit_breaker=CircuitBreaker(
+            "deadline-test",
+            failure_rate_threshold=1,
+            minimum_calls=10,
+            window_size=10,
+            open_seconds=30,
+            half_open_max_calls=1,
+            retry_budget=RetryBudget(ratio=0.1, max_tokens=10)
+        ),
+        max_retries=2
+    )
+
+
+@pytest.fixture
+def sent() -> list[httpx.Request]:
+    return []
+
+
+@pytest.fixture
+def app(sent: list[httpx.Request]) -> Flask:
+    app = Flask(__name__)
+    app.config["REQUEST_DEADLINE"] = 1.0
+    deadline.init_deadline(app)
+    register_error_handlers(app)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return httpx.Response(200, json={"id": 1})
+
+    client = make_client(httpx.MockTransport(handler))
+
+    @app.get("/courses")
+    def courses() -> ResponseReturnValue:
+        return jsonify(client.get("/1").json())
+
+    @app.get("/fanout")
+    def fanout() -> ResponseReturnValue:
+        def budget(_: int) -> float | None:
+            return deadline.remaining()
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            budgets = list(executor.map(deadline.bind(budget), range(2)))
+        return jsonify(budgets)
+
+    return app
+
+
+def test_downstream_calls_carry_deadline_and_capped_timeout(app: Flask, sent: list[httpx.Request]) -> None:
+    started = time.time()
+
+    response = app.test_client().get("/courses")
+
+    assert response.status_code == 200
+    propagated = float(sent[0].headers[deadline.DEADLINE_HEADER])
+    assert started < propagated <= time.time() + 1.0
+    timeout = sent[0].extensions["timeout"]
+    assert 0 < timeout["read"] <= 1.0
+    assert timeout["connect"] <= 1.0
+
+
+def test_earlier_client_deadline_is_honoured(app: Flask, sent: list[httpx.Request]) -> None:
+    requested = math.floor((time.time() + 0.5) * 1000) / 1000
+
+    app.test_client().get("/courses", headers={deadline.DEADLINE_HEADER: f"{requested:.3f}"})
+
+    assert sent[0].headers[deadline.DEADLINE_HEADER] == f"{requested:.3f}"
+    assert sent[0].extensions["timeout"]["read"] <= 0.5
+
+
+def test_expired_deadline_is_rejected_before_any_call(app: Flask, sent: list[httpx.Request]) -> None:
+    response = app.test_client().get("/courses", headers={deadline.DEADLINE_HEADER: f"{time.time() - 1:.3f}"})
+
+    assert response.status_code == 504
+    assert response.get_json()["error"] == "deadline_exceeded"
+    assert sent == []
+
+
+def test_malformed_deadline_header_is_ignored(app: Flask) -> None:
+    response = app.test_client().get("/courses", headers={deadline.DEADLINE_HEADER: "soon"})
+
+    assert response.status_code == 200
+
+
+def test_bind_carries_deadline_into_executor_threads(app: Flask) -> None:
+    budgets = app.test_client().get("/fanout").get_json()
+
+    assert all(0 < budget <= 1.0 for budget in budgets)
+
+
+def test_no_deadline_outside_requests() -> None:
+    assert deadline.remaining() is None
+    assert deadline.timeout(5) == 5
+    assert deadline.inject({"a": "b"}) == {"a": "b"}
+
+
+def test_timeout_of_a_call_that_outlives_the_deadline_is_reported_as_deadline_exceeded() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        time.sleep(0.06)
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    client = make_client(httpx.MockTransport(handler))
+    token = deadline._deadline.set(time.time() + 0.05)
+    try:
+        expired = deadline.bind(lambda: client.get("/1"))
+    finally:
+        deadline._deadline.reset(token)
+
+    with pytest.raises(DeadlineExceededException):
+        expired()
+
+
+def test_raise_for_status_maps_downstream_deadline_exceeded() -> None:
+    response = httpx.Response(504, json={"message": "Request deadline exceeded", "error": "deadline_exceeded"})
+
+    with pytest.raises(DeadlineExceededException):
+        raise_for_status(response)
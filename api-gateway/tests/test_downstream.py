@@ -0,0 +1,275 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from typing import Callable
+from flask import Flask
+from flask.typing import ResponseReturnValue
+from unittest.mock import MagicMock
+from webapp import deadline
+from webapp.api.streaming import ndjson_response
+from webapp.services.circuit_breaker import CircuitBreaker, CircuitState, RetryBudget
+from webapp.services.downstream import DownstreamClient, NDJSON_MIMETYPE, iter_chunks
+from webapp.services.exceptions import DeadlineExceededException, ServiceUnavailableException
+from webapp.services.single_flight import SingleFlight
+import httpx
+import pytest
+import time
+
+
+def test_single_flight_coalesces_concurrent_calls() -> None:
+    single_flight: SingleFlight[str] = SingleFlight()
+    release = Event()
+    calls = []
+
+    def fetch() -> str:
+        calls.append(1)
+        release.wait(timeout=5)
+        return "result"
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [executor.submit(single_flight.do, "key", fetch) for _ in range(5)]
+        while single_flight.stats().coalesced < 4:
+            pass
+        release.set()
+        results = [future.result(timeout=5) for future in futures]
+
+    assert results == ["result"] * 5
+    assert len(calls) == 1
+    stats = single_flight.stats()
+    assert stats.executed == 1
+    assert stats.coalesced == 4
+    assert stats.in_flight == 0
+
+def test_single_flight_shares_errors_and_does_not_cache() -> None:
+    single_flight: SingleFlight[str] = SingleFlight()
+
+    def fail() -> str:
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        single_flight.do("key", fail)
+
+    assert single_flight.do("key", lambda: "ok") == "ok"
+    assert single_flight.stats().executed == 2
+
+
+def test_single_flight_follower_gives_up_at_its_own_deadline() -> None:
+    single_flight: SingleFlight[str] = SingleFlight()
+    release = Event()
+
+    def fetch() -> str:
+        release.wait(timeout=5)
+        return "result"
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        leader = executor.submit(single_flight.do, "key", fetch)
+        while single_flight.stats().in_flight < 1:
+            pass
+        token = deadline._deadline.set(time.time() + 0.05)
+        try:
+            with pytest.raises(DeadlineExceededException):
+                single_flight.do("key", fetch)
+        finally:
+            deadline._deadline.reset(token)
+        release.set()
+        assert leader.result(timeout=5) == "result"
+
+
+def test_single_flight_followers_retry_after_leader_deadline() -> None:
+    single_flight: SingleFlight[str] = SingleFlight()
+    release = Event()
+    calls = []
+
+    def fetch() -> str:
+        calls.append(1)
+        if len(calls) == 1:
+            release.wait(timeout=5)
+            raise DeadlineExceededException()
+        return "result"
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(single_flight.do, "key", fetch)
+        while single_flight.stats().in_flight < 1:
+            pass
+        follower = executor.submit(single_flight.do, "key", fetch)
+        while single_flight.stats().coalesced < 1:
+            pass
+        release.set()
+        with pytest.raises(DeadlineExceededException):
+            leader.result(timeout=5)
+        assert follower.result(timeout=5) == "result"
+
+    assert len(calls) == 2
+    assert single_flight.stats().executed == 2
+
+def make_breaker(max_tokens: float = 10, minimum_calls: int = 5) -> CircuitBreaker:
+    return CircuitBreaker(
+        "users",
+        failure_rate_threshold=0.5,
+        minimum_calls=minimum_calls,
+        window_size=10,
+        open_seconds=30,
+        half_open_max_calls=1,
+        retry_budget=RetryBudget(ratio=0.1, max_tokens=max_tokens)
+    )
+
+def make_response(status_code: int) -> MagicMock:
+    response = MagicMock(spec=httpx.Response)
+    response.status_code = status_code
+    return response
+
+def test_downstream_client_coalesces_gets_by_path_and_params() -> None:
+    http_client = MagicMock(spec=httpx.Client)
+    single_flight = MagicMock(spec=SingleFlight)
+    client = DownstreamClient("users", http_client, single_flight, make_breaker())
+
+    client.get("/id", params={"user_id": "1"})
+
+    key = single_flight.do.call_args[0][0]
+    assert key == ("users", "/id", (("user_id", "1"),))
+
+def test_downstream_client_passes_through() -> None:
+    http_client = MagicMock(spec=httpx.Client)
+    http_client.request.return_value = make_response(200)
+    client = DownstreamClient("users", http_client, SingleFlight(), make_breaker(), single_flight_enabled=False)
+
+    client.get("/id", params={"user_id": "1"})
+    client.post("/", json={"a": 1})
+    client.patch("/activation", json={"code": "1"})
+    client.delete("/id", params={"user_id": "1"})
+
+    assert http_client.request.call_args_list == [
+        (("GET", "/id"), {"params": {"user_id": "1"}}),
+        (("POST", "/"), {"json": {"a": 1}}),
+        (("PATCH", "/activation"), {"json": {"code": "1"}}),
+        (("DELETE", "/id"), {"params": {"user_id": "1"}}),
+    ]
+    assert client.stats().executed == 0
+
+def test_downstream_client_retries_idempotent_gets() -> None:
+    http_client = MagicMock(spec=httpx.Client)
+    http_client.request.side_effect = [httpx.ConnectError("refused"), make_response(503), make_response(200)]
+    client = DownstreamClient("users", http_client, SingleFlight(), make_breaker(), max_retries=2)
+
+    response = client.get("/id")
+
+    assert response.status_code == 200
+    assert http_client.request.call_count == 3
+
+def test_downstream_client_does_not_retry_writes() -> None:
+    http_client = MagicMock(spec=httpx.Client)
+    http_client.request.side_effect = httpx.ConnectError("refused")
+    client = DownstreamClient("users", http_client, SingleFlight(), make_breaker(), max_retries=2)
+
+    with pytest.raises(ServiceUnavailableException):
+        client.post("/", json={})
+
+    http_client.request.assert_called_once()
+
+def test_downstream_client_retry_budget_exhausted() -> None:
+    http_client = MagicMock(spec=httpx.Client)
+    http_client.request.return_value = make_response(500)
+    client = DownstreamClient("users", http_client, SingleFlight(), make_breaker(max_tokens=0), max_retries=2)
+
+    response = client.get("/id")
+
+    assert response.status_code == 500
+    http_client.request.assert_called_once()
+
+def test_downstream_client_fails_fast_when_circuit_open() -> None:
+    http_client = MagicMock(spec=httpx.Client)
+    http_client.request.side_effect = httpx.ReadTimeout("timeout")
+    breaker = make_breaker(minimum_calls=2)
+    client = DownstreamClient("users", http_client, SingleFlight(), breaker)
+
+    for _ in range(2):
+        with pytest.raises(ServiceUnavailableException):
+            client.post("/", json={})
+
+    assert breaker.state == CircuitState.OPEN
+    with pytest.raises(ServiceUnavailableException, match="Service users is unavailable"):
+        client.get("/id")
+    assert http_client.request.call_count == 2
+
+@pytest.mark.parametrize("error", [httpx.DecodingError("bad gzip"), DeadlineExceededException()])
+def test_half_open_trial_ending_without_outcome_frees_its_slot(error: Exception) -> None:
+    now = [0.0]
+    breaker = CircuitBreaker(
+        "users",
+        failure_rate_threshold=0.5,
+        minimum_calls=1,
+        window_size=10,
+        open_seconds=30,
+        half_open_max_calls=1,
+        retry_budget=RetryBudget(ratio=0.1, max_tokens=0),
+        clock=lambda: now[0]
+    )
+    breaker.record_failure()
+    now[0] = 30
+    http_client = MagicMock(spec=httpx.Client)
+    http_client.request.side_effect = [error, make_response(200)]
+    client = DownstreamClient("users", http_client, SingleFlight(), breaker, single_flight_enabled=False)
+
+    with pytest.raises(type(error)):
+        client.get("/id")
+
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert client.get("/id").status_code == 200
+    assert breaker.state == CircuitState.CLOSED
+
+def make_stream_client(handler: Callable[[httpx.Request], httpx.Response]) -> DownstreamClient:
+    return DownstreamClient(
+        "enrolments",
+        client=httpx.Client(base_url="http://enrolments", transport=httpx.MockTransport(handler)),
+        single_flight=SingleFlight(),
+        circuit_breaker=make_breaker()
+    )
+
+def test_stream_relays_body_in_chunks() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["Accept"] == NDJSON_MIMETYPE
+        return httpx.Response(200, stream=httpx.ByteStream(b'{"id":1}\n{"id":2}\n'))
+
+    client = make_stream_client(handler)
+    response = client.stream("/active", headers={"Accept": NDJSON_MIMETYPE})
+
+    assert not response.is_closed
+    assert b"".join(iter_chunks(response)) == b'{"id":1}\n{"id":2}\n'
+    assert response.is_closed
+
+def test_stream_is_closed_when_body_is_never_iterated() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, stream=httpx.ByteStream(b'{"id":1}\n'))
+
+    client = make_stream_client(handler)
+    upstream: list[httpx.Response] = []
+    app = Flask(__name__)
+
+    @app.route("/active", methods=["GET", "HEAD"])
+    def active() -> ResponseReturnValue:
+        upstream.append(client.stream("/active"))
+        return ndjson_response(iter_chunks(upstream[-1]))
+
+    response = app.test_client().head("/active")
+    response.close()
+
+    assert response.status_code == 200
+    assert upstream[0].is_closed
+
+def test_stream_reads_error_responses() -> None:
+    client = make_stream_client(lambda request: httpx.Response(404, json={"message": "Not found"}))
+
+    response = client.stream("/active")
+
+    assert response.is_closed
+    assert response.json() == {"message": "Not found"}
+
+def test_stream_transport_error_opens_circuit() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused")
+
+    client = make_stream_client(handler)
+    for _ in range(5):
+        with pytest.raises(ServiceUnavailableException):
+            client.stream("/active")
+
+    assert client.circuit_breaker.state == CircuitState.OPEN
@@ -3,6 +3,7 @@ from webapp import register_error_handlers
 from flask.typing import ResponseReturnValue
 from flask.testing import FlaskClient
 from flask import Flask
+from werkzeug.exceptions import TooManyRequests
 from typing import Generator
 import pytest
 
@@ -28,6 +29,10 @@ def app_with_error_handlers() -> Generator[Flask, None, None]:
     def exception() -> ResponseReturnValue:
         raise ApiException(message="Test",status_code=400, error_code="validation_error", details=["Test"])
 
+    @app.route("/rate-limited")
+    def rate_limited() -> ResponseReturnValue:
+        raise TooManyRequests()
+
     @app.route("/conflict")
     def conflict() -> ResponseReturnValue:
         raise ConflictException(message="Conflict")
@@ -80,28 +85,8 @@ def test_conflict_exception(client: FlaskClient) -> None:
     assert data['error'] == "conflict"
 
 
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
+def test_rate_limited(client: FlaskClient) -> None:
+    response = client.get("/rate-limited")
+    assert response.status_code == 429
+    data = response.get_json()
+    assert data['error'] == "rate_limited"
@@ -82,4 +82,11 @@ def test_raise_for_status_validation_exception() -> None:
 
     result = e.value
 
-    assert result.message == "test_error"
\ No newline at end of file
+    assert result.message == "test_error"
+def test_raise_for_status_success_skips_body() -> None:
+    mock_resp = MagicMock(spec=httpx.Response)
+    mock_resp.status_code = 200
+
+    raise_for_status(mock_resp)
+
+    mock_resp.json.assert_not_called()
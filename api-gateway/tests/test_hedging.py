@@ -0,0 +1,180 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Callable, Iterator
+from webapp.services.bulkhead import Bulkhead
+from webapp.services.circuit_breaker import CircuitBreaker, RetryBudget
+from webapp.services.downstream import DownstreamClient
+from webapp.services.exceptions import ServiceUnavailableException
+from webapp.services.hedging import HedgingPolicy
+from webapp.services.single_flight import SingleFlight
+import httpx
+import pytest
+import time
+
+
+def make_policy(max_tokens: float = 10, latency: float = 0.02) -> HedgingPolicy:
+    policy = HedgingPolicy(
+        percentile=0.95,
+        min_delay=0.01,
+        budget=RetryBudget(ratio=0.05, max_tokens=max_tokens),
+        window_size=100,
+        min_samples=20
+    )
+    for _ in range(20):
+        policy.observe(latency)
+    return policy
+
+
+@pytest.fixture
+def executor() -> Iterator[ThreadPoolExecutor]:
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        yield executor
+
+
+def make_client(
+        handler: Callable[[httpx.Request], httpx.Response],
+        policy: HedgingPolicy,
+        executor: ThreadPoolExecutor,
+        bulkhead: Bulkhead | None = None
+) -> DownstreamClient:
+    return DownstreamClient(
+        "hedging-test",
+        client=httpx.Client(base_url="http://courses", transport=httpx.MockTransport(handler)),
+        single_flight=SingleFlight(),
+        circuit_breaker=CircuitBreaker(
+            "hedging-test",
+            failure_rate_threshold=1,
+            minimum_calls=10,
+            window_size=10,
+            open_seconds=30,
+            half_open_max_calls=1,
+            retry_budget=RetryBudget(ratio=0.1, max_tokens=0)
+        ),
+        hedging=policy,
+        hedging_executor=executor,
+        hedging_enabled=True,
+        bulkhead=bulkhead
+    )
+
+
+def slow_first_attempt(delay: float, error: bool = False) -> Callable[[httpx.Request], httpx.Response]:
+    attempts: list[int] = []
+    lock = Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        with lock:
+            attempts.append(1)
+            attempt = len(attempts)
+        if attempt == 1:
+            time.sleep(delay)
+            return httpx.Response(200, json={"attempt": 1})
+        if error:
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, json={"attempt": attempt})
+
+    return handler
+
+
+def test_policy_waits_for_samples_and_follows_percentile() -> None:
+    policy = HedgingPolicy(percentile=0.9, min_delay=0.001, budget=RetryBudget(0.05, 10), min_samples=10)
+    for latency in range(1, 10):
+        policy.observe(latency / 100)
+    assert policy.delay() is None
+
+    policy.observe(0.10)
+    assert policy.delay() == pytest.approx(0.09)
+
+    policy.observe(0.0)
+    policy.min_delay = 1.0
+    policy.observe(0.0)
+    assert policy.delay() == 1.0
+
+
+def test_budget_caps_hedges() -> None:
+    policy = make_policy(max_tokens=2)
+
+    assert [policy.try_hedge() for _ in range(3)] == [True, True, False]
+    for _ in range(20):
+        policy.request()
+    assert policy.try_hedge()
+    assert policy.stats().hedged == 3
+
+
+def test_slow_attempt_is_hedged_and_fastest_response_wins(executor: ThreadPoolExecutor) -> None:
+    policy = make_policy()
+    client = make_client(slow_first_attempt(0.5), policy, executor)
+
+    started = time.perf_counter()
+    response = client.get("/1")
+
+    assert time.perf_counter() - started < 0.4
+    assert response.json() == {"attempt": 2}
+    stats = client.hedging_stats()
+    assert stats is not None
+    assert stats.hedged == 1
+    assert stats.hedge_won == 1
+
+
+def test_fast_attempt_is_not_hedged(executor: ThreadPoolExecutor) -> None:
+    policy = make_policy(latency=0.2)
+    client = make_client(slow_first_attempt(0.01), policy, executor)
+
+    assert client.get("/1").json() == {"attempt": 1}
+    assert policy.stats().hedged == 0
+
+
+def test_no_hedge_without_budget(executor: ThreadPoolExecutor) -> None:
+    policy = make_policy(max_tokens=0)
+    client = make_client(slow_first_attempt(0.1), policy, executor)
+
+    assert client.get("/1").json() == {"attempt": 1}
+    assert policy.stats().hedged == 0
+
+
+def test_failed_hedge_falls_back_to_first_attempt(executor: ThreadPoolExecutor) -> None:
+    policy = make_policy()
+    client = make_client(slow_first_attempt(0.1, error=True), policy, executor)
+
+    assert client.get("/1").json() == {"attempt": 1}
+    assert policy.stats().hedge_won == 0
+
+
+def test_all_attempts_failing_reports_unavailable(executor: ThreadPoolExecutor) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        time.sleep(0.05)
+        raise httpx.ConnectError("refused", request=request)
+
+    client = make_client(handler, make_policy(), executor)
+
+    with pytest.raises(ServiceUnavailableException):
+        client.get("/1")
+
+
+def test_writes_are_never_hedged(executor: ThreadPoolExecutor) -> None:
+    policy = make_policy()
+    client = make_client(slow_first_attempt(0.1), policy, executor)
+
+    assert client.post("/", json={}).json() == {"attempt": 1}
+    assert policy.stats().hedged == 0
+
+
+def test_hedge_needs_a_free_bulkhead_slot(executor: ThreadPoolExecutor) -> None:
+    bulkhead = Bulkhead("hedging-full", max_concurrent=1, max_queue=0, queue_timeout=0.01)
+    client = make_client(slow_first_attempt(0.1), make_policy(), executor, bulkhead)
+
+    assert client.get("/1").json() == {"attempt": 1}
+    assert client.hedging_stats().hedged == 0  # type: ignore[union-attr]
+    assert bulkhead.stats().rejected == 0
+
+
+def test_hedged_attempt_holds_its_own_bulkhead_slot(executor: ThreadPoolExecutor) -> None:
+    bulkhead = Bulkhead("hedging-slots", max_concurrent=2, max_queue=0, queue_timeout=0.01)
+    client = make_client(slow_first_attempt(0.2), make_policy(), executor, bulkhead)
+
+    assert client.get("/1").json() == {"attempt": 2}
+    assert bulkhead.stats().active == 1
+
+    deadline = time.monotonic() + 2
+    while bulkhead.stats().active and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert bulkhead.stats().active == 0
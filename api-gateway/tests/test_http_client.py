@@ -0,0 +1,44 @@
+from flask import Flask
+from webapp.services.http_client import init_http_client
+from webapp.services.users.services import UserService
+import httpx
+
+
+def test_init_http_client_configures_pool_and_closes() -> None:
+    resource = init_http_client(
+        base_url="http://users-webapp:5000/api/users",
+        timeout=5,
+        connect_timeout=1,
+        max_connections=10,
+        max_keepalive_connections=4,
+        keepalive_expiry=15
+    )
+    client = next(resource)
+
+    assert isinstance(client, httpx.Client)
+    assert client.base_url == "http://users-webapp:5000/api/users/"
+    assert client.timeout == httpx.Timeout(5, connect=1)
+    assert not client.is_closed
+
+    resource.close()
+
+    assert client.is_closed
+
+def test_init_http_client_joins_relative_paths() -> None:
+    client = next(init_http_client("http://users-webapp:5000/api/users", 5, 1, 10, 4, 15))
+
+    assert client.build_request("GET", "/id").url == "http://users-webapp:5000/api/users/id"
+    client.close()
+
+def test_container_reuses_client_per_service(app: Flask) -> None:
+    container = app.container  # type: ignore
+
+    user_service: UserService = container.user_service()
+
+    assert user_service.client is container.auth_service().client
+    assert user_service.client is not container.course_service().client
+    assert str(user_service.client.client.base_url).rstrip("/") == app.config["USERS_SERVICE_URL"].rstrip("/")
+
+    container.shutdown_resources()
+
+    assert user_service.client.client.is_closed
@@ -0,0 +1,141 @@
+from flask import Blueprint, Flask, jsonify
+from flask.typing import ResponseReturnValue
+from webapp.api.error_handlers import register_error_handlers
+from webapp.load_shedding import GATEWAY_GROUP, AIMDLimiter, LoadShedder, init_load_shedding, route_group
+from webapp.services.exceptions import ServiceUnavailableException
+import pytest
+
+
+@pytest.fixture
+def app() -> Flask:
+    app = Flask(__name__)
+    app.config.update(
+        LOAD_SHEDDING_ENABLED=True,
+        LOAD_SHEDDING_INITIAL_LIMIT=10,
+        LOAD_SHEDDING_MIN_LIMIT=2,
+        LOAD_SHEDDING_MAX_LIMIT=20,
+        LOAD_SHEDDING_LATENCY_THRESHOLD=1,
+        LOAD_SHEDDING_BACKOFF=0.5,
+        LOAD_SHEDDING_NORMAL_SHARE=0.8,
+        LOAD_SHEDDING_LOW_PRIORITY_SHARE=0.5,
+        LOAD_SHEDDING_HIGH_PRIORITY_ENDPOINTS=["api.auth.refresh"],
+        LOAD_SHEDDING_LOW_PRIORITY_ENDPOINTS=["api.enrolment.expired"],
+        LOAD_SHEDDING_RETRY_AFTER=3
+    )
+    init_load_shedding(app)
+    register_error_handlers(app)
+
+    api_bp = Blueprint("api", __name__, url_prefix="/api")
+    auth_bp = Blueprint("auth", __name__, url_prefix="/auth")
+    enrolment_bp = Blueprint("enrolment", __name__, url_prefix="/enrolments")
+
+    @auth_bp.post("/refresh")
+    def refresh() -> ResponseReturnValue:
+        return jsonify(ok=True)
+
+    @enrolment_bp.get("/expired")
+    def expired() -> ResponseReturnValue:
+        return jsonify(ok=True)
+
+    @enrolment_bp.get("/unavailable")
+    def unavailable() -> ResponseReturnValue:
+        raise ServiceUnavailableException()
+
+    api_bp.register_blueprint(auth_bp)
+    api_bp.register_blueprint(enrolment_bp)
+    app.register_blueprint(api_bp)
+    return app
+
+
+def occupy(limiter: AIMDLimiter, count: int) -> None:
+    for _ in range(count):
+        assert limiter.try_acquire()
+
+
+def test_limit_grows_additively_and_backs_off_multiplicatively() -> None:
+    limiter = AIMDLimiter(initial_limit=4, min_limit=2, max_limit=5, latency_threshold=1, backoff_ratio=0.5)
+
+    occupy(limiter, 2)
+    limiter.release(0.1)
+    assert limiter.limit == 5
+    limiter.release(0.1)
+    assert limiter.limit == 5
+
+    occupy(limiter, 1)
+    limiter.release(0.1)
+    assert limiter.limit == 5
+
+    occupy(limiter, 1)
+    limiter.release(2)
+    assert limiter.limit == 2.5
+    occupy(limiter, 1)
+    limiter.release(0.1, dropped=True)
+    assert limiter.limit == 2
+    assert limiter.stats().in_flight == 0
+
+
+def test_try_acquire_respects_share_of_limit() -> None:
+    limiter = AIMDLimiter(initial_limit=10, min_limit=1, max_limit=10, latency_threshold=1)
+
+    occupy(limiter, 5)
+    assert not limiter.try_acquire(0.5)
+    assert limiter.try_acquire(1.0)
+
+
+def test_route_group() -> None:
+    assert route_group("api.enrolment") == "enrolment"
+    assert route_group("api") is None
+    assert route_group("metrics") is None
+    assert route_group(None) is None
+
+
+def test_shedder_releases_group_when_gateway_limit_is_reached() -> None:
+    shedder = LoadShedder(4, 1, 10, 1, 0.9, [], [], 1.0, 1.0)
+    occupy(shedder.limiters[GATEWAY_GROUP], 4)
+
+    assert shedder.try_acquire("auth", "normal") is None
+    assert shedder.limiter("auth").in_flight == 0
+
+
+def test_requests_over_limit_are_shed_with_retry_after(app: Flask) -> None:
+    shedder: LoadShedder = app.extensions["load_shedding"]
+    occupy(shedder.limiter("enrolment"), 5)
+    client = app.test_client()
+
+    response = client.get("/api/enrolments/expired")
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "3"
+    assert response.get_json()["error"] == "overloaded"
+    assert shedder.limiters[GATEWAY_GROUP].in_flight == 0
+    assert client.post("/api/auth/refresh").status_code == 200
+
+
+def test_high_priority_endpoints_use_the_whole_limit(app: Flask) -> None:
+    shedder: LoadShedder = app.extensions["load_shedding"]
+    occupy(shedder.limiters[GATEWAY_GROUP], 8)
+    client = app.test_client()
+
+    assert client.get("/api/enrolments/expired").status_code == 503
+    assert client.post("/api/auth/refresh").status_code == 200
+
+
+def test_completed_requests_release_and_adapt_limits(app: Flask) -> None:
+    shedder: LoadShedder = app.extensions["load_shedding"]
+    client = app.test_client()
+
+    assert client.get("/api/enrolments/expired").status_code == 200
+    assert client.get("/api/enrolments/unavailable").status_code == 503
+
+    stats = shedder.limiter("enrolment").stats()
+    assert stats.in_flight == 0
+    assert stats.limit == 5
+
+
+def test_disabled_load_shedding_registers_nothing() -> None:
+    app = Flask(__name__)
+    app.config["LOAD_SHEDDING_ENABLED"] = False
+
+    init_load_shedding(app)
+
+    assert "load_shedding" not in app.extensions
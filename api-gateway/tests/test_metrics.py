@@ -0,0 +1,104 @@
+from flask import Flask
+from webapp.metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    REQUEST_LATENCY,
+    UPSTREAM_IN_FLIGHT,
+    UPSTREAM_LATENCY,
+    init_metrics
+)
+from webapp.services.circuit_breaker import CircuitBreaker, RetryBudget
+from webapp.services.downstream import DownstreamClient
+from webapp.services.single_flight import SingleFlight
+import httpx
+import os
+import pytest
+
+
+def test_histogram_renders_cumulative_buckets() -> None:
+    histogram = Histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+    histogram.observe(0.05, "/a")
+    histogram.observe(0.1, "/a")
+    histogram.observe(0.5, "/a")
+    histogram.observe(5, "/a")
+
+    lines = list(histogram.collect())
+
+    assert lines[:2] == ["# HELP latency_seconds Latency.", "# TYPE latency_seconds histogram"]
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 2' in lines
+    assert 'latency_seconds_bucket{route="/a",le="1"} 3' in lines
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 4' in lines
+    assert 'latency_seconds_sum{route="/a"} 5.65' in lines
+    assert 'latency_seconds_count{route="/a"} 4' in lines
+
+
+def test_gauge_labels_and_function() -> None:
+    gauge = Gauge("in_flight", "In flight.", ("service",))
+    gauge.inc("a\"b")
+    gauge.inc("a\"b")
+    gauge.dec("a\"b")
+    assert 'in_flight{service="a\\"b"} 1' in list(gauge.collect())
+
+    gauge.set_function(lambda: 7)
+    assert list(gauge.collect())[-1] == "in_flight 7"
+
+
+def test_counter_is_rendered_with_total_suffix() -> None:
+    counter = Counter("shed_requests", "Shed requests.", ("group",))
+    counter.inc("auth")
+    counter.inc("auth", amount=2)
+
+    lines = list(counter.collect())
+
+    assert lines == [
+        "# HELP shed_requests_total Shed requests.",
+        "# TYPE shed_requests_total counter",
+        'shed_requests_total{group="auth"} 3'
+    ]
+    with pytest.raises(ValueError):
+        counter.inc("auth", amount=-1)
+
+
+def test_init_metrics_records_requests() -> None:
+    app = Flask(__name__)
+    init_metrics(app)
+    app.add_url_rule("/items/<int:item_id>", "item", lambda item_id: ("", 204))
+    client = app.test_client()
+
+    client.get("/items/1")
+    client.get("/items/2")
+    client.get("/missing")
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.content_type.startswith("text/plain; version=0.0.4")
+    body = response.get_data(as_text=True)
+    worker = f'worker="{os.getpid()}"'
+    assert f'http_request_duration_seconds_count{{{worker},method="GET",route="/items/<int:item_id>",status="204"}} 2' in body
+    assert f'http_request_duration_seconds_count{{{worker},method="GET",route="unmatched",status="404"}}' in body
+    assert f"http_requests_in_flight{{{worker}}} 1" in body
+    assert REQUEST_LATENCY.name in body
+
+
+def test_downstream_calls_are_observed() -> None:
+    client = DownstreamClient(
+        "metrics-test",
+        client=httpx.Client(base_url="http://users", transport=httpx.MockTransport(lambda request: httpx.Response(503))),
+        single_flight=SingleFlight(),
+        circuit_breaker=CircuitBreaker(
+            "metrics-test",
+            failure_rate_threshold=1,
+            minimum_calls=10,
+            window_size=10,
+            open_seconds=30,
+            half_open_max_calls=1,
+            retry_budget=RetryBudget(ratio=0.1, max_tokens=10)
+        )
+    )
+
+    client.post("/", json={})
+
+    lines = list(UPSTREAM_LATENCY.collect())
+    assert 'upstream_request_duration_seconds_count{service="metrics-test",method="POST",status="503"} 1' in lines
+    assert 'upstream_requests_in_flight{service="metrics-test"} 0' in list(UPSTREAM_IN_FLIGHT.collect())
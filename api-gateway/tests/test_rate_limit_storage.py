@@ -0,0 +1,83 @@
+from multiprocessing import get_context
+from pathlib import Path
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import FixedWindowRateLimiter
+from webapp.rate_limit_storage import MmapStorage
+import time
+
+
+def hit_many(uri: str, count: int) -> None:
+    storage = storage_from_string(uri)
+    for _ in range(count):
+        storage.incr("shared", 60)
+
+
+def test_storage_from_uri(tmp_path: Path) -> None:
+    storage = storage_from_string(f"mmap://{tmp_path}/limits.bin?slots=64")
+
+    assert isinstance(storage, MmapStorage)
+    assert storage.slots == 64
+    assert storage.check()
+
+def test_incr_get_and_expiry(tmp_path: Path) -> None:
+    storage = MmapStorage(f"mmap://{tmp_path}/limits.bin")
+
+    assert storage.incr("key", 60) == 1
+    assert storage.incr("key", 60, amount=2) == 3
+    assert storage.get("key") == 3
+    assert storage.get("other") == 0
+    assert time.time() < storage.get_expiry("key") <= time.time() + 60
+
+    storage.clear("key")
+    assert storage.get("key") == 0
+
+def test_expired_window_restarts(tmp_path: Path) -> None:
+    storage = MmapStorage(f"mmap://{tmp_path}/limits.bin")
+
+    storage.incr("key", 0.05)
+    time.sleep(0.1)
+
+    assert storage.get("key") == 0
+    assert storage.incr("key", 60) == 1
+
+def test_counters_shared_between_instances(tmp_path: Path) -> None:
+    uri = f"mmap://{tmp_path}/limits.bin"
+    first = MmapStorage(uri)
+    second = MmapStorage(uri)
+
+    first.incr("key", 60)
+    second.incr("key", 60)
+
+    assert first.get("key") == 2
+    assert second.reset() == 1
+    assert first.get("key") == 0
+
+def test_counters_shared_between_processes(tmp_path: Path) -> None:
+    uri = f"mmap://{tmp_path}/limits.bin"
+    context = get_context("fork")
+    processes = [context.Process(target=hit_many, args=(uri, 200)) for _ in range(4)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=30)
+
+    assert MmapStorage(uri).get("shared") == 800
+
+def test_eviction_when_probe_range_full(tmp_path: Path) -> None:
+    storage = MmapStorage(f"mmap://{tmp_path}/limits.bin?slots=16")
+
+    for index in range(20):
+        storage.incr(f"key-{index}", 60 + index)
+
+    assert storage.get("key-19") == 1
+    assert storage.get("key-0") == 0
+
+def test_fixed_window_limiter(tmp_path: Path) -> None:
+    limiter = FixedWindowRateLimiter(MmapStorage(f"mmap://{tmp_path}/limits.bin"))
+    limit = parse("2/minute")
+
+    assert limiter.hit(limit, "login", "127.0.0.1")
+    assert limiter.hit(limit, "login", "127.0.0.1")
+    assert not limiter.hit(limit, "login", "127.0.0.1")
+    assert limiter.get_window_stats(limit, "login", "127.0.0.1").remaining == 0
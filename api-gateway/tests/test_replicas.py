@@ -0,0 +1,130 @@
+from typing import Callable
+from webapp.services.http_client import init_http_client
+from webapp.services.replicas import BalancingTransport, Replica
+import httpx
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def ok(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"host": request.url.host, "path": request.url.path, "header": request.headers["Host"]})
+
+
+def streamed(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, content=iter([request.url.host.encode()]))
+
+
+def failing(request: httpx.Request) -> httpx.Response:
+    raise httpx.ConnectError("refused", request=request)
+
+
+def make_transport(handlers: dict[str, Handler], clock: Clock | None = None, **kwargs) -> BalancingTransport:
+    return BalancingTransport(
+        [Replica(url, httpx.MockTransport(handler)) for url, handler in handlers.items()],
+        clock=clock or Clock(),
+        **kwargs
+    )
+
+
+def test_requests_are_rewritten_to_the_chosen_replica() -> None:
+    transport = make_transport({"http://users-1:5000/api/users": failing, "http://users-2:5001/v2/users": ok})
+    transport.replicas[0].healthy = False
+    client = httpx.Client(base_url="http://users-1:5000/api/users", transport=transport)
+
+    assert client.get("/42").json() == {"host": "users-2", "path": "/v2/users/42", "header": "users-2:5001"}
+
+
+def test_least_loaded_replica_is_chosen_and_released_on_close() -> None:
+    transport = make_transport({"http://users-1": streamed, "http://users-2": streamed})
+    client = httpx.Client(base_url="http://users-1", transport=transport)
+
+    with client.stream("GET", "/1") as busy:
+        hosts = {client.get("/2").text for _ in range(10)}
+        assert hosts == {"users-1", "users-2"} - {busy.url.host}
+        assert sorted(stats.outstanding for stats in transport.stats()) == [0, 1]
+
+    assert [stats.outstanding for stats in transport.stats()] == [0, 0]
+
+
+def test_failing_replica_is_ejected_and_readmitted() -> None:
+    clock = Clock()
+    transport = make_transport({"http://users-1": failing, "http://users-2": ok}, clock, failure_threshold=2, ejection_seconds=30)
+    client = httpx.Client(base_url="http://users-1", transport=transport)
+
+    failures = 0
+    while failures < 2:
+        try:
+            client.get("/1")
+        except httpx.ConnectError:
+            failures += 1
+
+    assert not transport.stats()[0].available
+    assert all(client.get("/1").json()["host"] == "users-2" for _ in range(10))
+
+    clock.now = 31
+    assert transport.stats()[0].available
+    assert [stats.outstanding for stats in transport.stats()] == [0, 0]
+
+
+def test_server_errors_count_as_failures() -> None:
+    transport = make_transport({"http://users-1": lambda _: httpx.Response(503)}, failure_threshold=3)
+    client = httpx.Client(base_url="http://users-1", transport=transport)
+
+    client.get("/1")
+    client.get("/1")
+    assert transport.stats()[0].failures == 2
+
+    client.get("/1")
+    assert not transport.stats()[0].available
+
+
+def test_health_checks_take_unhealthy_replicas_out_of_rotation() -> None:
+    status = {"users-1": 200, "users-2": 200}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/users/health":
+            return httpx.Response(status[request.url.host])
+        return ok(request)
+
+    transport = make_transport({"http://users-1/api/users": handler, "http://users-2/api/users": handler})
+    client = httpx.Client(base_url="http://users-1/api/users", transport=transport)
+
+    status["users-1"] = 503
+    transport.check_health()
+    assert [stats.available for stats in transport.stats()] == [False, True]
+    assert all(client.get("/1").json()["host"] == "users-2" for _ in range(10))
+
+    status["users-1"] = 200
+    transport.check_health()
+    assert [stats.available for stats in transport.stats()] == [True, True]
+
+
+def test_requests_are_spread_over_all_replicas_when_none_is_available() -> None:
+    transport = make_transport({"http://users-1": ok, "http://users-2": ok})
+    for replica in transport.replicas:
+        replica.healthy = False
+    client = httpx.Client(base_url="http://users-1", transport=transport)
+
+    assert client.get("/1").status_code == 200
+
+
+def test_init_http_client_balances_comma_separated_replicas() -> None:
+    resource = init_http_client("http://users-1:5000/api/users, http://users-2:5000/api/users", 5, 1, 10, 4, 15)
+    client = next(resource)
+    transport = client._transport
+
+    assert isinstance(transport, BalancingTransport)
+    assert [str(replica.url) for replica in transport.replicas] == ["http://users-1:5000/api/users", "http://users-2:5000/api/users"]
+    assert len({id(replica.transport) for replica in transport.replicas}) == 2
+    assert client.base_url == "http://users-1:5000/api/users/"
+
+    resource.close()
+    assert client.is_closed
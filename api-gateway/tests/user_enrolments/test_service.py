@@ -0,0 +1,99 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from typing import Generator
+from unittest.mock import MagicMock
+from webapp.services.courses.dtos import CourseDTO, CourseIdDTO
+from webapp.services.courses.services import CourseService
+from webapp.services.enrolments.dtos import EnrolmentDTO, EnrolmentUserIdDTO, PaymentStatus, Status
+from webapp.services.enrolments.services import EnrolmentService
+from webapp.services.exceptions import NotFoundException
+from webapp.services.user_enrolments.services import UserEnrolmentsService
+import pytest
+
+
+def make_enrolment(enrolment_id: int, course_id: int) -> EnrolmentDTO:
+    return EnrolmentDTO(
+        id=enrolment_id,
+        user_id="user123",
+        course_id=course_id,
+        status=Status.ACTIVE,
+        payment_status=PaymentStatus.PAID
+    )
+
+
+def make_course(course_id: int) -> CourseDTO:
+    return CourseDTO(
+        id=course_id,
+        name=f"Course {course_id}",
+        description="Test Course",
+        price=100,
+        start_date="2026-01-10",
+        end_date="2026-01-20"
+    )
+
+
+@pytest.fixture
+def enrolment_service() -> MagicMock:
+    return MagicMock(spec=EnrolmentService)
+
+
+@pytest.fixture
+def course_service() -> MagicMock:
+    return MagicMock(spec=CourseService)
+
+
+@pytest.fixture
+def service(enrolment_service: MagicMock, course_service: MagicMock) -> Generator[UserEnrolmentsService, None, None]:
+    executor = ThreadPoolExecutor(max_workers=4)
+    yield UserEnrolmentsService(
+        enrolment_service=enrolment_service,
+        course_service=course_service,
+        executor=executor
+    )
+    executor.shutdown()
+
+
+def test_get_for_user_fetches_distinct_courses_concurrently(
+        service: UserEnrolmentsService,
+        enrolment_service: MagicMock,
+        course_service: MagicMock
+) -> None:
+    enrolment_service.get_by_user.return_value = [make_enrolment(1, 10), make_enrolment(2, 20), make_enrolment(3, 10)]
+    barrier = Barrier(2, timeout=5)
+
+    def get_by_id(dto: CourseIdDTO) -> CourseDTO:
+        barrier.wait()
+        return make_course(dto.course_id)
+
+    course_service.get_by_id.side_effect = get_by_id
+
+    result = service.get_for_user(EnrolmentUserIdDTO(user_id="user123"))
+
+    assert [item.enrolment.id for item in result] == [1, 2, 3]
+    assert [item.course.id for item in result if item.course] == [10, 20, 10]
+    assert course_service.get_by_id.call_count == 2
+    enrolment_service.get_by_user.assert_called_once_with(EnrolmentUserIdDTO(user_id="user123"))
+
+
+def test_get_for_user_missing_course(
+        service: UserEnrolmentsService,
+        enrolment_service: MagicMock,
+        course_service: MagicMock
+) -> None:
+    enrolment_service.get_by_user.return_value = [make_enrolment(1, 10)]
+    course_service.get_by_id.side_effect = NotFoundException("Course not found")
+
+    result = service.get_for_user(EnrolmentUserIdDTO(user_id="user123"))
+
+    assert result[0].course is None
+
+
+def test_get_for_user_without_enrolments(
+        service: UserEnrolmentsService,
+        enrolment_service: MagicMock,
+        course_service: MagicMock
+) -> None:
+    enrolment_service.get_by_user.return_value = []
+
+    assert service.get_for_user(EnrolmentUserIdDTO(user_id="user123")) == []
+    course_service.get_by_id.assert_not_called()
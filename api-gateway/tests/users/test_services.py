@@ -5,26 +5,35 @@ from flask import Flask
 from typing import Generator
 import pytest
 
+from webapp.api.users.schemas import GenderType
 from webapp.services.users.dtos import CreateUserDTO, UserDTO, ActivationUserDTO, ResendActivationCodeDTO, \
     ForgotPasswordDTO, ResetPasswordDTO, EnableMfaDTO, UserIdDTO, MfaSetupDTO, IdentifierDTO, DisableMfaDTO, GetMfaDTO, \
     DeleteUserByIdDTO, DeleteUserByIdentifierDTO
 from webapp.services.users.services import UserService
+from webapp.services.downstream import DownstreamClient
+from webapp.services.cache import TTLCache
 
 
 @pytest.fixture
 def app() -> Flask:
     app = Flask(__name__)
     app.config.update({
-        'TESTING': True,
-        "USERS_SERVICE_URL": "http://localhost:users-service",
-        'HTTP_TIMEOUT': 5
+        'TESTING': True
     })
     return app
 
 @pytest.fixture
-def service(app: Flask) -> Generator[UserService, None, None]:
+def http_client() -> MagicMock:
+    return MagicMock(spec=DownstreamClient)
+
+@pytest.fixture
+def cache() -> TTLCache[str, UserDTO]:
+    return TTLCache(max_size=10, ttl=60)
+
+@pytest.fixture
+def service(app: Flask, http_client: MagicMock, cache: TTLCache[str, UserDTO]) -> Generator[UserService, None, None]:
     with app.app_context():
-        yield UserService()
+        yield UserService(client=http_client, cache=cache)
 
 def make_response(json_data: dict, status: int = 200) -> MagicMock:
     resp = MagicMock(spec=httpx.Response)
@@ -32,9 +41,8 @@ def make_response(json_data: dict, status: int = 200) -> MagicMock:
     resp.status_code = status
     return resp
 
-@patch("webapp.services.users.services.httpx.post")
 @patch("webapp.services.users.services.raise_for_status")
-def test_create_user(mock_raise: MagicMock, mock_post: MagicMock, service: UserService, app: Flask) -> None:
+def test_create_user(mock_raise: MagicMock, service: UserService, app: Flask, http_client: MagicMock) -> None:
     dto = CreateUserDTO(
         username="test",
         first_name="Test",
@@ -46,7 +54,7 @@ def test_create_user(mock_raise: MagicMock, mock_post: MagicMock, service: UserS
         role="admin"
     )
 
-    mock_post.return_value = make_response(
+    http_client.post.return_value = make_response(
         {
         "id": 1,
         "username": "test",
@@ -64,13 +72,12 @@ def test_create_user(mock_raise: MagicMock, mock_post: MagicMock, service: UserS
     assert isinstance(result, UserDTO)
     assert result.username == "test"
     mock_raise.assert_called_once()
-    mock_post.assert_called_once()
+    http_client.post.assert_called_once()
 
-@patch("webapp.services.users.services.httpx.patch")
 @patch("webapp.services.users.services.raise_for_status")
-def test_activate_user(mock_raise: MagicMock, mock_patch: MagicMock, service: UserService, app: Flask) -> None:
+def test_activate_user(mock_raise: MagicMock, service: UserService, app: Flask, http_client: MagicMock) -> None:
     dto = ActivationUserDTO("code123")
-    mock_patch.return_value = make_response(
+    http_client.patch.return_value = make_response(
         {
             "id": 1,
             "username": "test",
@@ -89,13 +96,12 @@ def test_activate_user(mock_raise: MagicMock, mock_patch: MagicMock, service: Us
     assert result.username == "test"
     assert result.is_active is True
     mock_raise.assert_called_once()
-    mock_patch.assert_called_once()
+    http_client.patch.assert_called_once()
 
-@patch("webapp.services.users.services.httpx.get")
 @patch("webapp.services.users.services.raise_for_status")
-def test_resend_activation_code(mock_raise: MagicMock, mock_get: MagicMock, service: UserService, app: Flask) -> None:
+def test_resend_activation_code(mock_raise: MagicMock, service: UserService, app: Flask, http_client: MagicMock) -> None:
     dto = ResendActivationCodeDTO(identifier="test@example.com")
-    mock_get.return_value = make_response(
+    http_client.get.return_value = make_response(
         {
             "id": 1,
             "username": "test",
@@ -111,14 +117,13 @@ def test_resend_activation_code(mock_raise: MagicMock, mock_get: MagicMock, serv
         result = service.resend_activation_code(dto)
 
     assert result.email == "test@example.com"
-    mock_raise.assert_called_once_with(mock_get.return_value, not_found_message="User test@example.com not found")
-    mock_get.assert_called_once()
+    mock_raise.assert_called_once_with(http_client.get.return_value, not_found_message="User test@example.com not found")
+    http_client.get.assert_called_once()
 
-@patch("webapp.services.users.services.httpx.post")
 @patch("webapp.services.users.services.raise_for_status")
-def test_forgot_password(mock_raise: MagicMock, mock_post: MagicMock, service: UserService, app: Flask) -> None:
+def test_forgot_password(mock_raise: MagicMock, service: UserService, app: Flask, http_client: MagicMock) -> None:
     dto = ForgotPasswordDTO(identifier="test@example.com")
-    mock_post.return_value = make_response(
+    http_client.post.return_value = make_response(
         {
             "id": 1,
             "username": "test",
@@ -134,13 +139,12 @@ def test_forgot_password(mock_raise: MagicMock, mock_post: MagicMock, service: U
         service.forgot_password(dto)
 
     mock_raise.assert_called_once()
-    mock_post.assert_called_once_with("http://localhost:users-service/password/forgot", json=dto.__dict__, timeout=5)
+    http_client.post.assert_called_once_with("/password/forgot", json=dto.__dict__)
 
-@patch("webapp.services.users.services.httpx.post")
 @patch("webapp.services.users.services.raise_for_status")
-def test_reset_password(moc_raise: MagicMock, mock_post: MagicMock, service: UserService, app: Flask) -> None:
+def test_reset_password(moc_raise: MagicMock, service: UserService, app: Flask, http_client: MagicMock) -> None:
     dto = ResetPasswordDTO(token="test_token", new_password="1234567")
-    mock_post.return_value = make_response(
+    http_client.post.return_value = make_response(
         {
             "id": 1,
             "username": "test",
@@ -155,14 +159,13 @@ def test_reset_password(moc_raise: MagicMock, mock_post: MagicMock, service: Use
 
     with app.test_request_context():
         service.reset_password(dto)
-    mock_post.assert_called_once()
+    http_client.post.assert_called_once()
     moc_raise.assert_called_once()
 
-@patch("webapp.services.users.services.httpx.patch")
 @patch("webapp.services.users.services.raise_for_status")
-def test_enable_mfa(mock_raise: MagicMock, mock_patch: MagicMock, service: UserService, app: Flask) -> None:
+def test_enable_mfa(mock_raise: MagicMock, service: UserService, app: Flask, http_client: MagicMock) -> None:
     dto = EnableMfaDTO(user_id="123")
-    mock_patch.return_value = make_response(
+    http_client.patch.return_value = make_response(
         {
             "user_id": "123",
             "provisioning_uri": "uri",
@@ -175,13 +178,12 @@ def test_enable_mfa(mock_raise: MagicMock, mock_patch: MagicMock, service: UserS
     assert isinstance(result, MfaSetupDTO)
     assert result.provisioning_uri == "uri"
     mock_raise.assert_called_once()
-    mock_patch.assert_called_once_with("http://localhost:users-service/mfa/enable", json=dto.__dict__, timeout=5)
+    http_client.patch.assert_called_once_with("/mfa/enable", json=dto.__dict__)
 
-@patch("webapp.services.users.services.httpx.get")
 @patch("webapp.services.users.services.raise_for_status")
-def test_get_user_by_id(mock_raise: MagicMock, mock_get: MagicMock, service: UserService, app: Flask) -> None:
+def test_get_user_by_id(mock_raise: MagicMock, service: UserService, app: Flask, http_client: MagicMock) -> None:
     dto = UserIdDTO(user_id="123")
-    mock_get.return_value = make_response(
+    http_client.get.return_value = make_response(
         {
             "id": 1,
             "username": "test",
@@ -198,13 +200,12 @@ def test_get_user_by_id(mock_raise: MagicMock, mock_get: MagicMock, service: Use
 
     assert result.id == 1
     mock_raise.assert_called_once()
-    mock_get.assert_called_once_with("http://localhost:users-service/id", params=dto.__dict__, timeout=5)
+    http_client.get.assert_called_once_with("/id", params=dto.__dict__)
 
-@patch("webapp.services.users.services.httpx.get")
 @patch("webapp.services.users.services.raise_for_status")
-def test_get_user_by_identifier(mock_raise: MagicMock, mock_get: MagicMock, service: UserService, app: Flask) -> None:
+def test_get_user_by_identifier(mock_raise: MagicMock, service: UserService, app: Flask, http_client: MagicMock) -> None:
     dto = IdentifierDTO(identifier="test@example.com")
-    mock_get.return_value = make_response(
+    http_client.get.return_value = make_response(
         {
             "id": 1,
             "username": "test",
@@ -220,18 +221,16 @@ def test_get_user_by_identifier(mock_raise: MagicMock, mock_get: MagicMock, serv
         result = service.get_user_by_identifier(dto)
 
     assert result.email == "test@example.com"
-    mock_raise.assert_called_once_with(mock_get.return_value, not_found_message="User test@example.com not found")
-    mock_get.assert_called_once_with(
-        "http://localhost:users-service/identifier",
-        params={"identifier": "test@example.com"},
-        timeout=5)
+    mock_raise.assert_called_once_with(http_client.get.return_value, not_found_message="User test@example.com not found")
+    http_client.get.assert_called_once_with(
+        "/identifier",
+        params={"identifier": "test@example.com"})
 
 
-@patch("webapp.services.users.services.httpx.patch")
 @patch("webapp.services.users.services.raise_for_status")
-def test_disable_mfa(mock_raise: MagicMock, mock_patch: MagicMock, service: UserService, app: Flask) -> None:
+def test_disable_mfa(mock_raise: MagicMock, service: UserService, app: Flask, http_client: MagicMock) -> None:
     dto = DisableMfaDTO(user_id="123")
-    mock_patch.return_value = make_response(
+    http_client.patch.return_value = make_response(
         {
             "id": 1,
             "username": "test",
@@ -247,13 +246,12 @@ def test_disable_mfa(mock_raise: MagicMock, mock_patch: MagicMock, service: User
         result = service.disable_mfa(dto)
 
     mock_raise.assert_called_once()
-    mock_patch.assert_called_once_with("http://localhost:users-service/mfa/disable", json=dto.__dict__, timeout=5)
+    http_client.patch.assert_called_once_with("/mfa/disable", json=dto.__dict__)
 
-@patch("webapp.services.users.services.httpx.get")
 @patch("webapp.services.users.services.raise_for_status")
-def test_get_mfa_qr_code(mock_raise: MagicMock, mock_get: MagicMock, service: UserService, app: Flask) -> None:
+def test_get_mfa_qr_code(mock_raise: MagicMock, service: UserService, app: Flask, http_client: MagicMock) -> None:
     dto = GetMfaDTO(user_id="123")
-    mock_get.return_value = make_response(
+    http_client.get.return_value = make_response(
         {
             "user_id": "123",
             "provisioning_uri": "uri",
@@ -266,33 +264,82 @@ def test_get_mfa_qr_code(mock_raise: MagicMock, mock_get: MagicMock, service: Us
     assert isinstance(result, MfaSetupDTO)
     assert result.provisioning_uri == "uri"
     mock_raise.assert_called_once()
-    mock_get.assert_called_once_with("http://localhost:users-service/mfa/qr", params={"user_id": "123"}, timeout=5)
+    http_client.get.assert_called_once_with("/mfa/qr", params={"user_id": "123"})
 
-@patch("webapp.services.users.services.httpx.delete")
 @patch("webapp.services.users.services.raise_for_status")
-def test_delete_user_by_id(mock_raise: MagicMock, mock_delete: MagicMock, service: UserService, app: Flask) -> None:
+def test_delete_user_by_id(mock_raise: MagicMock, service: UserService, app: Flask, http_client: MagicMock) -> None:
     dto = DeleteUserByIdDTO(user_id="123")
-    mock_delete.return_value = make_response({}, 204)
+    http_client.delete.return_value = make_response({}, 204)
     with app.test_request_context():
         service.delete_user_by_id(dto)
 
     mock_raise.assert_called_once()
-    mock_delete.assert_called_once_with("http://localhost:users-service/id", params={"user_id": "123"}, timeout=5)
+    http_client.delete.assert_called_once_with("/id", params={"user_id": "123"})
 
-@patch("webapp.services.users.services.httpx.delete")
 @patch("webapp.services.users.services.raise_for_status")
-def test_delete_user_by_identifier(mock_raise: MagicMock, mock_delete: MagicMock, service: UserService, app: Flask) -> None:
+def test_delete_user_by_identifier(mock_raise: MagicMock, service: UserService, app: Flask, http_client: MagicMock) -> None:
     dto = DeleteUserByIdentifierDTO(identifier="test@example.com")
-    mock_delete.return_value = make_response({}, 204)
+    http_client.delete.return_value = make_response({}, 204)
     with app.test_request_context():
         service.delete_user_by_identifier(dto)
 
     mock_raise.assert_called_once()
-    mock_delete.assert_called_once_with(
-        "http://localhost:users-service/identifier",
-        params={"identifier": "test@example.com"},
-        timeout=5
+    http_client.delete.assert_called_once_with(
+        "/identifier",
+        params={"identifier": "test@example.com"})
+
+def make_user(user_id: str = "123") -> UserDTO:
+    return UserDTO(
+        id=user_id,
+        username="test",
+        first_name="Test",
+        last_name="Test",
+        email="test@example.com",
+        gender=GenderType.MALE,
+        role="admin",
+        is_active=True
     )
 
+@patch("webapp.services.users.services.UserService.get_user_by_id")
+def test_get_cached_user_by_id(mock_get: MagicMock, service: UserService, cache: TTLCache[str, UserDTO]) -> None:
+    mock_get.return_value = make_user()
+    dto = UserIdDTO(user_id="123")
+
+    first = service.get_cached_user_by_id(dto)
+    second = service.get_cached_user_by_id(dto)
+
+    assert first is second
+    mock_get.assert_called_once_with(dto)
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+@patch("webapp.services.users.services.raise_for_status")
+def test_mutations_invalidate_cached_user(
+        mock_raise: MagicMock,
+        service: UserService,
+        cache: TTLCache[str, UserDTO],
+        http_client: MagicMock
+) -> None:
+    http_client.patch.return_value = make_response({
+        "id": "123",
+        "username": "test",
+        "first_name": "Test",
+        "last_name": "Test",
+        "email": "test@example.com",
+        "gender": "male",
+        "role": "admin",
+        "is_active": True
+    })
+
+    cache.set("123", make_user())
+    service.disable_mfa(DisableMfaDTO(user_id="123"))
+    assert cache.get("123") is None
 
+    cache.set("123", make_user())
+    service.delete_user_by_id(DeleteUserByIdDTO(user_id="123"))
+    assert cache.get("123") is None
 
+    cache.set("123", make_user())
+    cache.set("456", make_user("456"))
+    service.delete_user_by_identifier(DeleteUserByIdentifierDTO(identifier="test@example.com"))
+    assert len(cache) == 0
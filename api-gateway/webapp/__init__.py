@@ -1,10 +1,18 @@
+import atexit
 from flask import Flask
 from flask_cors import CORS
 from .extensions import limiter
+from .metrics import init_metrics
+from .tracing import init_tracing
+from .compression import init_compression
+from .profiling import init_profiling
+from .deadline import init_deadline
+from .load_shedding import init_load_shedding
 from .settings import config
 from flask_jwt_extended import JWTManager
 from .api.error_handlers import register_error_handlers
 from .api import api_bp
+from .api.auth.revocation import is_token_revoked
 from .container import Container
 
 
@@ -14,10 +22,16 @@ def create_app() -> Flask:
 
     This function sets up:
         - Configuration from `settings.config`
+        - Request metrics exposed on `/metrics`
+        - Distributed tracing of requests and downstream calls
+        - On-demand profiling of single requests, listed on `/profiles`
+        - Response compression negotiated by `Accept-Encoding`
+        - Request deadlines propagated to downstream services
+        - Adaptive concurrency limits shedding excess API requests
         - Rate limiting via `limiter`
         - CORS for `/api/*` routes
-        - JWT authentication via `flask_jwt_extended`
-        - Dependency injection container
+        - JWT authentication via `flask_jwt_extended`, rejecting revoked tokens
+        - Dependency injection container with pooled downstream HTTP clients
         - Error handlers registration
         - Blueprint registration for all API routes
 
@@ -28,6 +42,12 @@ def create_app() -> Flask:
     app.config.from_object(config['default'])
     config['default'].init_app(app)
 
+    init_metrics(app)
+    init_tracing(app)
+    init_profiling(app)
+    init_compression(app)
+    init_deadline(app)
+    init_load_shedding(app)
     limiter.init_app(app)
 
     CORS(
@@ -44,9 +64,13 @@ def create_app() -> Flask:
 
     jwt = JWTManager()
     jwt.init_app(app)
+    jwt.token_in_blocklist_loader(is_token_revoked)
 
     container = Container()
+    container.config.from_dict(app.config)
     container.wire()
+    app.container = container  # type: ignore
+    atexit.register(container.shutdown_resources)
 
     register_error_handlers(app)
     app.register_blueprint(api_bp)
@@ -17,3 +17,8 @@ api_bp.register_blueprint(course_bp)
 from .enrolments import enrolment_bp
 api_bp.register_blueprint(enrolment_bp)
 
+from .batch import batch_bp
+api_bp.register_blueprint(batch_bp)
+
+from .health import health_bp
+api_bp.register_blueprint(health_bp)
\ No newline at end of file
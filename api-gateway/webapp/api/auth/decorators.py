@@ -1,9 +1,8 @@
 from typing import Callable
-from flask import jsonify
+from flask import jsonify, current_app
 from flask.typing import ResponseReturnValue
 from functools import wraps
-from flask_jwt_extended import verify_jwt_in_request, get_jwt_identity
-from webapp.container import Container
+from flask_jwt_extended import verify_jwt_in_request, get_jwt_identity, get_jwt
 from webapp.services.users.dtos import UserIdDTO
 from webapp.services.users.services import UserService
 
@@ -12,6 +11,11 @@ def role_required(*roles: str) -> Callable[[Callable[..., ResponseReturnValue]],
     """
     Decorator factory to restrict access to users with specific roles.
 
+    The role is read from the access token claims. Only when the token carries
+    no role or a stale role claims version, the role is verified against the
+    Users service (if `JWT_ROLE_FALLBACK_ENABLED` is set), through the
+    gateway's identity cache.
+
     Args:
         *roles (str): Allowed roles. If empty, allows any authenticated user.
 
@@ -23,14 +27,18 @@ def role_required(*roles: str) -> Callable[[Callable[..., ResponseReturnValue]],
         def decorated(*args, **kwargs) -> ResponseReturnValue:
             verify_jwt_in_request()
             user_id = get_jwt_identity()
+            claims = get_jwt()
 
-            container = Container()
-            user_service: UserService = container.user_service()
+            role = claims.get("role")
+            if role is None or claims.get("role_ver") != current_app.config["JWT_ROLE_CLAIMS_VERSION"]:
+                if not current_app.config["JWT_ROLE_FALLBACK_ENABLED"]:
+                    return jsonify({"Message": "Token role claims are stale"}), 401
 
-            dto = UserIdDTO(user_id=user_id)
-            user = user_service.get_user_by_id(dto)
+                user_service: UserService = current_app.container.user_service()  # type: ignore
+                user = user_service.get_cached_user_by_id(UserIdDTO(user_id=user_id))
+                role = user.role
 
-            if roles and user.role not in roles:
+            if roles and role not in roles:
                 return jsonify({"Message": "Forbidden"}), 403
 
             return func(*args, **kwargs)
@@ -1,3 +1,5 @@
+from datetime import datetime, timezone
+from typing import Any
 from webapp.api.auth.schemas import(
     LoginSchema,
     TokenPairSchema,
@@ -9,6 +11,7 @@ from webapp.services.auth.dtos import(
     TokenPairDTO,
     VerifyMfaDTO
 )
+from webapp.services.revocation.dtos import RevokeTokenDTO
 
 
 def to_dto_login(schema: LoginSchema) -> LoginDTO:
@@ -60,4 +63,17 @@ def to_schema_access_token(dto: TokenPairDTO) -> AccessTokenSchema:
     Returns:
         AccessTokenSchema: Schema containing only the access token.
     """
-    return AccessTokenSchema(access_token=dto.access_token)
\ No newline at end of file
+    return AccessTokenSchema(access_token=dto.access_token)
+
+
+def to_dto_revoke_token(claims: dict[str, Any]) -> RevokeTokenDTO:
+    """
+    Convert the claims of a JWT to RevokeTokenDTO.
+
+    Args:
+        claims (dict[str, Any]): Decoded claims of the token.
+
+    Returns:
+        RevokeTokenDTO: DTO object for revocation service.
+    """
+    return RevokeTokenDTO(jti=claims["jti"], expires_at=datetime.fromtimestamp(claims["exp"], timezone.utc))
@@ -0,0 +1,54 @@
+from typing import Any
+from flask import current_app, request
+from dependency_injector.wiring import Provide, inject
+from flask_jwt_extended import decode_token, get_jwt, verify_jwt_in_request
+from flask_jwt_extended.exceptions import JWTExtendedException
+from jwt.exceptions import PyJWTError
+from webapp.container import Container
+from webapp.services.revocation.services import RevocationService
+
+
+@inject
+def is_token_revoked(
+        jwt_header: dict[str, Any],
+        jwt_payload: dict[str, Any],
+        revocation_service: RevocationService = Provide[Container.revocation_service]
+) -> bool:
+    """
+    Blocklist loader of `JWTManager`, rejecting revoked access and refresh tokens.
+
+    Args:
+        jwt_header (dict[str, Any]): Header of the token.
+        jwt_payload (dict[str, Any]): Claims of the token.
+        revocation_service (RevocationService): Revocation service injected by dependency injector.
+
+    Returns:
+        bool: True if the token is revoked.
+    """
+    return revocation_service.is_revoked(jwt_payload["jti"])
+
+
+def presented_tokens() -> list[dict[str, Any]]:
+    """
+    Return the claims of the valid tokens sent with the current request.
+
+    The access token is read from the configured token locations and the refresh
+    token from its cookie. Missing, invalid, expired and revoked tokens are skipped.
+
+    Returns:
+        list[dict[str, Any]]: Claims of the access and refresh tokens found.
+    """
+    claims: list[dict[str, Any]] = []
+    try:
+        if verify_jwt_in_request(optional=True) is not None:
+            claims.append(get_jwt())
+    except (JWTExtendedException, PyJWTError):
+        pass
+
+    refresh_token = request.cookies.get(current_app.config["JWT_REFRESH_COOKIE_NAME"])
+    if refresh_token:
+        try:
+            claims.append(decode_token(refresh_token))
+        except (JWTExtendedException, PyJWTError):
+            pass
+    return claims
@@ -12,10 +12,13 @@ from webapp.container import Container
 from webapp.api.auth.mappers import (
     to_dto_login,
     to_dto_verify_mfa,
-    to_schema_access_token
+    to_schema_access_token,
+    to_dto_revoke_token
 )
+from webapp.api.auth.revocation import presented_tokens
 from webapp.api.auth.schemas import LoginSchema, VerifyMfaSchema
 from webapp.services.auth.services import AuthService
+from webapp.services.revocation.services import RevocationService
 from webapp.extensions import limiter
 from webapp.services.auth.dtos import TokenPairDTO, LoginMfaRequiredDTO
 from . import auth_bp
@@ -77,7 +80,7 @@ def verify_mfa(auth_service: AuthService=Provide[Container.auth_service]) -> Res
 def refresh_token(auth_service: AuthService = Provide[Container.auth_service]) -> ResponseReturnValue:
     """
     Refresh access token using refresh token.
-    Sets new refresh token in cookies.
+    Re-reads the user's role and sets new refresh token in cookies.
 
     Args:
         auth_service (AuthService): Auth service injected by dependency injector.
@@ -86,7 +89,7 @@ def refresh_token(auth_service: AuthService = Provide[Container.auth_service]) -
         ResponseReturnValue: JSON response with new access token.
     """
     identity = get_jwt_identity()
-    tokens_pair_dto = auth_service.generate_token(identity)
+    tokens_pair_dto = auth_service.refresh(identity)
 
     response: Response = jsonify(to_schema_access_token(tokens_pair_dto).model_dump(mode="json"))
     set_refresh_cookies(response, tokens_pair_dto.refresh_token)
@@ -95,13 +98,20 @@ def refresh_token(auth_service: AuthService = Provide[Container.auth_service]) -
 
 
 @auth_bp.post("/logout")
-def logout() -> ResponseReturnValue:
+@inject
+def logout(revocation_service: RevocationService = Provide[Container.revocation_service]) -> ResponseReturnValue:
     """
-    Logout endpoint. Clears JWT cookies.
+    Logout endpoint. Revokes the access and refresh tokens sent with the request and clears JWT cookies.
+
+    Args:
+        revocation_service (RevocationService): Revocation service injected by dependency injector.
 
     Returns:
         ResponseReturnValue: JSON response confirming logout.
     """
+    for claims in presented_tokens():
+        revocation_service.revoke(to_dto_revoke_token(claims))
+
     response: Response = jsonify({"Message": "Logged out"})
     unset_jwt_cookies(response)
     return response
\ No newline at end of file
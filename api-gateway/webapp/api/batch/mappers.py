@@ -0,0 +1,37 @@
+from webapp.api.batch.schemas import (
+    BatchRequestSchema,
+    BatchItemResponseSchema,
+    BatchResponseSchema
+)
+from webapp.services.batch.dtos import BatchItemDTO, BatchResultDTO
+
+
+def to_batch_item_dtos(schema: BatchRequestSchema) -> list[BatchItemDTO]:
+    """
+    Map BatchRequestSchema (API) to a list of BatchItemDTO (service layer).
+
+    Args:
+        schema (BatchRequestSchema): Validated batch request.
+
+    Returns:
+        list[BatchItemDTO]: Sub-requests ready for the BatchService.
+    """
+    return [
+        BatchItemDTO(method=item.method, path=item.path, query=item.query, body=item.body)
+        for item in schema.requests
+    ]
+
+
+def to_batch_response_schema(dtos: list[BatchResultDTO]) -> BatchResponseSchema:
+    """
+    Map a list of BatchResultDTO (service layer) to BatchResponseSchema (API response).
+
+    Args:
+        dtos (list[BatchResultDTO]): Results of the sub-requests.
+
+    Returns:
+        BatchResponseSchema: Schema ready to be returned in API response.
+    """
+    return BatchResponseSchema(
+        responses=[BatchItemResponseSchema(status=dto.status, body=dto.body) for dto in dtos]
+    )
@@ -0,0 +1,37 @@
+from dependency_injector.wiring import Provide, inject
+from flask import request, jsonify, current_app
+from flask.typing import ResponseReturnValue
+from webapp.api.auth.decorators import any_authenticated
+from webapp.api.batch.schemas import BatchRequestSchema
+from webapp.api.batch.mappers import to_batch_item_dtos, to_batch_response_schema
+from webapp.services.batch.services import BatchService
+from webapp.container import Container
+from . import batch_bp
+
+
+@batch_bp.post("")
+@any_authenticated
+@inject
+def batch(batch_service: BatchService = Provide[Container.batch_service]) -> ResponseReturnValue:
+    """
+    Execute several gateway requests concurrently in a single call.
+
+    Request JSON:
+        {
+            "requests": [
+                {"method": "GET", "path": "/api/users/id", "query": {"user_id": "..."}},
+                {"method": "GET", "path": "/api/enrolment/1/details"}
+            ]
+        }
+
+    Sub-requests run concurrently. Each one is authorized with the caller's
+    credentials and returns its own status, so a failing item does not fail
+    the whole batch.
+
+    Returns:
+        200 OK with BatchResponseSchema, results in request order.
+    """
+    payload = BatchRequestSchema.model_validate(request.get_json() or {})
+    dtos = to_batch_item_dtos(payload)
+    results = batch_service.execute(current_app._get_current_object(), request, dtos)  # type: ignore
+    return jsonify(to_batch_response_schema(results).model_dump(mode="json")), 200
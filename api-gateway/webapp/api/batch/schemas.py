@@ -0,0 +1,65 @@
+from pydantic import BaseModel, Field, field_validator
+from typing import Any, Literal
+from urllib.parse import unquote, urlsplit
+import posixpath
+
+BATCH_PATH = "/api/batch"
+
+
+class BatchItemSchema(BaseModel):
+    """
+    Schema for a single sub-request of a batch.
+
+    Fields:
+        method (Literal["GET", "POST", "PATCH", "DELETE"]): HTTP method.
+        path (str): Gateway path, must start with /api/ and must not target the batch endpoint;
+            query parameters go in `query`, so the path carries no query string or fragment.
+        query (dict[str, str]): Optional query string parameters.
+        body (Any): Optional JSON body.
+    """
+    method: Literal["GET", "POST", "PATCH", "DELETE"]
+    path: str
+    query: dict[str, str] = Field(default_factory=dict)
+    body: Any = None
+
+    @field_validator("path")
+    @classmethod
+    def validate_path(cls, path: str) -> str:
+        if "?" in path or "#" in path:
+            raise ValueError("Path must not contain a query string or fragment, use query instead")
+        normalized = posixpath.normpath(unquote(urlsplit(path).path))
+        if not path.startswith("/api/") or not normalized.startswith("/api/") or normalized == BATCH_PATH:
+            raise ValueError(f"Path must target a gateway route under /api/ other than {BATCH_PATH}")
+        return path
+
+
+class BatchRequestSchema(BaseModel):
+    """
+    Schema for a batch of sub-requests.
+
+    Fields:
+        requests (list[BatchItemSchema]): Sub-requests to execute, at least one.
+    """
+    requests: list[BatchItemSchema] = Field(min_length=1)
+
+
+class BatchItemResponseSchema(BaseModel):
+    """
+    Schema representing the result of a single sub-request.
+
+    Fields:
+        status (int): HTTP status code of the sub-request.
+        body (Any): JSON body of the sub-request response, or None.
+    """
+    status: int
+    body: Any = None
+
+
+class BatchResponseSchema(BaseModel):
+    """
+    Schema representing the results of a batch, in the order of the sub-requests.
+
+    Fields:
+        responses (list[BatchItemResponseSchema]): Results of the sub-requests.
+    """
+    responses: list[BatchItemResponseSchema]
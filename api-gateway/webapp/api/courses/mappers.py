@@ -4,15 +4,19 @@ from webapp.api.courses.schemas import (
     CourseIdSchema,
     CourseNameSchema,
     UpdateCourseSchema,
-    CoursesListResponseSchema
+    CoursesListResponseSchema,
+    CacheStatsSchema,
+    CourseCacheStatsResponseSchema
 )
 from webapp.services.courses.dtos import (
     CreateCourseDTO,
     CourseDTO,
     CourseIdDTO,
     CourseNameDTO,
-    UpdateCourseDTO
+    UpdateCourseDTO,
+    CourseCacheStatsDTO
 )
+from webapp.services.cache import CacheStatsDTO
 
 
 def to_dto_create(schema: CreateCourseSchema) -> CreateCourseDTO:
@@ -112,4 +116,39 @@ def to_dto_update_course(course_id: int, schema: UpdateCourseSchema) -> UpdateCo
         max_participants=schema.max_participants,
         start_date=schema.start_date,
         end_date=schema.end_date,
-    )
\ No newline at end of file
+    )
+
+
+def to_schema_cache_stats(dto: CacheStatsDTO) -> CacheStatsSchema:
+    """
+    Map CacheStatsDTO (service layer) to CacheStatsSchema (API response).
+
+    Args:
+        dto (CacheStatsDTO): Snapshot of cache statistics.
+
+    Returns:
+        CacheStatsSchema: Schema ready to be returned in API response.
+    """
+    return CacheStatsSchema(
+        size=dto.size,
+        max_size=dto.max_size,
+        ttl=dto.ttl,
+        hits=dto.hits,
+        misses=dto.misses
+    )
+
+
+def to_schema_course_cache_stats(dto: CourseCacheStatsDTO) -> CourseCacheStatsResponseSchema:
+    """
+    Map CourseCacheStatsDTO (service layer) to CourseCacheStatsResponseSchema (API response).
+
+    Args:
+        dto (CourseCacheStatsDTO): Statistics of the course caches.
+
+    Returns:
+        CourseCacheStatsResponseSchema: Schema ready to be returned in API response.
+    """
+    return CourseCacheStatsResponseSchema(
+        by_id=to_schema_cache_stats(dto.by_id),
+        by_name=to_schema_cache_stats(dto.by_name)
+    )
@@ -7,6 +7,8 @@ from webapp.api.courses.schemas import (
     UpdateCourseSchema
 )
 from webapp.api.auth.decorators import admin_required
+from webapp.api.conditional import etag_response
+from webapp.api.streaming import wants_ndjson, ndjson_response
 from webapp.services.courses.services import CourseService
 from flask.typing import ResponseReturnValue
 from webapp.container import Container
@@ -15,7 +17,8 @@ from .mappers import (
     to_schema_course,
     to_dto_course_id,
     to_dto_course_name,
-    to_dto_update_course, to_schema_list_course
+    to_dto_update_course, to_schema_list_course,
+    to_schema_course_cache_stats
 )
 from . import course_bp
 
@@ -41,12 +44,12 @@ def create_course(course_service: CourseService=Provide[Container.course_service
 @inject
 def get_by_id(course_id: int, course_service: CourseService=Provide[Container.course_service]) -> ResponseReturnValue:
     """
-    Get a course by its ID (admin only).
+    Get a course by its ID (admin only), answering a matching ``If-None-Match`` with 304.
     """
     payload = CourseIdSchema(course_id=course_id)
     dto = to_dto_course_id(payload)
     course = course_service.get_by_id(dto)
-    return jsonify(to_schema_course(course).model_dump(mode="json")), 200
+    return etag_response(to_schema_course(course))
 
 
 @course_bp.get("/")
@@ -63,14 +66,29 @@ def get_by_name(course_service: CourseService=Provide[Container.course_service])
           ResponseReturnValue: JSON response containing a list of courses in the format
                                of CoursesListResponseSchema, with HTTP status code 200.
                                Raises NotFoundException if no matching courses are found.
+                               With ``Accept: application/x-ndjson``, the courses are
+                               streamed one per line instead.
       """
     payload = CourseNameSchema.model_validate(request.args.to_dict() or {})
     dto = to_dto_course_name(payload)
+    if wants_ndjson():
+        return ndjson_response(course_service.stream_by_name(dto))
     dtos = course_service.get_by_name(dto)
     courses = to_schema_list_course(dtos)
     return jsonify(courses.model_dump(mode="json")), 200
 
 
+@course_bp.get("/cache/stats")
+@admin_required
+@inject
+def cache_stats(course_service: CourseService=Provide[Container.course_service]) -> ResponseReturnValue:
+    """
+    Get statistics of the gateway course caches (admin only).
+    """
+    stats = course_service.cache_stats()
+    return jsonify(to_schema_course_cache_stats(stats).model_dump(mode="json")), 200
+
+
 @course_bp.patch("/<int:course_id>")
 @admin_required
 @inject
@@ -88,4 +88,34 @@ class UpdateCourseSchema(BaseModel):
     price: float | None = None
     start_date: str | None = None
     end_date: str | None = None
-    max_participants: int | None = Field(None, ge=0)
\ No newline at end of file
+    max_participants: int | None = Field(None, ge=0)
+
+
+class CacheStatsSchema(BaseModel):
+    """
+    Schema representing statistics of a single cache.
+
+    Fields:
+        size (int): Number of entries currently stored.
+        max_size (int): Maximum number of entries.
+        ttl (float): Time to live of an entry in seconds.
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups not found or expired.
+    """
+    size: int
+    max_size: int
+    ttl: float
+    hits: int
+    misses: int
+
+
+class CourseCacheStatsResponseSchema(BaseModel):
+    """
+    Schema representing statistics of the gateway course caches.
+
+    Fields:
+        by_id (CacheStatsSchema): Cache of single courses looked up by ID.
+        by_name (CacheStatsSchema): Cache of course lists looked up by name.
+    """
+    by_id: CacheStatsSchema
+    by_name: CacheStatsSchema
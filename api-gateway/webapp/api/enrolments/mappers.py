@@ -1,17 +1,22 @@
+from webapp.api.courses.mappers import to_schema_course
 from webapp.services.enrolments.dtos import (
     CreateEnrolmentDTO,
     EnrolmentDTO,
     EnrolmentIdDTO,
     EnrolmentByUserDTO,
+    EnrolmentUserIdDTO,
     DeleteEnrolmentDTO
 )
+from webapp.services.user_enrolments.dtos import EnrolmentWithCourseDTO
 from webapp.api.enrolments.schemas import (
     CreateEnrolmentSchema,
     EnrolmentResponseSchema,
     EnrolmentIdSchema,
     EnrolmentByUserSchema,
     DeleteEnrolmentSchema,
-    EnrolmentsListResponseSchema
+    EnrolmentsListResponseSchema,
+    EnrolmentWithCourseResponseSchema,
+    UserEnrolmentsResponseSchema
 )
 
 
@@ -62,6 +67,38 @@ def to_enrolments_list_response_schema(dtos: list[EnrolmentDTO]) -> EnrolmentsLi
     return EnrolmentsListResponseSchema(enrolments=[to_enrolment_response_schema(dto) for dto in dtos])
 
 
+def to_user_enrolments_response_schema(dtos: list[EnrolmentWithCourseDTO]) -> UserEnrolmentsResponseSchema:
+    """
+    Converts a list of EnrolmentWithCourseDTOs to UserEnrolmentsResponseSchema.
+
+    Args:
+        dtos (list[EnrolmentWithCourseDTO]): Enrolments composed with their courses.
+
+    Returns:
+        UserEnrolmentsResponseSchema: Schema containing enrolments with course details.
+    """
+    return UserEnrolmentsResponseSchema(enrolments=[
+        EnrolmentWithCourseResponseSchema(
+            **to_enrolment_response_schema(dto.enrolment).model_dump(),
+            course=to_schema_course(dto.course) if dto.course is not None else None
+        )
+        for dto in dtos
+    ])
+
+
+def to_enrolment_user_id_dto(user_id: str) -> EnrolmentUserIdDTO:
+    """
+    Converts the ID of the requesting user to EnrolmentUserIdDTO.
+
+    Args:
+        user_id (str): ID of the requesting user.
+
+    Returns:
+        EnrolmentUserIdDTO: DTO ready for service layer retrieval.
+    """
+    return EnrolmentUserIdDTO(user_id=user_id)
+
+
 def to_enrolment_id_dto(schema: EnrolmentIdSchema) -> EnrolmentIdDTO:
     """
     Converts EnrolmentIdSchema to EnrolmentIdDTO.
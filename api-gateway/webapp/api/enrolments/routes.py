@@ -3,6 +3,7 @@ from flask.typing import ResponseReturnValue
 from flask import jsonify, request
 from flask_jwt_extended import get_jwt_identity
 from webapp.services.enrolments.services import EnrolmentService
+from webapp.services.user_enrolments.services import UserEnrolmentsService
 from webapp.api.enrolments.schemas import (
     CreateEnrolmentSchema,
     EnrolmentIdSchema,
@@ -15,8 +16,13 @@ from webapp.api.enrolments.mappers import (
     to_enrolment_id_dto,
     to_enrolment_by_user_dto,
     to_delete_enrolment_dto,
-    to_enrolments_list_response_schema
+    to_enrolments_list_response_schema,
+    to_enrolment_user_id_dto,
+    to_user_enrolments_response_schema
 )
+from webapp.api.conditional import etag_response
+from webapp.api.passthrough import passthrough_enabled, passthrough_response
+from webapp.api.streaming import wants_ndjson, ndjson_response
 from webapp.api.protected.routes import user_required, admin_required
 from webapp.container import Container
 from . import enrolment_bp
@@ -100,15 +106,17 @@ def get_by_id(enrolment_id: int, enrolment_service: EnrolmentService=Provide[Con
         enrolment_id (int): ID of the enrolment to retrieve.
 
     Returns:
-        200 OK with EnrolmentResponseSchema
+        200 OK with EnrolmentResponseSchema and its ETag, or 304 Not Modified if ``If-None-Match`` matches
 
     Permissions:
         Admin only.
     """
     payload = EnrolmentIdSchema(enrolment_id=enrolment_id)
     dto = to_enrolment_id_dto(payload)
+    if passthrough_enabled():
+        return passthrough_response(enrolment_service.get_by_id_raw(dto))
     enrolment = enrolment_service.get_by_id(dto)
-    return jsonify(to_enrolment_response_schema(enrolment).model_dump(mode="json")), 200
+    return etag_response(to_enrolment_response_schema(enrolment))
 
 
 @enrolment_bp.get("/<int:enrolment_id>/details")
@@ -122,7 +130,7 @@ def get_by_id_and_user(enrolment_id: int, enrolment_service: EnrolmentService=Pr
         enrolment_id (int): ID of the enrolment to retrieve.
 
     Returns:
-        200 OK with EnrolmentResponseSchema
+        200 OK with EnrolmentResponseSchema and its ETag, or 304 Not Modified if ``If-None-Match`` matches
 
     Permissions:
         User must be authenticated.
@@ -130,8 +138,30 @@ def get_by_id_and_user(enrolment_id: int, enrolment_service: EnrolmentService=Pr
     user_id = get_jwt_identity()
     payload = EnrolmentByUserSchema(enrolment_id=enrolment_id)
     dto = to_enrolment_by_user_dto(payload, user_id)
+    if passthrough_enabled():
+        return passthrough_response(enrolment_service.get_by_id_and_user_raw(dto))
     enrolment = enrolment_service.get_by_id_and_user(dto)
-    return jsonify(to_enrolment_response_schema(enrolment).model_dump(mode="json")), 200
+    return etag_response(to_enrolment_response_schema(enrolment))
+
+
+@enrolment_bp.get("/me")
+@user_required
+@inject
+def get_my_enrolments(
+        user_enrolments_service: UserEnrolmentsService=Provide[Container.user_enrolments_service]
+) -> ResponseReturnValue:
+    """
+    Get all enrolments of the authenticated user together with their course details.
+
+    Returns:
+        200 OK with UserEnrolmentsResponseSchema
+
+    Permissions:
+        User must be authenticated.
+    """
+    dto = to_enrolment_user_id_dto(get_jwt_identity())
+    dtos = user_enrolments_service.get_for_user(dto)
+    return jsonify(to_user_enrolments_response_schema(dtos).model_dump(mode="json")), 200
 
 
 @enrolment_bp.get("/active")
@@ -147,6 +177,10 @@ def get_active(enrolment_service: EnrolmentService=Provide[Container.enrolment_s
     Permissions:
         Admin only.
     """
+    if wants_ndjson():
+        return ndjson_response(enrolment_service.stream_active())
+    if passthrough_enabled():
+        return passthrough_response(enrolment_service.get_active_raw(), list_key="enrolments")
     dtos = enrolment_service.get_active()
     enrolments = to_enrolments_list_response_schema(dtos)
     return jsonify(enrolments.model_dump(mode="json")), 200
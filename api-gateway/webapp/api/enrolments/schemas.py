@@ -1,4 +1,5 @@
 from pydantic import BaseModel
+from webapp.api.courses.schemas import CourseResponseSchema
 from webapp.services.enrolments.dtos import PaymentStatus, Status
 
 class CreateEnrolmentSchema(BaseModel):
@@ -41,6 +42,26 @@ class EnrolmentsListResponseSchema(BaseModel):
     enrolments: list[EnrolmentResponseSchema]
 
 
+class EnrolmentWithCourseResponseSchema(EnrolmentResponseSchema):
+    """
+    Schema representing an enrolment together with its course.
+
+    Attributes:
+        course (CourseResponseSchema | None): Details of the enrolled course, null if the course no longer exists.
+    """
+    course: CourseResponseSchema | None
+
+
+class UserEnrolmentsResponseSchema(BaseModel):
+    """
+    Schema representing the authenticated user's enrolments with their courses.
+
+    Attributes:
+        enrolments (list[EnrolmentWithCourseResponseSchema]): List of enrolments with course details.
+    """
+    enrolments: list[EnrolmentWithCourseResponseSchema]
+
+
 class EnrolmentIdSchema(BaseModel):
     """
     Schema for identifying a specific enrolment by ID.
@@ -1,6 +1,6 @@
 from flask import Flask, jsonify
 from flask.typing import ResponseReturnValue
-from webapp.services.exceptions import ApiException
+from webapp.services.exceptions import ApiException, OverloadedException
 from typing import TypedDict
 import structlog
 import traceback
@@ -21,6 +21,8 @@ def register_error_handlers(app: Flask) -> None:
         }
         if error.details:
             response['details'] = error.details
+        if isinstance(error, OverloadedException):
+            return jsonify(response), error.status_code, {"Retry-After": str(error.retry_after)}
 
         return jsonify(response), error.status_code
 
@@ -33,6 +35,14 @@ def register_error_handlers(app: Flask) -> None:
         }
         ), 404
 
+    @app.errorhandler(429)
+    def handle_rate_limit_error(_: Exception) -> ResponseReturnValue:
+        return jsonify({
+            "message": "Too many requests.",
+            "error": "rate_limited",
+        }
+        ), 429
+
     @app.errorhandler(Exception)
     def handle_generic(error: Exception) -> ResponseReturnValue:
         logger.error(
@@ -0,0 +1,3 @@
+from flask import Blueprint
+
+health_bp = Blueprint('health', __name__, url_prefix='/health')
\ No newline at end of file
@@ -0,0 +1,29 @@
+from datetime import datetime, timezone
+from webapp.api.health.schemas import DependencyHealthSchema, HealthResponseSchema
+from webapp.services.health.dtos import HealthDTO, HealthStatus
+
+
+def to_schema_health(dto: HealthDTO) -> HealthResponseSchema:
+    """
+    Map HealthDTO (service layer) to HealthResponseSchema (API response).
+
+    Args:
+        dto (HealthDTO): Aggregated health of the downstream services.
+
+    Returns:
+        HealthResponseSchema: Schema ready to be returned in API response.
+    """
+    return HealthResponseSchema(
+        status="ok" if dto.status == HealthStatus.OK else "error",
+        gateway="ok",
+        checked_at=datetime.fromtimestamp(dto.checked_at, tz=timezone.utc),
+        dependencies={
+            dependency.name: DependencyHealthSchema(
+                status=dependency.status.value,
+                latency_ms=dependency.latency_ms,
+                circuit=dependency.circuit,
+                details=dependency.details
+            )
+            for dependency in dto.dependencies
+        }
+    )
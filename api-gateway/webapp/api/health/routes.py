@@ -0,0 +1,26 @@
+from dependency_injector.wiring import Provide, inject
+from flask import jsonify
+from flask.typing import ResponseReturnValue
+from webapp.api.health.mappers import to_schema_health
+from webapp.container import Container
+from webapp.services.health.dtos import HealthStatus
+from webapp.services.health.services import HealthService
+from . import health_bp
+
+
+@health_bp.get("")
+@inject
+def health(health_service: HealthService = Provide[Container.health_service]) -> ResponseReturnValue:
+    """
+    Health check endpoint of the gateway and its downstream services.
+
+    Probes the ``/health`` endpoints of the Users, Courses and Enrolments services
+    concurrently and reports their status, probe latency and circuit state. The
+    result is cached for ``HEALTH_CACHE_TTL`` seconds.
+
+    Returns:
+        200 OK with HealthResponseSchema if every service is up, 503 otherwise.
+    """
+    dto = health_service.check()
+    status_code = 200 if dto.status == HealthStatus.OK else 503
+    return jsonify(to_schema_health(dto).model_dump(mode="json")), status_code
@@ -0,0 +1,34 @@
+from datetime import datetime
+from pydantic import BaseModel
+
+
+class DependencyHealthSchema(BaseModel):
+    """
+    Schema representing the health of a downstream service.
+
+    Fields:
+        status (str): ``ok`` or ``down``.
+        latency_ms (float): Duration of the health probe in milliseconds.
+        circuit (str): State of the circuit breaker of the service.
+        details (dict[str, str]): Health report of the service itself.
+    """
+    status: str
+    latency_ms: float
+    circuit: str
+    details: dict[str, str]
+
+
+class HealthResponseSchema(BaseModel):
+    """
+    Schema representing the aggregated health of the gateway.
+
+    Fields:
+        status (str): ``ok`` if every dependency is up, ``error`` otherwise.
+        gateway (str): Status of the gateway itself.
+        checked_at (datetime): Time of the probes; results are cached for a short time.
+        dependencies (dict[str, DependencyHealthSchema]): Health of every downstream service by name.
+    """
+    status: str
+    gateway: str
+    checked_at: datetime
+    dependencies: dict[str, DependencyHealthSchema]
@@ -0,0 +1,58 @@
+"""
+Pass-through of downstream GET responses.
+
+Routes whose response shape matches the downstream shape may return the
+upstream body as is, skipping the DTO and schema round trip. Enabled with
+``PASSTHROUGH_ENABLED``.
+"""
+from flask import Response, current_app, request
+from werkzeug.wrappers import Response as BaseResponse
+from webapp.services.exceptions import ServerException
+import httpx
+import re
+
+FORWARDED_HEADERS = ("Cache-Control", "ETag", "Last-Modified")
+
+
+def passthrough_enabled() -> bool:
+    """Return whether routes should pass downstream responses through."""
+    return bool(current_app.config["PASSTHROUGH_ENABLED"])
+
+
+def passthrough_response(response: httpx.Response, list_key: str | None = None) -> BaseResponse:
+    """
+    Build a gateway response from the raw body of a downstream response.
+
+    Only a lightweight shape check is made: the body must be JSON and start
+    with an object, or with an object whose first key is ``list_key`` holding a list.
+    Hop-by-hop, length and encoding headers of the downstream response are dropped,
+    so Flask sets them for the body it actually sends. As the body is unchanged, the
+    downstream ETag stays valid and a matching ``If-None-Match`` is answered with 304.
+
+    Args:
+        response (httpx.Response): Successful downstream response.
+        list_key (str | None): Key of the list the body is expected to wrap, e.g. ``enrolments``.
+
+    Returns:
+        BaseResponse: Response carrying the downstream body unchanged, or an empty 304 response.
+
+    Raises:
+        ServerException: If the downstream body does not have the expected shape.
+    """
+    body = response.content
+    if not _matches_shape(response, body, list_key):
+        raise ServerException("Unexpected response from downstream service")
+
+    passthrough = Response(body, status=response.status_code, mimetype="application/json")
+    for name in FORWARDED_HEADERS:
+        if name in response.headers:
+            passthrough.headers[name] = response.headers[name]
+    return passthrough.make_conditional(request)
+
+
+def _matches_shape(response: httpx.Response, body: bytes, list_key: str | None) -> bool:
+    if not response.headers.get("Content-Type", "").startswith("application/json"):
+        return False
+    if list_key is None:
+        return re.match(rb"\s*\{", body) is not None
+    return re.match(rb'\s*\{\s*"%s"\s*:\s*\[' % re.escape(list_key.encode()), body) is not None
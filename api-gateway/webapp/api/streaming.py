@@ -0,0 +1,27 @@
+"""
+NDJSON streaming of large list responses.
+
+Clients opt in with ``Accept: application/x-ndjson``; the downstream NDJSON
+body is then relayed chunk by chunk instead of being buffered and re-parsed.
+"""
+from flask import Response, request
+from typing import Iterable
+from webapp.services.downstream import NDJSON_MIMETYPE
+
+
+def wants_ndjson() -> bool:
+    """Return whether the client prefers an NDJSON stream over a JSON document."""
+    return request.accept_mimetypes.best_match(["application/json", NDJSON_MIMETYPE]) == NDJSON_MIMETYPE
+
+
+def ndjson_response(chunks: Iterable[bytes]) -> Response:
+    """
+    Build a streamed NDJSON response relaying downstream chunks.
+
+    Args:
+        chunks (Iterable[bytes]): NDJSON body chunks, one or more objects per line.
+
+    Returns:
+        Response: Streamed response with the NDJSON mimetype.
+    """
+    return Response(chunks, mimetype=NDJSON_MIMETYPE)
@@ -1,4 +1,5 @@
 from webapp.api.auth.decorators import user_required, admin_required
+from webapp.api.conditional import etag_response
 from dependency_injector.wiring import Provide, inject
 from flask import request, jsonify
 from webapp.api.users.mappers import (
@@ -66,12 +67,13 @@ def get_user_by_id(user_service: UserService=Provide[Container.user_service]) ->
         user_id (str): User ID.
 
     Returns:
-        JSON response with user data (UserResponseSchema) and HTTP status 200.
+        JSON response with user data (UserResponseSchema) and its ETag with HTTP status 200,
+        or an empty response with HTTP status 304 if ``If-None-Match`` matches.
     """
     payload = UserIdSchema.model_validate(request.args.to_dict() or {})
     dto = to_dto_user_id(payload)
     user = user_service.get_user_by_id(dto)
-    return jsonify(to_schema_user(user).model_dump(mode="json")), 200
+    return etag_response(to_schema_user(user))
 
 
 @users_bp.get("/identifier")
@@ -85,12 +87,13 @@ def get_user_by_identifier(user_service: UserService=Provide[Container.user_serv
         identifier (str): Username or email.
 
     Returns:
-        JSON response with user data (UserResponseSchema) and HTTP status 200.
+        JSON response with user data (UserResponseSchema) and its ETag with HTTP status 200,
+        or an empty response with HTTP status 304 if ``If-None-Match`` matches.
     """
     payload = IdentifierSchema.model_validate(request.args.to_dict() or {})
     dto = to_dto_identifier(payload)
     user = user_service.get_user_by_identifier(dto)
-    return jsonify(to_schema_user(user).model_dump(mode="json")), 200
+    return etag_response(to_schema_user(user))
 
 
 @users_bp.patch("/activation")
@@ -0,0 +1,140 @@
+"""
+Negotiated response compression of the API gateway.
+
+Responses of at least ``COMPRESSION_MIN_SIZE`` bytes are compressed with the best
+encoding accepted by the client (``Accept-Encoding``) among ``COMPRESSION_ENCODINGS``.
+gzip is always available; ``br`` and ``zstd`` are used only when the ``brotli`` and
+``zstandard`` packages are installed. Streamed responses and content types that are
+already compressed are sent as they are.
+"""
+from flask import Flask, Response, current_app, request
+from types import ModuleType
+from typing import Callable
+import gzip
+import importlib
+
+
+def _optional_module(name: str) -> ModuleType | None:
+    try:
+        return importlib.import_module(name)
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+
+
+brotli = _optional_module("brotli")
+zstandard = _optional_module("zstandard")
+
+COMPRESSED_MIMETYPES = frozenset({
+    "application/gzip",
+    "application/x-gzip",
+    "application/zip",
+    "application/zstd",
+    "application/x-brotli",
+    "application/pdf",
+    "font/woff",
+    "font/woff2",
+})
+UNCOMPRESSED_MEDIA = frozenset({"image/svg+xml", "image/bmp", "image/x-icon"})
+
+
+def _gzip(data: bytes, level: int) -> bytes:
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+def _brotli(data: bytes, level: int) -> bytes:
+    return brotli.compress(data, quality=level)  # type: ignore[union-attr]
+
+
+def _zstd(data: bytes, level: int) -> bytes:
+    return zstandard.ZstdCompressor(level=level).compress(data)  # type: ignore[union-attr]
+
+
+def available_encodings() -> dict[str, Callable[[bytes, int], bytes]]:
+    """
+    Return the content encodings supported in this environment.
+
+    Returns:
+        dict[str, Callable[[bytes, int], bytes]]: Compress function by encoding name.
+    """
+    encodings: dict[str, Callable[[bytes, int], bytes]] = {"gzip": _gzip}
+    if brotli is not None:
+        encodings["br"] = _brotli
+    if zstandard is not None:
+        encodings["zstd"] = _zstd
+    return encodings
+
+
+def init_compression(app: Flask) -> None:
+    """
+    Compress responses of the application according to ``Accept-Encoding``.
+
+    Encodings listed in ``COMPRESSION_ENCODINGS`` whose package is missing are
+    ignored. Nothing is registered if compression is disabled.
+
+    Args:
+        app (Flask): Application whose responses are compressed.
+    """
+    if not app.config["COMPRESSION_ENABLED"]:
+        return
+
+    supported = available_encodings()
+    app.extensions["compression"] = {
+        name: supported[name] for name in app.config["COMPRESSION_ENCODINGS"] if name in supported
+    }
+    app.after_request(compress_response)
+
+
+def compress_response(response: Response) -> Response:
+    """
+    Compress a response with the encoding negotiated for the current request.
+
+    A compressed response carries ``Content-Encoding``, an updated ``Content-Length``
+    and a weakened ETag, as its bytes differ from the identity representation.
+    ``Vary: Accept-Encoding`` is set on every response eligible for compression.
+
+    Args:
+        response (Response): Response returned by the view.
+
+    Returns:
+        Response: The same response, compressed if applicable.
+    """
+    if (
+        response.direct_passthrough
+        or response.is_streamed
+        or response.status_code < 200
+        or response.status_code in (204, 304)
+        or "Content-Encoding" in response.headers
+        or not _is_compressible(response.mimetype)
+    ):
+        return response
+
+    data = response.get_data()
+    if len(data) < current_app.config["COMPRESSION_MIN_SIZE"]:
+        return response
+
+    response.vary.add("Accept-Encoding")
+    encodings = current_app.extensions["compression"]
+    encoding = request.accept_encodings.best_match(encodings)
+    if encoding is None:
+        return response
+
+    level = current_app.config[f"COMPRESSION_{encoding.upper()}_LEVEL"]
+    compressed = encodings[encoding](data, level)
+    if len(compressed) >= len(data):
+        return response
+
+    response.set_data(compressed)
+    response.headers["Content-Encoding"] = encoding
+    etag, weak = response.get_etag()
+    if etag is not None and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+
+def _is_compressible(mimetype: str | None) -> bool:
+    if not mimetype or mimetype in COMPRESSED_MIMETYPES:
+        return False
+    major = mimetype.partition("/")[0]
+    if major in ("video", "audio"):
+        return False
+    return major != "image" or mimetype in UNCOMPRESSED_MEDIA
@@ -1,19 +1,45 @@
+from concurrent.futures import ThreadPoolExecutor
 from dependency_injector import providers, containers
 from webapp.services.auth.services import AuthService
+from webapp.services.batch.services import BatchService
+from webapp.services.user_enrolments.services import UserEnrolmentsService
+from webapp.services.bulkhead import Bulkhead
+from webapp.services.cache import TTLCache
+from webapp.services.circuit_breaker import CircuitBreaker, RetryBudget
+from webapp.services.courses.dtos import CourseDTO
 from webapp.services.courses.services import CourseService
+from webapp.services.downstream import DownstreamClient
 from webapp.services.enrolments.services import EnrolmentService
+from webapp.services.health.services import HealthService
+from webapp.services.revocation.services import init_revocation_service
+from webapp.services.hedging import HedgingPolicy
+from webapp.services.http_client import init_http_client
+from webapp.services.single_flight import SingleFlight
+from webapp.services.users.dtos import UserDTO
 from webapp.services.users.services import UserService
 
 class Container(containers.DeclarativeContainer):
     """
     Dependency Injection container for the API Gateway.
 
-    Provides singleton instances of all core services:
+    Provides one pooled, keep-alive HTTP client per downstream microservice
+    and singleton instances of all core services:
         - AuthService
         - UserService
         - CourseService
         - EnrolmentService
+        - UserEnrolmentsService
+        - BatchService
+        - HealthService
+        - RevocationService
 
+    HTTP clients are resources, closed by `shutdown_resources()` when the worker exits.
+    Each one is wrapped in a DownstreamClient with its own circuit breaker and retry
+    budget, which also coalesces identical concurrent GETs. GETs to the Users and
+    Courses services can be hedged, within a hedging budget of their own. Every client
+    has a bulkhead bounding its concurrent calls, so one slow service cannot hold every worker.
+    Bounded TTL/LRU caches back role lookups in UserService and course lookups in CourseService.
+    Revoked JWTs are mirrored from the Users service in a Bloom filter synced in the background.
     Also wires these services into API packages for automatic dependency injection.
     """
 
@@ -22,10 +48,235 @@ class Container(containers.DeclarativeContainer):
             "webapp.api.auth",
             "webapp.api.users",
             "webapp.api.courses",
-            "webapp.api.enrolments"
+            "webapp.api.enrolments",
+            "webapp.api.batch",
+            "webapp.api.health"
         ]
     )
-    auth_service = providers.Singleton(AuthService)
-    user_service = providers.Singleton(UserService)
-    course_service = providers.Singleton(CourseService)
-    enrolment_service = providers.Singleton(EnrolmentService)
\ No newline at end of file
+    config = providers.Configuration()
+
+    users_http_client = providers.Resource(
+        init_http_client,
+        base_url=config.USERS_SERVICE_URL,
+        timeout=config.USERS_HTTP_TIMEOUT,
+        connect_timeout=config.HTTP_CONNECT_TIMEOUT,
+        max_connections=config.HTTP_POOL_MAX_CONNECTIONS,
+        max_keepalive_connections=config.HTTP_POOL_MAX_KEEPALIVE,
+        keepalive_expiry=config.HTTP_KEEPALIVE_EXPIRY,
+        replica_failure_threshold=config.REPLICA_FAILURE_THRESHOLD,
+        replica_ejection_seconds=config.REPLICA_EJECTION_SECONDS,
+        replica_health_interval=config.REPLICA_HEALTH_INTERVAL,
+        replica_health_timeout=config.HEALTH_TIMEOUT
+    )
+    courses_http_client = providers.Resource(
+        init_http_client,
+        base_url=config.COURSE_SERVICE_URL,
+        timeout=config.COURSE_HTTP_TIMEOUT,
+        connect_timeout=config.HTTP_CONNECT_TIMEOUT,
+        max_connections=config.HTTP_POOL_MAX_CONNECTIONS,
+        max_keepalive_connections=config.HTTP_POOL_MAX_KEEPALIVE,
+        keepalive_expiry=config.HTTP_KEEPALIVE_EXPIRY,
+        replica_failure_threshold=config.REPLICA_FAILURE_THRESHOLD,
+        replica_ejection_seconds=config.REPLICA_EJECTION_SECONDS,
+        replica_health_interval=config.REPLICA_HEALTH_INTERVAL,
+        replica_health_timeout=config.HEALTH_TIMEOUT
+    )
+    enrolments_http_client = providers.Resource(
+        init_http_client,
+        base_url=config.ENROLMENT_SERVICE_URL,
+        timeout=config.ENROLMENT_HTTP_TIMEOUT,
+        connect_timeout=config.HTTP_CONNECT_TIMEOUT,
+        max_connections=config.HTTP_POOL_MAX_CONNECTIONS,
+        max_keepalive_connections=config.HTTP_POOL_MAX_KEEPALIVE,
+        keepalive_expiry=config.HTTP_KEEPALIVE_EXPIRY,
+        replica_failure_threshold=config.REPLICA_FAILURE_THRESHOLD,
+        replica_ejection_seconds=config.REPLICA_EJECTION_SECONDS,
+        replica_health_interval=config.REPLICA_HEALTH_INTERVAL,
+        replica_health_timeout=config.HEALTH_TIMEOUT
+    )
+
+    hedging_executor = providers.Singleton(ThreadPoolExecutor, max_workers=config.HEDGING_MAX_WORKERS)
+
+    users_client = providers.Singleton(
+        DownstreamClient,
+        name="users",
+        client=users_http_client,
+        single_flight=providers.Singleton(SingleFlight),
+        circuit_breaker=providers.Singleton(
+            CircuitBreaker,
+            name="users",
+            failure_rate_threshold=config.CIRCUIT_BREAKER_FAILURE_RATE,
+            minimum_calls=config.CIRCUIT_BREAKER_MINIMUM_CALLS,
+            window_size=config.CIRCUIT_BREAKER_WINDOW_SIZE,
+            open_seconds=config.CIRCUIT_BREAKER_OPEN_SECONDS,
+            half_open_max_calls=config.CIRCUIT_BREAKER_HALF_OPEN_CALLS,
+            retry_budget=providers.Singleton(
+                RetryBudget,
+                ratio=config.RETRY_BUDGET_RATIO,
+                max_tokens=config.RETRY_BUDGET_MAX_TOKENS
+            )
+        ),
+        single_flight_enabled=config.SINGLE_FLIGHT_ENABLED,
+        max_retries=config.RETRY_MAX_RETRIES,
+        retry_backoff=config.RETRY_BACKOFF,
+        hedging=providers.Singleton(
+            HedgingPolicy,
+            percentile=config.HEDGING_PERCENTILE,
+            min_delay=config.HEDGING_MIN_DELAY,
+            budget=providers.Singleton(
+                RetryBudget,
+                ratio=config.HEDGING_BUDGET_RATIO,
+                max_tokens=config.HEDGING_BUDGET_MAX_TOKENS
+            ),
+            window_size=config.HEDGING_WINDOW_SIZE,
+            min_samples=config.HEDGING_MIN_SAMPLES
+        ),
+        hedging_executor=hedging_executor,
+        hedging_enabled=config.HEDGING_ENABLED,
+        bulkhead=providers.Singleton(
+            Bulkhead,
+            name="users",
+            max_concurrent=config.USERS_BULKHEAD_MAX_CONCURRENT,
+            max_queue=config.USERS_BULKHEAD_MAX_QUEUE,
+            queue_timeout=config.USERS_BULKHEAD_QUEUE_TIMEOUT
+        )
+    )
+    courses_client = providers.Singleton(
+        DownstreamClient,
+        name="courses",
+        client=courses_http_client,
+        single_flight=providers.Singleton(SingleFlight),
+        circuit_breaker=providers.Singleton(
+            CircuitBreaker,
+            name="courses",
+            failure_rate_threshold=config.CIRCUIT_BREAKER_FAILURE_RATE,
+            minimum_calls=config.CIRCUIT_BREAKER_MINIMUM_CALLS,
+            window_size=config.CIRCUIT_BREAKER_WINDOW_SIZE,
+            open_seconds=config.CIRCUIT_BREAKER_OPEN_SECONDS,
+            half_open_max_calls=config.CIRCUIT_BREAKER_HALF_OPEN_CALLS,
+            retry_budget=providers.Singleton(
+                RetryBudget,
+                ratio=config.RETRY_BUDGET_RATIO,
+                max_tokens=config.RETRY_BUDGET_MAX_TOKENS
+            )
+        ),
+        single_flight_enabled=config.SINGLE_FLIGHT_ENABLED,
+        max_retries=config.RETRY_MAX_RETRIES,
+        retry_backoff=config.RETRY_BACKOFF,
+        hedging=providers.Singleton(
+            HedgingPolicy,
+            percentile=config.HEDGING_PERCENTILE,
+            min_delay=config.HEDGING_MIN_DELAY,
+            budget=providers.Singleton(
+                RetryBudget,
+                ratio=config.HEDGING_BUDGET_RATIO,
+                max_tokens=config.HEDGING_BUDGET_MAX_TOKENS
+            ),
+            window_size=config.HEDGING_WINDOW_SIZE,
+            min_samples=config.HEDGING_MIN_SAMPLES
+        ),
+        hedging_executor=hedging_executor,
+        hedging_enabled=config.HEDGING_ENABLED,
+        bulkhead=providers.Singleton(
+            Bulkhead,
+            name="courses",
+            max_concurrent=config.COURSE_BULKHEAD_MAX_CONCURRENT,
+            max_queue=config.COURSE_BULKHEAD_MAX_QUEUE,
+            queue_timeout=config.COURSE_BULKHEAD_QUEUE_TIMEOUT
+        )
+    )
+    enrolments_client = providers.Singleton(
+        DownstreamClient,
+        name="enrolments",
+        client=enrolments_http_client,
+        single_flight=providers.Singleton(SingleFlight),
+        circuit_breaker=providers.Singleton(
+            CircuitBreaker,
+            name="enrolments",
+            failure_rate_threshold=config.CIRCUIT_BREAKER_FAILURE_RATE,
+            minimum_calls=config.CIRCUIT_BREAKER_MINIMUM_CALLS,
+            window_size=config.CIRCUIT_BREAKER_WINDOW_SIZE,
+            open_seconds=config.CIRCUIT_BREAKER_OPEN_SECONDS,
+            half_open_max_calls=config.CIRCUIT_BREAKER_HALF_OPEN_CALLS,
+            retry_budget=providers.Singleton(
+                RetryBudget,
+                ratio=config.RETRY_BUDGET_RATIO,
+                max_tokens=config.RETRY_BUDGET_MAX_TOKENS
+            )
+        ),
+        single_flight_enabled=config.SINGLE_FLIGHT_ENABLED,
+        max_retries=config.RETRY_MAX_RETRIES,
+        retry_backoff=config.RETRY_BACKOFF,
+        bulkhead=providers.Singleton(
+            Bulkhead,
+            name="enrolments",
+            max_concurrent=config.ENROLMENT_BULKHEAD_MAX_CONCURRENT,
+            max_queue=config.ENROLMENT_BULKHEAD_MAX_QUEUE,
+            queue_timeout=config.ENROLMENT_BULKHEAD_QUEUE_TIMEOUT
+        )
+    )
+
+    user_cache: providers.Singleton[TTLCache[str, UserDTO]] = providers.Singleton(
+        TTLCache,
+        max_size=config.USER_CACHE_MAX_SIZE,
+        ttl=config.USER_CACHE_TTL
+    )
+
+    course_cache: providers.Singleton[TTLCache[int, CourseDTO]] = providers.Singleton(
+        TTLCache,
+        max_size=config.COURSE_CACHE_MAX_SIZE,
+        ttl=config.COURSE_CACHE_TTL
+    )
+    course_search_cache: providers.Singleton[TTLCache[str, list[CourseDTO]]] = providers.Singleton(
+        TTLCache,
+        max_size=config.COURSE_CACHE_MAX_SIZE,
+        ttl=config.COURSE_SEARCH_CACHE_TTL
+    )
+
+    auth_service = providers.Singleton(AuthService, client=users_client)
+    user_service = providers.Singleton(UserService, client=users_client, cache=user_cache)
+    course_service = providers.Singleton(
+        CourseService,
+        client=courses_client,
+        cache=course_cache,
+        search_cache=course_search_cache
+    )
+    enrolment_service = providers.Singleton(EnrolmentService, client=enrolments_client)
+
+    fanout_executor = providers.Singleton(ThreadPoolExecutor, max_workers=config.FANOUT_MAX_WORKERS)
+    user_enrolments_service = providers.Singleton(
+        UserEnrolmentsService,
+        enrolment_service=enrolment_service,
+        course_service=course_service,
+        executor=fanout_executor
+    )
+
+    batch_executor = providers.Singleton(ThreadPoolExecutor, max_workers=config.BATCH_MAX_WORKERS)
+    batch_service = providers.Singleton(
+        BatchService,
+        executor=batch_executor,
+        max_items=config.BATCH_MAX_ITEMS
+    )
+
+    health_executor = providers.Singleton(ThreadPoolExecutor, max_workers=3)
+    health_service = providers.Singleton(
+        HealthService,
+        clients=providers.List(users_client, courses_client, enrolments_client),
+        executor=health_executor,
+        cache=providers.Singleton(TTLCache, max_size=1, ttl=config.HEALTH_CACHE_TTL),
+        timeout=config.HEALTH_TIMEOUT
+    )
+
+    revocation_service = providers.Resource(
+        init_revocation_service,
+        client=users_client,
+        cache=providers.Singleton(
+            TTLCache,
+            max_size=config.REVOCATION_CACHE_MAX_SIZE,
+            ttl=config.REVOCATION_CACHE_TTL
+        ),
+        capacity=config.REVOCATION_CAPACITY,
+        false_positive_rate=config.REVOCATION_FALSE_POSITIVE_RATE,
+        sync_interval=config.REVOCATION_SYNC_INTERVAL,
+        rebuild_interval=config.REVOCATION_REBUILD_INTERVAL
+    )
@@ -0,0 +1,153 @@
+"""
+Request deadlines of the API gateway.
+
+Every request gets an absolute deadline ``REQUEST_DEADLINE`` seconds after it
+arrives, or earlier if the client sent an earlier ``X-Request-Deadline``. The
+deadline is sent to downstream services in the same header as a UNIX timestamp,
+and the budget left until it caps the timeout of every upstream call, so no
+service keeps working for a client the gateway has already given up on.
+"""
+from contextvars import ContextVar
+from flask import Flask, current_app, g, request
+from typing import Callable
+from webapp.services.exceptions import DeadlineExceededException
+import math
+import time
+
+DEADLINE_HEADER = "X-Request-Deadline"
+
+_deadline: ContextVar[float | None] = ContextVar("deadline", default=None)
+
+
+def parse_deadline(value: str | None) -> float | None:
+    """
+    Parse an ``X-Request-Deadline`` header value.
+
+    Args:
+        value (str | None): UNIX timestamp in seconds, e.g. ``1760000000.250``.
+
+    Returns:
+        float | None: The deadline, or None if missing or malformed.
+    """
+    if not value:
+        return None
+    try:
+        deadline = float(value)
+    except ValueError:
+        return None
+    return deadline if math.isfinite(deadline) else None
+
+
+def current_deadline() -> float | None:
+    """Return the absolute deadline of the current request, if any."""
+    return _deadline.get()
+
+
+def remaining() -> float | None:
+    """
+    Return the time left until the deadline of the current request.
+
+    Returns:
+        float | None: Seconds left (negative once passed), or None without a deadline.
+    """
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.time()
+
+
+def check_deadline() -> None:
+    """
+    Reject work for a request whose deadline has passed.
+
+    Raises:
+        DeadlineExceededException: If the deadline of the current request has passed.
+    """
+    budget = remaining()
+    if budget is not None and budget <= 0:
+        raise DeadlineExceededException()
+
+
+def timeout(default: float | None) -> float | None:
+    """
+    Return the timeout of a call made on behalf of the current request.
+
+    Args:
+        default (float | None): Timeout used without a deadline; None means no timeout.
+
+    Returns:
+        float | None: `default` capped by the time left until the deadline.
+
+    Raises:
+        DeadlineExceededException: If the deadline has already passed.
+    """
+    budget = remaining()
+    if budget is None:
+        return default
+    if budget <= 0:
+        raise DeadlineExceededException()
+    return budget if default is None else min(default, budget)
+
+
+def inject(headers: dict[str, str] | None = None) -> dict[str, str]:
+    """
+    Return a copy of the headers carrying the deadline of the current request.
+
+    Args:
+        headers (dict[str, str] | None): Headers of an outgoing request.
+
+    Returns:
+        dict[str, str]: Headers to send.
+    """
+    headers = dict(headers or {})
+    deadline = _deadline.get()
+    if deadline is not None:
+        headers[DEADLINE_HEADER] = f"{deadline:.3f}"
+    return headers
+
+
+def bind[**P, R](fn: Callable[P, R]) -> Callable[P, R]:
+    """
+    Bind a function to the deadline of the current request, for use in another thread.
+
+    Args:
+        fn (Callable[P, R]): Function submitted to an executor.
+
+    Returns:
+        Callable[P, R]: Function running under the deadline current at the time of binding.
+    """
+    deadline = _deadline.get()
+
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        token = _deadline.set(deadline)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _deadline.reset(token)
+
+    return wrapper
+
+
+def init_deadline(app: Flask) -> None:
+    """
+    Give every request of the application a deadline.
+
+    Args:
+        app (Flask): Application whose requests get a deadline.
+    """
+    app.before_request(_start_deadline)
+    app.teardown_request(_end_deadline)
+
+
+def _start_deadline() -> None:
+    deadline = time.time() + current_app.config["REQUEST_DEADLINE"]
+    requested = parse_deadline(request.headers.get(DEADLINE_HEADER))
+    if requested is not None:
+        deadline = min(deadline, requested)
+
+    g.deadline_token = _deadline.set(deadline)
+    check_deadline()
+
+
+def _end_deadline(_: BaseException | None) -> None:
+    token = g.pop("deadline_token", None)
+    if token is not None:
+        _deadline.reset(token)
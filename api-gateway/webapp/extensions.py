@@ -1,4 +1,5 @@
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
+from webapp.rate_limit_storage import MmapStorage  # noqa: F401 - registers the mmap:// storage scheme
 
 limiter = Limiter(key_func=get_remote_address)
\ No newline at end of file
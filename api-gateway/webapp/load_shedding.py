@@ -0,0 +1,292 @@
+"""
+Adaptive concurrency limiting and load shedding of the API gateway.
+
+Every route group of ``/api`` (the sub-blueprint of a route: ``auth``, ``users``,
+``enrolment``...) has its own AIMD concurrency limit, and all of them share a
+gateway-wide one, so a degraded downstream service only narrows the groups that
+call it. A limit grows by one while requests complete within
+``LOAD_SHEDDING_LATENCY_THRESHOLD`` and the limit is in use, and is multiplied by
+``LOAD_SHEDDING_BACKOFF`` when a request is slower or fails with 503/504.
+
+Requests over a limit are shed at once with ``503`` and ``Retry-After`` instead of
+queueing in the worker backlog. Endpoints are admitted by priority: high priority
+endpoints (``LOAD_SHEDDING_HIGH_PRIORITY_ENDPOINTS``) may use the whole limit,
+others only ``LOAD_SHEDDING_NORMAL_SHARE`` of it and low priority endpoints
+(``LOAD_SHEDDING_LOW_PRIORITY_ENDPOINTS``) only ``LOAD_SHEDDING_LOW_PRIORITY_SHARE``,
+so cheap requests keep being served while expensive ones are shed first.
+"""
+from dataclasses import dataclass
+from flask import Flask, Response, current_app, g, request
+from threading import Lock
+from webapp.metrics import CONCURRENCY_LIMIT, REQUESTS_SHED
+from webapp.services.exceptions import OverloadedException
+import time
+
+GATEWAY_GROUP = "gateway"
+OVERLOAD_STATUSES = frozenset({503, 504})
+
+
+@dataclass(frozen=True)
+class LimiterStatsDTO:
+    """
+    DTO with a snapshot of a concurrency limiter.
+
+    Attributes:
+        limit (float): Current concurrency limit.
+        in_flight (int): Number of admitted requests still being handled.
+    """
+    limit: float
+    in_flight: int
+
+
+class AIMDLimiter:
+    """
+    Concurrency limit adjusted by additive increase and multiplicative decrease.
+
+    The limit grows by one for every request completing fast while at least half
+    of the limit is in use, and shrinks by `backoff_ratio` for every request that
+    is slower than `latency_threshold` or dropped, down to `min_limit`.
+    """
+
+    def __init__(
+            self,
+            initial_limit: int,
+            min_limit: int,
+            max_limit: int,
+            latency_threshold: float,
+            backoff_ratio: float = 0.9
+    ) -> None:
+        """
+        Initialize the limiter with no request in flight.
+
+        Args:
+            initial_limit (int): Concurrency limit before any request completes.
+            min_limit (int): Lower bound of the limit.
+            max_limit (int): Upper bound of the limit.
+            latency_threshold (float): Latency in seconds above which a request counts as congested.
+            backoff_ratio (float): Factor applied to the limit on congestion.
+        """
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_threshold = latency_threshold
+        self.backoff_ratio = backoff_ratio
+        self.in_flight = 0
+        self._lock = Lock()
+
+    def try_acquire(self, share: float = 1.0) -> bool:
+        """
+        Admit a request if the limit allows it.
+
+        Args:
+            share (float): Fraction of the limit the request may use (0-1).
+
+        Returns:
+            bool: True if the request is admitted and must be released.
+        """
+        with self._lock:
+            if self.in_flight >= max(1, int(self.limit * share)):
+                return False
+            self.in_flight += 1
+            return True
+
+    def release(self, latency: float, dropped: bool = False) -> None:
+        """
+        Release an admitted request and adjust the limit.
+
+        Args:
+            latency (float): Time the request took in seconds.
+            dropped (bool): Whether the request failed because of overload.
+        """
+        with self._lock:
+            in_flight = self.in_flight
+            self.in_flight -= 1
+            if dropped or latency > self.latency_threshold:
+                self.limit = max(self.min_limit, self.limit * self.backoff_ratio)
+            elif in_flight * 2 >= self.limit:
+                self.limit = min(self.max_limit, self.limit + 1)
+
+    def cancel(self) -> None:
+        """Release an admitted request that was not handled, leaving the limit as it is."""
+        with self._lock:
+            self.in_flight -= 1
+
+    def stats(self) -> LimiterStatsDTO:
+        """
+        Return the current limit and load.
+
+        Returns:
+            LimiterStatsDTO: Limit and requests in flight.
+        """
+        with self._lock:
+            return LimiterStatsDTO(limit=self.limit, in_flight=self.in_flight)
+
+
+class LoadShedder:
+    """Concurrency limiters of the route groups of ``/api`` and the priority of its endpoints."""
+
+    def __init__(
+            self,
+            initial_limit: int,
+            min_limit: int,
+            max_limit: int,
+            latency_threshold: float,
+            backoff_ratio: float,
+            high_priority_endpoints: list[str],
+            low_priority_endpoints: list[str],
+            normal_share: float,
+            low_priority_share: float
+    ) -> None:
+        """
+        Initialize the shedder with a gateway-wide limiter; group limiters are created on first use.
+
+        Args:
+            initial_limit (int): Initial concurrency limit of every limiter.
+            min_limit (int): Lower bound of every limit.
+            max_limit (int): Upper bound of every limit.
+            latency_threshold (float): Latency in seconds above which a request counts as congested.
+            backoff_ratio (float): Factor applied to a limit on congestion.
+            high_priority_endpoints (list[str]): Endpoints allowed to use whole limits.
+            low_priority_endpoints (list[str]): Endpoints shed first.
+            normal_share (float): Fraction of a limit available to other endpoints.
+            low_priority_share (float): Fraction of a limit available to low priority endpoints.
+        """
+        self._settings = (initial_limit, min_limit, max_limit, latency_threshold, backoff_ratio)
+        self._shares = {"high": 1.0, "normal": normal_share, "low": low_priority_share}
+        self._high_priority = frozenset(high_priority_endpoints)
+        self._low_priority = frozenset(low_priority_endpoints)
+        self.limiters: dict[str, AIMDLimiter] = {GATEWAY_GROUP: AIMDLimiter(*self._settings)}
+        self._lock = Lock()
+
+    def priority(self, endpoint: str) -> str:
+        """
+        Return the priority of an endpoint.
+
+        Args:
+            endpoint (str): Flask endpoint name, e.g. ``api.auth.refresh_token``.
+
+        Returns:
+            str: ``high``, ``normal`` or ``low``.
+        """
+        if endpoint in self._high_priority:
+            return "high"
+        if endpoint in self._low_priority:
+            return "low"
+        return "normal"
+
+    def limiter(self, group: str) -> AIMDLimiter:
+        """
+        Return the limiter of a route group, creating it on first use.
+
+        Args:
+            group (str): Route group name.
+
+        Returns:
+            AIMDLimiter: Limiter of the group.
+        """
+        limiter = self.limiters.get(group)
+        if limiter is None:
+            with self._lock:
+                limiter = self.limiters.setdefault(group, AIMDLimiter(*self._settings))
+        return limiter
+
+    def try_acquire(self, group: str, priority: str) -> list[AIMDLimiter] | None:
+        """
+        Admit a request of a route group under its limit and the gateway-wide one.
+
+        Args:
+            group (str): Route group of the request.
+            priority (str): Priority of the request endpoint.
+
+        Returns:
+            list[AIMDLimiter] | None: Limiters to release once the request completes, or None if it is shed.
+        """
+        share = self._shares[priority]
+        acquired: list[AIMDLimiter] = []
+        for limiter in (self.limiter(group), self.limiters[GATEWAY_GROUP]):
+            if not limiter.try_acquire(share):
+                for admitted in acquired:
+                    admitted.cancel()
+                return None
+            acquired.append(limiter)
+        return acquired
+
+
+def init_load_shedding(app: Flask) -> None:
+    """
+    Limit the concurrency of the ``/api`` route groups and shed requests over the limits.
+
+    Nothing is registered if load shedding is disabled.
+
+    Args:
+        app (Flask): Application whose API requests are limited.
+    """
+    if not app.config["LOAD_SHEDDING_ENABLED"]:
+        return
+
+    app.extensions["load_shedding"] = LoadShedder(
+        initial_limit=app.config["LOAD_SHEDDING_INITIAL_LIMIT"],
+        min_limit=app.config["LOAD_SHEDDING_MIN_LIMIT"],
+        max_limit=app.config["LOAD_SHEDDING_MAX_LIMIT"],
+        latency_threshold=app.config["LOAD_SHEDDING_LATENCY_THRESHOLD"],
+        backoff_ratio=app.config["LOAD_SHEDDING_BACKOFF"],
+        high_priority_endpoints=app.config["LOAD_SHEDDING_HIGH_PRIORITY_ENDPOINTS"],
+        low_priority_endpoints=app.config["LOAD_SHEDDING_LOW_PRIORITY_ENDPOINTS"],
+        normal_share=app.config["LOAD_SHEDDING_NORMAL_SHARE"],
+        low_priority_share=app.config["LOAD_SHEDDING_LOW_PRIORITY_SHARE"]
+    )
+    app.before_request(_admit_request)
+    app.after_request(_record_status)
+    app.teardown_request(_release_request)
+
+
+def route_group(blueprint: str | None) -> str | None:
+    """
+    Return the route group of a request blueprint.
+
+    Args:
+        blueprint (str | None): Dotted blueprint name, e.g. ``api.enrolment``.
+
+    Returns:
+        str | None: Group name (``enrolment``), or None outside of ``/api`` sub-blueprints.
+    """
+    if blueprint is None:
+        return None
+    parts = blueprint.split(".")
+    if len(parts) < 2 or parts[0] != "api":
+        return None
+    return parts[1]
+
+
+def _admit_request() -> None:
+    group = route_group(request.blueprint)
+    if group is None or request.endpoint is None:
+        return
+
+    shedder: LoadShedder = current_app.extensions["load_shedding"]
+    priority = shedder.priority(request.endpoint)
+    limiters = shedder.try_acquire(group, priority)
+    if limiters is None:
+        REQUESTS_SHED.inc(group, priority)
+        raise OverloadedException(retry_after=current_app.config["LOAD_SHEDDING_RETRY_AFTER"])
+
+    g.load_shedding = (group, limiters, time.perf_counter())
+
+
+def _record_status(response: Response) -> Response:
+    if "load_shedding" in g:
+        g.load_shedding_status = response.status_code
+    return response
+
+
+def _release_request(error: BaseException | None) -> None:
+    admitted = g.pop("load_shedding", None)
+    if admitted is None:
+        return
+
+    group, limiters, started_at = admitted
+    latency = time.perf_counter() - started_at
+    dropped = error is not None or g.pop("load_shedding_status", None) in OVERLOAD_STATUSES
+    for limiter, name in zip(limiters, (group, GATEWAY_GROUP)):
+        limiter.release(latency, dropped)
+        CONCURRENCY_LIMIT.set(limiter.limit, name)
@@ -0,0 +1,215 @@
+"""
+Rate limit storage shared by all gunicorn workers on one host.
+
+Registers the ``mmap://`` scheme with the `limits` library, so it can be selected with
+``RATELIMIT_STORAGE_URI=mmap:///path/to/file?slots=65536``.
+"""
+from limits.storage import Storage
+from threading import Lock
+from urllib.parse import urlparse, parse_qs
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+import time
+
+SLOT = struct.Struct("<Qqd")
+MAX_PROBES = 16
+
+
+class MmapStorage(Storage):
+    """
+    Fixed-window rate limit counters kept in a memory-mapped file.
+
+    The file is a fixed-size open-addressing hash table of slots holding
+    ``(key hash, counter, expiry timestamp)``. Every worker process maps the same
+    file, so counters are shared across workers and survive restarts. Each update
+    locks only the probe range of its key with a byte-range `fcntl` lock (plus an
+    in-process lock, as `fcntl` locks do not exclude threads of the same process).
+    When the probe range is full, the entry closest to expiry is evicted.
+
+    Only the fixed-window strategy is supported.
+    """
+
+    STORAGE_SCHEME = ["mmap"]
+
+    def __init__(self, uri: str, wrap_exceptions: bool = False, **options: float | str | bool) -> None:
+        """
+        Open (or create) the counters file.
+
+        Args:
+            uri (str): ``mmap:///path/to/file`` with an optional ``slots`` query parameter.
+            wrap_exceptions (bool): Whether to wrap storage errors in `limits.errors.StorageError`.
+            **options (float | str | bool): Unused storage options.
+        """
+        parsed = urlparse(uri)
+        if not parsed.path:
+            raise ValueError("mmap storage requires a file path, e.g. mmap:///tmp/ratelimit.bin")
+
+        self.path = parsed.path
+        self.slots = max(int(parse_qs(parsed.query).get("slots", ["65536"])[0]), MAX_PROBES)
+        size = self.slots * SLOT.size
+
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.lockf(self._fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(self._fd).st_size != size:
+                os.ftruncate(self._fd, 0)
+                os.ftruncate(self._fd, size)
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN)
+
+        self._map = mmap.mmap(self._fd, size)
+        self._lock = Lock()
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+
+    @property
+    def base_exceptions(self) -> type[Exception] | tuple[type[Exception], ...]:
+        return OSError, ValueError
+
+    def incr(self, key: str, expiry: float, amount: int = 1) -> int:
+        """
+        Increment the counter of a key, starting a new window if it is missing or expired.
+
+        Args:
+            key (str): Rate limit key.
+            expiry (float): Window length in seconds.
+            amount (int): Increment.
+
+        Returns:
+            int: Counter value after the increment.
+        """
+        key_hash = self._hash(key)
+        start = self._start(key_hash)
+        with self._locked(start):
+            now = time.time()
+            index, count, expires_at = self._find(start, key_hash, now, claim=True)
+            if count is None:
+                count, expires_at = 0, now + expiry
+            count += amount
+            self._write(index, key_hash, count, expires_at)
+            return count
+
+    def get(self, key: str) -> int:
+        """
+        Return the counter of a key.
+
+        Args:
+            key (str): Rate limit key.
+
+        Returns:
+            int: Current counter value, 0 if missing or expired.
+        """
+        key_hash = self._hash(key)
+        start = self._start(key_hash)
+        with self._locked(start):
+            _, count, _ = self._find(start, key_hash, time.time())
+            return count or 0
+
+    def get_expiry(self, key: str) -> float:
+        """
+        Return the expiry timestamp of a key.
+
+        Args:
+            key (str): Rate limit key.
+
+        Returns:
+            float: Expiry as a UNIX timestamp, now if missing or expired.
+        """
+        key_hash = self._hash(key)
+        start = self._start(key_hash)
+        with self._locked(start):
+            now = time.time()
+            _, count, expires_at = self._find(start, key_hash, now)
+            return expires_at if count is not None else now
+
+    def check(self) -> bool:
+        """Return whether the storage is usable."""
+        return not self._map.closed
+
+    def reset(self) -> int | None:
+        """
+        Remove all counters.
+
+        Returns:
+            int | None: Number of live counters removed.
+        """
+        with self._locked(0, self.slots):
+            now = time.time()
+            removed = 0
+            for index in range(self.slots):
+                key_hash, _, expires_at = self._read(index)
+                if key_hash and expires_at > now:
+                    removed += 1
+            self._map[:] = bytes(len(self._map))
+            return removed
+
+    def clear(self, key: str) -> None:
+        """
+        Remove the counter of a key.
+
+        Args:
+            key (str): Rate limit key.
+        """
+        key_hash = self._hash(key)
+        start = self._start(key_hash)
+        with self._locked(start):
+            index, count, _ = self._find(start, key_hash, time.time())
+            if count is not None:
+                self._write(index, 0, 0, 0.0)
+
+    def _find(self, start: int, key_hash: int, now: float, claim: bool = False) -> tuple[int, int | None, float]:
+        free = None
+        oldest = start
+        oldest_expiry = float("inf")
+        for index in range(start, start + MAX_PROBES):
+            slot_hash, count, expires_at = self._read(index)
+            if slot_hash == key_hash and expires_at > now:
+                return index, count, expires_at
+            if free is None and (not slot_hash or expires_at <= now):
+                free = index
+            if expires_at < oldest_expiry:
+                oldest, oldest_expiry = index, expires_at
+
+        return (free if free is not None else oldest) if claim else start, None, 0.0
+
+    def _read(self, index: int) -> tuple[int, int, float]:
+        return SLOT.unpack_from(self._map, index * SLOT.size)
+
+    def _write(self, index: int, key_hash: int, count: int, expires_at: float) -> None:
+        SLOT.pack_into(self._map, index * SLOT.size, key_hash, count, expires_at)
+
+    def _start(self, key_hash: int) -> int:
+        return key_hash % (self.slots - MAX_PROBES + 1)
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "little") or 1
+
+    def _locked(self, start: int, probes: int = MAX_PROBES) -> "_RangeLock":
+        return _RangeLock(self._lock, self._fd, start * SLOT.size, probes * SLOT.size)
+
+
+class _RangeLock:
+    """Holds the in-process lock and an exclusive `fcntl` lock on a byte range of the counters file."""
+
+    def __init__(self, lock: Lock, fd: int, offset: int, length: int) -> None:
+        self._lock = lock
+        self._fd = fd
+        self._offset = offset
+        self._length = length
+
+    def __enter__(self) -> None:
+        self._lock.acquire()
+        try:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, self._length, self._offset)
+        except BaseException:
+            self._lock.release()
+            raise
+
+    def __exit__(self, *_: object) -> None:
+        try:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, self._length, self._offset)
+        finally:
+            self._lock.release()
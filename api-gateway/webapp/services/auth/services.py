@@ -6,9 +6,8 @@ from webapp.services.auth.dtos import (
     VerifyMfaDTO,
     LoginMfaRequiredDTO
 )
+from webapp.services.downstream import DownstreamClient
 from webapp.services.exceptions import ValidationException, raise_for_status
-import httpx
-import pyotp
 
 
 class AuthService:
@@ -24,6 +23,15 @@ class AuthService:
     It acts as the authentication orchestrator for the system.
     """
 
+    def __init__(self, client: DownstreamClient) -> None:
+        """
+        Initialize the service with a downstream HTTP client.
+
+        Args:
+            client (DownstreamClient): Pooled client bound to the Users microservice base URL.
+        """
+        self.client = client
+
     def login(self, dto: LoginDTO) -> TokenPairDTO | LoginMfaRequiredDTO:
         """
         Authenticate a user using identifier and password.
@@ -46,30 +54,28 @@ class AuthService:
             ValidationException: If the user is not active.
             ApiException: If Users service returns an error.
         """
-        users_url = current_app.config["USERS_SERVICE_URL"]
-        http_timeout = current_app.config["HTTP_TIMEOUT"]
-
-        response = httpx.post(f"{users_url}/auth/check", json=dto.__dict__, timeout=http_timeout)
+        response = self.client.post("/auth/check", json=dto.__dict__)
         raise_for_status(response)
 
         user = response.json()
         if not user.get("is_active"):
             raise ValidationException("User is not active")
 
-        if user.get("mfa_secret"):
+        if user.get("mfa_enabled"):
             return LoginMfaRequiredDTO(mfa_required=True, user_id=user["id"])
 
-        return self.generate_token(user["id"])
+        return self.generate_token(user["id"], user.get("role"))
 
     def verify_mfa(self, dto: VerifyMfaDTO) -> TokenPairDTO:
         """
         Verify a user's MFA (TOTP) code.
 
+        The code is checked by the Users microservice, which keeps the MFA
+        secret to itself and refuses codes that were already used.
+
         Steps:
-        1. Fetch user details from Users microservice.
-        2. Validate that MFA is enabled.
-        3. Verify provided TOTP code.
-        4. Generate JWT token pair upon successful verification.
+        1. Send the user ID and code to the Users microservice.
+        2. Generate JWT token pair upon successful verification.
 
         Args:
             dto (VerifyMfaDTO): User ID and MFA code.
@@ -80,40 +86,63 @@ class AuthService:
         Raises:
             ValidationException:
                 - If MFA is not enabled.
-                - If MFA verification fails.
+                - If MFA verification fails or the code was already used.
             ApiException: If Users service returns an error.
         """
-        users_url = current_app.config["USERS_SERVICE_URL"]
-        http_timeout = current_app.config["HTTP_TIMEOUT"]
+        response = self.client.post("/mfa/verify", json=dto.__dict__)
+        raise_for_status(response)
 
-        response = httpx.get(f"{users_url}/id", params=dto.__dict__, timeout=http_timeout)
+        verification = response.json()
+        if not verification.get("verified"):
+            raise ValidationException("Mfa verification failed")
 
-        raise_for_status(response)
+        return self.generate_token(verification["user_id"], verification.get("role"))
 
-        user = response.json()
-        secret = user.get("mfa_secret")
+    def refresh(self, user_id: str) -> TokenPairDTO:
+        """
+        Issue a new token pair for a user holding a valid refresh token.
 
-        if not secret:
-            raise ValidationException("Mfa is not enabled for this user")
+        The user is re-read from the Users microservice so that the role
+        claims embedded in the new access token reflect the current role.
 
-        totp = pyotp.TOTP(secret)
+        Args:
+            user_id (str): Identity taken from the refresh token.
 
-        if not totp.verify(dto.code, valid_window=1):
-            raise ValidationException("Mfa verification failed")
+        Returns:
+            TokenPairDTO: Generated access and refresh tokens.
 
-        return self.generate_token(user["id"])
+        Raises:
+            ApiException: If Users service returns an error.
+        """
+        response = self.client.get("/id", params={"user_id": user_id})
+        raise_for_status(response)
 
-    def generate_token(self, user_id: str)  -> TokenPairDTO:
+        user = response.json()
+        return self.generate_token(user["id"], user.get("role"))
+
+    def generate_token(self, user_id: str, role: str | None = None)  -> TokenPairDTO:
         """
         Generate JWT access and refresh tokens for a given user.
 
+        When a role is given, it is embedded in the access token together with
+        the configured role claims version, so `role_required` can authorize
+        requests without calling the Users microservice.
+
         Args:
             user_id (str): Unique identifier of the authenticated user.
+            role (str | None): Role of the user, embedded as an additional claim.
 
         Returns:
             TokenPairDTO: Object containing access and refresh tokens.
         """
-        access_token = create_access_token(identity=user_id)
+        additional_claims: dict[str, str | int] = {}
+        if role:
+            additional_claims = {
+                "role": role,
+                "role_ver": current_app.config["JWT_ROLE_CLAIMS_VERSION"]
+            }
+
+        access_token = create_access_token(identity=user_id, additional_claims=additional_claims)
         refresh_token = create_refresh_token(identity=user_id)
 
         return TokenPairDTO(access_token=access_token, refresh_token=refresh_token)
\ No newline at end of file
@@ -0,0 +1,30 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+@dataclass(frozen=True)
+class BatchItemDTO:
+    """
+    DTO describing a single sub-request of a batch.
+
+    Attributes:
+        method (str): HTTP method of the sub-request.
+        path (str): Gateway path of the sub-request (e.g. ``/api/users/id``).
+        query (dict[str, str]): Query string parameters.
+        body (Any): JSON body, if any.
+    """
+    method: str
+    path: str
+    query: dict[str, str] = field(default_factory=dict)
+    body: Any = None
+
+@dataclass(frozen=True)
+class BatchResultDTO:
+    """
+    DTO representing the outcome of a single sub-request.
+
+    Attributes:
+        status (int): HTTP status code returned by the sub-request.
+        body (Any): JSON body of the sub-request response, or None if it has no JSON body.
+    """
+    status: int
+    body: Any = None
@@ -0,0 +1,81 @@
+from concurrent.futures import ThreadPoolExecutor
+from flask import Flask, Request
+from werkzeug.datastructures import Headers
+from werkzeug.test import EnvironBuilder
+from webapp import deadline
+from webapp.services.batch.dtos import BatchItemDTO, BatchResultDTO
+from webapp.services.exceptions import ValidationException
+from webapp.tracing import tracer
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+FORWARDED_HEADERS = ("Authorization", "Cookie")
+
+
+class BatchService:
+    """
+    Service executing batches of gateway sub-requests concurrently.
+
+    Every sub-request is dispatched through the gateway application itself, so it
+    passes the same authentication, rate limiting, validation and error handling
+    as a standalone request. The caller's credentials, trace context and
+    deadline are applied to each item. An item that cannot be dispatched at all
+    fails on its own with status 500, without failing the rest of the batch.
+    """
+
+    def __init__(self, executor: ThreadPoolExecutor, max_items: int) -> None:
+        """
+        Initialize the service.
+
+        Args:
+            executor (ThreadPoolExecutor): Executor running sub-requests concurrently.
+            max_items (int): Maximum number of sub-requests in a single batch.
+        """
+        self.executor = executor
+        self.max_items = max_items
+
+    def execute(self, app: Flask, request: Request, items: list[BatchItemDTO]) -> list[BatchResultDTO]:
+        """
+        Execute sub-requests concurrently and collect their results in order.
+
+        Args:
+            app (Flask): Gateway application dispatching the sub-requests.
+            request (Request): Incoming batch request whose credentials are forwarded.
+            items (list[BatchItemDTO]): Sub-requests to execute.
+
+        Returns:
+            list[BatchResultDTO]: Results in the order of the sub-requests.
+
+        Raises:
+            ValidationException: If the batch exceeds the maximum number of items.
+        """
+        if len(items) > self.max_items:
+            raise ValidationException(f"Batch may contain at most {self.max_items} requests")
+
+        headers = {name: request.headers[name] for name in FORWARDED_HEADERS if name in request.headers}
+        headers = deadline.inject(tracer.inject(headers))
+        remote_addr = request.remote_addr or ""
+
+        futures = [self.executor.submit(self._dispatch, app, item, headers, remote_addr) for item in items]
+        return [future.result() for future in futures]
+
+    @staticmethod
+    def _dispatch(app: Flask, item: BatchItemDTO, headers: dict[str, str], remote_addr: str) -> BatchResultDTO:
+        try:
+            builder = EnvironBuilder(
+                path=item.path,
+                method=item.method,
+                query_string=item.query,
+                json=item.body,
+                headers=Headers(headers),
+                environ_overrides={"REMOTE_ADDR": remote_addr}
+            )
+            with app.request_context(builder.get_environ()):
+                response = app.make_response(app.full_dispatch_request())
+        except Exception as error:
+            logger.error("Batch item failed", method=item.method, path=item.path, error=str(error))
+            return BatchResultDTO(status=500, body={"message": "Unexpected error.", "error": "internal_error"})
+
+        body = response.get_json(silent=True) if response.is_json else None
+        return BatchResultDTO(status=response.status_code, body=body)
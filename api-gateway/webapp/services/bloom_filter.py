@@ -0,0 +1,64 @@
+from threading import Lock
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    Compact, thread-safe set membership filter without false negatives.
+
+    `might_contain` is False only for items that were never added, and True for
+    added items and a fraction `false_positive_rate` of the others, as long as
+    no more than `capacity` items are added. Items cannot be removed; a filter
+    is rebuilt instead. Bit positions are derived by double hashing a single
+    BLAKE2b digest, so a lookup costs one hash and `hash_count` bit reads.
+    """
+
+    def __init__(self, capacity: int, false_positive_rate: float) -> None:
+        """
+        Initialize an empty filter sized for `capacity` items.
+
+        Args:
+            capacity (int): Number of items the filter is sized for.
+            false_positive_rate (float): Target false positive rate at capacity (0-1).
+        """
+        capacity = max(1, capacity)
+        self.capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        self.size = max(8, math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+        self._lock = Lock()
+
+    def add(self, item: str) -> None:
+        """
+        Add an item to the filter.
+
+        Args:
+            item (str): Item to add.
+        """
+        positions = self._positions(item)
+        with self._lock:
+            for position in positions:
+                self._bits[position >> 3] |= 1 << (position & 7)
+            self.count += 1
+
+    def might_contain(self, item: str) -> bool:
+        """
+        Check whether an item may have been added.
+
+        Args:
+            item (str): Item to check.
+
+        Returns:
+            bool: False if the item was definitely never added.
+        """
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def _positions(self, item: str) -> list[int]:
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self.size for i in range(self.hash_count)]
@@ -0,0 +1,123 @@
+from dataclasses import dataclass
+from threading import Condition
+from webapp.metrics import UPSTREAM_BULKHEAD_ACTIVE, UPSTREAM_BULKHEAD_QUEUED, UPSTREAM_BULKHEAD_REJECTED
+import time
+
+
+@dataclass(frozen=True)
+class BulkheadStatsDTO:
+    """
+    DTO with a snapshot of bulkhead occupancy.
+
+    Attributes:
+        max_concurrent (int): Maximum number of concurrent calls.
+        active (int): Number of calls currently holding a slot.
+        queued (int): Number of calls waiting for a slot.
+        rejected (int): Number of calls rejected with a full queue or after waiting too long.
+    """
+    max_concurrent: int
+    active: int
+    queued: int
+    rejected: int
+
+
+class Bulkhead:
+    """
+    Bounded pool of concurrent calls to a single downstream service.
+
+    At most `max_concurrent` calls run at once; up to `max_queue` more wait for
+    a slot for at most `queue_timeout` seconds, and any other call is rejected
+    right away. A stalled service can therefore hold only its own slots, and
+    gateway workers serving other services are never blocked behind it.
+    """
+
+    def __init__(self, name: str, max_concurrent: int, max_queue: int, queue_timeout: float) -> None:
+        """
+        Initialize an empty bulkhead.
+
+        Args:
+            name (str): Name of the downstream service, used as metric label.
+            max_concurrent (int): Maximum number of concurrent calls.
+            max_queue (int): Maximum number of calls waiting for a slot.
+            queue_timeout (float): Maximum time in seconds a call waits for a slot.
+        """
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.active = 0
+        self.queued = 0
+        self.rejected = 0
+        self._condition = Condition()
+
+    def acquire(self, timeout: float | None = None) -> bool:
+        """
+        Take a slot, waiting in the queue if all slots are taken.
+
+        Args:
+            timeout (float | None): Maximum wait in seconds; defaults to `queue_timeout`.
+
+        Returns:
+            bool: True if a slot was taken and must be released.
+        """
+        wait_until = time.monotonic() + (self.queue_timeout if timeout is None else timeout)
+        with self._condition:
+            if self.active >= self.max_concurrent:
+                if self.queued >= self.max_queue:
+                    return self._reject()
+                self.queued += 1
+                UPSTREAM_BULKHEAD_QUEUED.inc(self.name)
+                try:
+                    while self.active >= self.max_concurrent:
+                        remaining = wait_until - time.monotonic()
+                        if remaining <= 0:
+                            return self._reject()
+                        self._condition.wait(remaining)
+                finally:
+                    self.queued -= 1
+                    UPSTREAM_BULKHEAD_QUEUED.dec(self.name)
+
+            self.active += 1
+            UPSTREAM_BULKHEAD_ACTIVE.inc(self.name)
+            return True
+
+    def try_acquire(self) -> bool:
+        """
+        Take a slot only if one is free right away, without queueing or counting a rejection.
+
+        Returns:
+            bool: True if a slot was taken and must be released.
+        """
+        with self._condition:
+            if self.active >= self.max_concurrent or self.queued:
+                return False
+            self.active += 1
+            UPSTREAM_BULKHEAD_ACTIVE.inc(self.name)
+            return True
+
+    def release(self) -> None:
+        """Release a slot and wake up a waiting call."""
+        with self._condition:
+            self.active -= 1
+            UPSTREAM_BULKHEAD_ACTIVE.dec(self.name)
+            self._condition.notify()
+
+    def stats(self) -> BulkheadStatsDTO:
+        """
+        Return current bulkhead occupancy.
+
+        Returns:
+            BulkheadStatsDTO: Slots, active and queued calls, and rejections.
+        """
+        with self._condition:
+            return BulkheadStatsDTO(
+                max_concurrent=self.max_concurrent,
+                active=self.active,
+                queued=self.queued,
+                rejected=self.rejected
+            )
+
+    def _reject(self) -> bool:
+        self.rejected += 1
+        UPSTREAM_BULKHEAD_REJECTED.inc(self.name)
+        return False
@@ -0,0 +1,168 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Callable
+import time
+
+
+@dataclass(frozen=True)
+class CacheStatsDTO:
+    """
+    DTO with a snapshot of cache statistics.
+
+    Attributes:
+        size (int): Number of entries currently stored.
+        max_size (int): Maximum number of entries.
+        ttl (float): Time to live of an entry in seconds.
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups not found or expired.
+    """
+    size: int
+    max_size: int
+    ttl: float
+    hits: int
+    misses: int
+
+
+class TTLCache[K, V]:
+    """
+    Bounded, thread-safe in-process cache with TTL expiry and LRU eviction.
+
+    Entries older than `ttl` seconds are treated as missing. An expired entry
+    stored with an ETag is kept until evicted, so it can be revalidated with a
+    conditional request and refreshed instead of refetched. When the cache is
+    full, the least recently used entry is evicted. Hit and miss counters are
+    kept for monitoring.
+    """
+
+    def __init__(self, max_size: int, ttl: float, clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_size (int): Maximum number of entries kept in the cache.
+            ttl (float): Time to live of an entry in seconds.
+            clock (Callable[[], float]): Monotonic time source, replaceable in tests.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[float, V, str | None]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: K) -> V | None:
+        """
+        Return a cached value and mark it as recently used.
+
+        Args:
+            key (K): Cache key.
+
+        Returns:
+            V | None: Cached value, or None if missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None and entry[2] is None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def get_stale(self, key: K) -> tuple[V, str] | None:
+        """
+        Return a value stored with an ETag, even if it has expired, for revalidation.
+
+        Args:
+            key (K): Cache key.
+
+        Returns:
+            tuple[V, str] | None: Cached value and its ETag, or None if missing or stored without an ETag.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[2] is None:
+                return None
+            return entry[1], entry[2]
+
+    def set(self, key: K, value: V, etag: str | None = None) -> None:
+        """
+        Store a value, evicting the least recently used entry if the cache is full.
+
+        Args:
+            key (K): Cache key.
+            value (V): Value to cache.
+            etag (str | None): ETag the value was served with, allowing revalidation once expired.
+        """
+        if self.max_size <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl, value, etag)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def touch(self, key: K) -> None:
+        """
+        Restart the time to live of an entry, e.g. after a successful revalidation.
+
+        Args:
+            key (K): Cache key.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries[key] = (self._clock() + self.ttl, entry[1], entry[2])
+                self._entries.move_to_end(key)
+
+    def invalidate(self, key: K) -> None:
+        """
+        Remove a single entry from the cache.
+
+        Args:
+            key (K): Cache key.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[V], bool]) -> None:
+        """
+        Remove all entries whose value matches the predicate.
+
+        Args:
+            predicate (Callable[[V], bool]): Returns True for values to remove.
+        """
+        with self._lock:
+            for key in [k for k, (_, value, _) in self._entries.items() if predicate(value)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> CacheStatsDTO:
+        """
+        Return current cache statistics.
+
+        Returns:
+            CacheStatsDTO: Size, limits and hit/miss counters.
+        """
+        with self._lock:
+            return CacheStatsDTO(
+                size=len(self._entries),
+                max_size=self.max_size,
+                ttl=self.ttl,
+                hits=self.hits,
+                misses=self.misses
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
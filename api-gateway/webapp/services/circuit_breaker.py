@@ -0,0 +1,218 @@
+from collections import deque
+from dataclasses import dataclass
+from enum import StrEnum
+from threading import Lock
+from typing import Callable
+from webapp.services.exceptions import ServiceUnavailableException
+import structlog
+import time
+
+logger = structlog.get_logger(__name__)
+
+
+class CircuitState(StrEnum):
+    """State of a circuit breaker."""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class CircuitBreakerStatsDTO:
+    """
+    DTO with a snapshot of circuit breaker statistics.
+
+    Attributes:
+        state (CircuitState): Current state of the circuit.
+        failure_rate (float): Failure rate over the recorded window.
+        rejected (int): Number of calls rejected while the circuit was open.
+        retry_tokens (float): Retry budget tokens currently available.
+    """
+    state: CircuitState
+    failure_rate: float
+    rejected: int
+    retry_tokens: float
+
+
+class RetryBudget:
+    """
+    Token bucket bounding how many retries a downstream service may receive.
+
+    Every request deposits `ratio` tokens up to `max_tokens`; every retry
+    withdraws one token. Retries therefore stay a bounded fraction of
+    traffic and cannot amplify load on a failing service.
+    """
+
+    def __init__(self, ratio: float, max_tokens: float) -> None:
+        """
+        Initialize the retry budget with a full bucket.
+
+        Args:
+            ratio (float): Tokens deposited per request.
+            max_tokens (float): Maximum number of tokens in the bucket.
+        """
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+        self._lock = Lock()
+
+    def deposit(self) -> None:
+        """Deposit tokens for a new request."""
+        with self._lock:
+            self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """
+        Withdraw a token for a retry.
+
+        Returns:
+            bool: True if the retry is allowed.
+        """
+        with self._lock:
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker guarding calls to a single downstream service.
+
+    - CLOSED: calls pass; outcomes are recorded in a sliding window. Once at least
+      `minimum_calls` are recorded and the failure rate reaches `failure_rate_threshold`,
+      the circuit opens.
+    - OPEN: calls fail fast with ServiceUnavailableException for `open_seconds`.
+    - HALF_OPEN: up to `half_open_max_calls` trial calls pass. A successful trial
+      closes the circuit, a failed one opens it again.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            failure_rate_threshold: float,
+            minimum_calls: int,
+            window_size: int,
+            open_seconds: float,
+            half_open_max_calls: int,
+            retry_budget: RetryBudget,
+            clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        Initialize a closed circuit breaker.
+
+        Args:
+            name (str): Name of the guarded downstream service.
+            failure_rate_threshold (float): Failure rate (0-1) at which the circuit opens.
+            minimum_calls (int): Minimum number of recorded calls before the rate is evaluated.
+            window_size (int): Number of most recent calls in the sliding window.
+            open_seconds (float): Time the circuit stays open before allowing trial calls.
+            half_open_max_calls (int): Number of concurrent trial calls in half-open state.
+            retry_budget (RetryBudget): Budget bounding retries of idempotent calls.
+            clock (Callable[[], float]): Monotonic time source, replaceable in tests.
+        """
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_calls = minimum_calls
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = half_open_max_calls
+        self.retry_budget = retry_budget
+        self.rejected = 0
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+        self._outcomes: deque[bool] = deque(maxlen=window_size)
+        self._lock = Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state, moving from OPEN to HALF_OPEN once `open_seconds` have passed."""
+        with self._lock:
+            return self._current_state()
+
+    def before_call(self) -> None:
+        """
+        Check whether a call may be made.
+
+        Raises:
+            ServiceUnavailableException: If the circuit is open or no trial call slot is free.
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == CircuitState.CLOSED:
+                return
+            if state == CircuitState.HALF_OPEN and self._half_open_calls < self.half_open_max_calls:
+                self._half_open_calls += 1
+                return
+            self.rejected += 1
+
+        raise ServiceUnavailableException(f"Service {self.name} is unavailable")
+
+    def record_success(self) -> None:
+        """Record a successful call."""
+        with self._lock:
+            if self._current_state() == CircuitState.HALF_OPEN:
+                self._transition(CircuitState.CLOSED)
+                return
+            self._outcomes.append(True)
+
+    def release(self) -> None:
+        """
+        Release the trial call slot of a call that ended without an outcome.
+
+        A call interrupted by an error that says nothing about the health of the
+        service, e.g. its request deadline passing, records neither a success
+        nor a failure; in half-open state its slot is freed for another trial.
+        """
+        with self._lock:
+            if self._current_state() == CircuitState.HALF_OPEN and self._half_open_calls > 0:
+                self._half_open_calls -= 1
+
+    def record_failure(self) -> None:
+        """Record a failed call and open the circuit if the failure rate is reached."""
+        with self._lock:
+            state = self._current_state()
+            if state == CircuitState.HALF_OPEN:
+                self._transition(CircuitState.OPEN)
+                return
+            if state == CircuitState.OPEN:
+                return
+
+            self._outcomes.append(False)
+            if len(self._outcomes) >= self.minimum_calls and self._failure_rate() >= self.failure_rate_threshold:
+                self._transition(CircuitState.OPEN)
+
+    def stats(self) -> CircuitBreakerStatsDTO:
+        """
+        Return current circuit breaker statistics.
+
+        Returns:
+            CircuitBreakerStatsDTO: State, failure rate, rejections and retry tokens.
+        """
+        with self._lock:
+            return CircuitBreakerStatsDTO(
+                state=self._current_state(),
+                failure_rate=self._failure_rate(),
+                rejected=self.rejected,
+                retry_tokens=self.retry_budget.tokens
+            )
+
+    def _current_state(self) -> CircuitState:
+        if self._state == CircuitState.OPEN and self._clock() - self._opened_at >= self.open_seconds:
+            self._transition(CircuitState.HALF_OPEN)
+        return self._state
+
+    def _failure_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    def _transition(self, state: CircuitState) -> None:
+        logger.warning("Circuit state changed", service=self.name, old_state=self._state.value, new_state=state.value)
+        self._state = state
+        self._half_open_calls = 0
+        if state == CircuitState.OPEN:
+            self._opened_at = self._clock()
+        if state == CircuitState.CLOSED:
+            self._outcomes.clear()
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from webapp.services.cache import CacheStatsDTO
 
 @dataclass(frozen=True)
 class CreateCourseDTO:
@@ -82,4 +83,16 @@ class UpdateCourseDTO:
     price: float | None = None
     start_date: str | None = None
     end_date: str | None = None
-    max_participants: int | None = None
\ No newline at end of file
+    max_participants: int | None = None
+
+@dataclass(frozen=True)
+class CourseCacheStatsDTO:
+    """
+    DTO with statistics of the gateway course caches.
+
+    Attributes:
+        by_id (CacheStatsDTO): Cache of single courses looked up by ID.
+        by_name (CacheStatsDTO): Cache of course lists looked up by name.
+    """
+    by_id: CacheStatsDTO
+    by_name: CacheStatsDTO
\ No newline at end of file
@@ -1,17 +1,44 @@
-from flask import current_app
 from webapp.services.courses.dtos import (
     CreateCourseDTO,
     CourseDTO,
     CourseIdDTO,
     CourseNameDTO,
-    UpdateCourseDTO
+    UpdateCourseDTO,
+    CourseCacheStatsDTO
 )
+from webapp.services.cache import TTLCache
+from webapp.services.downstream import DownstreamClient, NDJSON_MIMETYPE, iter_chunks
 from webapp.services.exceptions import raise_for_status
-import httpx
+from typing import Iterable
 
 
 class CourseService:
-    """Service for interacting with the Courses microservice via HTTP."""
+    """
+    Service for interacting with the Courses microservice via HTTP.
+
+    Course lookups by ID and by name are read through in-process caches,
+    invalidated whenever a course is created, updated or deleted through the gateway.
+    Expired courses are revalidated with their ETag, so an unchanged course is
+    refreshed by an empty 304 response instead of being downloaded again.
+    """
+
+    def __init__(
+            self,
+            client: DownstreamClient,
+            cache: TTLCache[int, CourseDTO],
+            search_cache: TTLCache[str, list[CourseDTO]]
+    ) -> None:
+        """
+        Initialize the service with a downstream HTTP client and course caches.
+
+        Args:
+            client (DownstreamClient): Pooled client bound to the Courses microservice base URL.
+            cache (TTLCache[int, CourseDTO]): Cache of courses keyed by course ID.
+            search_cache (TTLCache[str, list[CourseDTO]]): Cache of name lookups keyed by the searched name.
+        """
+        self.client = client
+        self.cache = cache
+        self.search_cache = search_cache
 
     def create_course(self, dto: CreateCourseDTO) -> CourseDTO:
         """
@@ -23,11 +50,9 @@ class CourseService:
         Returns:
             CourseDTO: Created course details.
         """
-        course_url = current_app.config["COURSE_SERVICE_URL"]
-        http_timeout = current_app.config["HTTP_TIMEOUT"]
-
-        response = httpx.post(f"{course_url}/", json=dto.__dict__, timeout=http_timeout)
+        response = self.client.post("/", json=dto.__dict__)
         raise_for_status(response)
+        self.search_cache.clear()
         return CourseDTO(**response.json())
 
     def get_by_id(self, dto: CourseIdDTO) -> CourseDTO:
@@ -40,12 +65,23 @@ class CourseService:
         Returns:
             CourseDTO: Course details.
         """
-        course_url = current_app.config["COURSE_SERVICE_URL"]
-        http_timeout = current_app.config["HTTP_TIMEOUT"]
+        course = self.cache.get(dto.course_id)
+        if course is not None:
+            return course
+
+        stale = self.cache.get_stale(dto.course_id)
+        if stale is None:
+            response = self.client.get(f"/{dto.course_id}")
+        else:
+            response = self.client.get(f"/{dto.course_id}", headers={"If-None-Match": stale[1]})
+            if response.status_code == 304:
+                self.cache.touch(dto.course_id)
+                return stale[0]
 
-        response = httpx.get(f"{course_url}/{dto.course_id}", timeout=http_timeout)
         raise_for_status(response)
-        return CourseDTO(**response.json())
+        course = CourseDTO(**response.json())
+        self.cache.set(dto.course_id, course, response.headers.get("ETag"))
+        return course
 
     def get_by_name(self, dto: CourseNameDTO) -> list[CourseDTO]:
         """
@@ -57,12 +93,31 @@ class CourseService:
         Returns:
             list[CourseDTO]: List of matching courses. Can be empty if no courses are found.
         """
-        course_url = current_app.config["COURSE_SERVICE_URL"]
-        http_timeout = current_app.config["HTTP_TIMEOUT"]
+        courses = self.search_cache.get(dto.name)
+        if courses is not None:
+            return courses
 
-        response = httpx.get(f"{course_url}/", params={"name": dto.name}, timeout=http_timeout)
+        response = self.client.get("/", params={"name": dto.name})
         data = response.json()["courses"]
-        return [CourseDTO(**c) for c in data]
+        courses = [CourseDTO(**c) for c in data]
+        self.search_cache.set(dto.name, courses)
+        return courses
+
+    def stream_by_name(self, dto: CourseNameDTO) -> Iterable[bytes]:
+        """
+        Stream courses matching a name from the course service as NDJSON, one course per line.
+
+        The search cache is bypassed, as the body is relayed without being parsed.
+
+        Args:
+            dto (CourseNameDTO): DTO containing the full or partial course name.
+
+        Returns:
+            Iterable[bytes]: NDJSON body chunks, closing the downstream response once iterated or closed.
+        """
+        response = self.client.stream("/", params={"name": dto.name}, headers={"Accept": NDJSON_MIMETYPE})
+        raise_for_status(response)
+        return iter_chunks(response)
 
     def update_course(self, dto: UpdateCourseDTO) -> CourseDTO:
         """
@@ -74,11 +129,10 @@ class CourseService:
         Returns:
             CourseDTO: Updated course details.
         """
-        course_url = current_app.config["COURSE_SERVICE_URL"]
-        http_timeout = current_app.config["HTTP_TIMEOUT"]
-
-        response = httpx.patch(f"{course_url}/{dto.id}", json=dto.__dict__, timeout=http_timeout)
+        response = self.client.patch(f"/{dto.id}", json=dto.__dict__)
         raise_for_status(response)
+        self.cache.invalidate(dto.id)
+        self.search_cache.clear()
         return CourseDTO(**response.json())
 
     def delete_by_id(self, dto: CourseIdDTO) -> None:
@@ -91,8 +145,16 @@ class CourseService:
         Returns:
             None
         """
-        course_url = current_app.config["COURSE_SERVICE_URL"]
-        http_timeout = current_app.config["HTTP_TIMEOUT"]
+        response = self.client.delete(f"/{dto.course_id}")
+        raise_for_status(response)
+        self.cache.invalidate(dto.course_id)
+        self.search_cache.clear()
+
+    def cache_stats(self) -> CourseCacheStatsDTO:
+        """
+        Return statistics of the course caches.
 
-        response = httpx.delete(f"{course_url}/{dto.course_id}", timeout=http_timeout)
-        raise_for_status(response)
\ No newline at end of file
+        Returns:
+            CourseCacheStatsDTO: Statistics of the by-ID and by-name caches.
+        """
+        return CourseCacheStatsDTO(by_id=self.cache.stats(), by_name=self.search_cache.stats())
\ No newline at end of file
@@ -0,0 +1,500 @@
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from contextlib import contextmanager
+from threading import Lock
+from typing import Any, Callable, Iterator
+from webapp import deadline
+from webapp.metrics import UPSTREAM_HEDGED, UPSTREAM_IN_FLIGHT, UPSTREAM_LATENCY
+from webapp.services.bulkhead import Bulkhead, BulkheadStatsDTO
+from webapp.services.circuit_breaker import CircuitBreaker
+from webapp.services.exceptions import DeadlineExceededException, ServerException, ServiceUnavailableException
+from webapp.services.hedging import HedgingPolicy, HedgingStatsDTO
+from webapp.services.replicas import ReleasingStream
+from webapp.services.single_flight import SingleFlight, SingleFlightStatsDTO
+from webapp.tracing import TRACEPARENT, SpanKind, tracer
+import httpx
+import time
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+
+class DownstreamClient:
+    """
+    HTTP client for a single downstream microservice used by the gateway services.
+
+    Wraps the pooled `httpx.Client` of the service and exposes the same
+    `get`/`post`/`patch`/`delete` calls. Every call goes through the circuit
+    breaker of the service; transport errors and 5xx responses count as failures.
+    Every upstream attempt is recorded as a client span and carries the trace
+    context in its ``traceparent`` header. Within a request, attempts carry its
+    deadline in ``X-Request-Deadline`` and their timeouts are capped by the time
+    left until it; no attempt is made once the deadline has passed.
+    Idempotent GETs are retried within the retry budget, and identical concurrent
+    GET requests are coalesced into one upstream call whose response is shared
+    by all callers. With hedging enabled, a GET attempt that is slower than the
+    hedging policy allows gets a second, concurrent attempt; the first response
+    wins and the other attempt is cancelled or discarded. With a bulkhead, every
+    call holds one of its slots while it runs, and calls that find it full fail fast;
+    a streamed call holds its slot until its response is closed, and a hedged
+    attempt is only sent if it can take a slot of its own right away.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            client: httpx.Client,
+            single_flight: SingleFlight[httpx.Response],
+            circuit_breaker: CircuitBreaker,
+            single_flight_enabled: bool = True,
+            max_retries: int = 0,
+            retry_backoff: float = 0.0,
+            hedging: HedgingPolicy | None = None,
+            hedging_executor: Executor | None = None,
+            hedging_enabled: bool = False,
+            bulkhead: Bulkhead | None = None
+    ) -> None:
+        """
+        Initialize the downstream client.
+
+        Args:
+            name (str): Name of the downstream service (e.g. ``users``).
+            client (httpx.Client): Pooled client bound to the service base URL.
+            single_flight (SingleFlight[httpx.Response]): Coalescer for concurrent identical GETs.
+            circuit_breaker (CircuitBreaker): Circuit breaker of the service.
+            single_flight_enabled (bool): Whether GET requests are coalesced.
+            max_retries (int): Maximum number of retries of a failed GET.
+            retry_backoff (float): Base delay in seconds between retries, growing linearly.
+            hedging (HedgingPolicy | None): Policy deciding when a GET attempt is hedged.
+            hedging_executor (Executor | None): Executor running the attempts of hedged GETs.
+            hedging_enabled (bool): Whether GET attempts are hedged.
+            bulkhead (Bulkhead | None): Bulkhead bounding concurrent calls to the service.
+        """
+        self.name = name
+        self.client = client
+        self.single_flight = single_flight
+        self.circuit_breaker = circuit_breaker
+        self.single_flight_enabled = single_flight_enabled
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.hedging = hedging
+        self.hedging_executor = hedging_executor
+        self.hedging_enabled = hedging_enabled and hedging is not None and hedging_executor is not None
+        self.bulkhead = bulkhead
+
+    def get(
+            self,
+            url: str,
+            params: dict[str, Any] | None = None,
+            headers: dict[str, str] | None = None
+    ) -> httpx.Response:
+        """
+        Send a GET request, sharing the response with identical in-flight requests.
+
+        Args:
+            url (str): Path relative to the service base URL.
+            params (dict[str, Any] | None): Query parameters.
+            headers (dict[str, str] | None): Additional request headers, e.g. ``If-None-Match``.
+
+        Returns:
+            httpx.Response: Downstream response.
+        """
+        kwargs: dict[str, Any] = {"params": params}
+        key: tuple[Any, ...] = (self.name, url, tuple(sorted((params or {}).items())))
+        if headers:
+            kwargs["headers"] = headers
+            key += (tuple(sorted(headers.items())),)
+
+        if not self.single_flight_enabled:
+            return self._send("GET", url, idempotent=True, **kwargs)
+        return self.single_flight.do(key, lambda: self._send("GET", url, idempotent=True, **kwargs))
+
+    def stream(self, url: str, params: dict[str, Any] | None = None, headers: dict[str, str] | None = None) -> httpx.Response:
+        """
+        Send a GET request whose response body is read lazily.
+
+        The call goes through the circuit breaker but is neither retried nor coalesced,
+        as its body is consumed by a single caller. Error responses are read and closed,
+        so they can be passed to `raise_for_status`; a successful response must be
+        consumed with `iter_chunks`, which closes it. The bulkhead slot of the call
+        is held until the response is closed.
+
+        Args:
+            url (str): Path relative to the service base URL.
+            params (dict[str, Any] | None): Query parameters.
+            headers (dict[str, str] | None): Additional request headers.
+
+        Returns:
+            httpx.Response: Downstream response with an unread body if successful.
+
+        Raises:
+            ServiceUnavailableException: If the circuit is open, the bulkhead is full or the service cannot be reached.
+            DeadlineExceededException: If the request deadline passes before the service responds.
+        """
+        self.circuit_breaker.retry_budget.deposit()
+        deadline.check_deadline()
+        release = self._acquire_bulkhead_slot()
+        try:
+            self.circuit_breaker.before_call()
+        except BaseException:
+            release()
+            raise
+        try:
+            response = self._request("GET", url, stream=True, params=params, headers=headers)
+        except httpx.TransportError as error:
+            release()
+            self.circuit_breaker.record_failure()
+            raise self._unavailable() from error
+        except BaseException:
+            release()
+            self.circuit_breaker.release()
+            raise
+        if response.is_closed:
+            release()
+        else:
+            response.stream = ReleasingStream(response.stream, release)  # type: ignore[arg-type]
+
+        if response.status_code >= 500:
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_success()
+
+        if response.is_error:
+            try:
+                response.read()
+            finally:
+                response.close()
+        return response
+
+    def post(self, url: str, json: Any = None) -> httpx.Response:
+        """
+        Send a POST request.
+
+        Args:
+            url (str): Path relative to the service base URL.
+            json (Any): JSON body.
+
+        Returns:
+            httpx.Response: Downstream response.
+        """
+        return self._send("POST", url, json=json)
+
+    def patch(self, url: str, json: Any = None) -> httpx.Response:
+        """
+        Send a PATCH request.
+
+        Args:
+            url (str): Path relative to the service base URL.
+            json (Any): JSON body.
+
+        Returns:
+            httpx.Response: Downstream response.
+        """
+        return self._send("PATCH", url, json=json)
+
+    def delete(self, url: str, params: dict[str, Any] | None = None) -> httpx.Response:
+        """
+        Send a DELETE request.
+
+        Args:
+            url (str): Path relative to the service base URL.
+            params (dict[str, Any] | None): Query parameters.
+
+        Returns:
+            httpx.Response: Downstream response.
+        """
+        return self._send("DELETE", url, params=params)
+
+    def _send(self, method: str, url: str, idempotent: bool = False, **kwargs: Any) -> httpx.Response:
+        """
+        Send a request through the circuit breaker, retrying idempotent calls within the budget.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Path relative to the service base URL.
+            idempotent (bool): Whether the request may be retried.
+            **kwargs (Any): Arguments passed to `httpx.Client.request`.
+
+        Returns:
+            httpx.Response: Downstream response; a 5xx response is returned once retries are exhausted.
+
+        Raises:
+            ServiceUnavailableException: If the circuit is open, the bulkhead is full or the service cannot be reached.
+            DeadlineExceededException: If the request deadline passes before the service responds.
+        """
+        self.circuit_breaker.retry_budget.deposit()
+        with self._bulkhead_slot():
+            return self._send_with_retries(method, url, idempotent, **kwargs)
+
+    def _send_with_retries(self, method: str, url: str, idempotent: bool, **kwargs: Any) -> httpx.Response:
+        attempt = 0
+        while True:
+            deadline.check_deadline()
+            self.circuit_breaker.before_call()
+            try:
+                if idempotent and self.hedging_enabled:
+                    response = self._hedged_request(method, url, **kwargs)
+                else:
+                    response = self._request(method, url, **kwargs)
+            except httpx.TransportError as error:
+                self.circuit_breaker.record_failure()
+                if not self._should_retry(idempotent, attempt):
+                    raise self._unavailable() from error
+            except BaseException:
+                self.circuit_breaker.release()
+                raise
+            else:
+                if response.status_code < 500:
+                    self.circuit_breaker.record_success()
+                    return response
+                self.circuit_breaker.record_failure()
+                if not self._should_retry(idempotent, attempt):
+                    return response
+
+            attempt += 1
+            time.sleep(self.retry_backoff * attempt)
+
+    @contextmanager
+    def _bulkhead_slot(self) -> Iterator[None]:
+        """
+        Hold a slot of the bulkhead of the service, if any, waiting at most until the request deadline.
+
+        Raises:
+            ServiceUnavailableException: If no slot becomes available in time.
+            DeadlineExceededException: If the request deadline passes while waiting.
+        """
+        release = self._acquire_bulkhead_slot()
+        try:
+            yield
+        finally:
+            release()
+
+    def _acquire_bulkhead_slot(self) -> Callable[[], None]:
+        """
+        Take a slot of the bulkhead of the service, if any, waiting at most until the request deadline.
+
+        Returns:
+            Callable[[], None]: Function releasing the slot.
+
+        Raises:
+            ServiceUnavailableException: If no slot becomes available in time.
+            DeadlineExceededException: If the request deadline passes while waiting.
+        """
+        if self.bulkhead is None:
+            return _no_slot
+
+        if not self.bulkhead.acquire(deadline.timeout(self.bulkhead.queue_timeout)):
+            budget = deadline.remaining()
+            if budget is not None and budget <= 0:
+                raise DeadlineExceededException()
+            raise ServiceUnavailableException(f"Service {self.name} is busy")
+        return self.bulkhead.release
+
+    def _request(self, method: str, url: str, stream: bool = False, **kwargs: Any) -> httpx.Response:
+        budget = deadline.remaining()
+        if budget is not None:
+            if budget <= 0:
+                raise DeadlineExceededException()
+            kwargs["timeout"] = self._timeout(budget)
+            kwargs["headers"] = deadline.inject(kwargs.get("headers"))
+
+        status = "error"
+        UPSTREAM_IN_FLIGHT.inc(self.name)
+        started_at = time.perf_counter()
+        try:
+            with tracer.span(
+                    f"{method} {self.name}",
+                    SpanKind.CLIENT,
+                    attributes={"peer.service": self.name, "http.method": method, "http.url": url}
+            ) as span:
+                traceparent = tracer.traceparent()
+                if traceparent is not None:
+                    kwargs["headers"] = {**(kwargs.get("headers") or {}), TRACEPARENT: traceparent}
+                if stream:
+                    response = self.client.send(self.client.build_request(method, url, **kwargs), stream=True)
+                else:
+                    response = self.client.request(method, url, **kwargs)
+                span.set_attribute("http.status_code", response.status_code)
+            status = str(response.status_code)
+            return response
+        finally:
+            UPSTREAM_LATENCY.observe(time.perf_counter() - started_at, self.name, method, status)
+            UPSTREAM_IN_FLIGHT.dec(self.name)
+
+    def _hedged_request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """
+        Send an attempt and, if it is slower than the hedging delay, a second concurrent one.
+
+        Returns:
+            httpx.Response: The first response received.
+
+        Raises:
+            httpx.TransportError: If all attempts fail, the error of the first one.
+        """
+        hedging: HedgingPolicy = self.hedging  # type: ignore[assignment]
+        executor: Executor = self.hedging_executor  # type: ignore[assignment]
+        hedging.request()
+        delay = hedging.delay()
+        if delay is None:
+            return self._observed_request(method, url, **kwargs)
+
+        attempt = deadline.bind(tracer.wrap(self._observed_request))
+        first = executor.submit(attempt, method, url, **kwargs)
+        if wait([first], timeout=delay).done or not self._try_hedge(hedging):
+            return first.result()
+
+        second = executor.submit(attempt, method, url, **kwargs)
+        if self.bulkhead is not None:
+            _release_when_done([first, second], self.bulkhead.release)
+        pending = {first, second}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            winner = next((future for future in (first, second) if future in done and future.exception() is None), None)
+            if winner is not None:
+                for loser in pending:
+                    _discard(loser)
+                if winner is second:
+                    hedging.record_win()
+                UPSTREAM_HEDGED.inc(self.name, "hedge" if winner is second else "primary")
+                return winner.result()
+
+        return first.result()
+
+    def _try_hedge(self, hedging: HedgingPolicy) -> bool:
+        """
+        Decide whether to send a hedged attempt, taking a bulkhead slot for it.
+
+        The hedged attempt must find a free slot right away, so hedging never
+        queues behind or adds to a saturated service. The slot is held until
+        both attempts are done, as the losing one may outlive the call.
+        """
+        if self.bulkhead is not None and not self.bulkhead.try_acquire():
+            return False
+        if not hedging.try_hedge():
+            if self.bulkhead is not None:
+                self.bulkhead.release()
+            return False
+        return True
+
+    def _observed_request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        started_at = time.perf_counter()
+        response = self._request(method, url, **kwargs)
+        self.hedging.observe(time.perf_counter() - started_at)  # type: ignore[union-attr]
+        return response
+
+    def _timeout(self, budget: float) -> httpx.Timeout:
+        timeout = self.client.timeout
+        return httpx.Timeout(
+            connect=min(timeout.connect or budget, budget),
+            read=min(timeout.read or budget, budget),
+            write=min(timeout.write or budget, budget),
+            pool=min(timeout.pool or budget, budget)
+        )
+
+    def _unavailable(self) -> ServerException:
+        budget = deadline.remaining()
+        if budget is not None and budget <= 0:
+            return DeadlineExceededException()
+        return ServiceUnavailableException(f"Service {self.name} is unavailable")
+
+    def _should_retry(self, idempotent: bool, attempt: int) -> bool:
+        return idempotent and attempt < self.max_retries and self.circuit_breaker.retry_budget.withdraw()
+
+    def stats(self) -> SingleFlightStatsDTO:
+        """
+        Return single-flight statistics of this downstream service.
+
+        Returns:
+            SingleFlightStatsDTO: In-flight, executed and coalesced GET counters.
+        """
+        return self.single_flight.stats()
+
+    def hedging_stats(self) -> HedgingStatsDTO | None:
+        """
+        Return hedging statistics of this downstream service.
+
+        Returns:
+            HedgingStatsDTO | None: Hedging delay, counters and budget, or None without a hedging policy.
+        """
+        return self.hedging.stats() if self.hedging is not None else None
+
+    def bulkhead_stats(self) -> BulkheadStatsDTO | None:
+        """
+        Return bulkhead occupancy of this downstream service.
+
+        Returns:
+            BulkheadStatsDTO | None: Slots, active and queued calls and rejections, or None without a bulkhead.
+        """
+        return self.bulkhead.stats() if self.bulkhead is not None else None
+
+
+def _no_slot() -> None:
+    """Release nothing, for clients without a bulkhead."""
+
+
+def _release_when_done(futures: list[Future[httpx.Response]], release: Callable[[], None]) -> None:
+    """Call `release` once all futures are done, cancelled or failed."""
+    pending = [len(futures)]
+    lock = Lock()
+
+    def done(_: Future[httpx.Response]) -> None:
+        with lock:
+            pending[0] -= 1
+            if pending[0]:
+                return
+        release()
+
+    for future in futures:
+        future.add_done_callback(done)
+
+
+def _discard(future: Future[httpx.Response]) -> None:
+    """Cancel a losing attempt, or close its response once it arrives if it is already running."""
+    if not future.cancel():
+        future.add_done_callback(_close_response)
+
+
+def _close_response(future: Future[httpx.Response]) -> None:
+    if future.exception() is None:
+        future.result().close()
+
+
+class StreamedBody:
+    """
+    Body of a streamed response, relaying its chunks and closing it afterwards.
+
+    The response is also closed by `close`, which WSGI servers call even when
+    the body is never iterated, e.g. for HEAD requests and 204/304 responses,
+    so the pooled connection is always returned.
+    """
+
+    def __init__(self, response: httpx.Response) -> None:
+        """
+        Initialize the body.
+
+        Args:
+            response (httpx.Response): Response returned by `DownstreamClient.stream`.
+        """
+        self.response = response
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Yield decoded body chunks as they arrive from the downstream service."""
+        try:
+            yield from self.response.iter_bytes()
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Close the response, releasing its connection."""
+        self.response.close()
+
+
+def iter_chunks(response: httpx.Response) -> StreamedBody:
+    """
+    Return the body of a streamed response, relayed chunk by chunk and closed afterwards.
+
+    Args:
+        response (httpx.Response): Response returned by `DownstreamClient.stream`.
+
+    Returns:
+        StreamedBody: Iterable of decoded body chunks, closing the response once iterated or closed.
+    """
+    return StreamedBody(response)
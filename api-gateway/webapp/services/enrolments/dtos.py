@@ -87,6 +87,17 @@ class EnrolmentByUserDTO:
     user_id: str
 
 
+@dataclass(frozen=True)
+class EnrolmentUserIdDTO:
+    """
+    DTO for operations on all enrolments of a user.
+
+    Attributes:
+        user_id (str): The ID of the user.
+    """
+    user_id: str
+
+
 @dataclass(frozen=True)
 class DeleteEnrolmentDTO:
     """
@@ -1,12 +1,14 @@
-from flask import current_app
 from webapp.services.enrolments.dtos import (
     EnrolmentDTO,
     CreateEnrolmentDTO,
     EnrolmentIdDTO,
     EnrolmentByUserDTO,
+    EnrolmentUserIdDTO,
     DeleteEnrolmentDTO
 )
+from webapp.services.downstream import DownstreamClient, NDJSON_MIMETYPE, iter_chunks
 from webapp.services.exceptions import raise_for_status
+from typing import Iterable
 import httpx
 
 class EnrolmentService:
@@ -17,6 +19,15 @@ class EnrolmentService:
     fetching by ID or user, listing active enrolments, and deleting enrolments.
     """
 
+    def __init__(self, client: DownstreamClient) -> None:
+        """
+        Initialize the service with a downstream HTTP client.
+
+        Args:
+            client (DownstreamClient): Pooled client bound to the Enrolments microservice base URL.
+        """
+        self.client = client
+
     def create_enrolment_for_user(self, dto: CreateEnrolmentDTO) -> EnrolmentDTO:
         """
         Create a new enrolment for a given user and course.
@@ -27,10 +38,7 @@ class EnrolmentService:
         Returns:
             EnrolmentDTO: The created enrolment.
         """
-        enrolment_url = current_app.config["ENROLMENT_SERVICE_URL"]
-        http_timeout = current_app.config["HTTP_TIMEOUT"]
-
-        response = httpx.post(f"{enrolment_url}/", json=dto.__dict__, timeout=http_timeout)
+        response = self.client.post("/", json=dto.__dict__)
         raise_for_status(response)
         return EnrolmentDTO(**response.json())
 
@@ -44,10 +52,7 @@ class EnrolmentService:
         Returns:
             EnrolmentDTO: The updated enrolment with payment_status set to PAID.
         """
-        enrolment_url = current_app.config["ENROLMENT_SERVICE_URL"]
-        http_timeout = current_app.config["HTTP_TIMEOUT"]
-
-        response = httpx.patch(f"{enrolment_url}/paid", json=dto.__dict__, timeout=http_timeout)
+        response = self.client.patch("/paid", json=dto.__dict__)
         raise_for_status(response)
         return EnrolmentDTO(**response.json())
 
@@ -58,10 +63,7 @@ class EnrolmentService:
         Returns:
             list[EnrolmentDTO]: List of enrolments that were updated.
         """
-        enrolment_url = current_app.config["ENROLMENT_SERVICE_URL"]
-        http_timeout = current_app.config["HTTP_TIMEOUT"]
-
-        response = httpx.patch(f"{enrolment_url}/expired", timeout=http_timeout)
+        response = self.client.patch("/expired")
         raise_for_status(response)
         data = response.json()["enrolments"]
         return [EnrolmentDTO(**e) for e in data]
@@ -76,12 +78,21 @@ class EnrolmentService:
         Returns:
             EnrolmentDTO: The fetched enrolment.
         """
-        enrolment_url = current_app.config["ENROLMENT_SERVICE_URL"]
-        http_timeout = current_app.config["HTTP_TIMEOUT"]
+        return EnrolmentDTO(**self.get_by_id_raw(dto).json())
+
+    def get_by_id_raw(self, dto: EnrolmentIdDTO) -> httpx.Response:
+        """
+        Fetch an enrolment by its unique ID without deserializing it.
+
+        Args:
+            dto (EnrolmentIdDTO): DTO containing the enrolment ID.
 
-        response = httpx.get(f"{enrolment_url}/{dto.enrolment_id}", timeout=http_timeout)
+        Returns:
+            httpx.Response: Successful downstream response.
+        """
+        response = self.client.get(f"/{dto.enrolment_id}")
         raise_for_status(response)
-        return EnrolmentDTO(**response.json())
+        return response
 
     def get_by_id_and_user(self, dto: EnrolmentByUserDTO) -> EnrolmentDTO:
         """
@@ -93,16 +104,39 @@ class EnrolmentService:
         Returns:
             EnrolmentDTO: The fetched enrolment.
         """
-        enrolment_url = current_app.config["ENROLMENT_SERVICE_URL"]
-        http_timeout = current_app.config["HTTP_TIMEOUT"]
+        return EnrolmentDTO(**self.get_by_id_and_user_raw(dto).json())
+
+    def get_by_id_and_user_raw(self, dto: EnrolmentByUserDTO) -> httpx.Response:
+        """
+        Fetch an enrolment by its ID and associated user ID without deserializing it.
 
-        response = httpx.get(
-            f"{enrolment_url}/{dto.enrolment_id}/details",
-            params={"user_id": dto.user_id},
-            timeout=http_timeout
+        Args:
+            dto (EnrolmentByUserDTO): DTO containing enrolment ID and user ID.
+
+        Returns:
+            httpx.Response: Successful downstream response.
+        """
+        response = self.client.get(
+            f"/{dto.enrolment_id}/details",
+            params={"user_id": dto.user_id}
         )
         raise_for_status(response)
-        return EnrolmentDTO(**response.json())
+        return response
+
+    def get_by_user(self, dto: EnrolmentUserIdDTO) -> list[EnrolmentDTO]:
+        """
+        Fetch all enrolments of a user.
+
+        Args:
+            dto (EnrolmentUserIdDTO): DTO containing the user ID.
+
+        Returns:
+            list[EnrolmentDTO]: List of the user's enrolments.
+        """
+        response = self.client.get("/user", params={"user_id": dto.user_id})
+        raise_for_status(response)
+        data = response.json()["enrolments"]
+        return [EnrolmentDTO(**e) for e in data]
 
     def get_active(self) -> list[EnrolmentDTO]:
         """
@@ -111,13 +145,30 @@ class EnrolmentService:
         Returns:
             list[EnrolmentDTO]: List of active enrolments.
         """
-        enrolment_url = current_app.config["ENROLMENT_SERVICE_URL"]
-        http_timeout = current_app.config["HTTP_TIMEOUT"]
+        data = self.get_active_raw().json()["enrolments"]
+        return [EnrolmentDTO(**e) for e in data]
+
+    def get_active_raw(self) -> httpx.Response:
+        """
+        Fetch all currently active enrolments without deserializing them.
 
-        response = httpx.get(f"{enrolment_url}/active", timeout=http_timeout)
+        Returns:
+            httpx.Response: Successful downstream response.
+        """
+        response = self.client.get("/active")
         raise_for_status(response)
-        data = response.json()["enrolments"]
-        return [EnrolmentDTO(**e) for e in data]
+        return response
+
+    def stream_active(self) -> Iterable[bytes]:
+        """
+        Stream all currently active enrolments as NDJSON, one enrolment per line.
+
+        Returns:
+            Iterable[bytes]: NDJSON body chunks, closing the downstream response once iterated or closed.
+        """
+        response = self.client.stream("/active", headers={"Accept": NDJSON_MIMETYPE})
+        raise_for_status(response)
+        return iter_chunks(response)
 
     def delete_by_id(self, dto: DeleteEnrolmentDTO) -> None:
         """
@@ -126,8 +177,5 @@ class EnrolmentService:
         Args:
             dto (DeleteEnrolmentDTO): DTO containing the enrolment ID.
         """
-        enrolment_url = current_app.config["ENROLMENT_SERVICE_URL"]
-        http_timeout = current_app.config["HTTP_TIMEOUT"]
-
-        response = httpx.delete(f"{enrolment_url}/{dto.enrolment_id}", timeout=http_timeout)
+        response = self.client.delete(f"/{dto.enrolment_id}")
         raise_for_status(response)
\ No newline at end of file
@@ -58,6 +58,38 @@ class ServerException(ApiException):
     def __init__(self, message: str = "Server error") -> None:
         super().__init__(message, status_code=500, error_code="server_error")
 
+class ServiceUnavailableException(ServerException):
+    """
+    Exception raised when a downstream service cannot be reached or its circuit is open (HTTP 503).
+
+    Args:
+        message (str): Error message.
+    """
+    def __init__(self, message: str = "Service unavailable") -> None:
+        ApiException.__init__(self, message, status_code=503, error_code="service_unavailable")
+
+class OverloadedException(ServiceUnavailableException):
+    """
+    Exception raised when a request is shed because the gateway is over its concurrency limit (HTTP 503).
+
+    Args:
+        retry_after (int): Seconds after which the client may retry, sent in ``Retry-After``.
+        message (str): Error message.
+    """
+    def __init__(self, retry_after: int, message: str = "Server overloaded, retry later") -> None:
+        ApiException.__init__(self, message, status_code=503, error_code="overloaded")
+        self.retry_after = retry_after
+
+class DeadlineExceededException(ServerException):
+    """
+    Exception raised when the deadline of a request passes before its work is done (HTTP 504).
+
+    Args:
+        message (str): Error message.
+    """
+    def __init__(self, message: str = "Request deadline exceeded") -> None:
+        ApiException.__init__(self, message, status_code=504, error_code="deadline_exceeded")
+
 
 def extract_message(resp: httpx.Response) -> tuple[str, str, list]:
     """
@@ -90,8 +122,12 @@ def raise_for_status(resp: httpx.Response, not_found_message: str | None = None)
     Raises:
         NotFoundException: If the response status is 404.
         ValidationException: If the response indicates a client error (400–499).
+        DeadlineExceededException: If the downstream service gave up on the request deadline (504).
         ServerException: If the response indicates a server error (500+).
     """
+    if resp.status_code < 400:
+        return
+
     message, error_code, details = extract_message(resp)
 
     if resp.status_code == 404:
@@ -100,5 +136,7 @@ def raise_for_status(resp: httpx.Response, not_found_message: str | None = None)
         if error_code == "validation_error":
             raise ValidationException(message=message, details=details)
         raise ValidationException(message=message)
+    if resp.status_code == 504 and error_code == "deadline_exceeded":
+        raise DeadlineExceededException(message)
     if resp.status_code >= 500:
         raise ServerException(message)
\ No newline at end of file
@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+from enum import StrEnum
+
+
+class HealthStatus(StrEnum):
+    """Health of the gateway or of one of its dependencies."""
+    OK = "ok"
+    DOWN = "down"
+
+
+@dataclass(frozen=True)
+class DependencyHealthDTO:
+    """
+    DTO with the outcome of a health probe of a downstream service.
+
+    Attributes:
+        name (str): Name of the downstream service.
+        status (HealthStatus): OK if its ``/health`` endpoint answered 200.
+        latency_ms (float): Duration of the probe in milliseconds.
+        circuit (str): State of the circuit breaker of the service.
+        details (dict[str, str]): Body of the health response, e.g. ``{"database": "down"}``.
+    """
+    name: str
+    status: HealthStatus
+    latency_ms: float
+    circuit: str
+    details: dict[str, str]
+
+
+@dataclass(frozen=True)
+class HealthDTO:
+    """
+    DTO with the aggregated health of the gateway and its dependencies.
+
+    Attributes:
+        status (HealthStatus): OK if every dependency is up.
+        checked_at (float): UNIX timestamp of the probes.
+        dependencies (list[DependencyHealthDTO]): Outcome of every probe.
+    """
+    status: HealthStatus
+    checked_at: float
+    dependencies: list[DependencyHealthDTO]
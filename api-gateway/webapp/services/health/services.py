@@ -0,0 +1,96 @@
+from concurrent.futures import Executor
+from webapp.services.cache import TTLCache
+from webapp.services.downstream import DownstreamClient
+from webapp.services.health.dtos import DependencyHealthDTO, HealthDTO, HealthStatus
+from webapp.services.single_flight import SingleFlight
+from webapp.tracing import tracer
+import httpx
+import structlog
+import time
+
+logger = structlog.get_logger(__name__)
+
+HEALTH_KEY = "health"
+
+
+class HealthService:
+    """
+    Service aggregating the health of the downstream microservices.
+
+    The ``/health`` endpoints of all services are probed concurrently with a short
+    timeout. Probes bypass the circuit breakers and retries, so they report the
+    actual state of each service, and the current circuit state is reported next
+    to it. The aggregated result is cached for a short time and concurrent
+    refreshes are coalesced, so frequent load balancer probes do not reach the
+    databases behind the services.
+    """
+
+    def __init__(
+            self,
+            clients: list[DownstreamClient],
+            executor: Executor,
+            cache: TTLCache[str, HealthDTO],
+            timeout: float
+    ) -> None:
+        """
+        Initialize the service.
+
+        Args:
+            clients (list[DownstreamClient]): Clients of the downstream services to probe.
+            executor (Executor): Executor running the probes concurrently.
+            cache (TTLCache[str, HealthDTO]): Cache of the aggregated result.
+            timeout (float): Timeout of a single probe in seconds.
+        """
+        self.clients = clients
+        self.executor = executor
+        self.cache = cache
+        self.timeout = timeout
+        self._single_flight: SingleFlight[HealthDTO] = SingleFlight()
+
+    def check(self) -> HealthDTO:
+        """
+        Return the aggregated health, probing the services if the cached result has expired.
+
+        Returns:
+            HealthDTO: Health of every downstream service.
+        """
+        cached = self.cache.get(HEALTH_KEY)
+        if cached is not None:
+            return cached
+        return self._single_flight.do(HEALTH_KEY, self._refresh)
+
+    def _refresh(self) -> HealthDTO:
+        checked_at = time.time()
+        dependencies = list(self.executor.map(tracer.wrap(self._probe), self.clients))
+        status = HealthStatus.OK if all(d.status == HealthStatus.OK for d in dependencies) else HealthStatus.DOWN
+        health = HealthDTO(status=status, checked_at=checked_at, dependencies=dependencies)
+        self.cache.set(HEALTH_KEY, health)
+        return health
+
+    def _probe(self, client: DownstreamClient) -> DependencyHealthDTO:
+        started_at = time.perf_counter()
+        try:
+            response = client.client.get("/health", timeout=self.timeout)
+            status = HealthStatus.OK if response.status_code == 200 else HealthStatus.DOWN
+            details = _details(response)
+        except httpx.HTTPError as error:
+            logger.warning("Health probe failed", service=client.name, error=str(error))
+            status, details = HealthStatus.DOWN, {}
+
+        return DependencyHealthDTO(
+            name=client.name,
+            status=status,
+            latency_ms=round((time.perf_counter() - started_at) * 1000, 2),
+            circuit=client.circuit_breaker.state.value,
+            details=details
+        )
+
+
+def _details(response: httpx.Response) -> dict[str, str]:
+    try:
+        body = response.json()
+    except ValueError:
+        return {}
+    if not isinstance(body, dict):
+        return {}
+    return {str(key): str(value) for key, value in body.items()}
@@ -0,0 +1,124 @@
+from collections import deque
+from dataclasses import dataclass
+from threading import Lock
+from webapp.services.circuit_breaker import RetryBudget
+import math
+
+
+@dataclass(frozen=True)
+class HedgingStatsDTO:
+    """
+    DTO with a snapshot of hedging statistics.
+
+    Attributes:
+        delay (float | None): Current hedging delay in seconds, None until enough latencies are observed.
+        hedged (int): Number of requests that sent a hedged attempt.
+        hedge_won (int): Number of hedged requests answered first by the hedged attempt.
+        budget_tokens (float): Hedging budget tokens currently available.
+    """
+    delay: float | None
+    hedged: int
+    hedge_won: int
+    budget_tokens: float
+
+
+class HedgingPolicy:
+    """
+    Decides when an idempotent GET gets a second, hedged attempt.
+
+    Latencies of recent upstream attempts are kept in a sliding window. Once
+    `min_samples` are recorded, an attempt that has not answered after the
+    `percentile` of that window (at least `min_delay`) is hedged, provided the
+    budget has a token. Every request deposits `budget.ratio` tokens and every
+    hedge withdraws one, so hedges stay a bounded fraction of traffic and stop
+    when the service slows down as a whole.
+    """
+
+    def __init__(
+            self,
+            percentile: float,
+            min_delay: float,
+            budget: RetryBudget,
+            window_size: int = 200,
+            min_samples: int = 20
+    ) -> None:
+        """
+        Initialize the policy with an empty latency window.
+
+        Args:
+            percentile (float): Latency percentile (0-1) after which an attempt is hedged.
+            min_delay (float): Lower bound of the hedging delay in seconds.
+            budget (RetryBudget): Token bucket bounding the share of hedged requests.
+            window_size (int): Number of most recent latencies in the window.
+            min_samples (int): Number of latencies needed before hedging starts.
+        """
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.budget = budget
+        self.min_samples = min_samples
+        self.hedged = 0
+        self.hedge_won = 0
+        self._latencies: deque[float] = deque(maxlen=window_size)
+        self._delay: float | None = None
+        self._lock = Lock()
+
+    def observe(self, latency: float) -> None:
+        """
+        Record the latency of a completed upstream attempt.
+
+        Args:
+            latency (float): Duration of the attempt in seconds.
+        """
+        with self._lock:
+            self._latencies.append(latency)
+            if len(self._latencies) < self.min_samples:
+                return
+            ordered = sorted(self._latencies)
+            index = min(len(ordered) - 1, math.ceil(self.percentile * len(ordered)) - 1)
+            self._delay = max(self.min_delay, ordered[index])
+
+    def delay(self) -> float | None:
+        """
+        Return how long to wait for the first attempt before hedging it.
+
+        Returns:
+            float | None: Delay in seconds, or None while too few latencies are observed.
+        """
+        return self._delay
+
+    def request(self) -> None:
+        """Deposit budget tokens for a new request."""
+        self.budget.deposit()
+
+    def try_hedge(self) -> bool:
+        """
+        Withdraw a budget token for a hedged attempt.
+
+        Returns:
+            bool: True if the hedge may be sent.
+        """
+        if not self.budget.withdraw():
+            return False
+        with self._lock:
+            self.hedged += 1
+        return True
+
+    def record_win(self) -> None:
+        """Record that a hedged attempt answered before the first one."""
+        with self._lock:
+            self.hedge_won += 1
+
+    def stats(self) -> HedgingStatsDTO:
+        """
+        Return current hedging statistics.
+
+        Returns:
+            HedgingStatsDTO: Delay, hedge counters and budget tokens.
+        """
+        with self._lock:
+            return HedgingStatsDTO(
+                delay=self._delay,
+                hedged=self.hedged,
+                hedge_won=self.hedge_won,
+                budget_tokens=self.budget.tokens
+            )
@@ -0,0 +1,71 @@
+from typing import Generator
+from webapp.services.replicas import BalancingTransport, Replica
+import httpx
+
+
+def init_http_client(
+        base_url: str,
+        timeout: float,
+        connect_timeout: float,
+        max_connections: int,
+        max_keepalive_connections: int,
+        keepalive_expiry: float,
+        replica_failure_threshold: int = 5,
+        replica_ejection_seconds: float = 30.0,
+        replica_health_interval: float = 0.0,
+        replica_health_timeout: float = 1.0
+) -> Generator[httpx.Client, None, None]:
+    """
+    Create a pooled, keep-alive HTTP client for a single downstream microservice.
+
+    The client is meant to be provided as a container resource so that every
+    gunicorn worker holds one long-lived connection pool per downstream service
+    instead of opening a new TCP connection on every request.
+
+    `base_url` may list several comma-separated replicas of the service. The
+    client then balances requests over them with a `BalancingTransport`, which
+    keeps a separate connection pool per replica and takes failing or
+    unhealthy replicas out of rotation.
+
+    Args:
+        base_url (str): Base URL of the downstream service (e.g. ``http://users-webapp:5000/api/users``),
+            or comma-separated base URLs of its replicas.
+        timeout (float): Read, write and pool acquisition timeout in seconds.
+        connect_timeout (float): Timeout for establishing a new connection in seconds.
+        max_connections (int): Maximum number of concurrent connections in the pool of each replica.
+        max_keepalive_connections (int): Maximum number of idle connections kept alive per replica.
+        keepalive_expiry (float): Time in seconds after which an idle connection is closed.
+        replica_failure_threshold (int): Consecutive failures after which a replica is ejected.
+        replica_ejection_seconds (float): Time an ejected replica is kept out of rotation.
+        replica_health_interval (float): Interval of active replica health checks in seconds; 0 disables them.
+        replica_health_timeout (float): Timeout of a single replica health probe in seconds.
+
+    Yields:
+        httpx.Client: Configured client, closed when the container resources are shut down.
+    """
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry
+    )
+    urls = [url.strip() for url in base_url.split(",") if url.strip()]
+    transport = None
+    if len(urls) > 1:
+        transport = BalancingTransport(
+            [Replica(url, httpx.HTTPTransport(limits=limits)) for url in urls],
+            failure_threshold=replica_failure_threshold,
+            ejection_seconds=replica_ejection_seconds,
+            health_interval=replica_health_interval,
+            health_timeout=replica_health_timeout
+        )
+
+    client = httpx.Client(
+        base_url=urls[0] if transport is not None else base_url,
+        timeout=httpx.Timeout(timeout, connect=connect_timeout),
+        limits=limits,
+        transport=transport
+    )
+    try:
+        yield client
+    finally:
+        client.close()
@@ -0,0 +1,250 @@
+from dataclasses import dataclass
+from threading import Event, Lock, Thread
+from typing import Callable, Iterator
+import httpx
+import random
+import structlog
+import time
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class ReplicaStatsDTO:
+    """
+    DTO with a snapshot of the state of a single replica.
+
+    Attributes:
+        url (str): Base URL of the replica.
+        available (bool): Whether the replica currently receives requests.
+        outstanding (int): Number of requests in flight to the replica.
+        failures (int): Number of consecutive failed requests.
+    """
+    url: str
+    available: bool
+    outstanding: int
+    failures: int
+
+
+class Replica:
+    """A single replica of a downstream service with its own connection pool."""
+
+    def __init__(self, url: str, transport: httpx.BaseTransport) -> None:
+        """
+        Initialize a healthy replica.
+
+        Args:
+            url (str): Base URL of the replica (e.g. ``http://users-webapp-2:5000/api/users``).
+            transport (httpx.BaseTransport): Transport holding the connection pool of the replica.
+        """
+        self.url = httpx.URL(url)
+        self.transport = transport
+        self.outstanding = 0
+        self.failures = 0
+        self.ejected_until = 0.0
+        self.healthy = True
+
+
+class BalancingTransport(httpx.BaseTransport):
+    """
+    Transport spreading the requests of a client over the replicas of a downstream service.
+
+    Every request picks two random available replicas and goes to the one with
+    fewer outstanding requests (power of two choices), which approximates
+    least-outstanding-requests balancing without scanning all replicas. Requests
+    are rewritten from the client base URL to the base URL of the chosen replica.
+
+    Replicas are taken out of rotation:
+        - passively, for `ejection_seconds` after `failure_threshold` consecutive
+          transport errors or 5xx responses;
+        - actively, while their ``/health`` endpoint, probed every `health_interval`
+          seconds by a background thread, does not answer 200.
+
+    If no replica is available, requests are spread over all of them rather than failing.
+    """
+
+    def __init__(
+            self,
+            replicas: list[Replica],
+            failure_threshold: int = 5,
+            ejection_seconds: float = 30.0,
+            health_interval: float = 0.0,
+            health_timeout: float = 1.0,
+            clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        Initialize the transport and start active health checks if enabled.
+
+        Args:
+            replicas (list[Replica]): Replicas of the service; the first one matches the client base URL.
+            failure_threshold (int): Consecutive failures after which a replica is ejected.
+            ejection_seconds (float): Time an ejected replica is kept out of rotation.
+            health_interval (float): Interval of active health checks in seconds; 0 disables them.
+            health_timeout (float): Timeout of a single health probe in seconds.
+            clock (Callable[[], float]): Monotonic time source, replaceable in tests.
+        """
+        self.replicas = replicas
+        self.failure_threshold = failure_threshold
+        self.ejection_seconds = ejection_seconds
+        self.health_timeout = health_timeout
+        self._clock = clock
+        self._base_path = replicas[0].url.raw_path.rstrip(b"/")
+        self._lock = Lock()
+        self._stopped = Event()
+        self._health_thread: Thread | None = None
+        if health_interval > 0:
+            self._health_thread = Thread(target=self._check_health_periodically, args=(health_interval,), daemon=True)
+            self._health_thread.start()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """
+        Send a request to the least loaded of two available replicas.
+
+        Args:
+            request (httpx.Request): Request built against the client base URL.
+
+        Returns:
+            httpx.Response: Response of the replica; its replica is released when it is closed.
+        """
+        replica = self._acquire()
+        try:
+            response = replica.transport.handle_request(self._rewrite(request, replica))
+        except httpx.TransportError:
+            self._record(replica, failed=True)
+            self._release(replica)
+            raise
+
+        self._record(replica, failed=response.status_code >= 500)
+        if isinstance(response.stream, httpx.ByteStream):
+            self._release(replica)
+            return response
+        response.stream = ReleasingStream(response.stream, lambda: self._release(replica))  # type: ignore[arg-type]
+        return response
+
+    def check_health(self) -> None:
+        """Probe the ``/health`` endpoint of every replica and update its availability."""
+        for replica in self.replicas:
+            healthy = self._probe(replica)
+            if healthy != replica.healthy:
+                logger.warning("Replica health changed", url=str(replica.url), healthy=healthy)
+            replica.healthy = healthy
+
+    def stats(self) -> list[ReplicaStatsDTO]:
+        """
+        Return the state of every replica.
+
+        Returns:
+            list[ReplicaStatsDTO]: Availability, load and failures per replica.
+        """
+        now = self._clock()
+        with self._lock:
+            return [
+                ReplicaStatsDTO(
+                    url=str(replica.url),
+                    available=self._available(replica, now),
+                    outstanding=replica.outstanding,
+                    failures=replica.failures
+                )
+                for replica in self.replicas
+            ]
+
+    def close(self) -> None:
+        """Stop the health checks and close the connection pools of all replicas."""
+        self._stopped.set()
+        for replica in self.replicas:
+            replica.transport.close()
+
+    def _acquire(self) -> Replica:
+        now = self._clock()
+        with self._lock:
+            candidates = [replica for replica in self.replicas if self._available(replica, now)] or self.replicas
+            if len(candidates) == 1:
+                replica = candidates[0]
+            else:
+                first, second = random.sample(candidates, 2)
+                replica = first if first.outstanding <= second.outstanding else second
+            replica.outstanding += 1
+            return replica
+
+    def _release(self, replica: Replica) -> None:
+        with self._lock:
+            replica.outstanding -= 1
+
+    def _record(self, replica: Replica, failed: bool) -> None:
+        with self._lock:
+            if not failed:
+                replica.failures = 0
+                return
+            replica.failures += 1
+            if replica.failures >= self.failure_threshold and replica.ejected_until <= self._clock():
+                replica.ejected_until = self._clock() + self.ejection_seconds
+                replica.failures = 0
+                logger.warning("Replica ejected", url=str(replica.url), seconds=self.ejection_seconds)
+
+    @staticmethod
+    def _available(replica: Replica, now: float) -> bool:
+        return replica.healthy and replica.ejected_until <= now
+
+    def _rewrite(self, request: httpx.Request, replica: Replica) -> httpx.Request:
+        path = request.url.raw_path
+        if path.startswith(self._base_path):
+            path = replica.url.raw_path.rstrip(b"/") + path[len(self._base_path):]
+        request.url = request.url.copy_with(
+            scheme=replica.url.scheme,
+            host=replica.url.host,
+            port=replica.url.port,
+            raw_path=path
+        )
+        request.headers["Host"] = request.url.netloc.decode("ascii")
+        return request
+
+    def _probe(self, replica: Replica) -> bool:
+        request = httpx.Request(
+            "GET",
+            replica.url.copy_with(raw_path=replica.url.raw_path.rstrip(b"/") + b"/health"),
+            extensions={"timeout": httpx.Timeout(self.health_timeout).as_dict()}
+        )
+        try:
+            response = replica.transport.handle_request(request)
+            try:
+                response.read()
+            finally:
+                response.close()
+        except httpx.HTTPError:
+            return False
+        return response.status_code == 200
+
+    def _check_health_periodically(self, interval: float) -> None:
+        while not self._stopped.wait(interval):
+            try:
+                self.check_health()
+            except Exception:
+                logger.exception("Replica health check failed")
+
+
+class ReleasingStream(httpx.SyncByteStream):
+    """Response body stream calling `on_close` once the response is closed."""
+
+    def __init__(self, stream: httpx.SyncByteStream, on_close: Callable[[], None]) -> None:
+        """
+        Wrap a response body stream.
+
+        Args:
+            stream (httpx.SyncByteStream): Body stream of the response.
+            on_close (Callable[[], None]): Called once, when the stream is closed.
+        """
+        self._stream = stream
+        self._on_close: Callable[[], None] | None = on_close
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Yield the chunks of the wrapped stream."""
+        yield from self._stream
+
+    def close(self) -> None:
+        """Close the wrapped stream and call `on_close` if not called yet."""
+        try:
+            self._stream.close()
+        finally:
+            on_close, self._on_close = self._on_close, None
+            if on_close is not None:
+                on_close()
@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class RevokeTokenDTO:
+    """
+    DTO for revoking a token.
+
+    Attributes:
+        jti (str): Unique identifier of the token (``jti`` claim).
+        expires_at (datetime): Expiration timestamp of the token (``exp`` claim).
+    """
+    jti: str
+    expires_at: datetime
+
+
+@dataclass(frozen=True)
+class RevocationStatsDTO:
+    """
+    DTO with a snapshot of revocation statistics.
+
+    Attributes:
+        tokens (int): Number of revoked tokens added to the filter since it was built.
+        synced_at (datetime | None): Timestamp of the last successful sync, None before the first one.
+        lookups (int): Number of tokens that passed the filter and were looked up in the denylist.
+        false_positives (int): Number of looked up tokens that were not revoked.
+    """
+    tokens: int
+    synced_at: datetime | None
+    lookups: int
+    false_positives: int
@@ -0,0 +1,227 @@
+from datetime import datetime, timedelta
+from flask import current_app, has_app_context
+from threading import Event, Lock, Thread
+from typing import Generator
+from webapp.services.bloom_filter import BloomFilter
+from webapp.services.cache import TTLCache
+from webapp.services.downstream import DownstreamClient
+from webapp.services.exceptions import ApiException, raise_for_status
+from webapp.services.revocation.dtos import RevocationStatsDTO, RevokeTokenDTO
+import structlog
+import time
+
+logger = structlog.get_logger(__name__)
+
+SYNC_OVERLAP = timedelta(seconds=5)
+
+
+class RevocationService:
+    """
+    Denylist of revoked JWTs, stored by the Users microservice and mirrored in a Bloom filter.
+
+    The identifiers (``jti``) of revoked tokens are kept in the Users service until
+    the tokens expire, so every gateway instance and worker sees the same denylist.
+    Each worker mirrors it in an in-process Bloom filter, synced every
+    `sync_interval` seconds with the tokens revoked since the previous sync and
+    rebuilt from scratch every `rebuild_interval` seconds to drop expired ones.
+
+    A token missing from the filter is definitely not revoked, which answers the
+    check of almost every request without I/O. Only tokens that pass the filter,
+    i.e. revoked tokens and rare false positives, are looked up in the Users
+    service, and the answer is cached until a sync brings in the revocation of
+    the token. Until the first sync has loaded the filter, every token is looked
+    up. If the lookup fails, the token is treated as revoked.
+    """
+
+    def __init__(
+            self,
+            client: DownstreamClient,
+            cache: TTLCache[str, bool],
+            capacity: int,
+            false_positive_rate: float,
+            sync_interval: float,
+            rebuild_interval: float
+    ) -> None:
+        """
+        Initialize the service with an empty filter.
+
+        Args:
+            client (DownstreamClient): Pooled client bound to the Users microservice base URL.
+            cache (TTLCache[str, bool]): Cache of denylist lookups, keyed by token identifier.
+            capacity (int): Number of revoked tokens the filter is sized for.
+            false_positive_rate (float): Target false positive rate of the filter.
+            sync_interval (float): Interval in seconds between incremental syncs.
+            rebuild_interval (float): Interval in seconds between full rebuilds of the filter.
+        """
+        self.client = client
+        self.cache = cache
+        self.capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        self.sync_interval = sync_interval
+        self.rebuild_interval = rebuild_interval
+        self.lookups = 0
+        self.false_positives = 0
+        self._filter = BloomFilter(capacity, false_positive_rate)
+        self._synced_at: datetime | None = None
+        self._rebuilt_at = 0.0
+        self._revoked_during_sync: list[str] | None = None
+        self._lock = Lock()
+        self._stopped = Event()
+        self._thread: Thread | None = None
+
+    def revoke(self, dto: RevokeTokenDTO) -> None:
+        """
+        Revoke a token until it expires.
+
+        Args:
+            dto (RevokeTokenDTO): Identifier and expiration of the token.
+
+        Raises:
+            ApiException: If the Users service does not store the revocation.
+        """
+        response = self.client.post("/revoked-tokens/", json={"jti": dto.jti, "expires_at": dto.expires_at.isoformat()})
+        raise_for_status(response)
+
+        with self._lock:
+            self._filter.add(dto.jti)
+            if self._revoked_during_sync is not None:
+                self._revoked_during_sync.append(dto.jti)
+        self.cache.set(dto.jti, True)
+
+    def is_revoked(self, jti: str) -> bool:
+        """
+        Check whether a token is revoked.
+
+        Args:
+            jti (str): Unique identifier of the token.
+
+        Returns:
+            bool: True if the token is revoked or its revocation cannot be checked.
+        """
+        if self._synced_at is not None and not self._filter.might_contain(jti):
+            return False
+
+        cached = self.cache.get(jti)
+        if cached is not None:
+            return cached
+
+        self.lookups += 1
+        try:
+            response = self.client.get("/revoked-tokens/jti", params={"jti": jti})
+            if response.status_code == 404:
+                if self._synced_at is not None:
+                    self.false_positives += 1
+                self.cache.set(jti, False)
+                return False
+            raise_for_status(response)
+        except ApiException as error:
+            logger.warning("Token revocation lookup failed", jti=jti, error=error.message)
+            return True
+
+        self.cache.set(jti, True)
+        return True
+
+    def sync(self) -> None:
+        """
+        Add the tokens revoked since the last sync to the filter, or rebuild it when due.
+
+        Raises:
+            ApiException: If the Users service cannot list revoked tokens.
+        """
+        synced_at = self._synced_at
+        rebuild = synced_at is None or time.monotonic() - self._rebuilt_at >= self.rebuild_interval
+        params = None if rebuild or synced_at is None else {"since": (synced_at - SYNC_OVERLAP).isoformat()}
+
+        with self._lock:
+            self._revoked_during_sync = []
+        try:
+            response = self.client.get("/revoked-tokens/", params=params)
+            raise_for_status(response)
+            data = response.json()
+            tokens = [token["jti"] for token in data["tokens"]]
+
+            with self._lock:
+                if rebuild or self._filter.count + len(tokens) > self._filter.capacity:
+                    bloom_filter = BloomFilter(max(self.capacity, 2 * len(tokens)), self.false_positive_rate)
+                    for jti in tokens + self._revoked_during_sync:
+                        bloom_filter.add(jti)
+                    self._filter = bloom_filter
+                    self._rebuilt_at = time.monotonic()
+                else:
+                    for jti in tokens:
+                        self._filter.add(jti)
+                self._synced_at = datetime.fromisoformat(data["synced_at"])
+            for jti in tokens:
+                self.cache.invalidate(jti)
+        finally:
+            with self._lock:
+                self._revoked_during_sync = None
+
+    def start(self) -> None:
+        """Sync the filter in a background thread every `sync_interval` seconds, starting now."""
+        self._thread = Thread(target=self._sync_periodically, daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stop the background sync, waiting for a sync in progress to finish."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def stats(self) -> RevocationStatsDTO:
+        """
+        Return current revocation statistics.
+
+        Returns:
+            RevocationStatsDTO: Filtered tokens, last sync and denylist lookups.
+        """
+        return RevocationStatsDTO(
+            tokens=self._filter.count,
+            synced_at=self._synced_at,
+            lookups=self.lookups,
+            false_positives=self.false_positives
+        )
+
+    def _sync_periodically(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                self.sync()
+            except Exception as error:
+                logger.warning("Revoked tokens sync failed", error=str(error))
+            self._stopped.wait(self.sync_interval)
+
+
+def init_revocation_service(
+        client: DownstreamClient,
+        cache: TTLCache[str, bool],
+        capacity: int,
+        false_positive_rate: float,
+        sync_interval: float,
+        rebuild_interval: float
+) -> Generator[RevocationService, None, None]:
+    """
+    Create a revocation service syncing its filter in the background.
+
+    Meant to be provided as a container resource, so the sync stops when the
+    container resources are shut down. The sync is not started for a testing
+    application, whose tokens are then always looked up.
+
+    Args:
+        client (DownstreamClient): Pooled client bound to the Users microservice base URL.
+        cache (TTLCache[str, bool]): Cache of denylist lookups.
+        capacity (int): Number of revoked tokens the filter is sized for.
+        false_positive_rate (float): Target false positive rate of the filter.
+        sync_interval (float): Interval in seconds between incremental syncs.
+        rebuild_interval (float): Interval in seconds between full rebuilds of the filter.
+
+    Yields:
+        RevocationService: Started service, stopped on shutdown.
+    """
+    service = RevocationService(client, cache, capacity, false_positive_rate, sync_interval, rebuild_interval)
+    if not (has_app_context() and current_app.testing):
+        service.start()
+    try:
+        yield service
+    finally:
+        service.close()
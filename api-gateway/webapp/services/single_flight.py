@@ -0,0 +1,118 @@
+from dataclasses import dataclass
+from threading import Event, Lock
+from typing import Callable, Hashable
+from webapp import deadline
+from webapp.services.exceptions import DeadlineExceededException
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class SingleFlightStatsDTO:
+    """
+    DTO with a snapshot of single-flight statistics.
+
+    Attributes:
+        in_flight (int): Number of distinct calls currently executing.
+        executed (int): Number of calls that went upstream.
+        coalesced (int): Number of calls that shared the result of an in-flight call.
+    """
+    in_flight: int
+    executed: int
+    coalesced: int
+
+
+class _Call[T]:
+    """A single in-flight call shared by its concurrent callers."""
+
+    def __init__(self) -> None:
+        self.done = Event()
+        self.result: T | None = None
+        self.error: BaseException | None = None
+        self.followers = 0
+
+
+class SingleFlight[T]:
+    """
+    Coalesces concurrent identical calls into a single execution.
+
+    The first caller for a key executes the function; callers arriving with the
+    same key while it runs wait for it and receive the same result or exception.
+    Nothing is cached: once the call finishes, the next caller executes again.
+
+    Callers may carry different request deadlines, so a waiting caller gives up
+    at its own deadline rather than the leader's. If the leader fails on its
+    deadline, the waiting callers retry the call themselves instead of sharing
+    that failure, as their own deadlines may not have passed yet.
+    """
+
+    def __init__(self) -> None:
+        self.executed = 0
+        self.coalesced = 0
+        self._calls: dict[Hashable, _Call[T]] = {}
+        self._lock = Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """
+        Execute `fn` once for all concurrent callers with the same key.
+
+        Args:
+            key (Hashable): Identity of the call, e.g. ``(service, path, params)``.
+            fn (Callable[[], T]): Function performing the call.
+
+        Returns:
+            T: Result of the shared execution.
+
+        Raises:
+            DeadlineExceededException: If the deadline of the current request passes while waiting.
+            BaseException: Whatever the shared execution raised.
+        """
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                leader = call is None
+                if call is None:
+                    call = _Call()
+                    self._calls[key] = call
+                    self.executed += 1
+                else:
+                    call.followers += 1
+                    self.coalesced += 1
+
+            if leader:
+                break
+            if not call.done.wait(deadline.remaining()):
+                raise DeadlineExceededException()
+            if isinstance(call.error, DeadlineExceededException):
+                continue
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+            if call.followers:
+                logger.debug("Coalesced downstream calls", key=key, coalesced=call.followers)
+
+    def stats(self) -> SingleFlightStatsDTO:
+        """
+        Return current single-flight statistics.
+
+        Returns:
+            SingleFlightStatsDTO: In-flight, executed and coalesced call counters.
+        """
+        with self._lock:
+            return SingleFlightStatsDTO(
+                in_flight=len(self._calls),
+                executed=self.executed,
+                coalesced=self.coalesced
+            )
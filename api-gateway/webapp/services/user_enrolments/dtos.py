@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from webapp.services.courses.dtos import CourseDTO
+from webapp.services.enrolments.dtos import EnrolmentDTO
+
+
+@dataclass(frozen=True)
+class EnrolmentWithCourseDTO:
+    """
+    Enrolment composed with the details of its course.
+
+    Attributes:
+        enrolment (EnrolmentDTO): The enrolment.
+        course (CourseDTO | None): Details of the enrolled course, None if the course no longer exists.
+    """
+    enrolment: EnrolmentDTO
+    course: CourseDTO | None
@@ -0,0 +1,64 @@
+from concurrent.futures import ThreadPoolExecutor
+from webapp import deadline
+from webapp.services.courses.dtos import CourseDTO, CourseIdDTO
+from webapp.services.courses.services import CourseService
+from webapp.services.enrolments.dtos import EnrolmentUserIdDTO
+from webapp.services.enrolments.services import EnrolmentService
+from webapp.services.exceptions import NotFoundException
+from webapp.services.user_enrolments.dtos import EnrolmentWithCourseDTO
+from webapp.tracing import tracer
+
+
+class UserEnrolmentsService:
+    """
+    Service composing a user's enrolments with the details of their courses.
+
+    The enrolments are fetched in a single call to the Enrolments microservice,
+    then every distinct course is fetched concurrently from the Courses
+    microservice, so the latency is one extra round trip regardless of the
+    number of enrolments.
+    """
+
+    def __init__(
+            self,
+            enrolment_service: EnrolmentService,
+            course_service: CourseService,
+            executor: ThreadPoolExecutor
+    ) -> None:
+        """
+        Initialize the service.
+
+        Args:
+            enrolment_service (EnrolmentService): Service of the Enrolments microservice.
+            course_service (CourseService): Service of the Courses microservice.
+            executor (ThreadPoolExecutor): Executor fetching courses concurrently.
+        """
+        self.enrolment_service = enrolment_service
+        self.course_service = course_service
+        self.executor = executor
+
+    def get_for_user(self, dto: EnrolmentUserIdDTO) -> list[EnrolmentWithCourseDTO]:
+        """
+        Fetch all enrolments of a user together with their courses.
+
+        Args:
+            dto (EnrolmentUserIdDTO): DTO containing the user ID.
+
+        Returns:
+            list[EnrolmentWithCourseDTO]: The user's enrolments with course details.
+        """
+        enrolments = self.enrolment_service.get_by_user(dto)
+
+        course_ids = list(dict.fromkeys(enrolment.course_id for enrolment in enrolments))
+        courses = dict(zip(course_ids, self.executor.map(deadline.bind(tracer.wrap(self._get_course)), course_ids)))
+
+        return [
+            EnrolmentWithCourseDTO(enrolment=enrolment, course=courses[enrolment.course_id])
+            for enrolment in enrolments
+        ]
+
+    def _get_course(self, course_id: int) -> CourseDTO | None:
+        try:
+            return self.course_service.get_by_id(CourseIdDTO(course_id=course_id))
+        except NotFoundException:
+            return None
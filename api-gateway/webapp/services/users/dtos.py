@@ -45,7 +45,7 @@ class UserDTO:
         gender (GenderType): Gender type.
         role (Literal["user", "admin"]): User role.
         is_active (bool): Whether the user is active.
-        mfa_secret (str): Secret for MFA, if enabled.
+        mfa_enabled (bool): Whether MFA is enabled for the user.
     """
     id: str
     username: str
@@ -55,6 +55,7 @@ class UserDTO:
     gender: GenderType
     role: Literal["user", "admin"]
     is_active: bool
+    mfa_enabled: bool = False
 
 @dataclass(frozen=True)
 class ForgotPasswordDTO:
@@ -14,9 +14,9 @@ from webapp.services.users.dtos import (
     DeleteUserByIdDTO,
     DeleteUserByIdentifierDTO
 )
-from flask import current_app
+from webapp.services.cache import TTLCache
+from webapp.services.downstream import DownstreamClient
 from webapp.services.exceptions import raise_for_status
-import httpx
 
 
 class UserService:
@@ -27,6 +27,17 @@ class UserService:
     activation, password reset, MFA, retrieval, and deletion.
     """
 
+    def __init__(self, client: DownstreamClient, cache: TTLCache[str, UserDTO]) -> None:
+        """
+        Initialize the service with a downstream HTTP client.
+
+        Args:
+            client (DownstreamClient): Pooled client bound to the Users microservice base URL.
+            cache (TTLCache[str, UserDTO]): Identity cache used for role lookups, keyed by user ID.
+        """
+        self.client = client
+        self.cache = cache
+
     def create_user(self, dto: CreateUserDTO) -> UserDTO:
         """
         Create a new user.
@@ -37,10 +48,7 @@ class UserService:
         Returns:
             UserDTO: The created user object.
         """
-        users_url = current_app.config["USERS_SERVICE_URL"]
-        http_timeout = current_app.config["HTTP_TIMEOUT"]
-
-        response = httpx.post(f"{users_url}/", json=dto.__dict__, timeout=http_timeout)
+        response = self.client.post("/", json=dto.__dict__)
         raise_for_status(response)
 
         return UserDTO(**response.json())
@@ -55,10 +63,7 @@ class UserService:
         Returns:
             UserDTO: Activated user object.
         """
-        users_url = current_app.config["USERS_SERVICE_URL"]
-        http_timeout = current_app.config["HTTP_TIMEOUT"]
-
-        response = httpx.patch(f"{users_url}/activation", json=dto.__dict__, timeout=http_timeout)
+        response = self.client.patch("/activation", json=dto.__dict__)
         raise_for_status(response)
 
         return UserDTO(**response.json())
@@ -73,13 +78,9 @@ class UserService:
         Returns:
             UserDTO: The user object after resending activation code.
         """
-        users_url = current_app.config["USERS_SERVICE_URL"]
-        http_timeout = current_app.config["HTTP_TIMEOUT"]
-
-        response = httpx.get(
-            f"{users_url}/activation/resend",
-            params=dto.__dict__,
-            timeout=http_timeout
+        response = self.client.get(
+            "/activation/resend",
+            params=dto.__dict__
         )
         raise_for_status(response, not_found_message=f"User {dto.identifier} not found")
 
@@ -92,10 +93,7 @@ class UserService:
         Args:
             dto (ForgotPasswordDTO): DTO containing user identifier.
         """
-        users_url = current_app.config["USERS_SERVICE_URL"]
-        http_timeout = current_app.config["HTTP_TIMEOUT"]
-
-        response = httpx.post(f"{users_url}/password/forgot", json=dto.__dict__, timeout=http_timeout)
+        response = self.client.post("/password/forgot", json=dto.__dict__)
         raise_for_status(response)
 
     def reset_password(self, dto: ResetPasswordDTO) -> None:
@@ -105,10 +103,7 @@ class UserService:
         Args:
             dto (ResetPasswordDTO): DTO containing reset token and new password.
         """
-        users_url = current_app.config["USERS_SERVICE_URL"]
-        http_timeout = current_app.config["HTTP_TIMEOUT"]
-
-        response = httpx.post(f"{users_url}/password/reset", json=dto.__dict__, timeout=http_timeout)
+        response = self.client.post("/password/reset", json=dto.__dict__)
         raise_for_status(response)
 
     def enable_mfa(self, dto: EnableMfaDTO) -> MfaSetupDTO:
@@ -121,11 +116,9 @@ class UserService:
         Returns:
             MfaSetupDTO: MFA provisioning details including QR code.
         """
-        users_url = current_app.config["USERS_SERVICE_URL"]
-        http_timeout = current_app.config["HTTP_TIMEOUT"]
-
-        response = httpx.patch(f"{users_url}/mfa/enable", json=dto.__dict__, timeout=http_timeout)
+        response = self.client.patch("/mfa/enable", json=dto.__dict__)
         raise_for_status(response)
+        self.cache.invalidate(dto.user_id)
 
         return MfaSetupDTO(**response.json())
 
@@ -139,14 +132,31 @@ class UserService:
         Returns:
             UserDTO: User object.
         """
-        users_url = current_app.config["USERS_SERVICE_URL"]
-        http_timeout = current_app.config["HTTP_TIMEOUT"]
-
-        response = httpx.get(f"{users_url}/id", params=dto.__dict__, timeout=http_timeout)
+        response = self.client.get("/id", params=dto.__dict__)
         raise_for_status(response)
 
         return UserDTO(**response.json())
 
+    def get_cached_user_by_id(self, dto: UserIdDTO) -> UserDTO:
+        """
+        Retrieve a user by their ID, serving repeated lookups from the identity cache.
+
+        Used for role checks, where a short-lived, possibly stale copy of the user
+        is acceptable. Entries are invalidated when the gateway changes or deletes the user.
+
+        Args:
+            dto (UserIdDTO): DTO containing user ID.
+
+        Returns:
+            UserDTO: User object.
+        """
+        user = self.cache.get(dto.user_id)
+        if user is None:
+            user = self.get_user_by_id(dto)
+            self.cache.set(dto.user_id, user)
+
+        return user
+
     def get_user_by_identifier(self, dto: IdentifierDTO) -> UserDTO:
         """
         Retrieve a user by username or email.
@@ -157,13 +167,9 @@ class UserService:
         Returns:
             UserDTO: User object.
         """
-        users_url = current_app.config["USERS_SERVICE_URL"]
-        http_timeout = current_app.config["HTTP_TIMEOUT"]
-
-        response = httpx.get(
-            f"{users_url}/identifier",
-            params=dto.__dict__,
-            timeout=http_timeout
+        response = self.client.get(
+            "/identifier",
+            params=dto.__dict__
         )
         raise_for_status(response, not_found_message=f"User {dto.identifier} not found")
 
@@ -179,11 +185,9 @@ class UserService:
         Returns:
             UserDTO: User object after MFA is disabled.
         """
-        users_url = current_app.config["USERS_SERVICE_URL"]
-        http_timeout = current_app.config["HTTP_TIMEOUT"]
-
-        response = httpx.patch(f"{users_url}/mfa/disable", json=dto.__dict__, timeout=http_timeout)
+        response = self.client.patch("/mfa/disable", json=dto.__dict__)
         raise_for_status(response)
+        self.cache.invalidate(dto.user_id)
 
         return UserDTO(**response.json())
 
@@ -197,10 +201,7 @@ class UserService:
         Returns:
             MfaSetupDTO: MFA provisioning details including QR code.
         """
-        users_url = current_app.config["USERS_SERVICE_URL"]
-        http_timeout = current_app.config["HTTP_TIMEOUT"]
-
-        response = httpx.get(f"{users_url}/mfa/qr", params=dto.__dict__, timeout=http_timeout)
+        response = self.client.get("/mfa/qr", params=dto.__dict__)
         raise_for_status(response)
 
         return MfaSetupDTO(**response.json())
@@ -212,11 +213,9 @@ class UserService:
         Args:
             dto (DeleteUserByIdDTO): DTO containing user ID.
         """
-        users_url = current_app.config["USERS_SERVICE_URL"]
-        http_timeout = current_app.config["HTTP_TIMEOUT"]
-
-        response = httpx.delete(f"{users_url}/id", params=dto.__dict__, timeout=http_timeout)
+        response = self.client.delete("/id", params=dto.__dict__)
         raise_for_status(response)
+        self.cache.invalidate(dto.user_id)
 
     def delete_user_by_identifier(self, dto: DeleteUserByIdentifierDTO) -> None:
         """
@@ -225,8 +224,6 @@ class UserService:
         Args:
             dto (DeleteUserByIdentifierDTO): DTO containing username or email.
         """
-        users_url = current_app.config["USERS_SERVICE_URL"]
-        http_timeout = current_app.config["HTTP_TIMEOUT"]
-
-        response = httpx.delete(f"{users_url}/identifier", params=dto.__dict__, timeout=http_timeout)
-        raise_for_status(response)
\ No newline at end of file
+        response = self.client.delete("/identifier", params=dto.__dict__)
+        raise_for_status(response)
+        self.cache.invalidate_where(lambda user: dto.identifier in (user.username, user.email))
\ No newline at end of file
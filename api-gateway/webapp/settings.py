@@ -12,16 +12,55 @@ class Config:
 
     Reads environment variables for:
     - Flask app settings
-    - JWT settings
+    - JWT settings and revocation of tokens
     - External microservices URLs
+    - Pass-through of downstream GET responses
+    - Concurrent fan-out and batch endpoint limits
+    - Distributed tracing exporter and sampling
+    - Negotiated response compression
+    - Rate limiter storage
     - CORS configuration
-    - HTTP timeout
+    - HTTP timeouts, request deadline and connection pool limits
+    - Circuit breaker and retry budget of downstream calls
+    - Hedging of idempotent downstream GETs
+    - Bulkheads bounding concurrent calls per downstream service
+    - User identity and course caches
+    - Aggregated health check of downstream services
+    - Adaptive concurrency limits and load shedding of API route groups
     """
 
     SECRET_KEY: str = os.getenv('SECRET_KEY', "")
     FLASK_ENV: str = os.getenv('FLASK_ENV', "")
     FLASK_DEBUG: bool = os.getenv('FLASK_DEBUG') in ("1", "true", "True")
     HTTP_TIMEOUT: int = int(os.getenv("HTTP_TIMEOUT", ""))
+    REQUEST_DEADLINE: float = float(os.getenv("REQUEST_DEADLINE", "10"))
+    HTTP_CONNECT_TIMEOUT: float = float(os.getenv("HTTP_CONNECT_TIMEOUT", "2"))
+    HTTP_POOL_MAX_CONNECTIONS: int = int(os.getenv("HTTP_POOL_MAX_CONNECTIONS", "100"))
+    HTTP_POOL_MAX_KEEPALIVE: int = int(os.getenv("HTTP_POOL_MAX_KEEPALIVE", "20"))
+    HTTP_KEEPALIVE_EXPIRY: float = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+    SINGLE_FLIGHT_ENABLED: bool = os.getenv("SINGLE_FLIGHT_ENABLED", "True") in ("1", "true", "True")
+
+    CIRCUIT_BREAKER_FAILURE_RATE: float = float(os.getenv("CIRCUIT_BREAKER_FAILURE_RATE", "0.5"))
+    CIRCUIT_BREAKER_MINIMUM_CALLS: int = int(os.getenv("CIRCUIT_BREAKER_MINIMUM_CALLS", "10"))
+    CIRCUIT_BREAKER_WINDOW_SIZE: int = int(os.getenv("CIRCUIT_BREAKER_WINDOW_SIZE", "50"))
+    CIRCUIT_BREAKER_OPEN_SECONDS: float = float(os.getenv("CIRCUIT_BREAKER_OPEN_SECONDS", "30"))
+    CIRCUIT_BREAKER_HALF_OPEN_CALLS: int = int(os.getenv("CIRCUIT_BREAKER_HALF_OPEN_CALLS", "1"))
+    RETRY_MAX_RETRIES: int = int(os.getenv("RETRY_MAX_RETRIES", "2"))
+    RETRY_BACKOFF: float = float(os.getenv("RETRY_BACKOFF", "0.05"))
+    RETRY_BUDGET_RATIO: float = float(os.getenv("RETRY_BUDGET_RATIO", "0.1"))
+    RETRY_BUDGET_MAX_TOKENS: float = float(os.getenv("RETRY_BUDGET_MAX_TOKENS", "10"))
+
+    HEDGING_ENABLED: bool = os.getenv("HEDGING_ENABLED", "False") in ("1", "true", "True")
+    HEDGING_PERCENTILE: float = float(os.getenv("HEDGING_PERCENTILE", "0.95"))
+    HEDGING_MIN_DELAY: float = float(os.getenv("HEDGING_MIN_DELAY", "0.01"))
+    HEDGING_WINDOW_SIZE: int = int(os.getenv("HEDGING_WINDOW_SIZE", "200"))
+    HEDGING_MIN_SAMPLES: int = int(os.getenv("HEDGING_MIN_SAMPLES", "20"))
+    HEDGING_BUDGET_RATIO: float = float(os.getenv("HEDGING_BUDGET_RATIO", "0.05"))
+    HEDGING_BUDGET_MAX_TOKENS: float = float(os.getenv("HEDGING_BUDGET_MAX_TOKENS", "10"))
+    HEDGING_MAX_WORKERS: int = int(os.getenv("HEDGING_MAX_WORKERS", "32"))
+    BULKHEAD_MAX_CONCURRENT: int = int(os.getenv("BULKHEAD_MAX_CONCURRENT", "50"))
+    BULKHEAD_MAX_QUEUE: int = int(os.getenv("BULKHEAD_MAX_QUEUE", "50"))
+    BULKHEAD_QUEUE_TIMEOUT: float = float(os.getenv("BULKHEAD_QUEUE_TIMEOUT", "1"))
 
     JWT_SECRET_KEY: str = os.getenv('JWT_SECRET_KEY', "")
     JWT_ACCESS_TOKEN_EXPIRES: int = int(os.getenv('JWT_ACCESS_TOKEN_EXPIRES', ""))
@@ -29,11 +68,91 @@ class Config:
     JWT_COOKIE_CSRF_PROTECT: bool = os.getenv("JWT_COOKIE_CSRF_PROTECT", "False") in ("1", "true", "True")
     JWT_ALGORITHM: str = os.getenv('JWT_ALGORITHM', "HS256")
     JWT_TOKEN_LOCATION: list[str] = os.getenv('JWT_TOKEN_LOCATION', "cookies,headers").split(",")
+    JWT_ROLE_CLAIMS_VERSION: int = int(os.getenv('JWT_ROLE_CLAIMS_VERSION', "1"))
+    JWT_ROLE_FALLBACK_ENABLED: bool = os.getenv('JWT_ROLE_FALLBACK_ENABLED', "True") in ("1", "true", "True")
+
+    REVOCATION_CAPACITY: int = int(os.getenv('REVOCATION_CAPACITY', "100000"))
+    REVOCATION_FALSE_POSITIVE_RATE: float = float(os.getenv('REVOCATION_FALSE_POSITIVE_RATE', "0.001"))
+    REVOCATION_SYNC_INTERVAL: float = float(os.getenv('REVOCATION_SYNC_INTERVAL', "5"))
+    REVOCATION_REBUILD_INTERVAL: float = float(os.getenv('REVOCATION_REBUILD_INTERVAL', "3600"))
+    REVOCATION_CACHE_MAX_SIZE: int = int(os.getenv('REVOCATION_CACHE_MAX_SIZE', "10000"))
+    REVOCATION_CACHE_TTL: float = float(os.getenv('REVOCATION_CACHE_TTL', "60"))
 
     USERS_SERVICE_URL: str = os.getenv('USERS_SERVICE_URL', "")
     COURSE_SERVICE_URL: str = os.getenv('COURSE_SERVICE_URL', "")
     ENROLMENT_SERVICE_URL: str = os.getenv('ENROLMENT_SERVICE_URL', "")
 
+    REPLICA_FAILURE_THRESHOLD: int = int(os.getenv('REPLICA_FAILURE_THRESHOLD', "5"))
+    REPLICA_EJECTION_SECONDS: float = float(os.getenv('REPLICA_EJECTION_SECONDS', "30"))
+    REPLICA_HEALTH_INTERVAL: float = float(os.getenv('REPLICA_HEALTH_INTERVAL', "5"))
+
+    USERS_HTTP_TIMEOUT: float = float(os.getenv('USERS_HTTP_TIMEOUT', str(HTTP_TIMEOUT)))
+    COURSE_HTTP_TIMEOUT: float = float(os.getenv('COURSE_HTTP_TIMEOUT', str(HTTP_TIMEOUT)))
+    ENROLMENT_HTTP_TIMEOUT: float = float(os.getenv('ENROLMENT_HTTP_TIMEOUT', str(HTTP_TIMEOUT)))
+
+    USERS_BULKHEAD_MAX_CONCURRENT: int = int(os.getenv('USERS_BULKHEAD_MAX_CONCURRENT', str(BULKHEAD_MAX_CONCURRENT)))
+    COURSE_BULKHEAD_MAX_CONCURRENT: int = int(os.getenv('COURSE_BULKHEAD_MAX_CONCURRENT', str(BULKHEAD_MAX_CONCURRENT)))
+    ENROLMENT_BULKHEAD_MAX_CONCURRENT: int = int(os.getenv('ENROLMENT_BULKHEAD_MAX_CONCURRENT', str(BULKHEAD_MAX_CONCURRENT)))
+    USERS_BULKHEAD_MAX_QUEUE: int = int(os.getenv('USERS_BULKHEAD_MAX_QUEUE', str(BULKHEAD_MAX_QUEUE)))
+    COURSE_BULKHEAD_MAX_QUEUE: int = int(os.getenv('COURSE_BULKHEAD_MAX_QUEUE', str(BULKHEAD_MAX_QUEUE)))
+    ENROLMENT_BULKHEAD_MAX_QUEUE: int = int(os.getenv('ENROLMENT_BULKHEAD_MAX_QUEUE', str(BULKHEAD_MAX_QUEUE)))
+    USERS_BULKHEAD_QUEUE_TIMEOUT: float = float(os.getenv('USERS_BULKHEAD_QUEUE_TIMEOUT', str(BULKHEAD_QUEUE_TIMEOUT)))
+    COURSE_BULKHEAD_QUEUE_TIMEOUT: float = float(os.getenv('COURSE_BULKHEAD_QUEUE_TIMEOUT', str(BULKHEAD_QUEUE_TIMEOUT)))
+    ENROLMENT_BULKHEAD_QUEUE_TIMEOUT: float = float(os.getenv('ENROLMENT_BULKHEAD_QUEUE_TIMEOUT', str(BULKHEAD_QUEUE_TIMEOUT)))
+
+    USER_CACHE_MAX_SIZE: int = int(os.getenv('USER_CACHE_MAX_SIZE', "10000"))
+    USER_CACHE_TTL: float = float(os.getenv('USER_CACHE_TTL', "60"))
+    COURSE_CACHE_MAX_SIZE: int = int(os.getenv('COURSE_CACHE_MAX_SIZE', "1000"))
+    COURSE_CACHE_TTL: float = float(os.getenv('COURSE_CACHE_TTL', "300"))
+    COURSE_SEARCH_CACHE_TTL: float = float(os.getenv('COURSE_SEARCH_CACHE_TTL', "60"))
+
+    HEALTH_CACHE_TTL: float = float(os.getenv('HEALTH_CACHE_TTL', "2"))
+    HEALTH_TIMEOUT: float = float(os.getenv('HEALTH_TIMEOUT', "1"))
+
+    LOAD_SHEDDING_ENABLED: bool = os.getenv('LOAD_SHEDDING_ENABLED', "True") in ("1", "true", "True")
+    LOAD_SHEDDING_INITIAL_LIMIT: int = int(os.getenv('LOAD_SHEDDING_INITIAL_LIMIT', "50"))
+    LOAD_SHEDDING_MIN_LIMIT: int = int(os.getenv('LOAD_SHEDDING_MIN_LIMIT', "5"))
+    LOAD_SHEDDING_MAX_LIMIT: int = int(os.getenv('LOAD_SHEDDING_MAX_LIMIT', "500"))
+    LOAD_SHEDDING_LATENCY_THRESHOLD: float = float(os.getenv('LOAD_SHEDDING_LATENCY_THRESHOLD', "2"))
+    LOAD_SHEDDING_BACKOFF: float = float(os.getenv('LOAD_SHEDDING_BACKOFF', "0.9"))
+    LOAD_SHEDDING_NORMAL_SHARE: float = float(os.getenv('LOAD_SHEDDING_NORMAL_SHARE', "0.8"))
+    LOAD_SHEDDING_LOW_PRIORITY_SHARE: float = float(os.getenv('LOAD_SHEDDING_LOW_PRIORITY_SHARE', "0.5"))
+    LOAD_SHEDDING_HIGH_PRIORITY_ENDPOINTS: list[str] = os.getenv(
+        'LOAD_SHEDDING_HIGH_PRIORITY_ENDPOINTS', "api.auth.refresh_token,api.auth.logout,api.health.health"
+    ).split(",")
+    LOAD_SHEDDING_LOW_PRIORITY_ENDPOINTS: list[str] = os.getenv(
+        'LOAD_SHEDDING_LOW_PRIORITY_ENDPOINTS', "api.enrolment.expired_courses,api.batch.batch"
+    ).split(",")
+    LOAD_SHEDDING_RETRY_AFTER: int = int(os.getenv('LOAD_SHEDDING_RETRY_AFTER', "1"))
+
+    PASSTHROUGH_ENABLED: bool = os.getenv('PASSTHROUGH_ENABLED', "False") in ("1", "true", "True")
+
+    FANOUT_MAX_WORKERS: int = int(os.getenv('FANOUT_MAX_WORKERS', "16"))
+
+    BATCH_MAX_ITEMS: int = int(os.getenv('BATCH_MAX_ITEMS', "10"))
+    BATCH_MAX_WORKERS: int = int(os.getenv('BATCH_MAX_WORKERS', "16"))
+
+    TRACING_EXPORTER: str = os.getenv('TRACING_EXPORTER', "none")
+    TRACING_FILE: str = os.getenv('TRACING_FILE', "traces.jsonl")
+    TRACING_SAMPLE_RATIO: float = float(os.getenv('TRACING_SAMPLE_RATIO', "0.01"))
+
+    PROFILING_ENABLED: bool = os.getenv('PROFILING_ENABLED', "False") in ("1", "true", "True")
+    PROFILING_SECRET: str = os.getenv('PROFILING_SECRET', "")
+    PROFILING_SAMPLE_RATE: float = float(os.getenv('PROFILING_SAMPLE_RATE', "0"))
+    PROFILING_MODE: str = os.getenv('PROFILING_MODE', "cprofile")
+    PROFILING_SAMPLE_INTERVAL: float = float(os.getenv('PROFILING_SAMPLE_INTERVAL', "0.005"))
+    PROFILING_DIR: str = os.getenv('PROFILING_DIR', "profiles")
+    PROFILING_MAX_FILES: int = int(os.getenv('PROFILING_MAX_FILES', "50"))
+
+    COMPRESSION_ENABLED: bool = os.getenv('COMPRESSION_ENABLED', "True") in ("1", "true", "True")
+    COMPRESSION_ENCODINGS: list[str] = os.getenv('COMPRESSION_ENCODINGS', "zstd,br,gzip").split(",")
+    COMPRESSION_MIN_SIZE: int = int(os.getenv('COMPRESSION_MIN_SIZE', "1024"))
+    COMPRESSION_GZIP_LEVEL: int = int(os.getenv('COMPRESSION_GZIP_LEVEL', "5"))
+    COMPRESSION_BR_LEVEL: int = int(os.getenv('COMPRESSION_BR_LEVEL', "4"))
+    COMPRESSION_ZSTD_LEVEL: int = int(os.getenv('COMPRESSION_ZSTD_LEVEL', "3"))
+
+    RATELIMIT_STORAGE_URI: str = os.getenv('RATELIMIT_STORAGE_URI', "memory://")
+
     CORS_ORIGINS: list[str] = os.getenv('CORS_ORIGINS', "[]").split(",")
     CORS_METHODS: list[str] = os.getenv('CORS_METHODS', "[]").split(",")
     CORS_HEADERS: list[str] = os.getenv('CORS_HEADERS', "[]").split(",")
@@ -30,6 +30,8 @@ def app() -> Generator[Flask, None, None]:
 
     @application.after_request
     def cleanup(response: Response) -> Response:
+        if response.is_streamed:
+            return response
         try:
             db.session.commit()
         except Exception:
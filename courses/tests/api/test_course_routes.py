@@ -1,3 +1,4 @@
+import json
 from unittest.mock import patch, MagicMock
 from flask.testing import FlaskClient
 from webapp.api.courses.routes import check_db_connection
@@ -25,6 +26,29 @@ def test_get_by_id(client: FlaskClient) -> None:
     resp2 = client.get('/api/course/1', json={"course_id": 1})
     assert resp2.status_code == 200
 
+def test_get_by_id_conditional(client: FlaskClient) -> None:
+    _ = client.post('/api/course/', json={
+        'name': 'Test',
+        'description': 'test',
+        'start_date': '2026-10-10',
+        'end_date': '2026-10-10',
+        'price': 100
+    })
+
+    resp = client.get('/api/course/1')
+    etag = resp.headers['ETag']
+    assert resp.status_code == 200
+
+    not_modified = client.get('/api/course/1', headers={'If-None-Match': etag})
+    assert not_modified.status_code == 304
+    assert not_modified.data == b''
+    assert not_modified.headers['ETag'] == etag
+
+    client.patch('/api/course/1', json={'price': 120})
+    modified = client.get('/api/course/1', headers={'If-None-Match': etag})
+    assert modified.status_code == 200
+    assert modified.headers['ETag'] != etag
+
 def test_get_by_name(client: FlaskClient) -> None:
     _ = client.post('/api/course/', json={
         'name': 'Test',
@@ -37,6 +61,24 @@ def test_get_by_name(client: FlaskClient) -> None:
     resp = client.get('/api/course/?name=Test', json={'name': 'Test'})
     assert resp.status_code == 200
 
+def test_get_by_name_ndjson(client: FlaskClient) -> None:
+    for name in ("Test A", "Test B", "Other"):
+        _ = client.post('/api/course/', json={
+            'name': name,
+            'description': 'test',
+            'start_date': '2026-10-10',
+            'end_date': '2026-10-10',
+            'price': 100
+        })
+
+    resp = client.get('/api/course/?name=Test', headers={'Accept': 'application/x-ndjson'})
+    assert resp.status_code == 200
+    assert resp.mimetype == 'application/x-ndjson'
+    assert resp.is_streamed
+
+    lines = resp.get_data(as_text=True).splitlines()
+    assert [json.loads(line)['name'] for line in lines] == ['Test A', 'Test B']
+
 def test_update_course_and_delete(client: FlaskClient) -> None:
     _ = client.post('/api/course/', json={
         'name': 'Test',
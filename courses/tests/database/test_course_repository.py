@@ -29,6 +29,14 @@ def test_get_by_name(session: Session, course: Course) -> None:
     assert course_a[0].name == "Test"
     assert course_a[0].id == 1
 
+def test_iter_by_name(session: Session, course: Course) -> None:
+    session.add(course)
+    repo = CourseRepository()
+
+    courses = list(repo.iter_by_name("tes", batch_size=1))
+    assert [c.name for c in courses] == ["Test"]
+    assert list(repo.iter_by_name("missing")) == []
+
 def test_delete_by_id(session: Session, course: Course) -> None:
     session.add(course)
     repo = CourseRepository()
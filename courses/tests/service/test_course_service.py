@@ -111,6 +111,20 @@ def test_get_by_name_if_not_found(mock_course_repository: MagicMock, course_serv
         course_service.get_by_name(dto)
         mock_course_repository.get_by_name.assert_called_once()
 
+def test_stream_by_name(mock_course_repository: MagicMock, course_service: CourseService) -> None:
+    course = Course(
+        id=1,
+        name="Test",
+        description="test",
+        price=100,
+        start_date=datetime(2026, 1, 1),
+        end_date=datetime(2026, 1, 2),
+    )
+    mock_course_repository.iter_by_name.return_value = iter([course])
+    courses = list(course_service.stream_by_name(CourseNameDTO(name="Test")))
+    assert courses[0].name == "Test"
+    mock_course_repository.iter_by_name.assert_called_once_with("Test")
+
 def test_update_course(mock_course_repository: MagicMock, course_service: CourseService) -> None:
     course = Course(
         name="Test",
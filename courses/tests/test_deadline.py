@@ -0,0 +1,104 @@
+from flask import Flask, jsonify
+from flask.typing import ResponseReturnValue
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
+from typing import Any, Iterator
+from webapp.api.error_handlers import register_error_handlers
+from webapp.deadline import DEADLINE_HEADER, init_deadline, limit_engine, parse_deadline, remaining
+import math
+import pytest
+import time
+
+
+@pytest.fixture
+def engine(monkeypatch: pytest.MonkeyPatch) -> Iterator[Engine]:
+    engine = create_engine("sqlite://")
+    with monkeypatch.context() as patch:
+        patch.setattr(engine.dialect, "name", "mysql")
+        limit_engine(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def statements(engine: Engine) -> list[str]:
+    executed: list[str] = []
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def record(_: Any, __: Any, statement: str, *___: Any) -> None:
+        executed.append(statement)
+
+    return executed
+
+
+@pytest.fixture
+def app(engine: Engine) -> Flask:
+    app = Flask(__name__)
+    init_deadline(app)
+    register_error_handlers(app)
+
+    @app.get("/query")
+    def query() -> ResponseReturnValue:
+        with engine.connect() as connection:
+            return jsonify(connection.execute(text("SELECT 1")).scalar())
+
+    @app.get("/stream")
+    def stream() -> ResponseReturnValue:
+        with engine.connect() as connection:
+            return jsonify(connection.execute(text("SELECT 1").execution_options(stream_results=True)).scalar())
+
+    @app.get("/slow")
+    def slow() -> ResponseReturnValue:
+        time.sleep(0.06)
+        with engine.connect() as connection:
+            return jsonify(connection.execute(text("SELECT 1")).scalar())
+
+    return app
+
+
+def test_select_is_bounded_by_remaining_budget(app: Flask, statements: list[str]) -> None:
+    requested = math.floor((time.time() + 2) * 1000) / 1000
+    response = app.test_client().get("/query", headers={DEADLINE_HEADER: f"{requested:.3f}"})
+
+    assert response.get_json() == 1
+    hint, _, rest = statements[0].partition(" */")
+    assert hint.startswith("SELECT /*+ MAX_EXECUTION_TIME(")
+    assert 0 < int(hint.rsplit("(", 1)[1].rstrip(")")) <= 2000
+    assert rest == " 1"
+
+
+def test_streamed_select_is_not_bounded(app: Flask, statements: list[str]) -> None:
+    response = app.test_client().get("/stream", headers={DEADLINE_HEADER: f"{time.time() + 2:.3f}"})
+
+    assert response.get_json() == 1
+    assert statements == ["SELECT 1"]
+
+
+def test_queries_without_deadline_are_untouched(app: Flask, statements: list[str]) -> None:
+    response = app.test_client().get("/query")
+
+    assert response.get_json() == 1
+    assert statements == ["SELECT 1"]
+
+
+def test_request_after_deadline_is_rejected(app: Flask, statements: list[str]) -> None:
+    response = app.test_client().get("/query", headers={DEADLINE_HEADER: f"{time.time() - 1:.3f}"})
+
+    assert response.status_code == 504
+    assert response.get_json()["error"] == "deadline_exceeded"
+    assert statements == []
+
+
+def test_query_is_not_started_once_deadline_passes(app: Flask, statements: list[str]) -> None:
+    response = app.test_client().get("/slow", headers={DEADLINE_HEADER: f"{time.time() + 0.05:.3f}"})
+
+    assert response.status_code == 504
+    assert statements == []
+    assert remaining() is None
+
+
+def test_parse_deadline() -> None:
+    assert parse_deadline("1760000000.250") == 1760000000.25
+    assert parse_deadline("nan") is None
+    assert parse_deadline("soon") is None
+    assert parse_deadline(None) is None
@@ -0,0 +1,76 @@
+from flask import Flask
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import QueuePool
+from webapp.metrics import (
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_CHECKOUT,
+    Gauge,
+    Histogram,
+    REQUEST_LATENCY,
+    init_metrics,
+    instrument_engine
+)
+import os
+
+
+def test_histogram_renders_cumulative_buckets() -> None:
+    histogram = Histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+    histogram.observe(0.05, "/a")
+    histogram.observe(0.1, "/a")
+    histogram.observe(0.5, "/a")
+    histogram.observe(5, "/a")
+
+    lines = list(histogram.collect())
+
+    assert lines[:2] == ["# HELP latency_seconds Latency.", "# TYPE latency_seconds histogram"]
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 2' in lines
+    assert 'latency_seconds_bucket{route="/a",le="1"} 3' in lines
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 4' in lines
+    assert 'latency_seconds_sum{route="/a"} 5.65' in lines
+    assert 'latency_seconds_count{route="/a"} 4' in lines
+
+
+def test_gauge_labels_and_function() -> None:
+    gauge = Gauge("in_flight", "In flight.", ("service",))
+    gauge.inc("a\"b")
+    gauge.inc("a\"b")
+    gauge.dec("a\"b")
+    assert 'in_flight{service="a\\"b"} 1' in list(gauge.collect())
+
+    gauge.set_function(lambda: 7)
+    assert list(gauge.collect())[-1] == "in_flight 7"
+
+
+def test_init_metrics_records_requests() -> None:
+    app = Flask(__name__)
+    init_metrics(app)
+    app.add_url_rule("/items/<int:item_id>", "item", lambda item_id: ("", 204))
+    client = app.test_client()
+
+    client.get("/items/1")
+    client.get("/items/2")
+    client.get("/missing")
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.content_type.startswith("text/plain; version=0.0.4")
+    body = response.get_data(as_text=True)
+    worker = f'worker="{os.getpid()}"'
+    assert f'http_request_duration_seconds_count{{{worker},method="GET",route="/items/<int:item_id>",status="204"}} 2' in body
+    assert f'http_request_duration_seconds_count{{{worker},method="GET",route="unmatched",status="404"}}' in body
+    assert f"http_requests_in_flight{{{worker}}} 1" in body
+    assert REQUEST_LATENCY.name in body
+
+
+def test_instrument_engine_times_checkouts() -> None:
+    engine = create_engine("sqlite://", poolclass=QueuePool)
+    instrument_engine(engine)
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        assert list(DB_POOL_CHECKED_OUT.collect())[-1] == "db_pool_connections_checked_out 1"
+
+    lines = list(DB_POOL_CHECKOUT.collect())
+    assert any(line.startswith("db_pool_checkout_duration_seconds_count ") and not line.endswith(" 0") for line in lines)
+    assert list(DB_POOL_CHECKED_OUT.collect())[-1] == "db_pool_connections_checked_out 0"
+    engine.dispose()
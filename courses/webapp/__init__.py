@@ -1,6 +1,10 @@
 from flask import Flask
 from .settings import config
 from .extensions import db, migrate
+from .metrics import init_metrics, instrument_engine
+from .tracing import init_tracing, trace_engine
+from .profiling import init_profiling
+from .deadline import init_deadline, limit_engine
 from .container import Container
 from .api import api_bp
 from .api.error_handlers import register_error_handlers
@@ -11,7 +15,10 @@ def create_app() -> Flask:  # pragma: no cover
     Create and configure a Flask application instance.
 
     This function initializes the Flask app, loads configuration,
-    sets up extensions (SQLAlchemy, Migrate), wires the dependency
+    sets up request and database pool metrics on `/metrics`, traces
+    requests and database queries, profiles single requests on demand,
+    bounds them by the request deadline sent by the gateway, initializes
+    extensions (SQLAlchemy, Migrate), wires the dependency
     injection container, registers error handlers, and registers
     the API blueprint. Logs all routes upon app context initialization.
 
@@ -22,6 +29,10 @@ def create_app() -> Flask:  # pragma: no cover
     app.config.from_object(config['default'])
     config['default'].init_app(app)
 
+    init_metrics(app)
+    init_tracing(app)
+    init_profiling(app)
+    init_deadline(app)
     db.init_app(app)
     migrate.init_app(app, db)
 
@@ -32,6 +43,9 @@ def create_app() -> Flask:  # pragma: no cover
     app.register_blueprint(api_bp)
 
     with app.app_context():
+        instrument_engine(db.engine)
+        trace_engine(db.engine)
+        limit_engine(db.engine)
         app.logger.info("[COURSES ROUTES]")
         app.logger.info(app.url_map)
 
@@ -2,6 +2,8 @@ from dependency_injector.wiring import Provide, inject
 from flask.typing import ResponseReturnValue
 from flask import request, jsonify
 from sqlalchemy import text
+from webapp.api.conditional import etag_response
+from webapp.api.streaming import wants_ndjson, ndjson_response
 from webapp.container import Container
 from webapp.extensions import db
 from webapp.services.courses.services import CourseService
@@ -55,12 +57,13 @@ def get_by_id(course_id: int, course_service: CourseService = Provide[Container.
         course_service (CourseService): Injected course service.
 
     Returns:
-        ResponseReturnValue: JSON response containing the course data, status code 200.
+        ResponseReturnValue: JSON response containing the course data and its ETag, status code 200,
+                             or an empty response with status code 304 if ``If-None-Match`` matches.
     """
     payload = CourseIdSchema.model_validate({"course_id": course_id})
     dto = to_dto_course_id(payload)
     read_dto = course_service.get_by_id(dto)
-    return jsonify(to_schema_course(read_dto).model_dump(mode="json")), 200
+    return etag_response(to_schema_course(read_dto))
 
 
 @course_bp.get("/")
@@ -76,9 +79,13 @@ def get_by_name(course_service: CourseService = Provide[Container.courses_servic
            ResponseReturnValue: JSON response containing a list of courses in the format of
                                 CourseResponseListSchema, with HTTP status code 200.
                                 Raises NotFoundException if no matching courses are found.
+                                With ``Accept: application/x-ndjson``, the courses are
+                                streamed one per line instead.
        """
     payload = CourseNameSchema.model_validate(request.args.to_dict() or {})
     dto = to_dto_course_name(payload)
+    if wants_ndjson():
+        return ndjson_response(to_schema_course(d) for d in course_service.stream_by_name(dto))
     dtos = course_service.get_by_name(dto)
     courses =to_courses_list_response_schema(dtos)
     return jsonify(courses.model_dump(mode="json")), 200
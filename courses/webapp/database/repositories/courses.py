@@ -1,8 +1,11 @@
 from sqlalchemy import select
+from typing import Iterator
 from webapp.database.models.courses import Course
 from webapp.database.repositories.generic import GenericRepository
 from webapp.extensions import db
 
+STREAM_BATCH_SIZE = 500
+
 
 class CourseRepository(GenericRepository[Course]):
     """
@@ -51,6 +54,24 @@ class CourseRepository(GenericRepository[Course]):
         stmt = select(Course).where(Course.name.ilike(pattern))
         return list(db.session.scalars(stmt).all())
 
+    def iter_by_name(self, name: str, batch_size: int = STREAM_BATCH_SIZE) -> Iterator[Course]:
+        """
+        Iterate over courses matching a name (case-insensitive, partial match) using a server-side cursor.
+
+        Rows are fetched from the database in batches of `batch_size`, so only one
+        batch is held in memory at a time.
+
+        Args:
+            name (str): Full or partial course name.
+            batch_size (int): Number of rows fetched per round trip.
+
+        Returns:
+            Iterator[Course]: Lazily loaded matching Course instances.
+        """
+        pattern = f"%{name}%"
+        stmt = select(Course).where(Course.name.ilike(pattern)).execution_options(yield_per=batch_size)
+        return iter(db.session.scalars(stmt))
+
     def delete_by_id(self, course_id: int) -> None:
         """
         Delete a course from the database using its ID.
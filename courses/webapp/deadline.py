@@ -0,0 +1,131 @@
+"""
+Request deadlines of the Courses service.
+
+The API gateway sends the absolute deadline of every request in the
+``X-Request-Deadline`` header as a UNIX timestamp. Requests arriving after
+their deadline are rejected without touching the database, and queries run on
+their behalf are bounded by the time left, so no work is done for a client
+that has already given up.
+"""
+from contextvars import ContextVar
+from flask import Flask, g, request
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine, ExceptionContext, ExecutionContext
+from typing import Any
+from webapp.services.exceptions import DeadlineExceededException
+import math
+import time
+
+DEADLINE_HEADER = "X-Request-Deadline"
+
+_deadline: ContextVar[float | None] = ContextVar("deadline", default=None)
+
+
+def parse_deadline(value: str | None) -> float | None:
+    """
+    Parse an ``X-Request-Deadline`` header value.
+
+    Args:
+        value (str | None): UNIX timestamp in seconds, e.g. ``1760000000.250``.
+
+    Returns:
+        float | None: The deadline, or None if missing or malformed.
+    """
+    if not value:
+        return None
+    try:
+        deadline = float(value)
+    except ValueError:
+        return None
+    return deadline if math.isfinite(deadline) else None
+
+
+def remaining() -> float | None:
+    """
+    Return the time left until the deadline of the current request.
+
+    Returns:
+        float | None: Seconds left (negative once passed), or None without a deadline.
+    """
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.time()
+
+
+def check_deadline() -> None:
+    """
+    Reject work for a request whose deadline has passed.
+
+    Raises:
+        DeadlineExceededException: If the deadline of the current request has passed.
+    """
+    budget = remaining()
+    if budget is not None and budget <= 0:
+        raise DeadlineExceededException()
+
+
+def init_deadline(app: Flask) -> None:
+    """
+    Read the deadline of every request and reject requests that arrive after it.
+
+    Args:
+        app (Flask): Application whose requests carry deadlines.
+    """
+    app.before_request(_start_deadline)
+    app.teardown_request(_end_deadline)
+
+
+def limit_engine(engine: Engine) -> None:
+    """
+    Bound the queries of the engine by the deadline of the current request.
+
+    A query is not started once the deadline has passed. On MySQL, SELECT
+    statements get a ``MAX_EXECUTION_TIME`` optimizer hint with the time left,
+    so the server stops them when the deadline passes. Streamed queries
+    (``stream_results``, set by ``yield_per``) get no hint: their rows are
+    fetched while the response is sent, after the handler has returned, so the
+    server would cut a response already underway. A query failing after the
+    deadline raises DeadlineExceededException.
+
+    Args:
+        engine (Engine): Engine whose queries are bounded.
+    """
+    hint = engine.dialect.name == "mysql"
+
+    @event.listens_for(engine, "before_cursor_execute", retval=True)
+    def limit_query(
+            conn: Connection,
+            cursor: Any,
+            statement: str,
+            parameters: Any,
+            context: ExecutionContext | None,
+            *_: Any
+    ) -> tuple[str, Any]:
+        budget = remaining()
+        if budget is None:
+            return statement, parameters
+        if budget <= 0:
+            raise DeadlineExceededException()
+        streamed = context is not None and context.execution_options.get("stream_results", False)
+        if hint and not streamed and statement[:6].upper() == "SELECT":
+            statement = f"SELECT /*+ MAX_EXECUTION_TIME({math.ceil(budget * 1000)}) */{statement[6:]}"
+        return statement, parameters
+
+    @event.listens_for(engine, "handle_error")
+    def expire_query(context: ExceptionContext) -> None:
+        budget = remaining()
+        if budget is not None and budget <= 0:
+            raise DeadlineExceededException() from context.original_exception
+
+
+def _start_deadline() -> None:
+    deadline = parse_deadline(request.headers.get(DEADLINE_HEADER))
+    if deadline is None:
+        return
+    g.deadline_token = _deadline.set(deadline)
+    check_deadline()
+
+
+def _end_deadline(_: BaseException | None) -> None:
+    token = g.pop("deadline_token", None)
+    if token is not None:
+        _deadline.reset(token)
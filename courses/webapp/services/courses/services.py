@@ -10,6 +10,7 @@ from webapp.services.exceptions import ConflictException, NotFoundException
 from webapp.services.courses.mappers import to_read_dto
 from webapp.database.repositories.courses import CourseRepository
 from webapp.database.models.courses import Course
+from typing import Iterator
 
 
 class CourseService:
@@ -106,6 +107,20 @@ class CourseService:
 
         return [to_read_dto(c) for c in course]
 
+    def stream_by_name(self, dto: CourseNameDTO) -> Iterator[ReadCourseDTO]:
+        """
+        Stream courses matching a name without loading them into memory at once.
+
+        Unlike `get_by_name`, no exception is raised when nothing matches; the stream is empty.
+
+        Args:
+            dto (CourseNameDTO): DTO containing the name (full or partial) of the course.
+
+        Returns:
+            Iterator[ReadCourseDTO]: Lazily mapped matching courses.
+        """
+        return (to_read_dto(c) for c in self.course_repository.iter_by_name(dto.name))
+
     def update_course(self, dto: UpdateCourseDTO) -> ReadCourseDTO:
         """
         Update an existing course.
@@ -55,4 +55,12 @@ class ServerException(ApiException):
     """
 
     def __init__(self, message: str = "Server error") -> None:
-        super().__init__(message, status_code=500, error_code="server_error")
\ No newline at end of file
+        super().__init__(message, status_code=500, error_code="server_error")
+
+class DeadlineExceededException(ApiException):
+    """
+    Exception raised when the deadline of a request passes before its work is done.
+    """
+
+    def __init__(self, message: str = "Request deadline exceeded") -> None:
+        super().__init__(message, status_code=504, error_code="deadline_exceeded")
@@ -12,7 +12,7 @@ class Config:
     Flask application configuration class.
 
     Stores application secrets, environment settings, and MySQL database
-    connection parameters. Provides methods to build the SQLAlchemy URI
+    connection parameters, and distributed tracing settings. Provides methods to build the SQLAlchemy URI
     and configure logging for the Flask app.
     """
 
@@ -28,6 +28,18 @@ class Config:
     MYSQL_ROOT_PASSWORD: str = os.getenv('MYSQL_ROOT_PASSWORD', '')
     MYSQL_PORT: str = os.getenv('MYSQL_PORT', '')
 
+    TRACING_EXPORTER: str = os.getenv('TRACING_EXPORTER', "none")
+    TRACING_FILE: str = os.getenv('TRACING_FILE', "traces.jsonl")
+    TRACING_SAMPLE_RATIO: float = float(os.getenv('TRACING_SAMPLE_RATIO', "0.01"))
+
+    PROFILING_ENABLED: bool = os.getenv('PROFILING_ENABLED', "False") in ("1", "true", "True")
+    PROFILING_SECRET: str = os.getenv('PROFILING_SECRET', "")
+    PROFILING_SAMPLE_RATE: float = float(os.getenv('PROFILING_SAMPLE_RATE', "0"))
+    PROFILING_MODE: str = os.getenv('PROFILING_MODE', "cprofile")
+    PROFILING_SAMPLE_INTERVAL: float = float(os.getenv('PROFILING_SAMPLE_INTERVAL', "0.005"))
+    PROFILING_DIR: str = os.getenv('PROFILING_DIR', "profiles")
+    PROFILING_MAX_FILES: int = int(os.getenv('PROFILING_MAX_FILES', "50"))
+
     @property
     def SQLALCHEMY_DATABASE_URI(self) -> str:  # pragma: no cover
         """
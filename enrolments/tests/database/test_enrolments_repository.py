@@ -23,6 +23,15 @@ def test_get_by_user_and_course_success(session: Session, enrolment: Enrolment)
     assert result.user_id == "123"
     assert result.__repr__() == "Enrolment(id=1, course_id=1)"
 
+def test_get_by_user(session: Session, enrolment: Enrolment) -> None:
+    session.add(enrolment)
+    repo = EnrolmentRepository()
+
+    result = repo.get_by_user("123")
+    assert len(result) == 1
+    assert result[0].course_id == 1
+    assert repo.get_by_user("456") == []
+
 def test_get_by_active(session: Session, enrolment: Enrolment) -> None:
     session.add(enrolment)
     repo = EnrolmentRepository()
@@ -32,6 +41,13 @@ def test_get_by_active(session: Session, enrolment: Enrolment) -> None:
     enrolment_a = result[0]
     assert enrolment_a.user_id == "123"
 
+def test_iter_active(session: Session, enrolment: Enrolment) -> None:
+    session.add(enrolment)
+    repo = EnrolmentRepository()
+
+    result = list(repo.iter_active(batch_size=1))
+    assert [e.user_id for e in result] == ["123"]
+
 def test_mark_expired_enrolments_completed(session: Session) -> None:
     enrolment_expired = Enrolment(
         course_id=1,
@@ -0,0 +1,111 @@
+from flask import Flask, jsonify
+from flask.typing import ResponseReturnValue
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
+from typing import Any, Iterator
+from unittest.mock import MagicMock, patch
+from webapp.api.error_handlers import register_error_handlers
+from webapp.deadline import DEADLINE_HEADER, init_deadline, inject, limit_engine, timeout
+from webapp.services.enrolments.services import EnrolmentService
+import math
+import pytest
+import time
+
+
+@pytest.fixture
+def engine(monkeypatch: pytest.MonkeyPatch) -> Iterator[Engine]:
+    engine = create_engine("sqlite://")
+    with monkeypatch.context() as scoped:
+        scoped.setattr(engine.dialect, "name", "mysql")
+        limit_engine(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def statements(engine: Engine) -> list[str]:
+    executed: list[str] = []
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def record(_: Any, __: Any, statement: str, *___: Any) -> None:
+        executed.append(statement)
+
+    return executed
+
+
+@pytest.fixture
+def app(engine: Engine) -> Flask:
+    app = Flask(__name__)
+    app.config.update(USERS_SERVICE_URL="http://users-service", HTTP_TIMEOUT=5)
+    init_deadline(app)
+    register_error_handlers(app)
+    service = EnrolmentService(MagicMock(), MagicMock(), MagicMock(), executor=MagicMock())
+
+    @app.get("/query")
+    def query() -> ResponseReturnValue:
+        with engine.connect() as connection:
+            return jsonify(connection.execute(text("SELECT 1")).scalar())
+
+    @app.get("/stream")
+    def stream() -> ResponseReturnValue:
+        with engine.connect() as connection:
+            return jsonify(connection.execute(text("SELECT 1").execution_options(stream_results=True)).scalar())
+
+    @app.get("/user")
+    def user() -> ResponseReturnValue:
+        return jsonify(service._user_data("123"))
+
+    return app
+
+
+def test_select_is_bounded_by_remaining_budget(app: Flask, statements: list[str]) -> None:
+    response = app.test_client().get("/query", headers={DEADLINE_HEADER: f"{time.time() + 2:.3f}"})
+
+    assert response.get_json() == 1
+    assert statements[0].startswith("SELECT /*+ MAX_EXECUTION_TIME(")
+    assert statements[0].endswith("*/ 1")
+
+
+def test_streamed_select_is_not_bounded(app: Flask, statements: list[str]) -> None:
+    response = app.test_client().get("/stream", headers={DEADLINE_HEADER: f"{time.time() + 2:.3f}"})
+
+    assert response.get_json() == 1
+    assert statements == ["SELECT 1"]
+
+
+def test_request_after_deadline_is_rejected(app: Flask, statements: list[str]) -> None:
+    response = app.test_client().get("/query", headers={DEADLINE_HEADER: f"{time.time() - 1:.3f}"})
+
+    assert response.status_code == 504
+    assert response.get_json()["error"] == "deadline_exceeded"
+    assert statements == []
+
+
+@patch("webapp.services.enrolments.services.httpx.get")
+def test_calls_to_other_services_carry_deadline_and_remaining_budget(mock_get: MagicMock, app: Flask) -> None:
+    mock_get.return_value.status_code = 200
+    mock_get.return_value.json.return_value = {"id": "123"}
+    requested = math.floor((time.time() + 0.5) * 1000) / 1000
+
+    response = app.test_client().get("/user", headers={DEADLINE_HEADER: f"{requested:.3f}"})
+
+    assert response.get_json() == {"id": "123"}
+    kwargs = mock_get.call_args.kwargs
+    assert kwargs["headers"][DEADLINE_HEADER] == f"{requested:.3f}"
+    assert 0 < kwargs["timeout"] <= 0.5
+
+
+@patch("webapp.services.enrolments.services.httpx.get")
+def test_calls_without_deadline_keep_configured_timeout(mock_get: MagicMock, app: Flask) -> None:
+    mock_get.return_value.status_code = 200
+    mock_get.return_value.json.return_value = {"id": "123"}
+
+    app.test_client().get("/user")
+
+    assert mock_get.call_args.kwargs["timeout"] == 5
+    assert DEADLINE_HEADER not in mock_get.call_args.kwargs["headers"]
+
+
+def test_no_deadline_outside_requests() -> None:
+    assert timeout(5) == 5
+    assert inject() == {}
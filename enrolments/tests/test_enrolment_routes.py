@@ -1,6 +1,7 @@
+import json
 from webapp import register_error_handlers
 from webapp.services.enrolments.dtos import ReadEnrolmentDTO, CreateEnrolmentDTO, EnrolmentIdDTO, EnrolmentByUserDTO, \
-    DeleteEnrolmentDTO
+    DeleteEnrolmentDTO, EnrolmentUserIdDTO
 from webapp.database.models.enrolments import PaymentStatus, Status
 from webapp.services.exceptions import ServiceException
 from webapp.api import api_bp
@@ -89,6 +90,28 @@ def test_get_by_id_success(client: FlaskClient, mock_service: MagicMock) -> None
 
 
 
+def test_get_by_id_conditional(client: FlaskClient, mock_service: MagicMock) -> None:
+    mock_service.get_by_id.return_value = ReadEnrolmentDTO(
+        id=1,
+        user_id="123",
+        course_id=1,
+        invoice_url="https://invoice.example.com/555",
+        status=Status.ACTIVE,
+        payment_status=PaymentStatus.PENDING
+    )
+
+    response = client.get("/api/enrolment/1")
+    etag = response.headers["ETag"]
+    not_modified = client.get("/api/enrolment/1", headers={"If-None-Match": etag})
+    other = client.get("/api/enrolment/1", headers={"If-None-Match": '"other"'})
+
+    assert response.status_code == 200
+    assert not_modified.status_code == 304
+    assert not_modified.data == b""
+    assert other.status_code == 200
+    assert other.headers["ETag"] == etag
+
+
 def test_set_paid(client: FlaskClient, mock_service: MagicMock) -> None:
     fake_enrolment_dto = ReadEnrolmentDTO(
         id=1,
@@ -151,6 +174,26 @@ def test_get_by_id_and_user_if_not_user(client: FlaskClient, mock_service: Magic
     response = client.get(f"/api/enrolment/1/details")
     assert response.status_code == 400
 
+def test_get_by_user(client: FlaskClient, mock_service: MagicMock) -> None:
+    fake_enrolment_dto = ReadEnrolmentDTO(
+        id=1,
+        user_id="123",
+        course_id=1,
+        invoice_url=None,
+        status=Status.ACTIVE,
+        payment_status=PaymentStatus.PAID
+    )
+    mock_service.get_by_user.return_value = [fake_enrolment_dto]
+    response = client.get(f"/api/enrolment/user", query_string={"user_id": "123"})
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data["enrolments"][0]["course_id"] == 1
+    mock_service.get_by_user.assert_called_once_with(EnrolmentUserIdDTO(user_id="123"))
+
+def test_get_by_user_if_not_user(client: FlaskClient, mock_service: MagicMock) -> None:
+    response = client.get(f"/api/enrolment/user")
+    assert response.status_code == 400
+
 def test_get_active(client: FlaskClient, mock_service: MagicMock) -> None:
     fake_enrolment_dto = ReadEnrolmentDTO(
             id=1,
@@ -169,6 +212,26 @@ def test_get_active(client: FlaskClient, mock_service: MagicMock) -> None:
 
 
 
+def test_get_active_ndjson(client: FlaskClient, mock_service: MagicMock) -> None:
+    mock_service.stream_active.return_value = iter([
+        ReadEnrolmentDTO(
+            id=enrolment_id,
+            user_id="123",
+            course_id=1,
+            status=Status.ACTIVE,
+            payment_status=PaymentStatus.PENDING
+        )
+        for enrolment_id in (1, 2)
+    ])
+    response = client.get(f"/api/enrolment/active", headers={"Accept": "application/x-ndjson"})
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+
+    lines = response.get_data(as_text=True).splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [1, 2]
+    mock_service.get_active.assert_not_called()
+
+
 def test_delete_by_id(client: FlaskClient, mock_service: MagicMock) -> None:
     enrolment = DeleteEnrolmentDTO(1)
     mock_service.delete_by_id.return_value = enrolment
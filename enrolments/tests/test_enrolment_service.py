@@ -2,7 +2,7 @@ import datetime
 
 from webapp.services.exceptions import ValidationException, ServiceException, NotFoundException, ConflictException
 from webapp.services.enrolments.dtos import CreateEnrolmentDTO, EnrolmentIdDTO, ReadEnrolmentDTO, EnrolmentByUserDTO, \
-    DeleteEnrolmentDTO
+    DeleteEnrolmentDTO, EnrolmentUserIdDTO
 from webapp.services.enrolments.services import EnrolmentService
 from webapp.database.models.enrolments import PaymentStatus, Status, Enrolment
 from unittest.mock import MagicMock, patch
@@ -324,6 +324,13 @@ def test_get_active(repo: MagicMock, service: EnrolmentService, enrolment: Enrol
     assert result[0].status == Status.ACTIVE
 
 
+def test_stream_active(repo: MagicMock, service: EnrolmentService, enrolment: Enrolment) -> None:
+    repo.iter_active.return_value = iter([enrolment])
+    result = list(service.stream_active())
+    assert result[0].status == Status.ACTIVE
+    repo.iter_active.assert_called_once()
+
+
 def test_get_by_id_and_user(repo: MagicMock, service: EnrolmentService, enrolment: Enrolment) -> None:
     repo.get_by_id_and_user.return_value = enrolment
     result = service.get_by_id_and_user(enrolment)
@@ -340,6 +347,14 @@ def test_get_by_id_and_user_not_found(repo: MagicMock, service: EnrolmentService
     repo.get_by_id_and_user.assert_called_once()
 
 
+def test_get_by_user(repo: MagicMock, service: EnrolmentService, enrolment: Enrolment) -> None:
+    repo.get_by_user.return_value = [enrolment]
+    result = service.get_by_user(EnrolmentUserIdDTO(user_id="123"))
+    assert result[0].id == enrolment.id
+    assert result[0].user_id == enrolment.user_id
+    repo.get_by_user.assert_called_once_with("123")
+
+
 def test_delete_by_id(repo: MagicMock, service: EnrolmentService, enrolment: Enrolment) -> None:
     repo.get_by_id.return_value = enrolment
     delete = DeleteEnrolmentDTO(enrolment_id=1)
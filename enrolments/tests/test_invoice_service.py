@@ -13,6 +13,7 @@ def app() -> Generator[Flask, None, None]:
     app = Flask(__name__)
     app.config["INVOICE_API_TOKEN"] = "http://invoice-service"
     app.config["INVOICE_DOMAIN"] = "invoice-service"
+    app.config["HTTP_TIMEOUT"] = 5
     with app.app_context():
         yield app
 
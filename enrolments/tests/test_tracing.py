@@ -0,0 +1,177 @@
+from concurrent.futures import ThreadPoolExecutor
+from flask import Flask
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from typing import Iterator
+from unittest.mock import MagicMock, patch
+from webapp.services.enrolments.services import EnrolmentService
+from webapp.tracing import (
+    FileSpanExporter,
+    InMemorySpanExporter,
+    SpanContext,
+    SpanKind,
+    SpanStatus,
+    create_exporter,
+    init_tracing,
+    trace_engine,
+    tracer
+)
+import json
+import pytest
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+PARENT_ID = "00f067aa0ba902b7"
+
+
+@pytest.fixture
+def exporter() -> Iterator[InMemorySpanExporter]:
+    exporter = InMemorySpanExporter()
+    tracer.configure(exporter, 1.0)
+    yield exporter
+    tracer.configure(None, 0.0)
+
+
+@pytest.fixture
+def traced_app() -> Flask:
+    app = Flask(__name__)
+    app.config.update(TRACING_EXPORTER="none", TRACING_FILE="", TRACING_SAMPLE_RATIO=0.0)
+    init_tracing(app)
+    app.add_url_rule("/items/<int:item_id>", "item", lambda item_id: {"traceparent": tracer.traceparent()})
+    app.add_url_rule("/fail", "fail", lambda: ("", 503))
+    return app
+
+
+@pytest.mark.parametrize("value, expected", [
+    (f"00-{TRACE_ID}-{PARENT_ID}-01", SpanContext(TRACE_ID, PARENT_ID, True)),
+    (f"00-{TRACE_ID.upper()}-{PARENT_ID}-00", SpanContext(TRACE_ID, PARENT_ID, False)),
+    (f"01-{TRACE_ID}-{PARENT_ID}-01-future", SpanContext(TRACE_ID, PARENT_ID, True)),
+    (f"00-{TRACE_ID}-{PARENT_ID}-01-extra", None),
+    (f"ff-{TRACE_ID}-{PARENT_ID}-01", None),
+    (f"00-{'0' * 32}-{PARENT_ID}-01", None),
+    (f"00-{TRACE_ID}-{'0' * 16}-01", None),
+    ("garbage", None),
+    (None, None),
+])
+def test_parse_traceparent(value: str | None, expected: SpanContext | None) -> None:
+    assert SpanContext.from_traceparent(value) == expected
+
+
+def test_request_continues_incoming_trace(traced_app: Flask, exporter: InMemorySpanExporter) -> None:
+    response = traced_app.test_client().get("/items/1", headers={"traceparent": f"00-{TRACE_ID}-{PARENT_ID}-01"})
+
+    [span] = exporter.spans
+    assert span.name == "GET /items/<int:item_id>"
+    assert span.kind == SpanKind.SERVER
+    assert span.trace_id == TRACE_ID
+    assert span.parent_id == PARENT_ID
+    assert span.attributes["http.status_code"] == 200
+    assert response.get_json()["traceparent"] == f"00-{TRACE_ID}-{span.span_id}-01"
+    assert tracer.current_span() is None
+
+
+def test_request_keeps_unsampled_decision_of_caller(traced_app: Flask, exporter: InMemorySpanExporter) -> None:
+    response = traced_app.test_client().get("/items/1", headers={"traceparent": f"00-{TRACE_ID}-{PARENT_ID}-00"})
+
+    assert exporter.spans == []
+    assert response.get_json()["traceparent"].endswith("-00")
+
+
+def test_new_traces_follow_sample_ratio(traced_app: Flask, exporter: InMemorySpanExporter) -> None:
+    client = traced_app.test_client()
+    client.get("/fail")
+    tracer.sample_ratio = 0.0
+    client.get("/fail")
+
+    [span] = exporter.spans
+    assert span.parent_id is None
+    assert span.status == SpanStatus.ERROR
+
+
+def test_disabled_tracer_passes_context_through(traced_app: Flask) -> None:
+    client = traced_app.test_client()
+
+    traced = client.get("/items/1", headers={"traceparent": f"00-{TRACE_ID}-{PARENT_ID}-01"})
+    untraced = client.get("/items/1")
+
+    assert traced.get_json()["traceparent"] == f"00-{TRACE_ID}-{PARENT_ID}-01"
+    assert untraced.get_json()["traceparent"] is None
+
+
+def test_span_records_errors_and_nesting(exporter: InMemorySpanExporter) -> None:
+    with pytest.raises(RuntimeError):
+        with tracer.span("outer") as outer:
+            with tracer.span("inner", SpanKind.CLIENT):
+                raise RuntimeError("boom")
+
+    inner, recorded_outer = exporter.spans
+    assert inner.parent_id == outer.context.span_id == recorded_outer.span_id
+    assert inner.trace_id == recorded_outer.trace_id
+    assert inner.status == recorded_outer.status == SpanStatus.ERROR
+    assert inner.attributes["error.type"] == "RuntimeError"
+
+
+def test_wrap_carries_span_to_other_threads(exporter: InMemorySpanExporter) -> None:
+    def work() -> str | None:
+        with tracer.span("work"):
+            return tracer.traceparent()
+
+    with tracer.span("parent") as parent, ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(tracer.wrap(work)).result()
+
+    assert exporter.spans[0].parent_id == parent.context.span_id
+
+
+def test_create_exporter(tmp_path) -> None:
+    path = tmp_path / "traces.jsonl"
+
+    assert create_exporter("none") is None
+    assert isinstance(create_exporter("memory"), InMemorySpanExporter)
+    assert isinstance(create_exporter("webapp.tracing:InMemorySpanExporter"), InMemorySpanExporter)
+    with pytest.raises(ValueError):
+        create_exporter("zipkin")
+
+    file_exporter = create_exporter("file", str(path))
+    assert isinstance(file_exporter, FileSpanExporter)
+    tracer.configure(file_exporter, 1.0)
+    try:
+        with tracer.span("job"):
+            pass
+    finally:
+        tracer.configure(None, 0.0)
+        file_exporter.shutdown()
+
+    [line] = path.read_text().splitlines()
+    assert json.loads(line)["name"] == "job"
+
+
+def test_trace_engine_records_queries(exporter: InMemorySpanExporter) -> None:
+    engine = create_engine("sqlite://")
+    trace_engine(engine)
+
+    with tracer.span("request", SpanKind.SERVER) as parent, engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        with pytest.raises(OperationalError):
+            connection.execute(text("SELECT * FROM missing"))
+
+    query, failed, _ = exporter.spans
+    assert query.name == "sqlite SELECT"
+    assert query.kind == SpanKind.CLIENT
+    assert query.parent_id == parent.context.span_id
+    assert query.attributes["db.statement"] == "SELECT 1"
+    assert failed.status == SpanStatus.ERROR
+    engine.dispose()
+
+
+@patch("webapp.services.enrolments.services.httpx.get")
+def test_user_data_propagates_trace_context(mock_get: MagicMock, exporter: InMemorySpanExporter) -> None:
+    app = Flask(__name__)
+    app.config.update(USERS_SERVICE_URL="http://users-service", HTTP_TIMEOUT=5)
+    mock_get.return_value.status_code = 200
+    service = EnrolmentService(MagicMock(), MagicMock(), MagicMock(), executor=MagicMock())
+
+    with app.app_context(), tracer.span("request", SpanKind.SERVER):
+        service._user_data("123")
+
+    call, _ = exporter.spans
+    assert call.name == "GET users"
+    assert mock_get.call_args.kwargs["headers"] == {"traceparent": f"00-{call.trace_id}-{call.span_id}-01"}
@@ -1,6 +1,10 @@
 from flask import Flask
 from .settings import config
 from .extensions import db, migrate, mail
+from .metrics import init_metrics, instrument_engine
+from .tracing import init_tracing, trace_engine
+from .profiling import init_profiling
+from .deadline import init_deadline, limit_engine
 from .container import Container
 from .api import api_bp
 from .api.error_handlers import register_error_handlers
@@ -12,6 +16,10 @@ def create_app() -> Flask:  # pragma: no cover
 
     This function:
         - Loads configuration from the Config object.
+        - Records request and database pool metrics, exposed on `/metrics`.
+        - Traces requests, database queries and calls to other services.
+        - Profiles single requests on demand, saving the profiles on disk.
+        - Bounds database queries and calls to other services by the request deadline.
         - Initializes Flask extensions: SQLAlchemy, Flask-Migrate, and Flask-Mail.
         - Sets up dependency injection using the Container.
         - Registers API blueprints and error handlers.
@@ -25,6 +33,10 @@ def create_app() -> Flask:  # pragma: no cover
     app.config.from_object(config['default'])
     config['default'].init_app(app)
 
+    init_metrics(app)
+    init_tracing(app)
+    init_profiling(app)
+    init_deadline(app)
     db.init_app(app)
     mail.init_app(app)
     migrate.init_app(app, db)
@@ -36,6 +48,9 @@ def create_app() -> Flask:  # pragma: no cover
     app.register_blueprint(api_bp)
 
     with app.app_context():
+        instrument_engine(db.engine)
+        trace_engine(db.engine)
+        limit_engine(db.engine)
         app.logger.info("[ENROLMENTS ROUTES]")
         app.logger.info(app.url_map)
         start_enrolment_expiration_job(app, container)
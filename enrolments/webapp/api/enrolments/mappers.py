@@ -3,6 +3,7 @@ from webapp.api.enrolments.schemas import (
     EnrolmentResponseSchema,
     EnrolmentIdSchema,
     EnrolmentByUserSchema,
+    EnrolmentUserIdSchema,
     DeleteEnrolmentSchema,
     EnrolmentsListResponseSchema
 )
@@ -11,6 +12,7 @@ from webapp.services.enrolments.dtos import (
     ReadEnrolmentDTO,
     EnrolmentIdDTO,
     EnrolmentByUserDTO,
+    EnrolmentUserIdDTO,
     DeleteEnrolmentDTO
 )
 
@@ -90,6 +92,19 @@ def to_enrolment_by_user_dto(schema: EnrolmentByUserSchema) -> EnrolmentByUserDT
     return EnrolmentByUserDTO(enrolment_id=schema.enrolment_id, user_id=schema.user_id)
 
 
+def to_enrolment_user_id_dto(schema: EnrolmentUserIdSchema) -> EnrolmentUserIdDTO:
+    """
+    Convert an EnrolmentUserIdSchema into an EnrolmentUserIdDTO.
+
+    Args:
+        schema (EnrolmentUserIdSchema): Input schema containing user ID.
+
+    Returns:
+        EnrolmentUserIdDTO: DTO for service layer operations.
+    """
+    return EnrolmentUserIdDTO(user_id=schema.user_id)
+
+
 def to_enrolment_delete_dto(schema: DeleteEnrolmentSchema) -> DeleteEnrolmentDTO:
     """
     Convert a DeleteEnrolmentSchema into a DeleteEnrolmentDTO.
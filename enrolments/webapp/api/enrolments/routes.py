@@ -6,6 +6,7 @@ from webapp.api.enrolments.mappers import (
     to_create_enrolment_dto,
     to_enrolment_id_dto,
     to_enrolment_by_user_dto,
+    to_enrolment_user_id_dto,
     to_enrolment_delete_dto,
     to_enrolments_list_response_schema
 )
@@ -13,8 +14,11 @@ from webapp.api.enrolments.schemas import (
     CreateEnrolmentSchema,
     EnrolmentIdSchema,
     EnrolmentByUserSchema,
+    EnrolmentUserIdSchema,
     DeleteEnrolmentSchema
 )
+from webapp.api.conditional import etag_response
+from webapp.api.streaming import wants_ndjson, ndjson_response
 from webapp.container import Container
 from webapp.services.enrolments.services import EnrolmentService
 from webapp.services.exceptions import ApiException
@@ -90,7 +94,8 @@ def get_by_id(enrolment_id: int, enrolment_service: EnrolmentService = Provide[C
         enrolment_service (EnrolmentService): The service handling enrolment operations.
 
     Returns:
-        ResponseReturnValue: JSON response containing the enrolment details and HTTP 200 status.
+        ResponseReturnValue: JSON response containing the enrolment details and its ETag with HTTP 200 status,
+                             or an empty response with HTTP 304 status if ``If-None-Match`` matches.
 
     Raises:
         ApiException: If the enrolment is not found.
@@ -98,7 +103,7 @@ def get_by_id(enrolment_id: int, enrolment_service: EnrolmentService = Provide[C
     payload = EnrolmentIdSchema.model_validate({"enrolment_id": enrolment_id})
     dto = to_enrolment_id_dto(payload)
     read_dto = enrolment_service.get_by_id(dto)
-    return jsonify(to_enrolment_response_schema(read_dto).model_dump(mode="json")), 200
+    return etag_response(to_enrolment_response_schema(read_dto))
 
 
 @enrolment_bp.get("/<int:enrolment_id>/details")
@@ -115,7 +120,8 @@ def get_by_id_and_user(enrolment_id: int, enrolment_service: EnrolmentService =
         user_id (str): The ID of the user.
 
     Returns:
-        ResponseReturnValue: JSON response containing the enrolment details and HTTP 200 status.
+        ResponseReturnValue: JSON response containing the enrolment details and its ETag with HTTP 200 status,
+                             or an empty response with HTTP 304 status if ``If-None-Match`` matches.
 
     Raises:
         ApiException: If the user_id query parameter is missing or enrolment is not found.
@@ -130,7 +136,38 @@ def get_by_id_and_user(enrolment_id: int, enrolment_service: EnrolmentService =
     payload = EnrolmentByUserSchema(enrolment_id=enrolment_id, user_id=user_id)
     dto = to_enrolment_by_user_dto(payload)
     read_dto = enrolment_service.get_by_id_and_user(dto)
-    return jsonify(to_enrolment_response_schema(read_dto).model_dump(mode="json")), 200
+    return etag_response(to_enrolment_response_schema(read_dto))
+
+
+@enrolment_bp.get("/user")
+@inject
+def get_by_user(enrolment_service: EnrolmentService = Provide[Container.enrolment_service]) -> ResponseReturnValue:
+    """
+    Get all enrolments of a user.
+
+    Args:
+        enrolment_service (EnrolmentService): The service handling enrolment operations.
+
+    Query Parameters:
+        user_id (str): The ID of the user.
+
+    Returns:
+        ResponseReturnValue: JSON response containing the list of the user's enrolments and HTTP 200 status.
+
+    Raises:
+        ApiException: If the user_id query parameter is missing.
+    """
+    user_id = request.args.get("user_id")
+    if not user_id:
+        raise ApiException(
+            message="Missing required query parameter 'user_id'",
+            status_code=400,
+            error_code="missing_user_id"
+        )
+    payload = EnrolmentUserIdSchema(user_id=user_id)
+    dto = to_enrolment_user_id_dto(payload)
+    dtos = enrolment_service.get_by_user(dto)
+    return jsonify(to_enrolments_list_response_schema(dtos).model_dump(mode="json")), 200
 
 
 @enrolment_bp.get("/active")
@@ -144,10 +181,13 @@ def get_active(enrolment_service: EnrolmentService = Provide[Container.enrolment
 
     Returns:
         ResponseReturnValue: JSON response containing the list of active enrolments and HTTP 200 status.
+            With ``Accept: application/x-ndjson``, the enrolments are streamed one per line instead.
 
     Raises:
         ApiException: If no active enrolments are found.
     """
+    if wants_ndjson():
+        return ndjson_response(to_enrolment_response_schema(dto) for dto in enrolment_service.stream_active())
     dtos = enrolment_service.get_active()
     enrolments = to_enrolments_list_response_schema(dtos)
     return jsonify(enrolments.model_dump(mode="json")), 200
@@ -65,6 +65,16 @@ class EnrolmentByUserSchema(BaseModel):
     user_id: str
 
 
+class EnrolmentUserIdSchema(BaseModel):
+    """
+    Schema for identifying all enrolments of a user.
+
+    Attributes:
+        user_id (str): The ID of the user. Minimum length 1.
+    """
+    user_id: str = Field(..., min_length=1)
+
+
 class DeleteEnrolmentSchema(BaseModel):
     """
     Schema for deleting an enrolment by ID.
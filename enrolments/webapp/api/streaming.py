@@ -0,0 +1,37 @@
+"""
+NDJSON streaming of large list responses.
+
+Clients opt in with ``Accept: application/x-ndjson``; rows are then serialized
+one per line as they are read from the database, so memory stays flat
+regardless of the number of rows.
+"""
+from flask import Response, request, stream_with_context
+from pydantic import BaseModel
+from typing import Iterable, Iterator
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+
+def wants_ndjson() -> bool:
+    """Return whether the client prefers an NDJSON stream over a JSON document."""
+    return request.accept_mimetypes.best_match(["application/json", NDJSON_MIMETYPE]) == NDJSON_MIMETYPE
+
+
+def ndjson_response(rows: Iterable[BaseModel]) -> Response:
+    """
+    Build a streamed NDJSON response, one serialized row per line.
+
+    The request context stays open while streaming, so rows may be read
+    lazily from the database session.
+
+    Args:
+        rows (Iterable[BaseModel]): Response schemas to serialize.
+
+    Returns:
+        Response: Streamed response with the NDJSON mimetype.
+    """
+    def generate() -> Iterator[str]:
+        for row in rows:
+            yield row.model_dump_json() + "\n"
+
+    return Response(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
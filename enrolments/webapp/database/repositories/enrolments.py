@@ -1,9 +1,12 @@
 from datetime import datetime, timezone
 from sqlalchemy import select, and_
+from typing import Iterator
 from webapp.database.models.enrolments import Enrolment, Status
 from webapp.database.repositories.generic import GenericRepository
 from webapp.extensions import db
 
+STREAM_BATCH_SIZE = 500
+
 
 class EnrolmentRepository(GenericRepository[Enrolment]):
     """
@@ -15,7 +18,9 @@ class EnrolmentRepository(GenericRepository[Enrolment]):
     Methods:
         get_by_id_and_user(enrolment_id, user_id) -> Enrolment | None
         get_by_id(enrolment_id) -> Enrolment | None
+        get_by_user(user_id) -> list[Enrolment]
         get_active() -> list[Enrolment]
+        iter_active(batch_size) -> Iterator[Enrolment]
         mark_expired_enrolments_completed() -> list[Enrolment]
     """
 
@@ -50,6 +55,19 @@ class EnrolmentRepository(GenericRepository[Enrolment]):
         stmt = select(Enrolment).where(Enrolment.id == enrolment_id)
         return db.session.scalars(stmt).first()
 
+    def get_by_user(self, user_id: str) -> list[Enrolment]:
+        """
+        Retrieve all enrolments of a user, using the user_id index.
+
+        Args:
+            user_id (str): The ID of the user.
+
+        Returns:
+            list[Enrolment]: The user's enrolments ordered by ID.
+        """
+        stmt = select(Enrolment).where(Enrolment.user_id == user_id).order_by(Enrolment.id)
+        return list(db.session.scalars(stmt).all())
+
     def get_active(self) -> list[Enrolment]:
         """
         Retrieve all enrolments with ACTIVE status.
@@ -60,6 +78,22 @@ class EnrolmentRepository(GenericRepository[Enrolment]):
         stmt = select(Enrolment).where(Enrolment.status == Status.ACTIVE)
         return list(db.session.scalars(stmt).all())
 
+    def iter_active(self, batch_size: int = STREAM_BATCH_SIZE) -> Iterator[Enrolment]:
+        """
+        Iterate over all enrolments with ACTIVE status using a server-side cursor.
+
+        Rows are fetched from the database in batches of `batch_size`, so only one
+        batch is held in memory at a time.
+
+        Args:
+            batch_size (int): Number of rows fetched per round trip.
+
+        Returns:
+            Iterator[Enrolment]: Lazily loaded active enrolments.
+        """
+        stmt = select(Enrolment).where(Enrolment.status == Status.ACTIVE).execution_options(yield_per=batch_size)
+        return iter(db.session.scalars(stmt))
+
     def mark_expired_enrolments_completed(self) -> list[Enrolment]:
         """
         Mark all enrolments whose course_end_date has passed and are still ACTIVE as COMPLETED.
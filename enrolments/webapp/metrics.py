@@ -0,0 +1,264 @@
+"""
+Prometheus-style metrics of the Enrolments microservice.
+
+A minimal, dependency-free registry of histograms and gauges rendered in the
+Prometheus text exposition format on ``/metrics``. Values are kept per process
+and a scrape is answered by whichever gunicorn worker accepts it, so every
+rendered series carries a ``worker`` label with the id of that process: series
+of different workers never overwrite each other, and dashboards sum them with
+``sum without (worker)``.
+"""
+from bisect import bisect_left
+from flask import Flask, Response, g, request
+from sqlalchemy import Engine
+from sqlalchemy.pool import PoolProxiedConnection
+from threading import Lock
+from typing import Callable, Iterator
+import os
+import time
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+WORKER_LABEL = "worker"
+
+
+class Histogram:
+    """
+    Histogram of observed values, one series per label combination.
+
+    Observations are counted in non-cumulative buckets under a single lock and
+    only made cumulative when rendered, which keeps `observe` to a bisect and
+    two additions.
+    """
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = (), buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """
+        Initialize the histogram.
+
+        Args:
+            name (str): Metric name.
+            documentation (str): Help text.
+            labelnames (tuple[str, ...]): Names of the labels of every series.
+            buckets (tuple[float, ...]): Sorted upper bounds of the buckets, without +Inf.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = buckets
+        self._series: dict[tuple[str, ...], list[float]] = {}
+        self._lock = Lock()
+
+    def observe(self, value: float, *labels: str) -> None:
+        """
+        Record an observation.
+
+        Args:
+            value (float): Observed value, e.g. a duration in seconds.
+            *labels (str): Label values, in the order of `labelnames`.
+        """
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0.0] * (len(self.buckets) + 2)
+            series[index] += 1
+            series[-1] += value
+
+    def collect(self, const_labels: tuple[tuple[str, str], ...] = ()) -> Iterator[str]:
+        """Yield the histogram in the Prometheus text format, with `const_labels` on every series."""
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} histogram"
+        with self._lock:
+            snapshot = [(labels, list(series)) for labels, series in self._series.items()]
+
+        bounds = [_format_value(bound) for bound in self.buckets] + ["+Inf"]
+        for labels, series in snapshot:
+            cumulative = 0.0
+            for bound, count in zip(bounds, series):
+                cumulative += count
+                yield f"{self.name}_bucket{_format_labels(self.labelnames + ('le',), labels + (bound,), const_labels)} {_format_value(cumulative)}"
+            yield f"{self.name}_sum{_format_labels(self.labelnames, labels, const_labels)} {_format_value(series[-1])}"
+            yield f"{self.name}_count{_format_labels(self.labelnames, labels, const_labels)} {_format_value(cumulative)}"
+
+
+class Gauge:
+    """Gauge with one series per label combination, or a single value read from a callback."""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> None:
+        """
+        Initialize the gauge.
+
+        Args:
+            name (str): Metric name.
+            documentation (str): Help text.
+            labelnames (tuple[str, ...]): Names of the labels of every series.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: dict[tuple[str, ...], float] = {}
+        self._function: Callable[[], float] | None = None
+        self._lock = Lock()
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        """Increase the series of the given label values."""
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        """Decrease the series of the given label values."""
+        self.inc(*labels, amount=-amount)
+
+    def set(self, value: float, *labels: str) -> None:
+        """Set the series of the given label values."""
+        with self._lock:
+            self._values[labels] = value
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Read the unlabelled value from `function` whenever the gauge is rendered."""
+        self._function = function
+
+    def collect(self, const_labels: tuple[tuple[str, str], ...] = ()) -> Iterator[str]:
+        """Yield the gauge in the Prometheus text format, with `const_labels` on every series."""
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} gauge"
+        if self._function is not None:
+            yield f"{self.name}{_format_labels((), (), const_labels)} {_format_value(self._function())}"
+            return
+
+        with self._lock:
+            snapshot = list(self._values.items())
+        for labels, value in snapshot:
+            yield f"{self.name}{_format_labels(self.labelnames, labels, const_labels)} {_format_value(value)}"
+
+
+class MetricsRegistry:
+    """Collection of the metrics exposed by the application."""
+
+    def __init__(self) -> None:
+        self._metrics: list[Histogram | Gauge] = []
+
+    def histogram(self, name: str, documentation: str, labelnames: tuple[str, ...] = (), buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        """Create and register a histogram."""
+        metric = Histogram(name, documentation, labelnames, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def gauge(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+        """Create and register a gauge."""
+        metric = Gauge(name, documentation, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+
+        Every series is labelled with the id of the rendering process.
+
+        Returns:
+            str: Exposition text.
+        """
+        const_labels = ((WORKER_LABEL, str(os.getpid())),)
+        return "\n".join(line for metric in self._metrics for line in metric.collect(const_labels)) + "\n"
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], const_labels: tuple[tuple[str, str], ...] = ()) -> str:
+    pairs = [*const_labels, *zip(names, values)]
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+registry = MetricsRegistry()
+
+REQUEST_LATENCY = registry.histogram(
+    "http_request_duration_seconds",
+    "Time spent handling HTTP requests, until the response headers are ready.",
+    ("method", "route", "status")
+)
+REQUESTS_IN_FLIGHT = registry.gauge(
+    "http_requests_in_flight",
+    "Number of HTTP requests currently being handled."
+)
+DB_POOL_CHECKOUT = registry.histogram(
+    "db_pool_checkout_duration_seconds",
+    "Time spent checking a connection out of the database pool.",
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+)
+DB_POOL_CHECKED_OUT = registry.gauge(
+    "db_pool_connections_checked_out",
+    "Number of database connections currently checked out of the pool."
+)
+
+
+def init_metrics(app: Flask) -> None:
+    """
+    Record request metrics of the application and expose them on ``/metrics``.
+
+    Should be called before other extensions register their request hooks,
+    so requests they reject are measured as well.
+
+    Args:
+        app (Flask): Application to instrument.
+    """
+    app.before_request(_start_request)
+    app.after_request(_record_request)
+    app.teardown_request(_end_request)
+    app.add_url_rule("/metrics", "metrics", metrics_view)
+
+
+def metrics_view() -> Response:
+    """Return all metrics in the Prometheus text format."""
+    return Response(registry.render(), content_type=CONTENT_TYPE)
+
+
+def _start_request() -> None:
+    g.metrics_started_at = time.perf_counter()
+    REQUESTS_IN_FLIGHT.inc()
+
+
+def _record_request(response: Response) -> Response:
+    started_at = g.get("metrics_started_at")
+    if started_at is not None:
+        route = request.url_rule.rule if request.url_rule is not None else "unmatched"
+        REQUEST_LATENCY.observe(time.perf_counter() - started_at, request.method, route, str(response.status_code))
+    return response
+
+
+def _end_request(_: BaseException | None) -> None:
+    if g.pop("metrics_started_at", None) is not None:
+        REQUESTS_IN_FLIGHT.dec()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Time connection checkouts of the engine's pool and report the checked out connections.
+
+    SQLAlchemy emits no event before a checkout, so the pool's `connect` is wrapped.
+
+    Args:
+        engine (Engine): Engine whose pool is instrumented.
+    """
+    pool = engine.pool
+    connect = pool.connect
+
+    def timed_connect() -> PoolProxiedConnection:
+        started_at = time.perf_counter()
+        try:
+            return connect()
+        finally:
+            DB_POOL_CHECKOUT.observe(time.perf_counter() - started_at)
+
+    pool.connect = timed_connect  # type: ignore[method-assign]
+    checkedout = getattr(pool, "checkedout", None)
+    if checkedout is not None:
+        DB_POOL_CHECKED_OUT.set_function(checkedout)
@@ -0,0 +1,362 @@
+"""
+On-demand request profiling of the Enrolments service.
+
+Nothing is registered unless ``PROFILING_ENABLED`` is set. A request is then
+profiled when it carries a valid ``X-Profile`` header, or with probability
+``PROFILING_SAMPLE_RATE``. The header holds ``<expires>:<signature>``, the
+HMAC-SHA256 of ``<expires>:<path>`` keyed with ``PROFILING_SECRET`` (see `sign`),
+so only holders of the secret can profile a request, and only the signed path
+until the expiry.
+
+A profiled request runs under cProfile (``PROFILING_MODE=cprofile``, saved in
+the pstats format) or under a sampling profiler reading its stack every
+``PROFILING_SAMPLE_INTERVAL`` seconds (``sampling``, saved as collapsed stacks
+for flame graphs). At most one request per process is profiled at a time. The
+latest ``PROFILING_MAX_FILES`` profiles are kept in ``PROFILING_DIR``; their id is
+returned in the ``X-Profile-Id`` response header, and signed requests list them
+on ``/profiles`` and download them from ``/profiles/<id>``. A request that is not
+profiled costs a header lookup and, when sampling, a random draw.
+"""
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from flask import Flask, Response, current_app, g, jsonify, request, send_file
+from threading import Event, Lock, Thread, get_ident
+from webapp.services.exceptions import NotFoundException
+import cProfile
+import hashlib
+import hmac
+import logging
+import os
+import random
+import re
+import sys
+import time
+import uuid
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+PROFILE_ID = re.compile(r"^\d{13}-[\w.]+-[0-9a-f]{8}\.(prof|folded)$")
+ADMIN_ENDPOINTS = frozenset({"profiles", "profile"})
+
+logger = logging.getLogger(__name__)
+
+_profiling = Lock()
+
+
+@dataclass(frozen=True)
+class ProfileDTO:
+    """
+    DTO describing a saved profile.
+
+    Attributes:
+        id (str): Profile id, also its file name.
+        size (int): Size of the profile in bytes.
+        created_at (datetime): Time the profiled request started.
+    """
+    id: str
+    size: int
+    created_at: datetime
+
+
+class CProfiler:
+    """Deterministic profiler of the calling thread, saved in the pstats format."""
+
+    extension = "prof"
+
+    def __init__(self) -> None:
+        """Initialize the profiler without starting it."""
+        self._profile = cProfile.Profile()
+
+    def start(self) -> None:
+        """Start profiling the calling thread."""
+        self._profile.enable()
+
+    def stop(self) -> None:
+        """Stop profiling."""
+        self._profile.disable()
+
+    def dump(self, path: str) -> None:
+        """
+        Write the profile to a file.
+
+        Args:
+            path (str): Path of the file.
+        """
+        self._profile.dump_stats(path)
+
+
+class SamplingProfiler:
+    """
+    Statistical profiler of the calling thread, saved as collapsed stacks.
+
+    A background thread reads the stack of the profiled thread every
+    `interval` seconds and counts identical stacks, so the profiled code runs
+    at full speed whatever its call rate.
+    """
+
+    extension = "folded"
+
+    def __init__(self, interval: float) -> None:
+        """
+        Initialize the profiler without starting it.
+
+        Args:
+            interval (float): Time in seconds between two samples.
+        """
+        self.interval = interval
+        self.stacks: dict[str, int] = {}
+        self._thread_id = get_ident()
+        self._stopped = Event()
+        self._sampler = Thread(target=self._sample, daemon=True)
+
+    def start(self) -> None:
+        """Start sampling the calling thread."""
+        self._thread_id = get_ident()
+        self._sampler.start()
+
+    def stop(self) -> None:
+        """Stop sampling, waiting for the sampler thread to exit."""
+        self._stopped.set()
+        self._sampler.join()
+
+    def dump(self, path: str) -> None:
+        """
+        Write the stacks to a file, one ``frame;frame;... count`` line per stack.
+
+        Args:
+            path (str): Path of the file.
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            for stack, count in sorted(self.stacks.items()):
+                file.write(f"{stack} {count}\n")
+
+    def _sample(self) -> None:
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            frames: list[str] = []
+            while frame is not None:
+                code = frame.f_code
+                frames.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if frames:
+                stack = ";".join(reversed(frames))
+                self.stacks[stack] = self.stacks.get(stack, 0) + 1
+
+
+class ProfileStore:
+    """
+    Ring buffer of profiles in a directory, the oldest removed first.
+
+    Profiles are written to a temporary file and renamed, so workers sharing
+    the directory never list or serve a partial profile.
+    """
+
+    def __init__(self, directory: str, max_files: int) -> None:
+        """
+        Initialize the store, creating the directory if needed.
+
+        Args:
+            directory (str): Directory of the profiles.
+            max_files (int): Number of profiles kept.
+        """
+        self.directory = directory
+        self.max_files = max_files
+        os.makedirs(directory, exist_ok=True)
+
+    def save(self, profiler: CProfiler | SamplingProfiler, endpoint: str, started_at: float) -> str:
+        """
+        Save a stopped profiler and drop the profiles over the limit.
+
+        Args:
+            profiler (CProfiler | SamplingProfiler): Profiler of the request.
+            endpoint (str): Endpoint of the profiled request.
+            started_at (float): UNIX time the request started.
+
+        Returns:
+            str: Id of the saved profile.
+        """
+        profile_id = f"{int(started_at * 1000):013d}-{endpoint}-{uuid.uuid4().hex[:8]}.{profiler.extension}"
+        path = os.path.join(self.directory, profile_id)
+        profiler.dump(f"{path}.tmp")
+        os.replace(f"{path}.tmp", path)
+        self._prune()
+        return profile_id
+
+    def profiles(self) -> list[ProfileDTO]:
+        """
+        Return the saved profiles, newest first.
+
+        Returns:
+            list[ProfileDTO]: Saved profiles.
+        """
+        profiles = []
+        for profile_id in sorted(self._ids(), reverse=True):
+            try:
+                size = os.path.getsize(os.path.join(self.directory, profile_id))
+            except FileNotFoundError:
+                continue
+            created_at = datetime.fromtimestamp(int(profile_id[:13]) / 1000, timezone.utc)
+            profiles.append(ProfileDTO(id=profile_id, size=size, created_at=created_at))
+        return profiles
+
+    def path(self, profile_id: str) -> str:
+        """
+        Return the path of a saved profile.
+
+        Args:
+            profile_id (str): Profile id.
+
+        Returns:
+            str: Absolute path of the profile.
+
+        Raises:
+            NotFoundException: If the id is malformed or the profile was dropped.
+        """
+        path = os.path.abspath(os.path.join(self.directory, profile_id))
+        if not PROFILE_ID.match(profile_id) or not os.path.isfile(path):
+            raise NotFoundException("Profile not found")
+        return path
+
+    def _ids(self) -> list[str]:
+        return [name for name in os.listdir(self.directory) if PROFILE_ID.match(name)]
+
+    def _prune(self) -> None:
+        for profile_id in sorted(self._ids())[:-self.max_files or None]:
+            try:
+                os.remove(os.path.join(self.directory, profile_id))
+            except FileNotFoundError:
+                pass
+
+
+def sign(secret: str, path: str, expires: int) -> str:
+    """
+    Return an ``X-Profile`` header value authorizing requests to a path.
+
+    Args:
+        secret (str): Value of ``PROFILING_SECRET``.
+        path (str): Request path, e.g. ``/api/enrolments``.
+        expires (int): UNIX time after which the value is rejected.
+
+    Returns:
+        str: Header value ``<expires>:<signature>``.
+    """
+    signature = hmac.new(secret.encode(), f"{expires}:{path}".encode(), hashlib.sha256).hexdigest()
+    return f"{expires}:{signature}"
+
+
+def verify(secret: str, path: str, value: str | None) -> bool:
+    """
+    Check an ``X-Profile`` header value.
+
+    Args:
+        secret (str): Value of ``PROFILING_SECRET``; an empty secret rejects every value.
+        path (str): Path of the current request.
+        value (str | None): Header value.
+
+    Returns:
+        bool: True if the value was signed for the path and has not expired.
+    """
+    if not secret or not value:
+        return False
+    try:
+        expires = int(value.partition(":")[0])
+    except ValueError:
+        return False
+    return expires >= time.time() and hmac.compare_digest(sign(secret, path, expires), value)
+
+
+def init_profiling(app: Flask) -> None:
+    """
+    Profile requests on demand and expose the saved profiles on ``/profiles``.
+
+    Nothing is registered if profiling is disabled.
+
+    Args:
+        app (Flask): Application whose requests may be profiled.
+    """
+    if not app.config["PROFILING_ENABLED"]:
+        return
+
+    app.extensions["profiling"] = ProfileStore(app.config["PROFILING_DIR"], app.config["PROFILING_MAX_FILES"])
+    app.before_request(_start_profiling)
+    app.after_request(_save_profile)
+    app.teardown_request(_stop_profiling)
+    app.add_url_rule("/profiles", "profiles", list_profiles_view)
+    app.add_url_rule("/profiles/<profile_id>", "profile", download_profile_view)
+
+
+def list_profiles_view() -> Response:
+    """Return the saved profiles, newest first, to a signed request."""
+    store = _authorized_store()
+    return jsonify(profiles=[
+        {"id": profile.id, "size": profile.size, "created_at": profile.created_at.isoformat()}
+        for profile in store.profiles()
+    ])
+
+
+def download_profile_view(profile_id: str) -> Response:
+    """Return a saved profile as an attachment to a signed request."""
+    store = _authorized_store()
+    return send_file(store.path(profile_id), mimetype="application/octet-stream", as_attachment=True)
+
+
+def _authorized_store() -> ProfileStore:
+    if not verify(current_app.config["PROFILING_SECRET"], request.path, request.headers.get(PROFILE_HEADER)):
+        raise NotFoundException()
+    return current_app.extensions["profiling"]
+
+
+def _should_profile() -> bool:
+    if request.endpoint in ADMIN_ENDPOINTS:
+        return False
+    value = request.headers.get(PROFILE_HEADER)
+    if value is not None:
+        return verify(current_app.config["PROFILING_SECRET"], request.path, value)
+    sample_rate = current_app.config["PROFILING_SAMPLE_RATE"]
+    return sample_rate > 0 and random.random() < sample_rate
+
+
+def _start_profiling() -> None:
+    if not _should_profile() or not _profiling.acquire(blocking=False):
+        return
+
+    profiler: CProfiler | SamplingProfiler
+    if current_app.config["PROFILING_MODE"] == "sampling":
+        profiler = SamplingProfiler(current_app.config["PROFILING_SAMPLE_INTERVAL"])
+    else:
+        profiler = CProfiler()
+    try:
+        profiler.start()
+    except ValueError:
+        _profiling.release()
+        return
+    g.profiler = (profiler, time.time())
+
+
+def _save_profile(response: Response) -> Response:
+    profile_id = _finish_profile()
+    if profile_id is not None:
+        response.headers[PROFILE_ID_HEADER] = profile_id
+    return response
+
+
+def _stop_profiling(_: BaseException | None) -> None:
+    _finish_profile()
+
+
+def _finish_profile() -> str | None:
+    profiling = g.pop("profiler", None)
+    if profiling is None:
+        return None
+
+    profiler, started_at = profiling
+    try:
+        profiler.stop()
+    finally:
+        _profiling.release()
+    store: ProfileStore = current_app.extensions["profiling"]
+    try:
+        return store.save(profiler, request.endpoint or "unmatched", started_at)
+    except OSError as error:
+        logger.warning("Saving profile failed: %s", error)
+        return None
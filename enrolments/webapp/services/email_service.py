@@ -1,6 +1,7 @@
 from flask_mail import Message
 from flask import current_app
 from webapp.extensions import mail
+from webapp.tracing import SpanKind, tracer
 
 class EmailService:
     """
@@ -35,4 +36,5 @@ class EmailService:
             body=body,
             sender=sender or current_app.config["MAIL_DEFAULT_SENDER"],
         )
-        mail.send(msg)
\ No newline at end of file
+        with tracer.span("SMTP send", SpanKind.CLIENT, attributes={"peer.service": "smtp"}):
+            mail.send(msg)
\ No newline at end of file
@@ -55,6 +55,16 @@ class EnrolmentByUserDTO:
     enrolment_id: int
     user_id: str
 
+@dataclass(frozen=True)
+class EnrolmentUserIdDTO:
+    """
+    DTO for referencing all enrolments of a user.
+
+    Attributes:
+        user_id (str): The user's ID.
+    """
+    user_id: str
+
 @dataclass(frozen=True)
 class DeleteEnrolmentDTO:
     """
@@ -7,6 +7,7 @@ from webapp.services.enrolments.dtos import (
     ReadEnrolmentDTO,
     EnrolmentIdDTO,
     EnrolmentByUserDTO,
+    EnrolmentUserIdDTO,
     DeleteEnrolmentDTO
 )
 from webapp.services.enrolments.mappers import to_read_dto
@@ -14,12 +15,16 @@ from webapp.services.exceptions import (
     ValidationException,
     NotFoundException,
     ConflictException,
+    DeadlineExceededException,
     ServiceException
 )
+from webapp import deadline
 from webapp.extensions import db
 from webapp.services.invoices.services import InvoiceService
 from webapp.services.invoices.dtos import InvoiceDTO
+from webapp.tracing import SpanKind, tracer
 from flask import current_app, copy_current_request_context
+from typing import Iterator
 import httpx
 
 
@@ -60,6 +65,7 @@ class EnrolmentService:
         Raises:
             ServiceException: If external service fails or unknown error occurs.
             ValidationException, NotFoundException, ConflictException: For domain validation errors.
+            DeadlineExceededException: If the request deadline passes before the enrolment is created.
         """
         try:
             user_data = self._user_data(dto.user_id)
@@ -91,7 +97,7 @@ class EnrolmentService:
 
         except httpx.RequestError as e:
             raise ServiceException(f"HTTP Request Error: {e}")
-        except (ValidationException, NotFoundException, ConflictException):
+        except (ValidationException, NotFoundException, ConflictException, DeadlineExceededException):
             raise
         except Exception as e:
             raise ServiceException(f"Unknown Server Error: {e}")
@@ -137,7 +143,7 @@ class EnrolmentService:
         def send_email() -> None:
             self._send_payment_email(user_email, invoice_url)
 
-        self.executor.submit(send_email)
+        self.executor.submit(tracer.wrap(send_email))
         db.session.commit()
 
         return to_read_dto(enrolment)
@@ -189,6 +195,19 @@ class EnrolmentService:
             raise NotFoundException(f"Enrolment not found")
         return to_read_dto(enrolment)
 
+    def get_by_user(self, dto: EnrolmentUserIdDTO) -> list[ReadEnrolmentDTO]:
+        """
+        Get all enrolments of a user.
+
+        Args:
+            dto (EnrolmentUserIdDTO): DTO containing user ID.
+
+        Returns:
+            list[ReadEnrolmentDTO]: List of the user's enrolments, empty if there are none.
+        """
+        enrolments = self.repo.get_by_user(dto.user_id)
+        return [to_read_dto(e) for e in enrolments]
+
     def get_active(self) -> list[ReadEnrolmentDTO]:
         """
         Get all active enrolments.
@@ -203,6 +222,15 @@ class EnrolmentService:
 
         return [to_read_dto(e) for e in enrolments]
 
+    def stream_active(self) -> Iterator[ReadEnrolmentDTO]:
+        """
+        Stream all active enrolments without loading them into memory at once.
+
+        Returns:
+            Iterator[ReadEnrolmentDTO]: Lazily mapped active enrolments.
+        """
+        return (to_read_dto(e) for e in self.repo.iter_active())
+
     def delete_by_id(self, dto: DeleteEnrolmentDTO) -> None:
         """
         Delete an enrolment by its ID.
@@ -230,11 +258,19 @@ class EnrolmentService:
 
         Raises:
             ValidationException: If user does not exist or inactive.
+            DeadlineExceededException: If the request deadline has passed.
         """
         users_url = current_app.config["USERS_SERVICE_URL"]
-        http_timeout = current_app.config["HTTP_TIMEOUT"]
-
-        user_resp = httpx.get(f"{users_url}/id", params={"user_id": user_id}, timeout=http_timeout)
+        http_timeout = deadline.timeout(current_app.config["HTTP_TIMEOUT"])
+
+        with tracer.span("GET users", SpanKind.CLIENT, attributes={"peer.service": "users"}) as span:
+            user_resp = httpx.get(
+                f"{users_url}/id",
+                params={"user_id": user_id},
+                headers=deadline.inject(tracer.inject()),
+                timeout=http_timeout
+            )
+            span.set_attribute("http.status_code", user_resp.status_code)
         if user_resp.status_code != 200:
             raise ValidationException(f"User not found or inactive")
         return user_resp.json()
@@ -251,11 +287,18 @@ class EnrolmentService:
 
         Raises:
             ValidationException: If course does not exist.
+            DeadlineExceededException: If the request deadline has passed.
         """
         course_url = current_app.config["COURSE_SERVICE_URL"]
-        http_timeout = current_app.config["HTTP_TIMEOUT"]
-
-        course_resp = httpx.get(f"{course_url}/{course_id}", timeout=http_timeout)
+        http_timeout = deadline.timeout(current_app.config["HTTP_TIMEOUT"])
+
+        with tracer.span("GET courses", SpanKind.CLIENT, attributes={"peer.service": "courses"}) as span:
+            course_resp = httpx.get(
+                f"{course_url}/{course_id}",
+                headers=deadline.inject(tracer.inject()),
+                timeout=http_timeout
+            )
+            span.set_attribute("http.status_code", course_resp.status_code)
         if course_resp.status_code != 200:
             raise ValidationException(f"Course {course_id} not found")
         return course_resp.json()
@@ -51,4 +51,11 @@ class InvoiceCreationException(ApiException):
     Raised when invoice creation fails.
     """
     def __init__(self, message: str = "Service error") -> None:
-        super().__init__(message, status_code=422, error_code="service_error")
\ No newline at end of file
+        super().__init__(message, status_code=422, error_code="service_error")
+
+class DeadlineExceededException(ApiException):
+    """
+    Raised when the deadline of a request passes before its work is done.
+    """
+    def __init__(self, message: str = "Request deadline exceeded") -> None:
+        super().__init__(message, status_code=504, error_code="deadline_exceeded")
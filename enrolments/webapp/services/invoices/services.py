@@ -1,5 +1,7 @@
 from webapp.services.exceptions import InvoiceCreationException
 from webapp.services.invoices.dtos import InvoiceDTO
+from webapp import deadline
+from webapp.tracing import SpanKind, tracer
 from flask import  current_app
 import datetime
 import httpx
@@ -8,6 +10,7 @@ class InvoiceService:
     def __init__(self) -> None:
         domain = current_app.config["INVOICE_DOMAIN"]
         self.api_token = current_app.config["INVOICE_API_TOKEN"]
+        self.http_timeout = current_app.config["HTTP_TIMEOUT"]
         self.api_url = f"https://{domain}.fakturownia.pl/invoices.json"
         self.headers = {"Content-Type": "application/json"}
 
@@ -28,12 +31,14 @@ class InvoiceService:
             }
         }
 
-        with httpx.Client() as client:
-            response = client.post(
-                self.api_url,
-                headers=self.headers,
-                json=payload
-            )
+        with tracer.span("POST invoices", SpanKind.CLIENT, attributes={"peer.service": "invoices"}) as span:
+            with httpx.Client(timeout=deadline.timeout(self.http_timeout)) as client:
+                response = client.post(
+                    self.api_url,
+                    headers=self.headers,
+                    json=payload
+                )
+            span.set_attribute("http.status_code", response.status_code)
 
         response.raise_for_status()
         if response.status_code == 422:
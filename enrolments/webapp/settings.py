@@ -18,6 +18,7 @@ class Config:
     - External service URLs
     - Invoice API credentials
     - HTTP timeout
+    - Distributed tracing exporter and sampling
     """
 
     SECRET_KEY: str = os.getenv('SECRET_KEY', "")
@@ -75,6 +76,18 @@ class Config:
 
     HTTP_TIMEOUT: int = int(os.getenv('HTTP_TIMEOUT', ""))
 
+    TRACING_EXPORTER: str = os.getenv('TRACING_EXPORTER', "none")
+    TRACING_FILE: str = os.getenv('TRACING_FILE', "traces.jsonl")
+    TRACING_SAMPLE_RATIO: float = float(os.getenv('TRACING_SAMPLE_RATIO', "0.01"))
+
+    PROFILING_ENABLED: bool = os.getenv('PROFILING_ENABLED', "False") in ("1", "true", "True")
+    PROFILING_SECRET: str = os.getenv('PROFILING_SECRET', "")
+    PROFILING_SAMPLE_RATE: float = float(os.getenv('PROFILING_SAMPLE_RATE', "0"))
+    PROFILING_MODE: str = os.getenv('PROFILING_MODE', "cprofile")
+    PROFILING_SAMPLE_INTERVAL: float = float(os.getenv('PROFILING_SAMPLE_INTERVAL', "0.005"))
+    PROFILING_DIR: str = os.getenv('PROFILING_DIR', "profiles")
+    PROFILING_MAX_FILES: int = int(os.getenv('PROFILING_MAX_FILES', "50"))
+
     @staticmethod
     def configure_logging(app: Flask) -> None: # pragma: no cover
         """
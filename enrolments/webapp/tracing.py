@@ -0,0 +1,543 @@
+"""
+Distributed tracing of the Enrolments microservice.
+
+Incoming requests continue the trace of their W3C ``traceparent`` header and
+outgoing calls carry the context of the current span. Server spans wrap every
+request and client spans wrap every database query and every call to the Users,
+Courses, invoicing and mail services. Sampled spans are handed to a
+pluggable exporter; unsampled spans only carry their context, so tracing
+stays cheap at low sample ratios.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from enum import StrEnum
+from flask import Flask, Response, g, request
+from importlib import import_module
+from threading import Lock
+from typing import Any, Callable, Iterator
+from sqlalchemy import Connection, Engine, event
+from sqlalchemy.engine import ExceptionContext
+import json
+import logging
+import random
+import re
+import time
+
+TRACEPARENT = "traceparent"
+TRACEPARENT_PATTERN = re.compile(r"^([0-9a-f]{2})-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})(-.*)?$")
+INVALID_TRACE_ID = "0" * 32
+INVALID_SPAN_ID = "0" * 16
+
+logger = logging.getLogger(__name__)
+
+
+class SpanKind(StrEnum):
+    """Role of a span in a call between services."""
+    SERVER = "server"
+    CLIENT = "client"
+    INTERNAL = "internal"
+
+
+class SpanStatus(StrEnum):
+    """Outcome of a span."""
+    OK = "ok"
+    ERROR = "error"
+
+
+@dataclass(frozen=True)
+class SpanContext:
+    """
+    Identity of a span, propagated between services in the ``traceparent`` header.
+
+    Attributes:
+        trace_id (str): 32 hex digit ID shared by all spans of a trace.
+        span_id (str): 16 hex digit ID of the span.
+        sampled (bool): Whether spans of the trace are recorded.
+    """
+    trace_id: str
+    span_id: str
+    sampled: bool
+
+    @classmethod
+    def from_traceparent(cls, value: str | None) -> "SpanContext | None":
+        """
+        Parse a ``traceparent`` header.
+
+        Args:
+            value (str | None): Header value.
+
+        Returns:
+            SpanContext | None: Parsed context, or None if the header is missing or invalid.
+        """
+        match = TRACEPARENT_PATTERN.match(value.strip().lower()) if value else None
+        if match is None:
+            return None
+
+        version, trace_id, span_id, flags, rest = match.groups()
+        if version == "ff" or (version == "00" and rest) or trace_id == INVALID_TRACE_ID or span_id == INVALID_SPAN_ID:
+            return None
+        return cls(trace_id=trace_id, span_id=span_id, sampled=bool(int(flags, 16) & 1))
+
+    def to_traceparent(self) -> str:
+        """Return the context as a ``traceparent`` header value."""
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+
+UNTRACED = SpanContext(trace_id=INVALID_TRACE_ID, span_id=INVALID_SPAN_ID, sampled=False)
+
+
+@dataclass(frozen=True)
+class SpanDTO:
+    """
+    DTO of a finished span handed to the exporter.
+
+    Attributes:
+        service (str): Name of the service that recorded the span.
+        name (str): Name of the operation.
+        kind (SpanKind): Role of the span.
+        trace_id (str): ID of the trace.
+        span_id (str): ID of the span.
+        parent_id (str | None): ID of the parent span, None for the root span.
+        start_time (float): Start as a UNIX timestamp.
+        duration (float): Duration in seconds.
+        status (SpanStatus): Outcome of the operation.
+        attributes (dict[str, Any]): Additional attributes of the operation.
+    """
+    service: str
+    name: str
+    kind: SpanKind
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    start_time: float
+    duration: float
+    status: SpanStatus
+    attributes: dict[str, Any]
+
+
+class Span:
+    """A timed operation within a trace."""
+
+    def __init__(
+            self,
+            tracer: "Tracer",
+            name: str,
+            kind: SpanKind,
+            context: SpanContext,
+            parent_id: str | None,
+            attributes: dict[str, Any] | None = None
+    ) -> None:
+        """
+        Start the span.
+
+        Args:
+            tracer (Tracer): Tracer exporting the span when it ends.
+            name (str): Name of the operation.
+            kind (SpanKind): Role of the span.
+            context (SpanContext): Identity of the span.
+            parent_id (str | None): ID of the parent span.
+            attributes (dict[str, Any] | None): Initial attributes.
+        """
+        self.tracer = tracer
+        self.name = name
+        self.kind = kind
+        self.context = context
+        self.parent_id = parent_id
+        self.attributes = attributes or {}
+        self.status = SpanStatus.OK
+        self.start_time = time.time()
+        self._started_at = time.perf_counter()
+        self._ended = False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set an attribute of the span."""
+        self.attributes[key] = value
+
+    def record_error(self, error: BaseException) -> None:
+        """Mark the span as failed by the given exception."""
+        self.status = SpanStatus.ERROR
+        self.attributes["error.type"] = type(error).__name__
+        self.attributes["error.message"] = str(error)
+
+    def end(self) -> None:
+        """End the span and export it if its trace is sampled. Subsequent calls do nothing."""
+        if self._ended:
+            return
+        self._ended = True
+        if self.context.sampled:
+            self.tracer.export(self, time.perf_counter() - self._started_at)
+
+
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+class Tracer:
+    """
+    Creates spans of a service and hands the sampled ones to an exporter.
+
+    Sampling is decided once per trace: a trace started here is sampled when its
+    trace ID falls within `sample_ratio`, which gives every service the same
+    decision for the same ID; a trace continued from a ``traceparent`` header
+    keeps the decision of its caller. Without an exporter nothing is recorded,
+    an incoming context is passed on unchanged and no new trace is started.
+    """
+
+    def __init__(self, service: str, exporter: "SpanExporter | None" = None, sample_ratio: float = 0.0) -> None:
+        """
+        Initialize the tracer.
+
+        Args:
+            service (str): Name of the service recorded on every span.
+            exporter (SpanExporter | None): Destination of sampled spans, None to disable tracing.
+            sample_ratio (float): Fraction (0-1) of new traces that are sampled.
+        """
+        self.service = service
+        self.exporter = exporter
+        self.sample_ratio = sample_ratio
+
+    def configure(self, exporter: "SpanExporter | None", sample_ratio: float) -> None:
+        """
+        Replace the exporter and the sample ratio.
+
+        Args:
+            exporter (SpanExporter | None): Destination of sampled spans, None to disable tracing.
+            sample_ratio (float): Fraction (0-1) of new traces that are sampled.
+        """
+        self.exporter = exporter
+        self.sample_ratio = sample_ratio
+
+    def start(
+            self,
+            name: str,
+            kind: SpanKind = SpanKind.INTERNAL,
+            parent: SpanContext | None = None,
+            attributes: dict[str, Any] | None = None
+    ) -> Span:
+        """
+        Start a span without making it current.
+
+        Args:
+            name (str): Name of the operation.
+            kind (SpanKind): Role of the span.
+            parent (SpanContext | None): Parent context, defaults to the current span.
+            attributes (dict[str, Any] | None): Initial attributes.
+
+        Returns:
+            Span: Started span, which must be ended by the caller.
+        """
+        if parent is None:
+            current = _current_span.get()
+            parent = current.context if current is not None else None
+
+        if parent is None and self.exporter is None:
+            return Span(self, name, kind, UNTRACED, None, attributes)
+
+        if parent is None:
+            trace_id = f"{random.getrandbits(128):032x}"
+            context = SpanContext(trace_id=trace_id, span_id=_new_span_id(), sampled=self._should_sample(trace_id))
+            return Span(self, name, kind, context, None, attributes)
+
+        if self.exporter is None:
+            return Span(self, name, kind, parent, parent.span_id, attributes)
+
+        context = SpanContext(trace_id=parent.trace_id, span_id=_new_span_id(), sampled=parent.sampled)
+        return Span(self, name, kind, context, parent.span_id, attributes)
+
+    @contextmanager
+    def span(
+            self,
+            name: str,
+            kind: SpanKind = SpanKind.INTERNAL,
+            parent: SpanContext | None = None,
+            attributes: dict[str, Any] | None = None
+    ) -> Iterator[Span]:
+        """
+        Run a block within a new current span, recording an exception raised by the block.
+
+        Args:
+            name (str): Name of the operation.
+            kind (SpanKind): Role of the span.
+            parent (SpanContext | None): Parent context, defaults to the current span.
+            attributes (dict[str, Any] | None): Initial attributes.
+
+        Yields:
+            Span: The current span.
+        """
+        span = self.start(name, kind, parent, attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as error:
+            span.record_error(error)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+
+    @staticmethod
+    def current_span() -> Span | None:
+        """Return the current span of the calling thread, if any."""
+        return _current_span.get()
+
+    @staticmethod
+    def traceparent() -> str | None:
+        """
+        Return the ``traceparent`` header of the current span.
+
+        Returns:
+            str | None: Header value, or None if there is no trace to propagate.
+        """
+        span = _current_span.get()
+        if span is None or span.context is UNTRACED:
+            return None
+        return span.context.to_traceparent()
+
+    def inject(self, headers: dict[str, str] | None = None) -> dict[str, str]:
+        """
+        Return a copy of the headers carrying the ``traceparent`` of the current span.
+
+        Args:
+            headers (dict[str, str] | None): Headers of an outgoing request.
+
+        Returns:
+            dict[str, str]: Headers to send.
+        """
+        headers = dict(headers or {})
+        traceparent = self.traceparent()
+        if traceparent is not None:
+            headers[TRACEPARENT] = traceparent
+        return headers
+
+    @staticmethod
+    def wrap[**P, R](fn: Callable[P, R]) -> Callable[P, R]:
+        """
+        Bind a function to the current span, so spans it starts in another thread join the trace.
+
+        Args:
+            fn (Callable[P, R]): Function submitted to an executor.
+
+        Returns:
+            Callable[P, R]: Function running with the span current at the time of wrapping.
+        """
+        span = _current_span.get()
+
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            token = _current_span.set(span)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _current_span.reset(token)
+
+        return wrapper
+
+    def export(self, span: Span, duration: float) -> None:
+        """
+        Hand a finished span to the exporter; export errors are logged, not raised.
+
+        Args:
+            span (Span): Finished span.
+            duration (float): Duration of the span in seconds.
+        """
+        exporter = self.exporter
+        if exporter is None:
+            return
+
+        try:
+            exporter.export(SpanDTO(
+                service=self.service,
+                name=span.name,
+                kind=span.kind,
+                trace_id=span.context.trace_id,
+                span_id=span.context.span_id,
+                parent_id=span.parent_id,
+                start_time=span.start_time,
+                duration=duration,
+                status=span.status,
+                attributes=span.attributes
+            ))
+        except Exception:
+            logger.exception("Span export failed: %s", span.name)
+
+    def _should_sample(self, trace_id: str) -> bool:
+        return self.exporter is not None and int(trace_id[16:], 16) < self.sample_ratio * 2 ** 64
+
+
+def _new_span_id() -> str:
+    return f"{random.getrandbits(64) or 1:016x}"
+
+
+class SpanExporter:
+    """Destination of finished spans. Subclass it and implement `export` to plug in a tracing backend."""
+
+    def export(self, span: SpanDTO) -> None:
+        """
+        Export a finished span.
+
+        Args:
+            span (SpanDTO): Finished span.
+        """
+        raise NotImplementedError
+
+    def shutdown(self) -> None:
+        """Release resources of the exporter."""
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keeps finished spans in memory, for tests and local debugging."""
+
+    def __init__(self) -> None:
+        self.spans: list[SpanDTO] = []
+        self._lock = Lock()
+
+    def export(self, span: SpanDTO) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def clear(self) -> None:
+        """Remove all recorded spans."""
+        with self._lock:
+            self.spans.clear()
+
+
+class FileSpanExporter(SpanExporter):
+    """Appends finished spans to a file as JSON lines."""
+
+    def __init__(self, path: str) -> None:
+        """
+        Open the file for appending.
+
+        Args:
+            path (str): Path of the file.
+        """
+        self.path = path
+        self._file = open(path, "a", encoding="utf-8")
+        self._lock = Lock()
+
+    def export(self, span: SpanDTO) -> None:
+        line = json.dumps(asdict(span), default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+def create_exporter(name: str, path: str = "") -> SpanExporter | None:
+    """
+    Create the exporter selected in the configuration.
+
+    Args:
+        name (str): ``none``, ``memory``, ``file`` or the ``module:Class`` path of a
+            `SpanExporter` subclass constructed without arguments.
+        path (str): File written by the ``file`` exporter.
+
+    Returns:
+        SpanExporter | None: Exporter, or None if tracing is disabled.
+
+    Raises:
+        ValueError: If the exporter name is not recognised.
+    """
+    if name in ("", "none"):
+        return None
+    if name == "memory":
+        return InMemorySpanExporter()
+    if name == "file":
+        return FileSpanExporter(path)
+    if ":" not in name:
+        raise ValueError(f"Unknown tracing exporter: {name}")
+
+    module, attribute = name.split(":", 1)
+    return getattr(import_module(module), attribute)()
+
+
+tracer = Tracer("enrolments")
+
+
+def init_tracing(app: Flask) -> None:
+    """
+    Configure the tracer from the application settings and trace every request.
+
+    Should be called before other extensions register their request hooks,
+    so requests they reject are traced as well.
+
+    Args:
+        app (Flask): Application to instrument.
+    """
+    tracer.configure(
+        create_exporter(app.config["TRACING_EXPORTER"], app.config["TRACING_FILE"]),
+        app.config["TRACING_SAMPLE_RATIO"]
+    )
+    app.before_request(_start_request_span)
+    app.after_request(_record_response)
+    app.teardown_request(_end_request_span)
+
+
+def _start_request_span() -> None:
+    route = request.url_rule.rule if request.url_rule is not None else "unmatched"
+    span = tracer.start(
+        f"{request.method} {route}",
+        SpanKind.SERVER,
+        parent=SpanContext.from_traceparent(request.headers.get(TRACEPARENT)),
+        attributes={"http.method": request.method, "http.route": route}
+    )
+    g.trace_span = span
+    g.trace_previous_span = _current_span.get()
+    _current_span.set(span)
+
+
+def _record_response(response: Response) -> Response:
+    span = g.get("trace_span")
+    if span is not None:
+        span.set_attribute("http.status_code", response.status_code)
+        if response.status_code >= 500:
+            span.status = SpanStatus.ERROR
+    return response
+
+
+def _end_request_span(error: BaseException | None) -> None:
+    span = g.pop("trace_span", None)
+    if span is None:
+        return
+    if error is not None:
+        span.record_error(error)
+    _current_span.set(g.pop("trace_previous_span", None))
+    span.end()
+
+
+def trace_engine(engine: Engine) -> None:
+    """
+    Record a client span around every query executed by the engine.
+
+    Args:
+        engine (Engine): Engine whose queries are traced.
+    """
+    system = engine.dialect.name
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def start_query_span(conn: Connection, cursor: Any, statement: str, *_: Any) -> None:
+        if tracer.exporter is None:
+            return
+        operation = statement.split(None, 1)[0].upper() if statement.strip() else "QUERY"
+        span = tracer.start(
+            f"{system} {operation}",
+            SpanKind.CLIENT,
+            attributes={"db.system": system, "db.statement": statement}
+        )
+        conn.info.setdefault("trace_spans", []).append(span)
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def end_query_span(conn: Connection, *_: Any) -> None:
+        spans = conn.info.get("trace_spans")
+        if spans:
+            spans.pop().end()
+
+    @event.listens_for(engine, "handle_error")
+    def fail_query_span(context: ExceptionContext) -> None:
+        spans = context.connection.info.get("trace_spans") if context.connection is not None else None
+        if spans:
+            span = spans.pop()
+            span.record_error(context.original_exception)
+            span.end()
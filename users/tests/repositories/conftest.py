@@ -4,6 +4,7 @@ from mongoengine import connect, disconnect
 import pytest
 
 from webapp.database.repositories.user import UserRepository
+from webapp.database.repositories.revoked_token import RevokedTokenRepository
 
 
 @pytest.fixture(scope="session")
@@ -20,3 +21,7 @@ def mongo_connection(mongo_db_container: str) -> Generator[None, None, None]:
 @pytest.fixture
 def user_repository() -> UserRepository:
     return UserRepository()
+
+@pytest.fixture
+def revoked_token_repository() -> RevokedTokenRepository:
+    return RevokedTokenRepository()
@@ -0,0 +1,31 @@
+from datetime import datetime, timezone, timedelta
+from webapp.database.models.revoked_token import RevokedToken
+from webapp.database.repositories.revoked_token import RevokedTokenRepository
+
+
+def test_revoke_is_idempotent(revoked_token_repository: RevokedTokenRepository) -> None:
+    expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+
+    first = revoked_token_repository.revoke("jti-idempotent", expires_at)
+    second = revoked_token_repository.revoke("jti-idempotent", expires_at + timedelta(hours=1))
+
+    assert first.revoked_at == second.revoked_at
+    assert RevokedToken.objects(jti="jti-idempotent").count() == 1
+    assert revoked_token_repository.get_by_jti("jti-idempotent") is not None
+
+
+def test_expired_tokens_are_not_returned(revoked_token_repository: RevokedTokenRepository) -> None:
+    revoked_token_repository.revoke("jti-expired", datetime.now(timezone.utc) - timedelta(seconds=1))
+
+    assert revoked_token_repository.get_by_jti("jti-expired") is None
+    assert "jti-expired" not in [token.jti for token in revoked_token_repository.get_revoked_since()]
+
+
+def test_get_revoked_since(revoked_token_repository: RevokedTokenRepository) -> None:
+    expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+    revoked_token_repository.revoke("jti-old", expires_at)
+    since = datetime.now(timezone.utc)
+    revoked_token_repository.revoke("jti-new", expires_at)
+
+    assert [token.jti for token in revoked_token_repository.get_revoked_since(since)] == ["jti-new"]
+    assert {"jti-old", "jti-new"} <= {token.jti for token in revoked_token_repository.get_revoked_since()}
@@ -82,8 +82,14 @@ def test_delete_user_by_identifier_if_not_user(user_repository: UserRepository)
     result = user_repository.delete_user_by_identifier(fake_identifier)
     assert result is False
 
+def test_claim_mfa_step_accepts_only_later_steps(user_repository: UserRepository) -> None:
+    user = make_user("test_mfa", "mfa@example.com", "mfa123")
+    user.mfa_secret = "SECRET"
+    user_repository.create_user(user)
 
-
-
-
-
+    assert user_repository.claim_mfa_step(str(user.id), "SECRET", 100)
+    assert not user_repository.claim_mfa_step(str(user.id), "SECRET", 100)
+    assert not user_repository.claim_mfa_step(str(user.id), "SECRET", 99)
+    assert not user_repository.claim_mfa_step(str(user.id), "OTHER", 101)
+    assert user_repository.claim_mfa_step(str(user.id), "SECRET", 101)
+    assert user_repository.get_by_id(str(user.id)).mfa_last_step == 101  # type: ignore[union-attr]
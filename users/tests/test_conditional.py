@@ -0,0 +1,29 @@
+from flask import Flask
+from pydantic import BaseModel
+from webapp.api.conditional import etag_response
+
+
+class ItemSchema(BaseModel):
+    id: str
+    name: str
+
+
+def test_etag_response() -> None:
+    app = Flask(__name__)
+    item = {"name": "first"}
+    app.add_url_rule("/item", "item", lambda: etag_response(ItemSchema(id="1", name=item["name"])))
+    client = app.test_client()
+
+    response = client.get("/item")
+    etag = response.headers["ETag"]
+    not_modified = client.get("/item", headers={"If-None-Match": etag})
+    item["name"] = "second"
+    modified = client.get("/item", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.get_json() == {"id": "1", "name": "first"}
+    assert not etag.startswith("W/")
+    assert not_modified.status_code == 304
+    assert not_modified.data == b""
+    assert modified.status_code == 200
+    assert modified.headers["ETag"] != etag
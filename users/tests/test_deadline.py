@@ -0,0 +1,65 @@
+from flask import Flask, jsonify
+from flask.typing import ResponseReturnValue
+from pymongo import _csot
+from pymongo.errors import ExecutionTimeout, OperationFailure
+from webapp.api.error_handlers import register_error_handlers
+from webapp.deadline import DEADLINE_HEADER, init_deadline, parse_deadline, remaining
+import math
+import pytest
+import time
+
+
+@pytest.fixture
+def app() -> Flask:
+    app = Flask(__name__)
+    init_deadline(app)
+    register_error_handlers(app)
+
+    @app.get("/timeout")
+    def current_timeout() -> ResponseReturnValue:
+        return jsonify(_csot.get_timeout())
+
+    @app.get("/expired")
+    def expired() -> ResponseReturnValue:
+        raise ExecutionTimeout("operation exceeded time limit", 50)
+
+    @app.get("/failed")
+    def failed() -> ResponseReturnValue:
+        raise OperationFailure("failed")
+
+    return app
+
+
+def test_mongodb_operations_run_under_remaining_budget(app: Flask) -> None:
+    requested = math.floor((time.time() + 2) * 1000) / 1000
+    response = app.test_client().get("/timeout", headers={DEADLINE_HEADER: f"{requested:.3f}"})
+
+    assert 0 < response.get_json() <= 2
+    assert _csot.get_timeout() is None
+    assert remaining() is None
+
+
+def test_requests_without_deadline_have_no_timeout(app: Flask) -> None:
+    assert app.test_client().get("/timeout").get_json() is None
+
+
+def test_request_after_deadline_is_rejected(app: Flask) -> None:
+    response = app.test_client().get("/timeout", headers={DEADLINE_HEADER: f"{time.time() - 1:.3f}"})
+
+    assert response.status_code == 504
+    assert response.get_json()["error"] == "deadline_exceeded"
+
+
+def test_mongodb_timeout_within_deadline_is_reported_as_deadline_exceeded(app: Flask) -> None:
+    client = app.test_client()
+    headers = {DEADLINE_HEADER: f"{time.time() + 2:.3f}"}
+
+    assert client.get("/expired", headers=headers).status_code == 504
+    assert client.get("/expired").status_code == 500
+    assert client.get("/failed", headers=headers).status_code == 500
+
+
+def test_parse_deadline() -> None:
+    assert parse_deadline("1760000000.250") == 1760000000.25
+    assert parse_deadline("inf") is None
+    assert parse_deadline("") is None
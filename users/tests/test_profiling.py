@@ -0,0 +1,111 @@
+from flask import Flask, jsonify
+from flask.typing import ResponseReturnValue
+from pathlib import Path
+from webapp.api.error_handlers import register_error_handlers
+from webapp.profiling import PROFILE_HEADER, PROFILE_ID_HEADER, init_profiling, sign
+import pstats
+import pytest
+import time
+
+SECRET = "profiling-secret"
+
+
+@pytest.fixture
+def app(tmp_path: Path) -> Flask:
+    app = Flask(__name__)
+    app.config.update(
+        PROFILING_ENABLED=True,
+        PROFILING_SECRET=SECRET,
+        PROFILING_SAMPLE_RATE=0,
+        PROFILING_MODE="cprofile",
+        PROFILING_SAMPLE_INTERVAL=0.001,
+        PROFILING_DIR=str(tmp_path),
+        PROFILING_MAX_FILES=2
+    )
+    init_profiling(app)
+    register_error_handlers(app)
+
+    @app.get("/slow")
+    def slow_endpoint() -> ResponseReturnValue:
+        time.sleep(0.05)
+        return jsonify(ok=True)
+
+    return app
+
+
+def signed(path: str, expires_in: int = 60) -> dict[str, str]:
+    return {PROFILE_HEADER: sign(SECRET, path, int(time.time()) + expires_in)}
+
+
+def test_unsigned_requests_are_not_profiled(app: Flask, tmp_path: Path) -> None:
+    client = app.test_client()
+
+    responses = [
+        client.get("/slow"),
+        client.get("/slow", headers={PROFILE_HEADER: "9999999999:forged"}),
+        client.get("/slow", headers=signed("/other")),
+        client.get("/slow", headers=signed("/slow", expires_in=-1))
+    ]
+
+    assert all(response.status_code == 200 for response in responses)
+    assert not any(PROFILE_ID_HEADER in response.headers for response in responses)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_signed_request_is_profiled_and_downloadable(app: Flask) -> None:
+    client = app.test_client()
+
+    profile_id = client.get("/slow", headers=signed("/slow")).headers[PROFILE_ID_HEADER]
+    profiles = client.get("/profiles", headers=signed("/profiles")).get_json()["profiles"]
+    download = client.get(f"/profiles/{profile_id}", headers=signed(f"/profiles/{profile_id}"))
+
+    assert profile_id.endswith(".prof") and "-slow_endpoint-" in profile_id
+    assert [profile["id"] for profile in profiles] == [profile_id]
+    assert download.status_code == 200
+    assert profiles[0]["size"] == len(download.data)
+
+
+def test_cprofile_profile_is_a_pstats_file(app: Flask, tmp_path: Path) -> None:
+    profile_id = app.test_client().get("/slow", headers=signed("/slow")).headers[PROFILE_ID_HEADER]
+
+    stats = pstats.Stats(str(tmp_path / profile_id))
+
+    assert any(name == "slow_endpoint" for _, _, name in stats.stats)  # type: ignore[attr-defined]
+
+
+def test_sampled_requests_are_profiled_as_collapsed_stacks(app: Flask, tmp_path: Path) -> None:
+    app.config.update(PROFILING_SAMPLE_RATE=1, PROFILING_MODE="sampling")
+
+    profile_id = app.test_client().get("/slow").headers[PROFILE_ID_HEADER]
+
+    assert profile_id.endswith(".folded")
+    lines = (tmp_path / profile_id).read_text().splitlines()
+    assert lines and all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    assert any("slow_endpoint" in line for line in lines)
+
+
+def test_only_latest_profiles_are_kept(app: Flask, tmp_path: Path) -> None:
+    client = app.test_client()
+
+    profile_ids = [client.get("/slow", headers=signed("/slow")).headers[PROFILE_ID_HEADER] for _ in range(3)]
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(profile_ids[1:])
+
+
+def test_profiles_require_a_signed_request(app: Flask) -> None:
+    client = app.test_client()
+    profile_id = client.get("/slow", headers=signed("/slow")).headers[PROFILE_ID_HEADER]
+
+    assert client.get("/profiles").status_code == 404
+    assert client.get(f"/profiles/{profile_id}", headers=signed("/profiles")).status_code == 404
+    assert client.get("/profiles/..", headers=signed("/profiles/..")).status_code == 404
+
+
+def test_disabled_profiling_registers_nothing() -> None:
+    app = Flask(__name__)
+    app.config["PROFILING_ENABLED"] = False
+
+    init_profiling(app)
+
+    assert "profiling" not in app.extensions
+    assert not app.before_request_funcs
@@ -0,0 +1,46 @@
+from datetime import datetime, timezone, timedelta
+from unittest.mock import MagicMock
+from webapp.database.models.revoked_token import RevokedToken
+from webapp.services.exceptions import NotFoundException
+from webapp.services.revoked_tokens.dtos import RevokeTokenDTO, TokenIdDTO, RevokedSinceDTO
+from webapp.services.revoked_tokens.services import RevokedTokenService
+import pytest
+
+
+@pytest.fixture
+def mock_revoked_token_repository() -> MagicMock:
+    return MagicMock()
+
+@pytest.fixture
+def revoked_token_service(mock_revoked_token_repository: MagicMock) -> RevokedTokenService:
+    return RevokedTokenService(revoked_token_repository=mock_revoked_token_repository)
+
+def make_token(jti: str) -> RevokedToken:
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return RevokedToken(jti=jti, expires_at=now + timedelta(hours=1), revoked_at=now)
+
+def test_revoke_stores_token(revoked_token_service: RevokedTokenService, mock_revoked_token_repository: MagicMock) -> None:
+    expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+    mock_revoked_token_repository.revoke.return_value = make_token("jti-1")
+
+    result = revoked_token_service.revoke(RevokeTokenDTO(jti="jti-1", expires_at=expires_at))
+
+    mock_revoked_token_repository.revoke.assert_called_once_with("jti-1", expires_at)
+    assert result.jti == "jti-1"
+    assert result.revoked_at.tzinfo == timezone.utc
+
+def test_get_by_jti_raises_when_not_revoked(revoked_token_service: RevokedTokenService, mock_revoked_token_repository: MagicMock) -> None:
+    mock_revoked_token_repository.get_by_jti.return_value = None
+
+    with pytest.raises(NotFoundException):
+        revoked_token_service.get_by_jti(TokenIdDTO(jti="unknown"))
+
+def test_get_revoked_since_returns_tokens_and_sync_timestamp(revoked_token_service: RevokedTokenService, mock_revoked_token_repository: MagicMock) -> None:
+    since = datetime.now(timezone.utc) - timedelta(minutes=1)
+    mock_revoked_token_repository.get_revoked_since.return_value = [make_token("jti-1"), make_token("jti-2")]
+
+    result = revoked_token_service.get_revoked_since(RevokedSinceDTO(since=since))
+
+    mock_revoked_token_repository.get_revoked_since.assert_called_once_with(since)
+    assert [token.jti for token in result.tokens] == ["jti-1", "jti-2"]
+    assert result.synced_at > since
@@ -9,6 +9,7 @@ from webapp.services.users.dtos import (
     CreateUserDTO,
     EnableMfaDTO, DisableMfaDTO,
     GetMfaQrCodeDTO,
+    VerifyMfaDTO,
     ResetPasswordDTO,
     LoginUserDTO,
     ForgotPasswordDTO,
@@ -18,9 +19,11 @@ from webapp.services.users.dtos import (
     DeleteUserByIdDTO,
     DeleteUserByIdentifierDTO
 )
+from webapp.services.users.mfa import TotpVerifier
 from webapp.services.users.services import UserService
 import pyotp
 import pytest
+import time
 import urllib
 
 
@@ -335,6 +338,68 @@ def test_delete_user_by_identifier_if_not_user(user_service: UserService, mock_u
         user_service.delete_by_identifier(dto)
     mock_user_repository.delete_user_by_identifier.assert_called_with(dto.identifier)
 
+def make_mfa_user(secret: str | None = None) -> User:
+    return User(
+        id="4234dsfsgd98234234",
+        username="test_user",
+        first_name="test_first_name",
+        last_name="test_last_name",
+        email="test@example.com",
+        password_hash="hash1234",
+        gender="Male",
+        role="admin",
+        activation_code="code123",
+        mfa_secret=secret or pyotp.random_base32()
+    )
+
+def test_verify_mfa(user_service: UserService, mock_user_repository: MagicMock) -> None:
+    secret = pyotp.random_base32()
+    user = make_mfa_user(secret)
+    mock_user_repository.get_by_id.return_value = user
+    mock_user_repository.claim_mfa_step.return_value = True
+
+    result = user_service.verify_mfa(VerifyMfaDTO(user_id=str(user.id), code=pyotp.TOTP(secret).now()))
+
+    assert (result.user_id, result.role, result.verified) == (str(user.id), "admin", True)
+    step = int(time.time() // 30)
+    assert mock_user_repository.claim_mfa_step.call_args.args[:2] == (str(user.id), secret)
+    assert mock_user_repository.claim_mfa_step.call_args.args[2] in (step - 1, step)
+
+def test_verify_mfa_rejects_replayed_code(user_service: UserService, mock_user_repository: MagicMock) -> None:
+    secret = pyotp.random_base32()
+    user = make_mfa_user(secret)
+    mock_user_repository.get_by_id.return_value = user
+    mock_user_repository.claim_mfa_step.return_value = False
+
+    with pytest.raises(ValidationException, match="MFA verification failed"):
+        user_service.verify_mfa(VerifyMfaDTO(user_id=str(user.id), code=pyotp.TOTP(secret).now()))
+
+def test_verify_mfa_if_invalid_code(user_service: UserService, mock_user_repository: MagicMock) -> None:
+    secret = pyotp.random_base32()
+    user = make_mfa_user(secret)
+    mock_user_repository.get_by_id.return_value = user
+    code = pyotp.TOTP(secret).now()
+    wrong_code = f"{(int(code) + 1) % 1000000:06d}"
+
+    with pytest.raises(ValidationException, match="MFA verification failed"):
+        user_service.verify_mfa(VerifyMfaDTO(user_id=str(user.id), code=wrong_code))
+    mock_user_repository.claim_mfa_step.assert_not_called()
+
+def test_verify_mfa_if_not_enabled(user_service: UserService, mock_user_repository: MagicMock) -> None:
+    user = make_mfa_user()
+    user.disable_mfa_secret()
+    mock_user_repository.get_by_id.return_value = user
 
+    with pytest.raises(ValidationException, match="MFA is not enabled"):
+        user_service.verify_mfa(VerifyMfaDTO(user_id=str(user.id), code="123456"))
 
+def test_totp_verifier_matches_steps_of_the_window() -> None:
+    verifier = TotpVerifier(valid_window=1)
+    secret = pyotp.random_base32()
+    totp = pyotp.TOTP(secret)
+    now = int(time.time())
+    step = int(now // 30)
 
+    assert verifier.matching_step(secret, totp.at(now)) == step
+    assert verifier.matching_step(secret, totp.at(now - 30)) == step - 1
+    assert verifier.matching_step(secret, totp.at(now - 300)) is None
@@ -1,6 +1,10 @@
 from flask import Flask
 from .settings import config
 from .extensions import db, mail
+from .metrics import PoolMetricsListener, init_metrics
+from .tracing import CommandTracingListener, init_tracing
+from .deadline import init_deadline
+from .profiling import init_profiling
 from .container import Container
 from .api import api_bp
 from .api.error_handlers import register_error_handlers
@@ -9,7 +13,11 @@ def create_app() -> Flask:
     """
     Creates and configures the Flask application.
 
-    Sets up configuration, database connection, email service, dependency injection,
+    Sets up configuration, request and connection pool metrics on `/metrics`,
+    distributed tracing of requests and MongoDB commands,
+    on-demand profiling of single requests,
+    request deadlines bounding MongoDB operations,
+    database connection, email service, dependency injection,
     error handlers, and registers the API blueprint.
 
     Returns:
@@ -19,6 +27,11 @@ def create_app() -> Flask:
     app.config.from_object(config['default'])
     config['default'].init_app(app)
 
+    init_metrics(app)
+    init_tracing(app)
+    init_profiling(app)
+    init_deadline(app)
+
     db.connect(
         db=app.config['MONGODB_DB'],
         host=app.config['MONGODB_HOST'],
@@ -26,11 +39,13 @@ def create_app() -> Flask:
         username=app.config['MONGODB_USERNAME'],
         password=app.config['MONGODB_PASSWORD'],
         uuidRepresentation="standard",
+        event_listeners=[PoolMetricsListener(), CommandTracingListener()],
     )
 
     mail.init_app(app)
 
     container = Container()
+    container.config.from_dict(app.config)
     container.wire()
 
     register_error_handlers(app)
@@ -6,4 +6,7 @@ Main API Blueprint for the application.
 api_bp = Blueprint('api', __name__, url_prefix='/api')
 
 from .users import users_bp
-api_bp.register_blueprint(users_bp) #type: ignore
\ No newline at end of file
+api_bp.register_blueprint(users_bp) #type: ignore
+
+from .revoked_tokens import revoked_tokens_bp
+api_bp.register_blueprint(revoked_tokens_bp) #type: ignore
@@ -0,0 +1,27 @@
+"""
+Conditional GET of single resources.
+
+Responses carry a strong ETag hashed from the serialized body, so a client
+revalidating with ``If-None-Match`` receives an empty 304 when the resource
+has not changed. The hash covers exactly the bytes sent, so it stays a valid
+strong validator even for fields that are not tracked by ``updated_at``.
+"""
+from flask import jsonify, request
+from werkzeug.wrappers import Response
+from pydantic import BaseModel
+import hashlib
+
+
+def etag_response(schema: BaseModel) -> Response:
+    """
+    Serialize a single resource with a strong ETag, answering a matching ``If-None-Match`` with 304.
+
+    Args:
+        schema (BaseModel): Response schema of the resource.
+
+    Returns:
+        Response: JSON response with status 200, or an empty response with status 304.
+    """
+    response = jsonify(schema.model_dump(mode="json"))
+    response.set_etag(hashlib.blake2b(response.get_data(), digest_size=16).hexdigest())
+    return response.make_conditional(request)
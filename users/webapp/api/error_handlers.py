@@ -1,4 +1,6 @@
-from webapp.services.exceptions import ApiException
+from webapp.deadline import remaining
+from webapp.services.exceptions import ApiException, DeadlineExceededException
+from pymongo.errors import PyMongoError
 from flask.typing import ResponseReturnValue
 from typing import TypedDict, Sequence
 from pydantic import ValidationError
@@ -58,6 +60,21 @@ def register_error_handlers(app: Flask) -> None:
             "details": errors
         }), 400
 
+    @app.errorhandler(PyMongoError)
+    def handle_database_error(error: PyMongoError) -> ResponseReturnValue:
+        """
+        Handles MongoDB errors, reporting timeouts of requests with a deadline as deadline exceeded.
+
+        Args:
+            error (PyMongoError): The raised MongoDB error.
+
+        Returns:
+            ResponseReturnValue: JSON response with HTTP 504 for deadline timeouts, 500 otherwise.
+        """
+        if error.timeout and remaining() is not None:
+            return handle_api_exception(DeadlineExceededException())
+        return jsonify({"message": "Unexpected error", "error": "internal_error"}), 500
+
     @app.errorhandler(404)
     def handle_not_found_error(_: Exception) -> ResponseReturnValue:
         """
@@ -0,0 +1,6 @@
+from flask import Blueprint
+"""
+Revoked Tokens Blueprint for the Users Microservice.
+"""
+
+revoked_tokens_bp = Blueprint('revoked_tokens', __name__, url_prefix='/users/revoked-tokens')
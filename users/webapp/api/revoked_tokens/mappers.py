@@ -0,0 +1,77 @@
+from webapp.api.revoked_tokens.schemas import (
+    RevokeTokenSchema,
+    TokenIdSchema,
+    RevokedSinceSchema,
+    RevokedTokenResponseSchema,
+    RevokedTokensResponseSchema
+)
+from webapp.services.revoked_tokens.dtos import (
+    RevokeTokenDTO,
+    TokenIdDTO,
+    RevokedSinceDTO,
+    RevokedTokenDTO,
+    RevokedTokensDTO
+)
+
+def to_dto_revoke_token(schema: RevokeTokenSchema) -> RevokeTokenDTO:
+    """
+    Converts a RevokeTokenSchema to RevokeTokenDTO.
+
+    Args:
+        schema (RevokeTokenSchema): Input schema from API request.
+
+    Returns:
+        RevokeTokenDTO: DTO for revoking the token.
+    """
+    return RevokeTokenDTO(jti=schema.jti, expires_at=schema.expires_at)
+
+def to_dto_token_id(schema: TokenIdSchema) -> TokenIdDTO:
+    """
+    Converts a TokenIdSchema to TokenIdDTO.
+
+    Args:
+        schema (TokenIdSchema): Input schema from API request.
+
+    Returns:
+        TokenIdDTO: DTO for looking up the token.
+    """
+    return TokenIdDTO(jti=schema.jti)
+
+def to_dto_revoked_since(schema: RevokedSinceSchema) -> RevokedSinceDTO:
+    """
+    Converts a RevokedSinceSchema to RevokedSinceDTO.
+
+    Args:
+        schema (RevokedSinceSchema): Input schema from API request.
+
+    Returns:
+        RevokedSinceDTO: DTO for listing revoked tokens.
+    """
+    return RevokedSinceDTO(since=schema.since)
+
+def to_schema_revoked_token(dto: RevokedTokenDTO) -> RevokedTokenResponseSchema:
+    """
+    Converts a RevokedTokenDTO to RevokedTokenResponseSchema.
+
+    Args:
+        dto (RevokedTokenDTO): DTO of the revoked token.
+
+    Returns:
+        RevokedTokenResponseSchema: Schema for API response.
+    """
+    return RevokedTokenResponseSchema(jti=dto.jti, expires_at=dto.expires_at, revoked_at=dto.revoked_at)
+
+def to_schema_revoked_tokens(dto: RevokedTokensDTO) -> RevokedTokensResponseSchema:
+    """
+    Converts a RevokedTokensDTO to RevokedTokensResponseSchema.
+
+    Args:
+        dto (RevokedTokensDTO): DTO of the listed revoked tokens.
+
+    Returns:
+        RevokedTokensResponseSchema: Schema for API response.
+    """
+    return RevokedTokensResponseSchema(
+        tokens=[to_schema_revoked_token(token) for token in dto.tokens],
+        synced_at=dto.synced_at
+    )
@@ -0,0 +1,73 @@
+from flask import request, jsonify
+from flask.typing import ResponseReturnValue
+from dependency_injector.wiring import Provide, inject
+from webapp.api.revoked_tokens.schemas import RevokeTokenSchema, TokenIdSchema, RevokedSinceSchema
+from webapp.api.revoked_tokens.mappers import (
+    to_dto_revoke_token,
+    to_dto_token_id,
+    to_dto_revoked_since,
+    to_schema_revoked_token,
+    to_schema_revoked_tokens
+)
+from webapp.services.revoked_tokens.services import RevokedTokenService
+from webapp.container import Container
+from . import revoked_tokens_bp
+
+
+@revoked_tokens_bp.post("/")  # type: ignore
+@inject
+def revoke_token(
+        revoked_token_service: RevokedTokenService = Provide[Container.revoked_token_service]
+) -> ResponseReturnValue:
+    """
+    Endpoint to revoke a token until its expiration.
+
+    Expects a JSON payload conforming to RevokeTokenSchema. Revoking an already
+    revoked token is a no-op.
+
+    Returns:
+        JSON response with revoked token data (RevokedTokenResponseSchema) and HTTP 201.
+    """
+    payload = RevokeTokenSchema.model_validate(request.get_json() or {})
+    dto = to_dto_revoke_token(payload)
+    read_dto = revoked_token_service.revoke(dto)
+    return jsonify(to_schema_revoked_token(read_dto).model_dump(mode="json")), 201
+
+
+@revoked_tokens_bp.get("/")  # type: ignore
+@inject
+def get_revoked_tokens(
+        revoked_token_service: RevokedTokenService = Provide[Container.revoked_token_service]
+) -> ResponseReturnValue:
+    """
+    Endpoint to list unexpired tokens revoked since a timestamp.
+
+    Expects query parameters conforming to RevokedSinceSchema.
+
+    Returns:
+        JSON response with revoked tokens (RevokedTokensResponseSchema) and HTTP 200.
+    """
+    payload = RevokedSinceSchema.model_validate(request.args.to_dict() or {})
+    dto = to_dto_revoked_since(payload)
+    read_dto = revoked_token_service.get_revoked_since(dto)
+    return jsonify(to_schema_revoked_tokens(read_dto).model_dump(mode="json")), 200
+
+
+@revoked_tokens_bp.get("/jti")  # type: ignore
+@inject
+def get_revoked_token(
+        revoked_token_service: RevokedTokenService = Provide[Container.revoked_token_service]
+) -> ResponseReturnValue:
+    """
+    Endpoint to check whether a token is revoked.
+
+    Expects query parameters conforming to TokenIdSchema.
+
+    Returns:
+        JSON response with revoked token data (RevokedTokenResponseSchema) and HTTP 200,
+        or HTTP 404 if the token is not revoked.
+    """
+    payload = TokenIdSchema.model_validate(request.args.to_dict() or {})
+    dto = to_dto_token_id(payload)
+    read_dto = revoked_token_service.get_by_jti(dto)
+    return jsonify(to_schema_revoked_token(read_dto).model_dump(mode="json")), 200
@@ -0,0 +1,55 @@
+from datetime import datetime
+from pydantic import BaseModel, Field
+
+class RevokeTokenSchema(BaseModel):
+    """
+    Schema for revoking a token.
+
+    Attributes:
+        jti (str): Unique identifier of the token (``jti`` claim).
+        expires_at (datetime): Expiration timestamp of the token (``exp`` claim).
+    """
+    jti: str = Field(..., min_length=1, max_length=64)
+    expires_at: datetime
+
+class TokenIdSchema(BaseModel):
+    """
+    Schema for looking up a revoked token.
+
+    Attributes:
+        jti (str): Unique identifier of the token.
+    """
+    jti: str = Field(..., min_length=1, max_length=64)
+
+class RevokedSinceSchema(BaseModel):
+    """
+    Schema for listing tokens revoked since a timestamp.
+
+    Attributes:
+        since (datetime | None): Lower bound of the revocation timestamp; all revoked tokens if omitted.
+    """
+    since: datetime | None = None
+
+class RevokedTokenResponseSchema(BaseModel):
+    """
+    Schema for returning a revoked token.
+
+    Attributes:
+        jti (str): Unique identifier of the token.
+        expires_at (datetime): Expiration timestamp of the token.
+        revoked_at (datetime): Timestamp when the token was revoked.
+    """
+    jti: str
+    expires_at: datetime
+    revoked_at: datetime
+
+class RevokedTokensResponseSchema(BaseModel):
+    """
+    Schema for returning a list of revoked tokens.
+
+    Attributes:
+        tokens (list[RevokedTokenResponseSchema]): Revoked tokens ordered by revocation timestamp.
+        synced_at (datetime): Timestamp of the listing, to be passed as `since` by the next one.
+    """
+    tokens: list[RevokedTokenResponseSchema]
+    synced_at: datetime
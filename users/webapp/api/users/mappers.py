@@ -7,6 +7,8 @@ from webapp.api.users.schemas import (
     MfaSetupSchema,
     EnableMfaSchema,
     DisableMfaSchema,
+    VerifyMfaSchema,
+    MfaVerificationSchema,
     UserIDSchema,
     IdentifierSchema,
     ResendActivationCodeSchema,
@@ -23,6 +25,8 @@ from webapp.services.users.dtos import (
     EnableMfaDTO,
     DisableMfaDTO,
     GetMfaQrCodeDTO,
+    VerifyMfaDTO,
+    MfaVerificationDTO,
     UserIdDTO,
     IdentifierDTO,
     ResendActivationCodeDTO,
@@ -69,7 +73,7 @@ def to_schema_user(dto: ReadUserDTO) -> UserResponseSchema:
         gender=dto.gender,
         role=dto.role,
         is_active=dto.is_active,
-
+        mfa_enabled=dto.mfa_enabled,
     )
 
 def to_dto_login(schema: LoginSchema) -> LoginUserDTO:
@@ -161,6 +165,30 @@ def to_dto_get_mfa_qrcode(schema: UserIDSchema) -> GetMfaQrCodeDTO:
     """
     return GetMfaQrCodeDTO(user_id=schema.user_id)
 
+def to_dto_verify_mfa(schema: VerifyMfaSchema) -> VerifyMfaDTO:
+    """
+    Converts a VerifyMfaSchema to VerifyMfaDTO.
+
+    Args:
+        schema (VerifyMfaSchema): Input schema from API request.
+
+    Returns:
+        VerifyMfaDTO: DTO for service layer.
+    """
+    return VerifyMfaDTO(user_id=schema.user_id, code=schema.code)
+
+def to_schema_mfa_verification(dto: MfaVerificationDTO) -> MfaVerificationSchema:
+    """
+    Converts a MfaVerificationDTO to MfaVerificationSchema.
+
+    Args:
+        dto (MfaVerificationDTO): DTO from service layer.
+
+    Returns:
+        MfaVerificationSchema: Schema for API response.
+    """
+    return MfaVerificationSchema(user_id=dto.user_id, role=dto.role, verified=dto.verified)
+
 def to_dto_user_id(schema: UserIDSchema) -> UserIdDTO:
     """
     Converts a UserIDSchema to UserIdDTO.
@@ -9,6 +9,7 @@ from webapp.api.users.schemas import (
     ResetPasswordSchema,
     DisableMfaSchema,
     EnableMfaSchema,
+    VerifyMfaSchema,
     UserIDSchema,
     IdentifierSchema,
     ResendActivationCodeSchema,
@@ -25,12 +26,15 @@ from webapp.api.users.mappers import (
     to_schema_mfa_setup,
     to_dto_mfa_disable,
     to_dto_get_mfa_qrcode,
+    to_dto_verify_mfa,
+    to_schema_mfa_verification,
     to_dto_user_id,
     to_dto_identifier,
     to_dto_resend_activation_code,
     to_dto_delete_user_by_id,
     to_dto_delete_user_by_identifier
 )
+from webapp.api.conditional import etag_response
 from webapp.services.users.services import UserService
 from webapp.container import Container
 from webapp.extensions import db
@@ -96,12 +100,13 @@ def get_user_by_identifier(user_service: UserService = Provide[Container.user_se
     Expects query parameters conforming to IdentifierSchema.
 
     Returns:
-        JSON response with user data (UserResponseSchema) and HTTP 200.
+        JSON response with user data (UserResponseSchema) and its ETag with HTTP 200,
+        or an empty response with HTTP 304 if ``If-None-Match`` matches.
     """
     payload = IdentifierSchema.model_validate(request.args.to_dict() or {})
     dto = to_dto_identifier(payload)
     read_dto = user_service.get_by_username_or_email(dto)
-    return jsonify(to_schema_user(read_dto).model_dump(mode="json")), 200
+    return etag_response(to_schema_user(read_dto))
 
 
 @users_bp.get("/id")  # type: ignore
@@ -113,12 +118,13 @@ def get_user_by_id(user_service: UserService = Provide[Container.user_service])
     Expects query parameters conforming to UserIDSchema.
 
     Returns:
-        JSON response with user data (UserResponseSchema) and HTTP 200.
+        JSON response with user data (UserResponseSchema) and its ETag with HTTP 200,
+        or an empty response with HTTP 304 if ``If-None-Match`` matches.
     """
     payload = UserIDSchema.model_validate(request.args.to_dict() or {})
     dto = to_dto_user_id(payload)
     read_dto = user_service.get_by_id(dto)
-    return jsonify(to_schema_user(read_dto).model_dump(mode="json")), 200
+    return etag_response(to_schema_user(read_dto))
 
 
 @users_bp.post("/auth/check")  # type: ignore
@@ -223,6 +229,24 @@ def get_mfa_qrcode(user_service: UserService = Provide[Container.user_service])
     return jsonify(to_schema_mfa_setup(result).model_dump(mode="json")), 200
 
 
+@users_bp.post("/mfa/verify")  # type: ignore
+@inject
+def verify_mfa(user_service: UserService = Provide[Container.user_service]) -> ResponseReturnValue:
+    """
+    Endpoint to verify a user's MFA code.
+
+    Expects a JSON payload conforming to VerifyMfaSchema. The MFA secret never
+    leaves the service, and an accepted code cannot be replayed.
+
+    Returns:
+        JSON response with the verification result (MfaVerificationSchema) and HTTP 200.
+    """
+    payload = VerifyMfaSchema.model_validate(request.get_json() or {})
+    dto = to_dto_verify_mfa(payload)
+    result = user_service.verify_mfa(dto)
+    return jsonify(to_schema_mfa_verification(result).model_dump(mode="json")), 200
+
+
 @users_bp.delete("/id")  # type: ignore
 @inject
 def delete_by_id(user_service: UserService = Provide[Container.user_service]) -> ResponseReturnValue:
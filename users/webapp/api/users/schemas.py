@@ -84,7 +84,7 @@ class UserResponseSchema(BaseModel):
         gender (GenderType): User's gender.
         role (Literal['user', 'admin']): Role assigned to the user.
         is_active (bool): Whether the user account is active.
-        mfa_secret (str | None): Optional MFA secret if enabled.
+        mfa_enabled (bool): Whether MFA is enabled for the user.
     """
     id: str
     username: str
@@ -94,6 +94,7 @@ class UserResponseSchema(BaseModel):
     gender: GenderType
     role: Literal["user", "admin"]
     is_active: bool
+    mfa_enabled: bool = False
 
 class LoginSchema(BaseModel):
     """
@@ -144,6 +145,30 @@ class DisableMfaSchema(BaseModel):
     """
     user_id: str
 
+class VerifyMfaSchema(BaseModel):
+    """
+    Schema for verifying a user's MFA code.
+
+    Attributes:
+        user_id (str): ID of the user.
+        code (str): Six-digit TOTP code.
+    """
+    user_id: str
+    code: str = Field(..., pattern=r"^\d{6}$")
+
+class MfaVerificationSchema(BaseModel):
+    """
+    Schema for returning the result of an MFA verification.
+
+    Attributes:
+        user_id (str): ID of the verified user.
+        role (Literal['user', 'admin']): Role of the user.
+        verified (bool): Whether the code was accepted.
+    """
+    user_id: str
+    role: Literal["user", "admin"]
+    verified: bool
+
 class UserIDSchema(BaseModel):
     """
     Generic schema for operations requiring a user ID.
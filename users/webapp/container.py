@@ -1,27 +1,43 @@
 from dependency_injector import containers, providers
 from webapp.database.repositories.user import UserRepository
+from webapp.database.repositories.revoked_token import RevokedTokenRepository
 from webapp.services.users.services import UserService
+from webapp.services.users.mfa import TotpVerifier
+from webapp.services.revoked_tokens.services import RevokedTokenService
 from webapp.services.email_service import EmailService
 
 class Container(containers.DeclarativeContainer):
     """
     Dependency injection container for the Users Microservice.
 
-    Provides singleton instances of the UserRepository, EmailService, and UserService.
+    Provides singleton instances of the UserRepository, EmailService, TotpVerifier and UserService,
+    and of the RevokedTokenRepository and RevokedTokenService backing the JWT denylist.
     Automatically wires dependencies for the API packages.
     """
 
     wiring_config = containers.WiringConfiguration(
         packages=[
-            "webapp.api.users"
+            "webapp.api.users",
+            "webapp.api.revoked_tokens"
         ]
     )
 
+    config = providers.Configuration()
+
     user_repository = providers.Singleton(UserRepository)
     email_service = providers.Singleton(EmailService)
+    totp_verifier = providers.Singleton(TotpVerifier, valid_window=config.MFA_VALID_WINDOW)
 
     user_service = providers.Singleton(
         UserService,
         user_repository=user_repository,
-        email_service=email_service
-    )
\ No newline at end of file
+        email_service=email_service,
+        totp_verifier=totp_verifier
+    )
+
+    revoked_token_repository = providers.Singleton(RevokedTokenRepository)
+
+    revoked_token_service = providers.Singleton(
+        RevokedTokenService,
+        revoked_token_repository=revoked_token_repository
+    )
@@ -0,0 +1,27 @@
+from mongoengine import Document, StringField, DateTimeField
+from datetime import datetime, timezone
+
+
+class RevokedToken(Document):
+    """
+    Revoked JWT, identified by its ``jti`` claim.
+
+    Documents are removed by a TTL index once the token expires, as an
+    expired token is rejected anyway.
+
+    Attributes:
+        jti (str): Unique identifier of the revoked token.
+        expires_at (datetime): Expiration timestamp of the token.
+        revoked_at (datetime): Timestamp when the token was revoked.
+    """
+    meta = {
+        "collection": "revoked_tokens",
+        "indexes": [
+            {"fields": ["expires_at"], "expireAfterSeconds": 0},
+            "revoked_at"
+        ]
+    }
+
+    jti: str = StringField(required=True, unique=True, max_length=64)
+    expires_at: datetime = DateTimeField(required=True)
+    revoked_at: datetime = DateTimeField(default=lambda: datetime.now(timezone.utc))
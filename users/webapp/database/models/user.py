@@ -1,4 +1,4 @@
-from mongoengine import Document, StringField, BooleanField, DateTimeField, EmailField, EnumField
+from mongoengine import Document, StringField, BooleanField, DateTimeField, EmailField, EnumField, IntField
 from werkzeug.security import generate_password_hash
 from datetime import datetime, timedelta, timezone
 from enum import Enum as PyEnum
@@ -35,6 +35,7 @@ class User(Document):
         activation_code (str): Code used for account activation.
         activation_created_at (datetime): Timestamp when activation code was created.
         mfa_secret (str | None): Secret key for multi-factor authentication.
+        mfa_last_step (int | None): TOTP time step of the last accepted MFA code.
         reset_password_token (str | None): Token for password reset.
         reset_password_expires_at (datetime | None): Expiration timestamp for reset token.
         created_at (datetime): Timestamp when the user was created.
@@ -55,6 +56,7 @@ class User(Document):
     activation_created_at: datetime = DateTimeField(default=lambda: datetime.now(timezone.utc))
 
     mfa_secret: str | None = StringField(default=None)
+    mfa_last_step: int | None = IntField(default=None)
 
     reset_password_token: str | None = StringField(unique=True, sparse=True, default=None)
     reset_password_expires_at: datetime | None = DateTimeField(default=None)
@@ -146,12 +148,14 @@ class User(Document):
             secret (str): The secret key for MFA.
         """
         self.mfa_secret = secret
+        self.mfa_last_step = None
 
     def disable_mfa_secret(self) -> None:
         """
         Disables MFA by clearing the secret.
         """
         self.mfa_secret = None
+        self.mfa_last_step = None
 
     def has_mfa_secret(self) -> bool:
         """
@@ -0,0 +1,53 @@
+from datetime import datetime, timezone
+from webapp.database.models.revoked_token import RevokedToken
+
+
+class RevokedTokenRepository:
+    """
+    Repository class for managing RevokedToken objects in the database.
+    """
+
+    def revoke(self, jti: str, expires_at: datetime) -> RevokedToken:
+        """
+        Stores a revoked token, keeping the original revocation if it is already stored.
+
+        Args:
+            jti (str): Unique identifier of the token.
+            expires_at (datetime): Expiration timestamp of the token.
+
+        Returns:
+            RevokedToken: The stored RevokedToken instance.
+        """
+        RevokedToken.objects(jti=jti).update_one(
+            upsert=True,
+            set_on_insert__expires_at=expires_at,
+            set_on_insert__revoked_at=datetime.now(timezone.utc)
+        )
+        return RevokedToken.objects.get(jti=jti)
+
+    def get_by_jti(self, jti: str) -> RevokedToken | None:
+        """
+        Retrieves a revoked token by its identifier.
+
+        Args:
+            jti (str): Unique identifier of the token.
+
+        Returns:
+            RevokedToken | None: The RevokedToken instance if the token is revoked and not expired, else None.
+        """
+        return RevokedToken.objects(jti=jti, expires_at__gt=datetime.now(timezone.utc)).first()
+
+    def get_revoked_since(self, since: datetime | None = None) -> list[RevokedToken]:
+        """
+        Retrieves unexpired tokens revoked at or after a timestamp.
+
+        Args:
+            since (datetime | None): Lower bound of the revocation timestamp; None returns all revoked tokens.
+
+        Returns:
+            list[RevokedToken]: Revoked tokens ordered by revocation timestamp.
+        """
+        query = RevokedToken.objects(expires_at__gt=datetime.now(timezone.utc))
+        if since is not None:
+            query = query.filter(revoked_at__gte=since)
+        return list(query.only("jti", "expires_at", "revoked_at").order_by("revoked_at"))
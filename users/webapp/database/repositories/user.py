@@ -124,6 +124,28 @@ class UserRepository:
         """
         return User.objects(reset_password_token=token).first()
 
+    def claim_mfa_step(self, user_id: str, secret: str, step: int) -> bool:
+        """
+        Records a TOTP time step as the last one accepted for a user, if it is later.
+
+        The check and the update are a single atomic operation on the user document,
+        so concurrent workers never accept the same or an older step twice.
+
+        Args:
+            user_id (str): The unique ID of the user.
+            secret (str): MFA secret the step was verified with.
+            step (int): Time step of the verified code.
+
+        Returns:
+            bool: True if the step was recorded, False if it was already used or superseded.
+        """
+        updated = User.objects(
+            Q(mfa_last_step=None) | Q(mfa_last_step__lt=step),
+            id=user_id,
+            mfa_secret=secret
+        ).update_one(set__mfa_last_step=step)
+        return updated == 1
+
     def delete_user_by_id(self, user_id: str) -> bool:
         """
         Deletes a user by their ID.
@@ -0,0 +1,93 @@
+"""
+Request deadlines of the Users service.
+
+The API gateway sends the absolute deadline of every request in the
+``X-Request-Deadline`` header as a UNIX timestamp. Requests arriving after
+their deadline are rejected before doing any work, and the MongoDB operations
+of a request run under a ``pymongo.timeout`` of the time left, so the driver
+gives up once the client has.
+"""
+from contextvars import ContextVar
+from flask import Flask, g, request
+from webapp.services.exceptions import DeadlineExceededException
+import math
+import pymongo
+import time
+
+DEADLINE_HEADER = "X-Request-Deadline"
+
+_deadline: ContextVar[float | None] = ContextVar("deadline", default=None)
+
+
+def parse_deadline(value: str | None) -> float | None:
+    """
+    Parse an ``X-Request-Deadline`` header value.
+
+    Args:
+        value (str | None): UNIX timestamp in seconds, e.g. ``1760000000.250``.
+
+    Returns:
+        float | None: The deadline, or None if missing or malformed.
+    """
+    if not value:
+        return None
+    try:
+        deadline = float(value)
+    except ValueError:
+        return None
+    return deadline if math.isfinite(deadline) else None
+
+
+def remaining() -> float | None:
+    """
+    Return the time left until the deadline of the current request.
+
+    Returns:
+        float | None: Seconds left (negative once passed), or None without a deadline.
+    """
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.time()
+
+
+def check_deadline() -> None:
+    """
+    Reject work for a request whose deadline has passed.
+
+    Raises:
+        DeadlineExceededException: If the deadline of the current request has passed.
+    """
+    budget = remaining()
+    if budget is not None and budget <= 0:
+        raise DeadlineExceededException()
+
+
+def init_deadline(app: Flask) -> None:
+    """
+    Read the deadline of every request and bound its MongoDB operations by it.
+
+    Args:
+        app (Flask): Application whose requests carry deadlines.
+    """
+    app.before_request(_start_deadline)
+    app.teardown_request(_end_deadline)
+
+
+def _start_deadline() -> None:
+    deadline = parse_deadline(request.headers.get(DEADLINE_HEADER))
+    if deadline is None:
+        return
+    g.deadline_token = _deadline.set(deadline)
+    check_deadline()
+
+    scope = pymongo.timeout(remaining())
+    scope.__enter__()
+    g.deadline_scope = scope
+
+
+def _end_deadline(_: BaseException | None) -> None:
+    scope = g.pop("deadline_scope", None)
+    if scope is not None:
+        scope.__exit__(None, None, None)
+    token = g.pop("deadline_token", None)
+    if token is not None:
+        _deadline.reset(token)
@@ -84,4 +84,20 @@ class ServerException(ApiException):
         Args:
             message (str): Optional custom error message. Defaults to "Server error".
         """
-        super().__init__(message, status_code=500, error_code="server_error")
\ No newline at end of file
+        super().__init__(message, status_code=500, error_code="server_error")
+
+class DeadlineExceededException(ApiException):
+    """
+    Exception raised when the deadline of a request passes before its work is done.
+
+    Defaults to status code 504 and error code "deadline_exceeded".
+    """
+
+    def __init__(self, message: str = "Request deadline exceeded") -> None:
+        """
+        Initializes a DeadlineExceededException.
+
+        Args:
+            message (str): Optional custom error message. Defaults to "Request deadline exceeded".
+        """
+        super().__init__(message, status_code=504, error_code="deadline_exceeded")
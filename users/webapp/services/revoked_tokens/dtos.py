@@ -0,0 +1,60 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+@dataclass(frozen=True)
+class RevokeTokenDTO:
+    """
+    Data Transfer Object for revoking a token.
+
+    Attributes:
+        jti (str): Unique identifier of the token.
+        expires_at (datetime): Expiration timestamp of the token.
+    """
+    jti: str
+    expires_at: datetime
+
+@dataclass(frozen=True)
+class RevokedTokenDTO:
+    """
+    Data Transfer Object for reading a revoked token.
+
+    Attributes:
+        jti (str): Unique identifier of the token.
+        expires_at (datetime): Expiration timestamp of the token.
+        revoked_at (datetime): Timestamp when the token was revoked.
+    """
+    jti: str
+    expires_at: datetime
+    revoked_at: datetime
+
+@dataclass(frozen=True)
+class TokenIdDTO:
+    """
+    Data Transfer Object for looking up a token by identifier.
+
+    Attributes:
+        jti (str): Unique identifier of the token.
+    """
+    jti: str
+
+@dataclass(frozen=True)
+class RevokedSinceDTO:
+    """
+    Data Transfer Object for listing tokens revoked since a timestamp.
+
+    Attributes:
+        since (datetime | None): Lower bound of the revocation timestamp, None for all revoked tokens.
+    """
+    since: datetime | None = None
+
+@dataclass(frozen=True)
+class RevokedTokensDTO:
+    """
+    Data Transfer Object for a list of revoked tokens.
+
+    Attributes:
+        tokens (list[RevokedTokenDTO]): Revoked tokens ordered by revocation timestamp.
+        synced_at (datetime): Timestamp of the listing, to be passed as `since` by the next one.
+    """
+    tokens: list[RevokedTokenDTO]
+    synced_at: datetime
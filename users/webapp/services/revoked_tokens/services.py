@@ -0,0 +1,85 @@
+from datetime import datetime, timezone
+from webapp.database.models.revoked_token import RevokedToken
+from webapp.database.repositories.revoked_token import RevokedTokenRepository
+from webapp.services.revoked_tokens.dtos import (
+    RevokeTokenDTO,
+    RevokedTokenDTO,
+    TokenIdDTO,
+    RevokedSinceDTO,
+    RevokedTokensDTO
+)
+from webapp.services.exceptions import NotFoundException
+
+class RevokedTokenService:
+    """
+    Service class for the denylist of revoked JWTs.
+
+    Stores the tokens revoked by the API gateway on logout and lets gateway
+    instances check single tokens or sync the tokens revoked since their last sync.
+
+    Attributes:
+        revoked_token_repository (RevokedTokenRepository): Repository for RevokedToken entities.
+    """
+
+    def __init__(self, revoked_token_repository: RevokedTokenRepository) -> None:
+        """
+        Initializes the RevokedTokenService with the provided repository.
+
+        Args:
+            revoked_token_repository (RevokedTokenRepository): Repository for RevokedToken entities.
+        """
+        self.revoked_token_repository = revoked_token_repository
+
+    def revoke(self, dto: RevokeTokenDTO) -> RevokedTokenDTO:
+        """
+        Revokes a token until its expiration.
+
+        Args:
+            dto (RevokeTokenDTO): DTO containing the token identifier and expiration.
+
+        Returns:
+            RevokedTokenDTO: DTO of the revoked token.
+        """
+        token = self.revoked_token_repository.revoke(dto.jti, dto.expires_at)
+        return self._to_dto(token)
+
+    def get_by_jti(self, dto: TokenIdDTO) -> RevokedTokenDTO:
+        """
+        Retrieves a revoked token by its identifier.
+
+        Args:
+            dto (TokenIdDTO): DTO containing the token identifier.
+
+        Returns:
+            RevokedTokenDTO: DTO of the revoked token.
+
+        Raises:
+            NotFoundException: If the token is not revoked or already expired.
+        """
+        token = self.revoked_token_repository.get_by_jti(dto.jti)
+        if token is None:
+            raise NotFoundException("Token is not revoked")
+        return self._to_dto(token)
+
+    def get_revoked_since(self, dto: RevokedSinceDTO) -> RevokedTokensDTO:
+        """
+        Lists unexpired tokens revoked at or after a timestamp.
+
+        Args:
+            dto (RevokedSinceDTO): DTO containing the lower bound of the revocation timestamp.
+
+        Returns:
+            RevokedTokensDTO: Revoked tokens and the timestamp of the listing.
+        """
+        synced_at = datetime.now(timezone.utc)
+        tokens = self.revoked_token_repository.get_revoked_since(dto.since)
+        return RevokedTokensDTO(tokens=[self._to_dto(token) for token in tokens], synced_at=synced_at)
+
+    @staticmethod
+    def _to_dto(token: RevokedToken) -> RevokedTokenDTO:
+        return RevokedTokenDTO(jti=token.jti, expires_at=_as_utc(token.expires_at), revoked_at=_as_utc(token.revoked_at))
+
+
+def _as_utc(value: datetime) -> datetime:
+    """MongoDB returns naive UTC datetimes; make them timezone-aware."""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
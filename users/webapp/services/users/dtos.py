@@ -40,7 +40,7 @@ class ReadUserDTO:
         role (Literal["user", "admin"]): Role of the user.
         is_active (bool): Account activation status.
         created_at (datetime): Account creation timestamp.
-        mfa_secret (str | None): MFA secret key if set.
+        mfa_enabled (bool): Whether MFA is enabled for the user.
     """
     id: str
     username: str
@@ -51,6 +51,7 @@ class ReadUserDTO:
     role: Literal["user", "admin"]
     is_active: bool
     created_at: datetime
+    mfa_enabled: bool = False
 
 
 @dataclass(frozen=True)
@@ -131,6 +132,32 @@ class MfaSetupDTO:
     provisioning_uri: str
     qr_code_base64: str
 
+@dataclass(frozen=True)
+class VerifyMfaDTO:
+    """
+    Data Transfer Object for verifying a user's MFA code.
+
+    Attributes:
+        user_id (str): ID of the user.
+        code (str): TOTP code provided by the user.
+    """
+    user_id: str
+    code: str
+
+@dataclass(frozen=True)
+class MfaVerificationDTO:
+    """
+    Data Transfer Object representing a successful MFA verification.
+
+    Attributes:
+        user_id (str): ID of the verified user.
+        role (Literal["user", "admin"]): Role of the user.
+        verified (bool): Whether the code was accepted.
+    """
+    user_id: str
+    role: Literal["user", "admin"]
+    verified: bool
+
 @dataclass(frozen=True)
 class UserIdDTO:
     """
@@ -0,0 +1,43 @@
+import pyotp
+import time
+
+
+class TotpVerifier:
+    """
+    Matcher of TOTP codes to the time step they were generated for.
+
+    A code stays valid for `valid_window` time steps on either side of the
+    current one, so a verified code could be replayed until the window closes.
+    The matched step lets the caller accept a code only if its step is later
+    than the last one accepted for the user, which is stored on the user
+    document (`User.mfa_last_step`, claimed by `UserRepository.claim_mfa_step`).
+    """
+
+    def __init__(self, valid_window: int = 1, interval: int = 30) -> None:
+        """
+        Initialize the verifier.
+
+        Args:
+            valid_window (int): Number of time steps accepted before and after the current one.
+            interval (int): Length of a TOTP time step in seconds.
+        """
+        self.valid_window = valid_window
+        self.interval = interval
+
+    def matching_step(self, secret: str, code: str) -> int | None:
+        """
+        Return the time step a TOTP code was generated for.
+
+        Args:
+            secret (str): MFA secret of the user.
+            code (str): TOTP code to verify.
+
+        Returns:
+            int | None: Time step of the code, or None if it matches no step of the window.
+        """
+        totp = pyotp.TOTP(secret, interval=self.interval)
+        current = int(time.time() // self.interval)
+        for step in range(current - self.valid_window, current + self.valid_window + 1):
+            if pyotp.utils.strings_equal(code, totp.at(step * self.interval)):
+                return step
+        return None
@@ -11,6 +11,8 @@ from webapp.services.users.dtos import (
     MfaSetupDTO,
     DisableMfaDTO,
     GetMfaQrCodeDTO,
+    VerifyMfaDTO,
+    MfaVerificationDTO,
     UserIdDTO,
     IdentifierDTO,
     ResendActivationCodeDTO,
@@ -20,6 +22,7 @@ from webapp.services.users.dtos import (
 from webapp.services.exceptions import ConflictException, NotFoundException, ValidationException
 from werkzeug.security import generate_password_hash, check_password_hash
 from webapp.services.email_service import EmailService
+from webapp.services.users.mfa import TotpVerifier
 from flask import current_app
 import uuid
 import io
@@ -38,18 +41,26 @@ class UserService:
     Attributes:
         user_repository (UserRepository): Repository for User entities.
         email_service (EmailService): Service for sending emails.
+        totp_verifier (TotpVerifier): Matcher of MFA codes to their TOTP time step.
     """
 
-    def __init__(self, user_repository: UserRepository, email_service: EmailService) -> None:
+    def __init__(
+            self,
+            user_repository: UserRepository,
+            email_service: EmailService,
+            totp_verifier: TotpVerifier | None = None
+    ) -> None:
         """
         Initializes the UserService with the provided repository and email service.
 
         Args:
             user_repository (UserRepository): Repository for User entities.
             email_service (EmailService): Service for sending emails.
+            totp_verifier (TotpVerifier | None): Matcher of MFA codes; a default one if omitted.
         """
         self.user_repository = user_repository
         self.email_service = email_service
+        self.totp_verifier = totp_verifier or TotpVerifier()
 
     def create_user(self, dto: CreateUserDTO ) -> ReadUserDTO:
         """
@@ -331,6 +342,37 @@ class UserService:
 
         return self._generate_mfa_setup(user)
 
+    def verify_mfa(self, dto: VerifyMfaDTO) -> MfaVerificationDTO:
+        """
+        Verifies a user's MFA code without exposing the MFA secret.
+
+        A code is accepted only once: replaying it, or an older code, within
+        the valid window fails. The last accepted time step is stored on the
+        user, so this holds across workers.
+
+        Args:
+            dto (VerifyMfaDTO): DTO containing user ID and TOTP code.
+
+        Returns:
+            MfaVerificationDTO: DTO with the verified user ID and role.
+
+        Raises:
+            NotFoundException: If user not found.
+            ValidationException: If MFA is not enabled or the code is invalid or already used.
+        """
+        user = self.user_repository.get_by_id(dto.user_id)
+        if not user:
+            raise NotFoundException("User not found")
+        secret = user.mfa_secret
+        if secret is None:
+            raise ValidationException("MFA is not enabled for this user")
+
+        step = self.totp_verifier.matching_step(secret, dto.code)
+        if step is None or not self.user_repository.claim_mfa_step(str(user.id), secret, step):
+            raise ValidationException("MFA verification failed")
+
+        return MfaVerificationDTO(user_id=str(user.id), role=user.role, verified=True)
+
     def delete_by_id(self, dto: DeleteUserByIdDTO) -> None:
         """
         Deletes a user by ID.
@@ -411,7 +453,8 @@ class UserService:
             gender=GenderType(user.gender),
             role=user.role,
             is_active=user.is_active,
-            created_at=user.created_at
+            created_at=user.created_at,
+            mfa_enabled=user.has_mfa_secret()
         )
 
     def _send_email_with_activation_code(
@@ -20,7 +20,7 @@ class Config:
     """
     Main application configuration class.
 
-    Reads environment variables for secrets, database, email, and feature settings.
+    Reads environment variables for secrets, database, email, tracing, and feature settings.
     Provides properties for MongoDB settings and static methods for logging initialization.
     """
 
@@ -30,6 +30,7 @@ class Config:
     USER_ACTIVATION_EXPIRATION_MINUTES: int = int(os.getenv("USER_ACTIVATION_EXPIRATION_MINUTES", ""))
     RESET_PASSWORD_EXPIRATION_MINUTES: int = int(os.getenv('RESET_PASSWORD_EXPIRATION_MINUTES', ""))
     FRONTEND_URL: str = os.getenv('FRONTEND_URL', '')
+    MFA_VALID_WINDOW: int = int(os.getenv('MFA_VALID_WINDOW', "1"))
 
     MONGODB_DB: str = os.getenv('MONGODB_DB', "")
     MONGODB_HOST: str = os.getenv('MONGODB_HOST', "")
@@ -58,6 +59,18 @@ class Config:
     MAIL_PASSWORD: str = os.getenv('MAIL_PASSWORD', "")
     MAIL_DEFAULT_SENDER: str = os.getenv('MAIL_DEFAULT_SENDER', "")
 
+    TRACING_EXPORTER: str = os.getenv('TRACING_EXPORTER', "none")
+    TRACING_FILE: str = os.getenv('TRACING_FILE', "traces.jsonl")
+    TRACING_SAMPLE_RATIO: float = float(os.getenv('TRACING_SAMPLE_RATIO', "0.01"))
+
+    PROFILING_ENABLED: bool = os.getenv('PROFILING_ENABLED', "False") in ("1", "true", "True")
+    PROFILING_SECRET: str = os.getenv('PROFILING_SECRET', "")
+    PROFILING_SAMPLE_RATE: float = float(os.getenv('PROFILING_SAMPLE_RATE', "0"))
+    PROFILING_MODE: str = os.getenv('PROFILING_MODE', "cprofile")
+    PROFILING_SAMPLE_INTERVAL: float = float(os.getenv('PROFILING_SAMPLE_INTERVAL', "0.005"))
+    PROFILING_DIR: str = os.getenv('PROFILING_DIR', "profiles")
+    PROFILING_MAX_FILES: int = int(os.getenv('PROFILING_MAX_FILES', "50"))
+
     @staticmethod
     def configure_logging(app: Flask) -> None:
         """